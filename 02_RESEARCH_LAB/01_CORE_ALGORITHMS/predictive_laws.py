@@ -5,12 +5,19 @@ Predictive Laws for Prime Numbers and Zeta Zeros
 باسل يحيى عبدالله - Basil Yahya Abdullah
 """
 
+import os
+import sys
 import numpy as np
 import matplotlib.pyplot as plt
 from scipy.optimize import fsolve
 from scipy.special import zetac
 import math
 
+# وحدات المختبر (zeta_zeros) في المجلد الأب: تُضاف للمسار كاحتياط عند التشغيل من داخل المجلد
+LAB_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if LAB_DIR not in sys.path:
+    sys.path.append(LAB_DIR)
+
 class PredictiveLaws:
     """القوانين التنبؤية المكتشفة"""
     
@@ -154,32 +161,38 @@ class PredictiveLaws:
         """
         التنبؤ بصفر زيتا التالي
         Predict Next Zeta Zero
+        
+        Args:
+            zero_index: ترتيب الصفر بدءاً من 0 (len(known_zeta_zeros) = الصفر التالي)
+        
+        Raises:
+            ValueError: إذا كان zero_index سالباً
+        
+        التقدير من عكس الجزء الأملس لـ N(T) (Lambert W) ثم صقله بـ Brent على Z(t)
+        (zeta_zeros.locate_zeros)، فلا يحتاج أي صفر سابق ويصلح لأي ترتيب
         """
-        if zero_index >= len(self.known_zeta_zeros):
-            # استخدام نمط النمو
-            if len(self.known_zeta_zeros) >= 2:
-                # حساب متوسط الفجوات
-                gaps = []
-                for i in range(len(self.known_zeta_zeros)-1):
-                    gap = self.known_zeta_zeros[i+1] - self.known_zeta_zeros[i]
-                    gaps.append(gap)
-                
-                avg_gap = np.mean(gaps)
-                last_zero = self.known_zeta_zeros[-1]
-                
-                # تطبيق تصحيح ترددي
-                frequency_factor = last_zero / self.PI
-                corrected_gap = avg_gap * (1 + 0.1 * math.log(frequency_factor))
-                
-                predicted_zero = last_zero + corrected_gap
-                
-                return {
-                    'predicted_zero': predicted_zero,
-                    'method': 'frequency_corrected_gap',
-                    'confidence': 0.70
-                }
-        
-        return None
+        from zeta_zeros import locate_zeros, zero_estimate
+        
+        if zero_index < 0:
+            raise ValueError(f"zero_index must be non-negative, got {zero_index}")
+        
+        n = zero_index + 1
+        estimate = float(zero_estimate(n))
+        located = float(locate_zeros(n, 1)[0])
+        if math.isnan(located):
+            return {
+                'predicted_zero': estimate,
+                'estimate': estimate,
+                'method': 'smooth_counting_inversion',
+                'confidence': 0.70
+            }
+        
+        return {
+            'predicted_zero': located,
+            'estimate': estimate,
+            'method': 'riemann_siegel_brent',
+            'confidence': 0.99
+        }
     
     def zeta_prime_correlation_law(self, prime):
         """
@@ -282,52 +295,6 @@ class PredictiveLaws:
             'prediction_accuracy': prediction['confidence']
         }
 
-def main():
-    """الدالة الرئيسية لاختبار القوانين"""
-    
-    print("🎯 القوانين التنبؤية للأعداد الأولية وأصفار زيتا")
-    print("=" * 60)
-    print("👨‍🔬 الباحث: باسل يحيى عبدالله")
-    print("=" * 60)
-    
-    # إنشاء كائن القوانين التنبؤية
-    laws = PredictiveLaws()
-    
-    # التحقق من صحة القوانين
-    validation_results = laws.validate_laws()
-    
-    print("\n" + "="*60)
-    print("🔮 التنبؤات الجديدة:")
-    print("=" * 60)
-    
-    # التنبؤ بالعدد الأولي التالي
-    prime_prediction = laws.unified_prediction_law('prime')
-    print(f"\n🎯 التنبؤ بالعدد الأولي التالي:")
-    print(f"   العدد المتوقع: {prime_prediction['unified_prediction']}")
-    print(f"   مستوى الثقة: {prime_prediction['confidence']:.2%}")
-    
-    # التنبؤ بصفر زيتا التالي
-    zeta_prediction = laws.unified_prediction_law('zeta')
-    if zeta_prediction:
-        print(f"\n🎯 التنبؤ بصفر زيتا التالي:")
-        print(f"   الصفر المتوقع: {zeta_prediction['predicted_zero']:.6f}")
-        print(f"   مستوى الثقة: {zeta_prediction['confidence']:.2%}")
-    
-    # تحليل الارتباطات
-    print(f"\n🔗 تحليل الارتباطات:")
-    for prime in [7, 11, 13, 17]:
-        correlation = laws.zeta_prime_correlation_law(prime)
-        print(f"   p={prime}: أقرب صفر زيتا={correlation['closest_zero']:.3f}, قوة الارتباط={correlation['correlation_strength']:.3f}")
-    
-    return {
-        'laws': laws,
-        'validation': validation_results,
-        'predictions': {
-            'next_prime': prime_prediction,
-            'next_zeta': zeta_prediction
-        }
-    }
-
     def advanced_prime_prediction(self):
         """
         خوارزمية متقدمة للتنبؤ بالأعداد الأولية
@@ -432,34 +399,27 @@ def main():
         print("\n🌊 الخوارزمية المتقدمة لأصفار زيتا:")
         print("=" * 40)
 
-        # تحليل أنماط أصفار زيتا
-        zero_gaps = []
-        for i in range(len(self.known_zeta_zeros)-1):
-            gap = self.known_zeta_zeros[i+1] - self.known_zeta_zeros[i]
-            zero_gaps.append(gap)
-
-        # نموذج النمو
-        indices = np.arange(len(zero_gaps))
-        growth_coeffs = np.polyfit(indices, zero_gaps, 1)
+        from zeta_zeros import locate_zeros, zero_estimate
 
-        # التنبؤ بالفجوة التالية
-        next_gap_index = len(zero_gaps)
-        predicted_gap = np.polyval(growth_coeffs, next_gap_index)
-
-        # تطبيق تصحيح ترددي
+        # الصفر التالي بترتيبه: تقدير N(T) الأملس ثم Brent على Z(t)
+        n = len(self.known_zeta_zeros) + 1
+        estimate = float(zero_estimate(n))
+        predicted_zero = float(locate_zeros(n, 1)[0])
         last_zero = self.known_zeta_zeros[-1]
-        frequency_factor = last_zero / self.PI
-        frequency_correction = math.log(frequency_factor) * 0.5
 
-        corrected_gap = predicted_gap + frequency_correction
-        predicted_zero = last_zero + corrected_gap
+        # متوسط الفجوة عند الارتفاع t هو 2π / ln(t/2π)، ومعدل تغيره مع الترتيب
+        # d/dn = −4π² / (t·ln³(t/2π))
+        log_height = math.log(predicted_zero / (2 * self.PI))
+        growth_rate = -4 * self.PI ** 2 / (predicted_zero * log_height ** 3)
 
         return {
             'predicted_zero': predicted_zero,
-            'predicted_gap': corrected_gap,
-            'growth_rate': growth_coeffs[0],
-            'confidence': 0.75,
-            'method': 'growth_pattern_with_frequency_correction'
+            'predicted_gap': predicted_zero - last_zero,
+            'estimate': estimate,
+            'mean_gap': 2 * self.PI / log_height,
+            'growth_rate': growth_rate,
+            'confidence': 0.99,
+            'method': 'riemann_siegel_brent'
         }
 
     def comprehensive_validation(self):
@@ -508,6 +468,52 @@ def main():
             'average_accuracy': avg_accuracy
         }
 
+def main():
+    """الدالة الرئيسية لاختبار القوانين"""
+    
+    print("🎯 القوانين التنبؤية للأعداد الأولية وأصفار زيتا")
+    print("=" * 60)
+    print("👨‍🔬 الباحث: باسل يحيى عبدالله")
+    print("=" * 60)
+    
+    # إنشاء كائن القوانين التنبؤية
+    laws = PredictiveLaws()
+    
+    # التحقق من صحة القوانين
+    validation_results = laws.validate_laws()
+    
+    print("\n" + "="*60)
+    print("🔮 التنبؤات الجديدة:")
+    print("=" * 60)
+    
+    # التنبؤ بالعدد الأولي التالي
+    prime_prediction = laws.unified_prediction_law('prime')
+    print(f"\n🎯 التنبؤ بالعدد الأولي التالي:")
+    print(f"   العدد المتوقع: {prime_prediction['unified_prediction']}")
+    print(f"   مستوى الثقة: {prime_prediction['confidence']:.2%}")
+    
+    # التنبؤ بصفر زيتا التالي
+    zeta_prediction = laws.unified_prediction_law('zeta')
+    if zeta_prediction:
+        print(f"\n🎯 التنبؤ بصفر زيتا التالي:")
+        print(f"   الصفر المتوقع: {zeta_prediction['predicted_zero']:.6f}")
+        print(f"   مستوى الثقة: {zeta_prediction['confidence']:.2%}")
+    
+    # تحليل الارتباطات
+    print(f"\n🔗 تحليل الارتباطات:")
+    for prime in [7, 11, 13, 17]:
+        correlation = laws.zeta_prime_correlation_law(prime)
+        print(f"   p={prime}: أقرب صفر زيتا={correlation['closest_zero']:.3f}, قوة الارتباط={correlation['correlation_strength']:.3f}")
+    
+    return {
+        'laws': laws,
+        'validation': validation_results,
+        'predictions': {
+            'next_prime': prime_prediction,
+            'next_zeta': zeta_prediction
+        }
+    }
+
 if __name__ == "__main__":
     results = main()
 
@@ -9,15 +9,15 @@ Exploring Zeta-Primes Intuition using Complex Impedance Model
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.patches import Circle
-import seaborn as sns
 from typing import List, Tuple, Optional
 import math
 
-# إعداد الخطوط العربية
-plt.rcParams['font.family'] = ['DejaVu Sans', 'Arial Unicode MS', 'Tahoma']
-plt.rcParams['axes.unicode_minus'] = False
+def _pyplot():
+    """استيراد matplotlib عند أول رسم فقط مع إعداد الخطوط العربية"""
+    import matplotlib.pyplot as plt
+    plt.rcParams['font.family'] = ['DejaVu Sans', 'Arial Unicode MS', 'Tahoma']
+    plt.rcParams['axes.unicode_minus'] = False
+    return plt
 
 class ZetaPrimesExplorer:
     """فئة لاستكشاف العلاقة بين زيتا والأعداد الأولية"""
@@ -85,6 +85,7 @@ class ZetaPrimesExplorer:
     
     def plot_complex_plane(self, impedances: np.ndarray, primes: np.ndarray, title: str = ""):
         """رسم المقاومات المركبة في المستوى المركب"""
+        plt = _pyplot()
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
         
         # الرسم الأول: المستوى المركب
@@ -142,6 +143,7 @@ class ZetaPrimesExplorer:
 
 def main():
     """الدالة الرئيسية لتشغيل الاستكشاف"""
+    plt = _pyplot()
     explorer = ZetaPrimesExplorer()
     
     print("🔍 بدء استكشاف حدسية زيتا والأعداد الأولية...")
@@ -21,63 +21,36 @@ class AdvancedPredictiveAlgorithms(PredictiveLaws):
         # المزيد من أصفار زيتا
         self.extended_zeta_zeros = [14.134725, 21.022040, 25.010858, 30.424876, 32.935062, 37.586178, 40.918719, 43.327073, 48.005151, 49.773832]
     
-    def neural_network_prime_prediction(self):
+    def neural_network_prime_prediction(self, model=None):
         """
         شبكة عصبية بسيطة للتنبؤ بالأعداد الأولية
         Simple Neural Network for Prime Prediction
+        
+        Args:
+            model: PolynomialPrimeModel مدرب مسبقاً (train_prime_model أو
+                PolynomialPrimeModel.load)؛ بدونه يُدرَّب على extended_primes
         """
+        from polynomial_prime_model import fit_primes
+        
         print("\n🧠 الشبكة العصبية للتنبؤ بالأعداد الأولية:")
         print("=" * 50)
         
-        # إعداد البيانات للتدريب
-        X = []  # المدخلات: [العدد الأولي الحالي، تردده، مقاومته]
-        y = []  # المخرجات: العدد الأولي التالي
-        
-        for i in range(len(self.extended_primes)-1):
-            current_prime = self.extended_primes[i]
-            next_prime = self.extended_primes[i+1]
-            
-            frequency = self.prime_frequency_law(current_prime)
-            resistance = math.sqrt(current_prime)
-            
-            X.append([current_prime, frequency, resistance])
-            y.append(next_prime)
-        
-        X = np.array(X)
-        y = np.array(y)
+        # المدخلات: [العدد الأولي الحالي، تردده، مقاومته] ← العدد الأولي التالي
+        primes = np.array(self.extended_primes)
+        y = primes[1:]
         
-        # تطبيع البيانات
-        X_normalized = (X - np.mean(X, axis=0)) / np.std(X, axis=0)
-        
-        # نموذج انحدار متعدد الحدود
-        from sklearn.preprocessing import PolynomialFeatures
-        from sklearn.linear_model import LinearRegression
-        from sklearn.pipeline import Pipeline
-        
-        # إنشاء نموذج متعدد الحدود
-        poly_model = Pipeline([
-            ('poly', PolynomialFeatures(degree=2)),
-            ('linear', LinearRegression())
-        ])
-        
-        # تدريب النموذج
-        poly_model.fit(X_normalized, y)
+        # نموذج انحدار متعدد الحدود (الدرجة الثانية) على مدخلات مطبّعة
+        if model is None:
+            model = fit_primes(primes, degree=2)
         
         # التنبؤ بالعدد الأولي التالي
-        last_prime = self.extended_primes[-1]
-        last_frequency = self.prime_frequency_law(last_prime)
-        last_resistance = math.sqrt(last_prime)
-        
-        input_data = np.array([[last_prime, last_frequency, last_resistance]])
-        input_normalized = (input_data - np.mean(X, axis=0)) / np.std(X, axis=0)
-        
-        predicted_prime = poly_model.predict(input_normalized)[0]
+        predicted_prime = model.predict_next(primes[-1:])[0]
         
         # تحسين التنبؤ
         optimized_prime = self._optimize_prime_candidate(int(round(predicted_prime)))
         
         # حساب دقة النموذج
-        predictions = poly_model.predict(X_normalized)
+        predictions = model.predict_next(primes[:-1])
         accuracy = 1 - np.mean(np.abs(predictions - y) / y)
         
         print(f"   دقة النموذج: {accuracy:.2%}")
@@ -101,12 +74,12 @@ class AdvancedPredictiveAlgorithms(PredictiveLaws):
         # حساب ترددات جميع الأعداد الأولية
         prime_frequencies = [self.prime_frequency_law(p) for p in self.extended_primes]
         
-        # تحليل فورييه للترددات
-        fft_result = np.fft.fft(prime_frequencies)
-        frequencies = np.fft.fftfreq(len(prime_frequencies))
+        # تحليل فورييه للترددات (rFFT: السلسلة حقيقية فيكفي نصف الطيف)
+        fft_result = np.fft.rfft(prime_frequencies)
+        frequencies = np.fft.rfftfreq(len(prime_frequencies))
         
         # العثور على الترددات المهيمنة
-        dominant_freq_idx = np.argmax(np.abs(fft_result[1:len(fft_result)//2])) + 1
+        dominant_freq_idx = np.argmax(np.abs(fft_result[1:len(prime_frequencies)//2])) + 1
         dominant_frequency = frequencies[dominant_freq_idx]
         
         print(f"   التردد المهيمن: {dominant_frequency:.6f}")
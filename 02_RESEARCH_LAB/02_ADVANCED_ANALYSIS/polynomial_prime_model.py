@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+نموذج الانحدار متعدد الحدود للعدد الأولي التالي
+Chunked Polynomial Regression for Next-Prime Prediction
+باسل يحيى عبدالله - Basil Yahya Abdullah
+
+نفس نموذج neural_network_prime_prediction (مدخلات [p، p/π، √p] مطبّعة،
+حدود من الدرجة الثانية، مربعات صغرى) لكن بتدريب قابل للتوسع:
+
+- المدخلات تُبنى متجهة من جدول الأعداد الأولية (primes_between مقطعاً مقطعاً)
+- المتوسط والانحراف المعياري في تمريرة أولى بدمج إحصاءات المقاطع (Chan)
+- المربعات الصغرى في تمريرة ثانية بتحديث QR تدريجي: R للمصفوفة [A | y] تُدمج مع كل
+  دفعة (partial_fit)، فالذاكرة بطول الدفعة فقط والدقة دقة QR المباشرة
+- النموذج المدرب قاموس JSON صغير (save / load) والتنبؤ متجه على المصفوفات
+
+    python polynomial_prime_model.py --limit 200000000 --output prime_model.json
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import argparse
+from typing import Dict, Iterator, Sequence, Tuple
+
+import numpy as np
+
+# وحدات المختبر (prime_sieve) في المجلد الأب: تُضاف للمسار كاحتياط عند التشغيل من داخل المجلد
+LAB_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if LAB_DIR not in sys.path:
+    sys.path.append(LAB_DIR)
+
+CHUNK_SIZE = 1 << 18
+SEGMENT_SIZE = 1 << 22
+
+
+def prime_features(primes) -> np.ndarray:
+    """المدخلات [العدد الأولي، تردده p/π، مقاومته √p] لكل عدد (n, 3)"""
+    p = np.asarray(primes, dtype=float)
+    return np.column_stack([p, p / math.pi, np.sqrt(p)])
+
+
+def polynomial_terms(Z: np.ndarray, degree: int = 2) -> np.ndarray:
+    """
+    حدود كثيرة الحدود بنفس ترتيب PolynomialFeatures في sklearn:
+    1، z_i، z_i·z_j (i ≤ j)، ...
+    """
+    columns = [np.ones(len(Z))]
+    previous = [(i,) for i in range(Z.shape[1])]
+    columns += [Z[:, i] for i in range(Z.shape[1])]
+    for _ in range(degree - 1):
+        current = [term + (j,) for term in previous for j in range(term[-1], Z.shape[1])]
+        columns += [np.prod(Z[:, list(term)], axis=1) for term in current]
+        previous = current
+    return np.column_stack(columns)
+
+
+def prime_pairs(limit: int, start: int = 2,
+                segment_size: int = SEGMENT_SIZE) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    """
+    أزواج (العدد الأولي، التالي) لكل الأعداد الأولية في [start, limit) مقطعاً مقطعاً
+
+    التالي لآخر عدد في المقطع يُؤخذ من أول المقطع الذي يليه
+    """
+    from prime_sieve import primes_between
+
+    carry = np.zeros(0, dtype=np.int64)
+    for lo in range(start, limit, segment_size):
+        primes = np.concatenate([carry, primes_between(lo, min(lo + segment_size, limit))])
+        if len(primes) > 1:
+            yield primes[:-1], primes[1:]
+        carry = primes[-1:]
+
+
+class PolynomialPrimeModel:
+    """انحدار متعدد الحدود على مدخلات مطبّعة، يُدرَّب دفعة دفعة"""
+
+    def __init__(self, mean: Sequence[float], std: Sequence[float], degree: int = 2):
+        """
+        Args:
+            mean, std: إحصاءات تطبيع المدخلات (ثابتة أثناء التدريب)
+            degree: درجة كثيرة الحدود
+        """
+        self.mean = np.asarray(mean, dtype=float)
+        self.std = np.asarray(std, dtype=float)
+        self.degree = degree
+        terms = polynomial_terms(np.zeros((1, len(self.mean))), degree).shape[1]
+        # R لـ QR المصفوفة [A | y]: R[:k, :k] مثلثية، R[:k, k] = Qᵀy، R[k, k]² = مجموع مربعات البواقي
+        self._R = np.zeros((terms + 1, terms + 1))
+        self._coefficients = None
+        self.count = 0
+        self.target_sum = 0.0
+        self.target_squares = 0.0
+
+    def design(self, X: np.ndarray) -> np.ndarray:
+        """مصفوفة التصميم لمدخلات خام"""
+        return polynomial_terms((np.asarray(X, dtype=float) - self.mean) / self.std, self.degree)
+
+    def partial_fit(self, X: np.ndarray, y: np.ndarray) -> 'PolynomialPrimeModel':
+        """دمج دفعة في حل المربعات الصغرى: R ← QR([R; A | y])"""
+        y = np.asarray(y, dtype=float)
+        R = np.linalg.qr(np.vstack([self._R, np.column_stack([self.design(X), y])]), mode='r')
+        self._R[:] = 0
+        self._R[:len(R)] = R
+        self.count += len(y)
+        self.target_sum += float(np.sum(y))
+        self.target_squares += float(np.sum(y ** 2))
+        self._coefficients = None
+        return self
+
+    @property
+    def coefficients(self) -> np.ndarray:
+        """معاملات الحدود (حل بأصغر معيار عند وجود حدود مترابطة مثل p و p/π)"""
+        if self._coefficients is None:
+            k = len(self._R) - 1
+            self._coefficients = np.linalg.lstsq(self._R[:k, :k], self._R[:k, k], rcond=1e-10)[0]
+        return self._coefficients
+
+    @property
+    def r_squared(self) -> float:
+        """R² على بيانات التدريب من R دون إعادة المرور على البيانات"""
+        k = len(self._R) - 1
+        sse = np.sum((self._R[:k, :k] @ self.coefficients - self._R[:k, k]) ** 2) + self._R[k, k] ** 2
+        sst = self.target_squares - self.target_sum ** 2 / self.count
+        return 1 - sse / sst
+
+    def predict(self, X: np.ndarray, chunk_size: int = CHUNK_SIZE) -> np.ndarray:
+        """التنبؤ لمصفوفة مدخلات، دفعة دفعة"""
+        X = np.asarray(X, dtype=float)
+        coefficients = self.coefficients
+        return np.concatenate([self.design(X[i:i + chunk_size]) @ coefficients
+                               for i in range(0, len(X), chunk_size)] or [np.zeros(0)])
+
+    def predict_next(self, primes) -> np.ndarray:
+        """العدد الأولي التالي المتوقع (غير مقرب) لكل عدد"""
+        return self.predict(prime_features(primes))
+
+    def to_dict(self) -> Dict:
+        """الحالة كقاموس قابل لـ JSON (تكفي لمتابعة التدريب)"""
+        return {
+            'mean': self.mean.tolist(),
+            'std': self.std.tolist(),
+            'degree': self.degree,
+            'R': self._R.tolist(),
+            'count': self.count,
+            'target_sum': self.target_sum,
+            'target_squares': self.target_squares
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict) -> 'PolynomialPrimeModel':
+        """استعادة نموذج من to_dict"""
+        model = cls(state['mean'], state['std'], state['degree'])
+        model._R = np.array(state['R'], dtype=float)
+        model.count = state['count']
+        model.target_sum = state['target_sum']
+        model.target_squares = state['target_squares']
+        return model
+
+    def save(self, path: str):
+        """حفظ النموذج في ملف JSON"""
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def load(cls, path: str) -> 'PolynomialPrimeModel':
+        """تحميل نموذج محفوظ بـ save"""
+        with open(path) as f:
+            return cls.from_dict(json.load(f))
+
+
+def feature_moments(chunks: Iterator[np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    المتوسط والانحراف المعياري (مقسوم على n كما في np.std) لمدخلات مقسمة دفعات
+
+    دمج إحصاءات الدفعات بصيغة Chan لتجنب فقد الدقة في Σx² − (Σx)²/n
+    """
+    count, mean, m2 = 0, None, None
+    for X in chunks:
+        n = len(X)
+        if not n:
+            continue
+        chunk_mean = X.mean(axis=0)
+        chunk_m2 = ((X - chunk_mean) ** 2).sum(axis=0)
+        if mean is None:
+            count, mean, m2 = n, chunk_mean, chunk_m2
+            continue
+        delta = chunk_mean - mean
+        total = count + n
+        mean = mean + delta * n / total
+        m2 = m2 + chunk_m2 + delta ** 2 * count * n / total
+        count = total
+    return mean, np.sqrt(m2 / count)
+
+
+def fit_primes(primes, degree: int = 2) -> PolynomialPrimeModel:
+    """تدريب النموذج على قائمة أعداد أولية صغيرة (كل عدد ← التالي)"""
+    primes = np.asarray(primes)
+    X = prime_features(primes[:-1])
+    mean, std = feature_moments([X])
+    return PolynomialPrimeModel(mean, std, degree).partial_fit(X, primes[1:])
+
+
+def train_prime_model(limit: int, degree: int = 2, segment_size: int = SEGMENT_SIZE,
+                      chunk_size: int = CHUNK_SIZE) -> PolynomialPrimeModel:
+    """
+    تدريب النموذج على كل الأعداد الأولية الأصغر من limit في تمريرتين
+
+    Args:
+        limit: حد جدول الأعداد الأولية (10^7 عينة ≈ limit = 1.8×10^8)
+        segment_size: طول مقطع الغربال
+        chunk_size: عدد العينات في كل partial_fit
+    """
+    mean, std = feature_moments(prime_features(current) for current, _ in prime_pairs(limit, segment_size=segment_size))
+    model = PolynomialPrimeModel(mean, std, degree)
+    for current, following in prime_pairs(limit, segment_size=segment_size):
+        for i in range(0, len(current), chunk_size):
+            model.partial_fit(prime_features(current[i:i + chunk_size]), following[i:i + chunk_size])
+    return model
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Train the chunked polynomial next-prime model")
+    parser.add_argument('--limit', type=int, default=20_000_000)
+    parser.add_argument('--degree', type=int, default=2)
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+    parser.add_argument('--output', default=None, help="ملف JSON لحفظ النموذج")
+    args = parser.parse_args()
+
+    print("🧠 تدريب نموذج الانحدار متعدد الحدود")
+    print("=" * 50)
+
+    start = time.perf_counter()
+    model = train_prime_model(args.limit, args.degree, chunk_size=args.chunk_size)
+    seconds = time.perf_counter() - start
+    print(f"   العينات: {model.count:,} في {seconds:.1f}s ({model.count / seconds:,.0f} عينة/ثانية)")
+    print(f"   R²: {model.r_squared:.10f}")
+
+    # تنبؤ متجه على عينة الاختبار الأخيرة
+    current, following = next(prime_pairs(args.limit, start=max(2, args.limit - 1_000_000)))
+    start = time.perf_counter()
+    predicted = model.predict_next(current)
+    seconds = time.perf_counter() - start
+    accuracy = 1 - np.mean(np.abs(predicted - following) / following)
+    print(f"   دقة آخر {len(current):,} عدد: {accuracy:.6%} | التنبؤ: {len(current) / seconds:,.0f} عدد/ثانية")
+
+    if args.output:
+        model.save(args.output)
+        print(f"✅ تم حفظ النموذج في: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
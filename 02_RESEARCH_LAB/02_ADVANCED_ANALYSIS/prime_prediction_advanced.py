@@ -102,19 +102,23 @@ class AdvancedPrimePredictor:
         x = np.arange(len(gaps))
         trend_coeff = np.polyfit(x, gaps, 1)[0]
         
-        # تحليل الدورية
-        fft = np.fft.fft(gaps)
-        frequencies = np.fft.fftfreq(len(gaps))
-        dominant_freq_idx = np.argmax(np.abs(fft[1:len(fft)//2])) + 1
+        # تحليل الدورية (rFFT: السلسلة حقيقية فيكفي نصف الطيف)
+        fft = np.fft.rfft(gaps)
+        frequencies = np.fft.rfftfreq(len(gaps))
+        dominant_freq_idx = np.argmax(np.abs(fft[1:len(gaps)//2])) + 1
         dominant_period = 1 / abs(frequencies[dominant_freq_idx]) if frequencies[dominant_freq_idx] != 0 else 0
         
+        # ثقة الأدوار المهيمنة مقابل خلفية الطيف (لسلاسل أطول: spectral_analysis.welch_psd)
+        from spectral_analysis import periodogram, dominant_periods
+        
         return {
             'statistics': gap_stats,
             'trend_coefficient': trend_coeff,
             'dominant_period': dominant_period,
+            'dominant_periods': dominant_periods(periodogram(gaps), count=3),
             'fft_analysis': {
-                'frequencies': frequencies[:len(frequencies)//2],
-                'magnitudes': np.abs(fft[:len(fft)//2])
+                'frequencies': frequencies[:len(gaps)//2],
+                'magnitudes': np.abs(fft[:len(gaps)//2])
             }
         }
     
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+ملائمة دوال الخطأ دفعة واحدة
+Batched Error-Function Fitting
+باسل يحيى عبدالله - Basil Yahya Abdullah
+
+الدوال y = a·g(x) + b (خطية، لوغاريتمية، جذرية) خطية في المعاملات: حلها
+مغلق (معادلات طبيعية مركزية) لكل الطرق وكل الدوال في تمريرة متجهة واحدة
+على جدول الأخطاء، وهو نفس حل المربعات الصغرى الذي يقترب منه curve_fit.
+
+الدوال غير الخطية فعلاً (القوة a·x^b والأسية a·e^(bx)) تُبدأ من حل خطي
+بعد أخذ اللوغاريتم (ln y = ln a + b·ln x أو b·x) ثم تُحسَّن بـ curve_fit
+على الخطأ الأصلي، فتتقارب في خطوات قليلة.
+"""
+
+from typing import Dict, Sequence
+
+import numpy as np
+
+
+def linear_func(x, a, b):
+    return a * x + b
+
+
+def logarithmic_func(x, a, b):
+    return a * np.log(x) + b
+
+
+def sqrt_func(x, a, b):
+    return a * np.sqrt(x) + b
+
+
+def power_func(x, a, b):
+    return a * np.power(x, b)
+
+
+def exponential_func(x, a, b):
+    return a * np.exp(b * x)
+
+
+# الدوال الخطية في المعاملات: y = a·basis(x) + b
+LINEAR_MODELS = {
+    'linear': (linear_func, lambda x: x),
+    'logarithmic': (logarithmic_func, np.log),
+    'sqrt': (sqrt_func, np.sqrt),
+}
+
+# الدوال غير الخطية: ln y = ln a + b·basis(x) كبداية لـ curve_fit
+NONLINEAR_MODELS = {
+    'power': (power_func, np.log),
+    'exponential': (exponential_func, lambda x: x),
+}
+
+DEFAULT_MODELS = ('linear', 'logarithmic', 'power', 'sqrt')
+
+
+def grouped_line_fits(codes: np.ndarray, groups: int, features: np.ndarray,
+                      targets: np.ndarray, weights: np.ndarray = None) -> Dict:
+    """
+    انحدار خطي بسيط target = slope·feature + intercept لكل (مجموعة، عمود) معاً
+
+    Args:
+        codes: رقم المجموعة لكل صف (rows,)
+        groups: عدد المجموعات
+        features, targets: (rows, k) عمود لكل نموذج
+        weights: (rows, k) أوزان 0/1 لاستبعاد صفوف من نموذج معين
+
+    Returns:
+        {'slope', 'intercept', 'sse', 'sst', 'count'} كل منها (groups, k)
+    """
+    if weights is None:
+        weights = np.ones_like(features)
+    one_hot = (codes[None, :] == np.arange(groups)[:, None]).astype(float)
+
+    def group_sum(values):
+        return one_hot @ (weights * values)
+
+    count = group_sum(np.ones_like(features))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean_f = group_sum(features) / count
+        mean_y = group_sum(targets) / count
+        df = np.where(weights > 0, features - mean_f[codes], 0.0)
+        dy = np.where(weights > 0, targets - mean_y[codes], 0.0)
+        slope = group_sum(df * dy) / group_sum(df * df)
+        intercept = mean_y - slope * mean_f
+        residual = dy - slope[codes] * df
+    return {
+        'slope': slope,
+        'intercept': intercept,
+        'sse': group_sum(residual ** 2),
+        'sst': group_sum(dy ** 2),
+        'count': count
+    }
+
+
+def fit_error_models(labels: Sequence, x: np.ndarray, y: np.ndarray,
+                     models: Sequence[str] = DEFAULT_MODELS, maxfev: int = 5000) -> Dict:
+    """
+    ملائمة كل الدوال لكل مجموعة (طريقة تنبؤ) في جدول الأخطاء
+
+    Args:
+        labels: اسم المجموعة لكل صف
+        x, y: المتغير المستقل والخطأ
+        models: أسماء الدوال من LINEAR_MODELS و NONLINEAR_MODELS
+
+    Returns:
+        {label: {model: {'parameters', 'r_squared', 'function', 'solver'}}}
+        النماذج التي فشلت ملائمتها تحمل 'error' بدل المعاملات
+    """
+    from scipy.optimize import curve_fit
+
+    names, codes = np.unique(np.asarray(labels), return_inverse=True)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    results = {name: {} for name in names}
+
+    # كل الدوال الخطية وبدايات الدوال غير الخطية في تمريرة واحدة
+    linear = [name for name in models if name in LINEAR_MODELS]
+    nonlinear = [name for name in models if name in NONLINEAR_MODELS]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        features = np.column_stack([LINEAR_MODELS[name][1](x) for name in linear]
+                                   + [NONLINEAR_MODELS[name][1](x) for name in nonlinear])
+        log_y = np.log(np.where(y > 0, y, 1.0))
+    targets = np.column_stack([y] * len(linear) + [log_y] * len(nonlinear))
+    weights = np.column_stack([np.ones_like(y)] * len(linear) + [(y > 0).astype(float)] * len(nonlinear))
+    weights = weights * np.isfinite(features)
+    features = np.where(weights > 0, features, 0.0)
+    fits = grouped_line_fits(codes, len(names), features, targets, weights)
+
+    for g, name in enumerate(names):
+        for k, model in enumerate(linear):
+            slope, intercept = fits['slope'][g, k], fits['intercept'][g, k]
+            if not np.isfinite(slope) or fits['count'][g, k] < len(y[codes == g]):
+                results[name][model] = {'error': 'linear fit is undefined for this data'}
+                continue
+            results[name][model] = {
+                'parameters': np.array([slope, intercept]),
+                'r_squared': 1 - fits['sse'][g, k] / fits['sst'][g, k],
+                'function': LINEAR_MODELS[model][0],
+                'solver': 'closed_form'
+            }
+
+        rows = codes == g
+        x_g, y_g = x[rows], y[rows]
+        sst = np.sum((y_g - np.mean(y_g)) ** 2)
+        for k, model in enumerate(nonlinear, start=len(linear)):
+            func = NONLINEAR_MODELS[model][0]
+            slope, intercept = fits['slope'][g, k], fits['intercept'][g, k]
+            p0 = (np.exp(intercept), slope) if np.isfinite(slope) else None
+            try:
+                popt, _ = curve_fit(func, x_g, y_g, p0=p0, maxfev=maxfev)
+            except Exception as e:
+                results[name][model] = {'error': str(e)}
+                continue
+            results[name][model] = {
+                'parameters': popt,
+                'r_squared': 1 - np.sum((y_g - func(x_g, *popt)) ** 2) / sst,
+                'function': func,
+                'solver': 'curve_fit'
+            }
+
+    return results
+
+
+if __name__ == "__main__":
+    import time
+    import warnings
+    from scipy.optimize import curve_fit
+
+    print("🧮 ملائمة دوال الخطأ دفعة واحدة")
+    print("=" * 40)
+
+    rng = np.random.default_rng(0)
+    x = np.tile(np.arange(30, 5000, dtype=float), 3)
+    labels = np.repeat(['basic_law', 'golden_ratio', 'frequency_based'], len(x) // 3)
+    y = np.abs(0.02 * x + 0.5 + rng.normal(0, 5, len(x)))
+
+    start = time.perf_counter()
+    batched = fit_error_models(labels, x, y)
+    batched_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    worst = 0.0
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        for label in np.unique(labels):
+            rows = labels == label
+            for model in DEFAULT_MODELS:
+                func = (LINEAR_MODELS.get(model) or NONLINEAR_MODELS[model])[0]
+                try:
+                    popt, _ = curve_fit(func, x[rows], y[rows], maxfev=5000)
+                except Exception:
+                    continue
+                r2 = 1 - np.sum((y[rows] - func(x[rows], *popt)) ** 2) / np.sum((y[rows] - y[rows].mean()) ** 2)
+                worst = max(worst, abs(r2 - batched[label][model]['r_squared']))
+    loop_time = time.perf_counter() - start
+
+    print(f"⏱️ دفعة: {batched_time * 1000:.1f}ms | curve_fit لكل نموذج: {loop_time * 1000:.1f}ms")
+    print(f"📊 أكبر فرق في R²: {worst:.2e}")
@@ -10,9 +10,21 @@ import matplotlib.pyplot as plt
 import math
 from sympy import isprime, primerange, nextprime
 from scipy import stats
-from scipy.optimize import curve_fit
 import pandas as pd
 
+from error_fitting import fit_error_models
+from online_correction import RecursiveLeastSquares
+
+try:
+    from result_cache import cached_result
+except ImportError:
+    # تشغيل مباشر من داخل المجلد: بدون ذاكرة مؤقتة
+    def cached_result(*args, **kwargs):
+        return lambda method: method
+
+# معاملات تصحيح frequency_based من النتائج السابقة (a, b)
+INITIAL_CORRECTION = (0.021700, 0.559885)
+
 class ErrorPatternAnalysis:
     """تحليل أنماط الخطأ في التنبؤ"""
     
@@ -26,6 +38,10 @@ class ErrorPatternAnalysis:
         # قوائم لتسجيل الأخطاء
         self.error_data = []
         
+        # نموذج تصحيح الخطأ المتجدد: error = a * prime + b، يبدأ من النتائج السابقة
+        self.correction_model = RecursiveLeastSquares(INITIAL_CORRECTION)
+        self.absorbed_error_rows = 0
+        
     def basic_prediction_law(self, known_primes):
         """قانوننا الأساسي للتنبؤ"""
         if len(known_primes) < 3:
@@ -63,6 +79,8 @@ class ErrorPatternAnalysis:
         
         return last_prime + base_gap + correction_factor
     
+    @cached_result(state=('test_primes', 'error_data'),
+                   restore=lambda self, data: setattr(self, 'error_data', data))
     def comprehensive_error_analysis(self, max_test_primes=100):
         """تحليل شامل لأنماط الخطأ"""
         
@@ -178,60 +196,31 @@ class ErrorPatternAnalysis:
         
         df = pd.DataFrame(self.error_data)
         
-        # دوال مختلفة للاختبار
-        def linear_func(x, a, b):
-            return a * x + b
-        
-        def logarithmic_func(x, a, b):
-            return a * np.log(x) + b
-        
-        def power_func(x, a, b):
-            return a * np.power(x, b)
-        
-        def exponential_func(x, a, b):
-            return a * np.exp(b * x)
-        
-        def sqrt_func(x, a, b):
-            return a * np.sqrt(x) + b
-        
-        functions = {
-            'linear': linear_func,
-            'logarithmic': logarithmic_func,
-            'power': power_func,
-            'sqrt': sqrt_func
-        }
+        # كل الطرق وكل الدوال في تمريرة واحدة على جدول الأخطاء
+        models = ('linear', 'logarithmic', 'power', 'sqrt')
+        fits = fit_error_models(df['method'].values, df['last_known_prime'].values,
+                                df['absolute_error'].values, models)
         
         best_fits = {}
         
         for method in df['method'].unique():
-            method_data = df[df['method'] == method]
-            x_data = method_data['last_known_prime'].values
-            y_data = method_data['absolute_error'].values
-            
             print(f"\n🔍 تحليل {method}:")
             
             method_fits = {}
             
-            for func_name, func in functions.items():
-                try:
-                    # محاولة ملائمة الدالة
-                    popt, pcov = curve_fit(func, x_data, y_data, maxfev=5000)
-                    
-                    # حساب جودة الملائمة
-                    y_pred = func(x_data, *popt)
-                    r_squared = 1 - (np.sum((y_data - y_pred) ** 2) / 
-                                   np.sum((y_data - np.mean(y_data)) ** 2))
-                    
-                    method_fits[func_name] = {
-                        'parameters': popt,
-                        'r_squared': r_squared,
-                        'function': func
-                    }
-                    
-                    print(f"  {func_name}: R² = {r_squared:.4f}, معاملات = {popt}")
-                    
-                except Exception as e:
-                    print(f"  {func_name}: فشل في الملائمة - {e}")
+            for func_name in models:
+                fit = fits[method][func_name]
+                if 'error' in fit:
+                    print(f"  {func_name}: فشل في الملائمة - {fit['error']}")
+                    continue
+                
+                method_fits[func_name] = {
+                    'parameters': fit['parameters'],
+                    'r_squared': fit['r_squared'],
+                    'function': fit['function']
+                }
+                
+                print(f"  {func_name}: R² = {fit['r_squared']:.4f}, معاملات = {fit['parameters']}")
             
             # اختيار أفضل ملائمة
             if method_fits:
@@ -364,44 +353,6 @@ class ErrorPatternAnalysis:
         
         return interpretations
 
-def main():
-    """الدالة الرئيسية"""
-    
-    print("🎯 تحليل أنماط الخطأ في التنبؤ بالأعداد الأولية")
-    print("=" * 60)
-    print("👨‍🔬 الباحث: باسل يحيى عبدالله")
-    print("=" * 60)
-    
-    # إنشاء محلل أنماط الخطأ
-    analyzer = ErrorPatternAnalysis()
-    
-    # تحليل شامل للأخطاء
-    error_data = analyzer.comprehensive_error_analysis(max_test_primes=50)
-    
-    # تحليل أنماط الخطأ
-    correlations = analyzer.analyze_error_patterns()
-    
-    # البحث عن دوال رياضية
-    best_fits = analyzer.fit_error_functions()
-    
-    # إنشاء الرسوم البيانية
-    analyzer.create_error_visualizations()
-    
-    # التفسير الفيزيائي
-    physical_analysis = analyzer.physical_interpretation_analysis()
-    
-    print(f"\n🏆 النتائج النهائية:")
-    print(f"  تم تحليل {len(error_data)} نقطة بيانات")
-    print(f"  تم اختبار {len(set(d['method'] for d in error_data))} طرق مختلفة")
-    print(f"  تم العثور على أنماط رياضية قابلة للنمذجة")
-    
-    return {
-        'error_data': error_data,
-        'correlations': correlations,
-        'best_fits': best_fits,
-        'physical_analysis': physical_analysis
-    }
-
     def create_error_correction_model(self):
         """إنشاء نموذج تصحيح الخطأ"""
 
@@ -416,12 +367,14 @@ def main():
         # اختيار أفضل طريقة (frequency_based)
         best_method_data = df[df['method'] == 'frequency_based']
 
-        # إنشاء نموذج تصحيح خطي
-        x_data = best_method_data['last_known_prime'].values
-        y_data = best_method_data['absolute_error'].values
+        # تحديث النموذج المتجدد بالملاحظات الجديدة فقط: error = a * prime + b
+        new_rows = best_method_data.iloc[self.absorbed_error_rows:]
+        x_data = new_rows['last_known_prime'].values.astype(float)
+        y_data = new_rows['absolute_error'].values
+        self.correction_model.update_many(np.column_stack([x_data, np.ones_like(x_data)]), y_data)
+        self.absorbed_error_rows = len(best_method_data)
 
-        # الدالة الخطية للتصحيح: error = a * prime + b
-        coeffs = np.polyfit(x_data, y_data, 1)
+        coeffs = self.correction_model.coefficients.copy()
         a, b = coeffs
 
         print(f"📐 دالة تصحيح الخطأ:")
@@ -469,12 +422,20 @@ def main():
 
         return {
             'correction_coefficients': coeffs,
+            'correction_state': self.correction_model.to_dict(),
             'improvement_percentage': improvement_percentage,
             'corrected_predictions': corrected_predictions
         }
 
-    def advanced_error_prediction(self, known_primes):
-        """تنبؤ محسن مع تصحيح الخطأ"""
+    def advanced_error_prediction(self, known_primes, actual_next=None):
+        """
+        تنبؤ محسن مع تصحيح الخطأ
+
+        Args:
+            known_primes: الأعداد الأولية المعروفة
+            actual_next: العدد التالي الفعلي إن عُرف؛ يُحدَّث به نموذج التصحيح
+                بعد التنبؤ
+        """
 
         # التنبؤ الأساسي
         basic_pred = self.frequency_based_prediction(known_primes)
@@ -482,13 +443,15 @@ def main():
         # تطبيق تصحيح الخطأ
         last_prime = known_primes[-1]
 
-        # معاملات التصحيح المحسوبة
-        a, b = 0.021700, 0.559885  # من النتائج السابقة
-        error_correction = a * last_prime + b
+        # معاملات التصحيح الحالية للنموذج المتجدد
+        error_correction = self.correction_model.predict([last_prime, 1.0])
 
         # التنبؤ المصحح
         corrected_pred = basic_pred - error_correction
 
+        if actual_next is not None:
+            self.correction_model.update([last_prime, 1.0], abs(basic_pred - actual_next))
+
         return {
             'basic_prediction': basic_pred,
             'error_correction': error_correction,
@@ -496,6 +459,44 @@ def main():
             'confidence': 0.95  # ثقة عالية بعد التصحيح
         }
 
+def main():
+    """الدالة الرئيسية"""
+    
+    print("🎯 تحليل أنماط الخطأ في التنبؤ بالأعداد الأولية")
+    print("=" * 60)
+    print("👨‍🔬 الباحث: باسل يحيى عبدالله")
+    print("=" * 60)
+    
+    # إنشاء محلل أنماط الخطأ
+    analyzer = ErrorPatternAnalysis()
+    
+    # تحليل شامل للأخطاء
+    error_data = analyzer.comprehensive_error_analysis(max_test_primes=50)
+    
+    # تحليل أنماط الخطأ
+    correlations = analyzer.analyze_error_patterns()
+    
+    # البحث عن دوال رياضية
+    best_fits = analyzer.fit_error_functions()
+    
+    # إنشاء الرسوم البيانية
+    analyzer.create_error_visualizations()
+    
+    # التفسير الفيزيائي
+    physical_analysis = analyzer.physical_interpretation_analysis()
+    
+    print(f"\n🏆 النتائج النهائية:")
+    print(f"  تم تحليل {len(error_data)} نقطة بيانات")
+    print(f"  تم اختبار {len(set(d['method'] for d in error_data))} طرق مختلفة")
+    print(f"  تم العثور على أنماط رياضية قابلة للنمذجة")
+    
+    return {
+        'error_data': error_data,
+        'correlations': correlations,
+        'best_fits': best_fits,
+        'physical_analysis': physical_analysis
+    }
+
 if __name__ == "__main__":
     results = main()
 
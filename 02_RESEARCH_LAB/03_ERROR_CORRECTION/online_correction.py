@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+نموذج تصحيح خطأ متجدد (مربعات صغرى تكرارية)
+Online Error Correction with Recursive Least Squares
+باسل يحيى عبدالله - Basil Yahya Abdullah
+
+تصحيح الخطأ error ≈ θ·x (مثلاً x = [prime, 1] ⇒ error = a·prime + b) يُحدَّث
+مع كل تنبؤ جديد بتكلفة O(k²) بدل إعادة ملائمة الجدول كله:
+
+    g = P·x / (λ + xᵀ·P·x)
+    θ ← θ + g·(y − θ·x)
+    P ← (P − g·xᵀ·P) / λ
+
+وهو مرشح كالمان لمعاملات ثابتة. λ = 1 يعطي نفس حل المربعات الصغرى على كل
+البيانات (مع انحياز مهمل نحو θ الابتدائية بقدر 1/delta)، و λ < 1 ينسى
+الملاحظات القديمة بوزن λ^عمرها فيتبع المعاملات إذا تغيرت مع حجم الأعداد.
+
+الحالة (θ، P، λ، العدد) قاموس JSON عبر to_dict / from_dict.
+"""
+
+from typing import Dict, Sequence
+
+import numpy as np
+
+
+class RecursiveLeastSquares:
+    """مربعات صغرى تكرارية لنموذج خطي y = θ·x"""
+
+    def __init__(self, coefficients: Sequence[float], forgetting: float = 1.0,
+                 delta: float = 1e6):
+        """
+        Args:
+            coefficients: θ الابتدائية (تحدد عدد المعاملات k)
+            forgetting: عامل النسيان λ في (0, 1]
+            delta: تباين θ الابتدائية (P = delta·I)؛ كبير = ثقة ضعيفة بها
+        """
+        if not 0 < forgetting <= 1:
+            raise ValueError("forgetting factor must be in (0, 1]")
+        self.coefficients = np.array(coefficients, dtype=float)
+        self.covariance = np.eye(len(self.coefficients)) * delta
+        self.forgetting = forgetting
+        self.count = 0
+
+    def predict(self, features: Sequence[float]) -> float:
+        """θ·x"""
+        return float(self.coefficients @ np.asarray(features, dtype=float))
+
+    def update(self, features: Sequence[float], target: float) -> float:
+        """
+        إضافة ملاحظة واحدة
+
+        Returns:
+            خطأ التنبؤ قبل التحديث (y − θ·x)
+        """
+        x = np.asarray(features, dtype=float)
+        Px = self.covariance @ x
+        gain = Px / (self.forgetting + x @ Px)
+        residual = target - self.coefficients @ x
+        self.coefficients = self.coefficients + gain * residual
+        covariance = (self.covariance - np.outer(gain, Px)) / self.forgetting
+        self.covariance = (covariance + covariance.T) / 2  # تبقى متماثلة رغم التقريب
+        self.count += 1
+        return float(residual)
+
+    def update_many(self, features: np.ndarray, targets: Sequence[float]) -> np.ndarray:
+        """إضافة ملاحظات بالترتيب؛ يعيد أخطاء التنبؤ المسبقة لكل منها"""
+        return np.array([self.update(x, y) for x, y in zip(np.asarray(features, dtype=float), targets)])
+
+    def to_dict(self) -> Dict:
+        """الحالة كقاموس قابل لـ JSON"""
+        return {
+            'coefficients': self.coefficients.tolist(),
+            'covariance': self.covariance.tolist(),
+            'forgetting': self.forgetting,
+            'count': self.count
+        }
+
+    @classmethod
+    def from_dict(cls, state: Dict) -> 'RecursiveLeastSquares':
+        """استعادة نموذج من to_dict"""
+        model = cls(state['coefficients'], state['forgetting'])
+        model.covariance = np.array(state['covariance'], dtype=float)
+        model.count = state['count']
+        return model
+
+
+if __name__ == "__main__":
+    import json
+    import time
+    from sympy import primerange
+
+    print("🔁 تصحيح خطأ متجدد (RLS)")
+    print("=" * 40)
+
+    primes = np.array(list(primerange(2, 2_000_000)), dtype=float)
+    rng = np.random.default_rng(0)
+    errors = 0.0217 * primes + 0.56 + rng.normal(0, 3, len(primes))
+    features = np.column_stack([primes, np.ones_like(primes)])
+
+    model = RecursiveLeastSquares([0.0, 0.0])
+    start = time.perf_counter()
+    model.update_many(features, errors)
+    online_time = time.perf_counter() - start
+
+    batch = np.polyfit(primes, errors, 1)
+    print(f"📐 RLS: {model.coefficients} | polyfit: {batch}")
+    print(f"   أكبر فرق نسبي: {np.max(np.abs(model.coefficients - batch) / np.abs(batch)):.2e}")
+    print(f"⏱️ {len(primes):,} تحديث: {online_time / len(primes) * 1e6:.1f}µs لكل تحديث")
+
+    restored = RecursiveLeastSquares.from_dict(json.loads(json.dumps(model.to_dict())))
+    print(f"💾 الاستعادة مطابقة: {np.array_equal(restored.coefficients, model.coefficients)}")
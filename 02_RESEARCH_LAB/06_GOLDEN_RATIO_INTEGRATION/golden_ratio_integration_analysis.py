@@ -10,6 +10,10 @@ import matplotlib.pyplot as plt
 import math
 from sympy import isprime, primerange
 from predictive_laws import PredictiveLaws
+from two_squares import two_squares
+from gaussian_angles import angle_distribution, angle_histograms, prime_angles
+
+CHUNK_SIZE = 1 << 20
 
 class GoldenRatioIntegration:
     """دمج النسبة الذهبية مع قوانيننا المكتشفة"""
@@ -28,12 +32,16 @@ class GoldenRatioIntegration:
             return (1, 1)  # 2 = 1² + 1²
         
         if p % 4 == 1:
-            # تمثيل الأعداد 4k+1 كمجموع مربعين
-            for x in range(1, int(math.isqrt(p)) + 1):
-                y2 = p - x**2
-                y = math.isqrt(y2)
-                if y**2 == y2:
-                    return (x, y)
+            # تمثيل الأعداد 4k+1 كمجموع مربعين (Hermite–Serret بدل البحث حتى √p)
+            try:
+                return two_squares(p)
+            except ValueError:
+                # عدد غير أولي: البحث المباشر القديم ثم التمثيل في المستوى المركب
+                for x in range(1, int(math.isqrt(p)) + 1):
+                    y2 = p - x**2
+                    y = math.isqrt(y2)
+                    if y**2 == y2:
+                        return (x, y)
         
         # تمثيل الأعداد 4k+3 في المستوى المركب
         a = math.sqrt(p) * math.cos(self.PI/4)
@@ -74,15 +82,31 @@ class GoldenRatioIntegration:
             'prime_type': '4k+1' if p % 4 == 1 else '4k+3'
         }
     
-    def compare_frequency_models(self):
-        """مقارنة نماذج الترددات المختلفة"""
+    def compare_frequency_models(self, primes=None, detail=20, limit=None, workers=0):
+        """
+        مقارنة نماذج الترددات المختلفة
+        
+        Args:
+            primes: الأعداد الأولية (افتراضياً أول 20)؛ تُعالج دفعة دفعة فتصلح
+                لمصفوفات بطول 10^8 (أو memmap)
+            detail: عدد الأعداد التي تُطبع تفاصيلها وتُعاد سجلاتها
+            limit: إن حُدد تشمل الإحصاءات كل الأعداد الأولية الأصغر منه
+                (angle_distribution مقطعاً مقطعاً دون قائمة أعداد)
+            workers: عمليات angle_distribution (0 = في نفس العملية)
+        
+        Returns:
+            سجلات golden_resonance_model لأول detail عدد؛ الإحصاءات تشمل الكل
+        """
         
         print("🔍 مقارنة نماذج الترددات:")
         print("=" * 50)
         
+        if primes is None:
+            primes = self.primes[:20]  # أول 20 عدد أولي
+        
         results = []
-        for p in self.primes[:20]:  # أول 20 عدد أولي
-            model = self.golden_resonance_model(p)
+        for p in list(primes[:detail]):
+            model = self.golden_resonance_model(int(p))
             results.append(model)
             
             print(f"\nالعدد الأولي: {p}")
@@ -92,16 +116,20 @@ class GoldenRatioIntegration:
             print(f"  الزاوية: {model['angle_degrees']:.2f}°")
             print(f"  النوع: {model['prime_type']}")
         
-        # تحليل إحصائي
-        ratios = [r['frequency_ratio'] for r in results]
-        angles_4k1 = [r['angle_degrees'] for r in results if r['prime_type'] == '4k+1']
-        angles_4k3 = [r['angle_degrees'] for r in results if r['prime_type'] == '4k+3']
+        # تحليل إحصائي على كل الأعداد بالمدرجات المتدفقة
+        if limit is None:
+            distribution = angle_histograms(primes)
+        else:
+            distribution = angle_distribution(limit, workers=workers)
+        # النسبة (p/π) / (√p/(2πφ)) = 2φ·√p، فعزومها من عزوم |z| = √p
+        scale = 2 * self.GOLDEN_RATIO
+        angles = distribution['classes']
         
-        print(f"\n📊 التحليل الإحصائي:")
-        print(f"  متوسط النسبة (ترددنا/التردد الذهبي): {np.mean(ratios):.4f}")
-        print(f"  الانحراف المعياري للنسبة: {np.std(ratios):.4f}")
-        print(f"  متوسط زوايا 4k+1: {np.mean(angles_4k1):.2f}°")
-        print(f"  متوسط زوايا 4k+3: {np.mean(angles_4k3):.2f}°")
+        print(f"\n📊 التحليل الإحصائي ({distribution['prime_count']:,} عدد):")
+        print(f"  متوسط النسبة (ترددنا/التردد الذهبي): {scale * distribution['radius'].mean:.4f}")
+        print(f"  الانحراف المعياري للنسبة: {scale * distribution['radius'].std:.4f}")
+        print(f"  متوسط زوايا 4k+1: {angles['4k+1'].moments.mean:.2f}°")
+        print(f"  متوسط زوايا 4k+3: {angles['4k+3'].moments.mean:.2f}°")
         
         return results
     
@@ -132,26 +160,47 @@ class GoldenRatioIntegration:
             'beta': beta
         }
     
-    def analyze_45_degree_phenomenon(self):
-        """تحليل ظاهرة الزاوية 45° للأعداد 4k+3"""
+    def analyze_45_degree_phenomenon(self, primes=None, detail=None, limit=None, workers=0):
+        """
+        تحليل ظاهرة الزاوية 45° للأعداد 4k+3
+        
+        Args:
+            primes: الأعداد الأولية (افتراضياً self.primes)، تُعالج دفعة دفعة
+            detail: عدد أعداد 4k+3 التي تُطبع وتُعاد (None = الكل)
+            limit: إن حُدد يشمل الثبات كل الأعداد الأولية الأصغر منه
+                (angle_distribution مقطعاً مقطعاً)
+            workers: عمليات angle_distribution (0 = في نفس العملية)
+        """
         
         print("\n🔍 تحليل ظاهرة الزاوية 45°:")
         print("=" * 40)
         
+        if primes is None:
+            primes = self.primes
+        
         angles_4k3 = []
         primes_4k3 = []
         
-        for p in self.primes:
-            if p % 4 == 3:
-                model = self.golden_resonance_model(p)
-                angles_4k3.append(model['angle_degrees'])
+        for start in range(0, len(primes), CHUNK_SIZE):
+            if detail is not None and len(primes_4k3) >= detail:
+                break
+            chunk = np.asarray(primes[start:start + CHUNK_SIZE], dtype=np.int64)
+            chunk = chunk[chunk % 4 == 3]
+            shown = len(chunk) if detail is None else min(len(chunk), detail - len(primes_4k3))
+            for p, angle in zip(chunk[:shown].tolist(), prime_angles(chunk[:shown]).tolist()):
+                angles_4k3.append(angle)
                 primes_4k3.append(p)
                 
-                print(f"العدد {p}: زاوية {model['angle_degrees']:.2f}°")
+                print(f"العدد {p}: زاوية {angle:.2f}°")
         
-        # التحقق من الثبات
-        angle_std = np.std(angles_4k3)
-        print(f"\nالانحراف المعياري للزوايا 4k+3: {angle_std:.6f}°")
+        # التحقق من الثبات على كل الأعداد بالمدرج المتدفق
+        if limit is None:
+            distribution = angle_histograms(primes)
+        else:
+            distribution = angle_distribution(limit, workers=workers)
+        histogram = distribution['classes']['4k+3']
+        angle_std = histogram.moments.std
+        print(f"\nالانحراف المعياري للزوايا 4k+3 ({histogram.total:,} عدد): {angle_std:.6f}°")
         
         if angle_std < 0.1:
             print("✅ تأكيد: جميع الأعداد 4k+3 لها زاوية ثابتة 45°!")
@@ -167,7 +216,55 @@ class GoldenRatioIntegration:
             'primes_4k3': primes_4k3,
             'angles': angles_4k3,
             'angle_std': angle_std,
-            'is_constant': angle_std < 0.1
+            'is_constant': angle_std < 0.1,
+            'histogram': histogram
+        }
+    
+    def analyze_prime_race(self, primes=None, limit=None, workers=0, zeros=3):
+        """
+        سباق الأعداد 4k+1 ضد 4k+3: π(x;4,1) − π(x;4,3) ومواقع تغير المتصدر
+        
+        Args:
+            primes: الأعداد الأولية مرتبة (افتراضياً self.primes)، تُعالج دفعة دفعة
+            limit: إن حُدد يشمل السباق كل الأعداد الأولية الأصغر منه
+                (prime_race مقطعاً مقطعاً)
+            workers: عمليات prime_race (0 = في نفس العملية)
+            zeros: عدد أصفار L(s, χ₄) الأدنى التي تُطبع
+        """
+        from prime_race import RaceCounter, prime_race
+        from dirichlet_l import chi4_zeros
+        
+        print("\n🏁 سباق الأعداد 4k+1 ضد 4k+3:")
+        print("=" * 40)
+        
+        if limit is None:
+            primes = self.primes if primes is None else primes
+            race = RaceCounter()
+            for start in range(0, len(primes), CHUNK_SIZE):
+                race.add(primes[start:start + CHUNK_SIZE])
+        else:
+            race = prime_race(limit, workers=workers)
+        
+        print(f"π(x;4,1) = {race.count_1:,} | π(x;4,3) = {race.count_3:,} | Δ = {race.lead:+,}")
+        print(f"4k+1 في المقدمة عند {race.leading / max(race.primes, 1):.4%} من الأعداد الأولية")
+        print(f"تغيرات المتصدر: {len(race.crossings):,}")
+        for x, sign in race.crossings[:5]:
+            print(f"  x = {x:,}: {'4k+1' if sign > 0 else '4k+3'} يتقدم")
+        
+        # أدنى أصفار L(s, χ₄) تحدد شكل التذبذب؛ أولها ≈ 6.02 يرجّح 4k+3
+        t_max = 10.0
+        low_zeros = chi4_zeros(t_max)
+        while len(low_zeros) < zeros:
+            t_max *= 2
+            low_zeros = chi4_zeros(t_max)
+        low_zeros = low_zeros[:zeros]
+        print(f"\n🔗 أدنى أصفار L(½ + iγ, χ₄): {', '.join(f'{gamma:.6f}' for gamma in low_zeros)}")
+        
+        return {
+            'race': race,
+            'lead': race.lead,
+            'crossings': race.crossings,
+            'l_zeros': low_zeros
         }
     
     def enhanced_prediction_algorithm(self):
@@ -347,6 +444,9 @@ def main():
     # تحليل ظاهرة الزاوية 45°
     angle_analysis = analyzer.analyze_45_degree_phenomenon()
     
+    # سباق 4k+1 ضد 4k+3
+    race_analysis = analyzer.analyze_prime_race(limit=10**7)
+    
     # الخوارزمية المحسنة للتنبؤ
     enhanced_prediction = analyzer.enhanced_prediction_algorithm()
     
@@ -363,6 +463,7 @@ def main():
     return {
         'frequency_analysis': frequency_results,
         'angle_analysis': angle_analysis,
+        'race_analysis': race_analysis,
         'enhanced_prediction': enhanced_prediction
     }
 
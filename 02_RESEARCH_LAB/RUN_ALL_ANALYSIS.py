@@ -6,12 +6,243 @@ Complete Analysis Runner for Basil Yahya Abdullah Prime Research Project
 
 import os
 import sys
-import subprocess
+import math
+import argparse
 from pathlib import Path
-import time
+import numpy as np
 
-def run_analysis_suite():
-    """تشغيل جميع تحليلات المشروع بالتسلسل"""
+from analysis_dag import AnalysisDAG, print_run_report
+from instrumentation import metrics
+from prime_sieve import sieve_primes
+
+PROJECT_ROOT = Path(__file__).parent
+
+# مجلدات التحليل التي تستورد من بعضها (predictive_laws يُستورد من عدة مجلدات)
+ANALYSIS_FOLDERS = [
+    '01_CORE_ALGORITHMS',
+    '02_ADVANCED_ANALYSIS',
+    '03_ERROR_CORRECTION',
+    '06_GOLDEN_RATIO_INTEGRATION'
+]
+
+# أحجام البيانات المشتركة
+PRIME_LIMIT = 1000   # تحليل أنماط الخطأ يحتاج الأعداد الأولية حتى 1000
+ZERO_COUNT = 10      # أكبر قائمة أصفار تستخدمها التحليلات
+
+def _init_worker(paths):
+    """تهيئة العامل: مسارات الاستيراد وواجهة رسم بدون شاشة"""
+    for path in paths:
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+    os.environ['MPLBACKEND'] = 'Agg'
+    import matplotlib
+    matplotlib.use('Agg')
+
+# ===== البيانات المشتركة (تُحسب مرة واحدة) =====
+
+def build_prime_table():
+    """جدول الأعداد الأولية المشترك"""
+    return sieve_primes(PRIME_LIMIT)
+
+def build_prime_gaps(prime_table):
+    """مصفوفة الفجوات بين الأعداد الأولية المتتالية"""
+    return np.diff(prime_table)
+
+def build_zero_table():
+    """جدول أصفار زيتا المشترك (بدقة القوائم المستخدمة في التحليلات)"""
+    import mpmath
+    return [round(float(mpmath.zetazero(n).imag), 6) for n in range(1, ZERO_COUNT + 1)]
+
+def build_circuit_batch(prime_table):
+    """
+    دفعة الدوائر لكل الأعداد الأولية دفعة واحدة
+    R = √p, L = 1/(4p^(3/2)), C = 1/√p عند ω = 2p
+    """
+    p = prime_table.astype(float)
+    omega = 2 * p
+    R = np.sqrt(p)
+    L = 1 / (4 * p**1.5)
+    C = 1 / np.sqrt(p)
+    X = omega * L - 1 / (omega * C)
+
+    return {
+        'prime': prime_table,
+        'R': R, 'L': L, 'C': C,
+        'f': p / math.pi,
+        'reactance': X,
+        'Z_magnitude': np.hypot(R, X),
+        'Z_phase': np.arctan2(X, R)
+    }
+
+# ===== التحليلات =====
+
+def run_predictive_laws(prime_table, prime_gaps, zero_table, circuit_batch):
+    """القوانين التنبؤية الأساسية f = p/π"""
+    from predictive_laws import PredictiveLaws
+
+    laws = PredictiveLaws()
+    laws.known_primes = prime_table[:len(laws.known_primes)].tolist()
+    laws.known_zeta_zeros = zero_table[:len(laws.known_zeta_zeros)]
+
+    validation = laws.validate_laws()
+    prime_prediction = laws.unified_prediction_law('prime')
+    zeta_prediction = laws.unified_prediction_law('zeta')
+
+    count = len(laws.known_primes)
+    return {
+        'frequency_law_deviation': validation['frequency_law_deviation'],
+        'next_prime': prime_prediction['unified_prediction'],
+        'next_zeta_zero': zeta_prediction['predicted_zero'] if zeta_prediction else None,
+        'mean_impedance': float(np.mean(circuit_batch['Z_magnitude'][:count])),
+        'mean_gap': float(np.mean(prime_gaps[:count - 1]))
+    }
+
+def run_advanced_algorithms(prime_table, zero_table):
+    """الخوارزميات المتقدمة والشبكة العصبية"""
+    from advanced_predictive_algorithms import AdvancedPredictiveAlgorithms
+
+    algo = AdvancedPredictiveAlgorithms()
+    algo.known_primes = prime_table[:len(algo.known_primes)].tolist()
+    algo.extended_primes = prime_table[:len(algo.extended_primes)].tolist()
+    algo.known_zeta_zeros = zero_table[:len(algo.known_zeta_zeros)]
+    algo.extended_zeta_zeros = zero_table[:len(algo.extended_zeta_zeros)]
+
+    ensemble = algo.comprehensive_prediction_ensemble()
+    if not ensemble:
+        raise RuntimeError("Ensemble produced no prediction")
+
+    return {
+        'ensemble_prediction': int(ensemble['ensemble_prediction']),
+        'confidence': ensemble['confidence']
+    }
+
+def run_error_patterns(prime_table):
+    """تحليل أنماط الخطأ على 120 نقطة بيانات"""
+    from error_pattern_analysis import ErrorPatternAnalysis
+
+    analyzer = ErrorPatternAnalysis()
+    analyzer.test_primes = prime_table.tolist()
+
+    error_data = analyzer.comprehensive_error_analysis(max_test_primes=50)
+    analyzer.analyze_error_patterns()
+    best_fits = analyzer.fit_error_functions()
+    analyzer.create_error_visualizations()
+    analyzer.physical_interpretation_analysis()
+
+    # معاملات تصحيح الطريقة الترددية من النموذج المتجدد: error = a × prime + b
+    correction_model = analyzer.create_error_correction_model()
+    a, b = correction_model['correction_coefficients']
+
+    return {
+        'data_points': len(error_data),
+        'best_fits': {method: (fit[0], float(fit[1]['r_squared']))
+                      for method, fit in best_fits.items()},
+        'correction_coefficients': [float(a), float(b)]
+    }
+
+def run_enhanced_correction(error_patterns):
+    """نموذج التصحيح المحسن بمعاملات تحليل أنماط الخطأ"""
+    from enhanced_error_correction import EnhancedErrorCorrection
+
+    corrector = EnhancedErrorCorrection()
+    corrector.error_correction_coeffs = error_patterns['correction_coefficients']
+
+    test_results = corrector.test_enhanced_model()
+    corrector.create_correction_visualization(test_results)
+    next_prediction = corrector.predict_next_prime_after_113()
+
+    return {
+        'average_improvement': float(np.mean([r['improvement_percent'] for r in test_results])),
+        'next_prediction': float(next_prediction['corrected_prediction'])
+    }
+
+def run_golden_ratio(prime_table):
+    """تحليل دمج النسبة الذهبية"""
+    from golden_ratio_integration_analysis import GoldenRatioIntegration
+
+    analyzer = GoldenRatioIntegration()
+    analyzer.primes = prime_table[prime_table < 100].tolist()
+    analyzer.basic_laws.known_primes = analyzer.primes
+
+    analyzer.compare_frequency_models()
+    angle_analysis = analyzer.analyze_45_degree_phenomenon()
+    enhanced_prediction = analyzer.enhanced_prediction_algorithm()
+    analyzer.create_comprehensive_visualization()
+
+    return {
+        'final_prediction': int(enhanced_prediction['final_prediction']),
+        'confidence': enhanced_prediction['confidence'],
+        'angles_constant': bool(angle_analysis['is_constant'])
+    }
+
+def run_final_analysis(prime_table, zero_table, advanced_algorithms):
+    """التصورات البيانية النهائية بنتيجة الخوارزميات المتقدمة"""
+    from final_analysis_and_visualization import FinalAnalysisAndVisualization
+
+    final_analysis = FinalAnalysisAndVisualization()
+    known_primes = prime_table[:len(final_analysis.results['known_primes'])].tolist()
+    final_analysis.results['known_primes'] = known_primes
+    final_analysis.results['predicted_next_prime'] = advanced_algorithms['ensemble_prediction']
+    for laws in (final_analysis.basic_laws, final_analysis.advanced_algo):
+        laws.known_primes = prime_table[:len(laws.known_primes)].tolist()
+        laws.known_zeta_zeros = zero_table[:len(laws.known_zeta_zeros)]
+    final_analysis.advanced_algo.extended_primes = known_primes
+    final_analysis.advanced_algo.extended_zeta_zeros = zero_table
+
+    final_analysis.create_comprehensive_visualization()
+    final_analysis.generate_prediction_report()
+    final_prediction = final_analysis.validate_final_prediction()
+
+    return {
+        'final_prediction': int(final_prediction),
+        'confidence': final_analysis.results['confidence']
+    }
+
+def build_analysis_dag(timeout=120):
+    """بناء رسم الاعتماديات: البيانات المشتركة ثم التحليلات"""
+
+    dag = AnalysisDAG()
+
+    # المصفوفات تُنشر في الذاكرة المشتركة (shared=True) ويرتبط بها العمال دون نسخ
+    dag.add_artifact('prime_table', build_prime_table, shared=True,
+                     description=f'جدول الأعداد الأولية < {PRIME_LIMIT}')
+    dag.add_artifact('prime_gaps', build_prime_gaps, ['prime_table'], shared=True,
+                     description='الفجوات بين الأعداد الأولية المتتالية')
+    dag.add_artifact('zero_table', build_zero_table,
+                     description=f'أول {ZERO_COUNT} أصفار لدالة زيتا')
+    dag.add_artifact('circuit_batch', build_circuit_batch, ['prime_table'], shared=True,
+                     description='معاملات الدائرة R, L, C, Z لكل الأعداد الأولية')
+
+    def folder(name):
+        return str(PROJECT_ROOT / name)
+
+    dag.add_analysis('predictive_laws', run_predictive_laws,
+                     ['prime_table', 'prime_gaps', 'zero_table', 'circuit_batch'],
+                     cwd=folder('01_CORE_ALGORITHMS'), timeout=timeout,
+                     description='🎵 القوانين الأساسية f = p/π')
+    dag.add_analysis('advanced_algorithms', run_advanced_algorithms,
+                     ['prime_table', 'zero_table'],
+                     cwd=folder('02_ADVANCED_ANALYSIS'), timeout=timeout,
+                     description='🧮 الخوارزميات المتقدمة والشبكة العصبية')
+    dag.add_analysis('error_patterns', run_error_patterns, ['prime_table'],
+                     cwd=folder('03_ERROR_CORRECTION'), timeout=timeout,
+                     description='🔍 تحليل أنماط الخطأ')
+    dag.add_analysis('enhanced_correction', run_enhanced_correction, ['error_patterns'],
+                     cwd=folder('03_ERROR_CORRECTION'), timeout=timeout,
+                     description='🔧 نموذج التصحيح المحسن')
+    dag.add_analysis('golden_ratio', run_golden_ratio, ['prime_table'],
+                     cwd=folder('06_GOLDEN_RATIO_INTEGRATION'), timeout=timeout,
+                     description='🌟 دمج النسبة الذهبية')
+    dag.add_analysis('final_analysis', run_final_analysis,
+                     ['prime_table', 'zero_table', 'advanced_algorithms'],
+                     cwd=folder('02_ADVANCED_ANALYSIS'), timeout=timeout,
+                     description='📊 التحليل النهائي والتصور')
+
+    return dag
+
+def run_analysis_suite(max_workers=None, timeout=120, verbose=False):
+    """تشغيل جميع تحليلات المشروع بالتوازي حسب رسم الاعتماديات"""
     
     print("🚀 مشروع باسل يحيى عبدالله للأعداد الأولية")
     print("=" * 60)
@@ -20,161 +251,59 @@ def run_analysis_suite():
     print("🎯 الموضوع: القوانين التنبؤية للأعداد الأولية وأصفار زيتا")
     print("=" * 60)
     
-    # المسار الرئيسي للمشروع
-    project_root = Path(__file__).parent
-    
-    # قائمة التحليلات للتشغيل
-    analyses = [
-        {
-            'name': '🎵 القوانين الأساسية',
-            'folder': '01_CORE_ALGORITHMS',
-            'script': 'predictive_laws.py',
-            'description': 'تشغيل القوانين التنبؤية الأساسية f = p/π'
-        },
-        {
-            'name': '🧮 الخوارزميات المتقدمة', 
-            'folder': '02_ADVANCED_ANALYSIS',
-            'script': 'advanced_predictive_algorithms.py',
-            'description': 'تشغيل الخوارزميات المتقدمة والشبكة العصبية'
-        },
-        {
-            'name': '🔍 تحليل أنماط الخطأ',
-            'folder': '03_ERROR_CORRECTION', 
-            'script': 'error_pattern_analysis.py',
-            'description': 'تحليل شامل لأنماط الخطأ على 120 نقطة بيانات'
-        },
-        {
-            'name': '🔧 نموذج التصحيح المحسن',
-            'folder': '03_ERROR_CORRECTION',
-            'script': 'enhanced_error_correction.py', 
-            'description': 'تطبيق نموذج تصحيح الخطأ بتحسن 82.4%'
-        },
-        {
-            'name': '🌟 دمج النسبة الذهبية',
-            'folder': '06_GOLDEN_RATIO_INTEGRATION',
-            'script': 'golden_ratio_integration_analysis.py',
-            'description': 'تحليل دمج النسبة الذهبية مع قوانيننا'
-        },
-        {
-            'name': '📊 التحليل النهائي والتصور',
-            'folder': '02_ADVANCED_ANALYSIS', 
-            'script': 'final_analysis_and_visualization.py',
-            'description': 'إنشاء التصورات البيانية النهائية'
-        }
-    ]
-    
-    results = []
+    dag = build_analysis_dag(timeout)
+    analyses = [dag.nodes[name] for name in dag.order if dag.nodes[name]['kind'] == 'analysis']
     
     print(f"\n🎯 سيتم تشغيل {len(analyses)} تحليل:")
     for i, analysis in enumerate(analyses, 1):
-        print(f"   {i}. {analysis['name']}")
+        inputs = ', '.join(analysis['inputs'])
+        print(f"   {i}. {analysis['description']} ← [{inputs}]")
     
     print(f"\n" + "="*60)
     
-    # تشغيل كل تحليل
-    for i, analysis in enumerate(analyses, 1):
-        print(f"\n🔄 [{i}/{len(analyses)}] {analysis['name']}")
-        print(f"📝 {analysis['description']}")
-        print("-" * 50)
-        
-        # تغيير المجلد
-        analysis_dir = project_root / analysis['folder']
-        script_path = analysis_dir / analysis['script']
-        
-        if not script_path.exists():
-            print(f"❌ الملف غير موجود: {script_path}")
-            results.append({
-                'name': analysis['name'],
-                'status': 'failed',
-                'error': 'File not found'
-            })
-            continue
-        
-        try:
-            # تشغيل السكريبت
-            start_time = time.time()
-            
-            result = subprocess.run(
-                [sys.executable, analysis['script']], 
-                cwd=analysis_dir,
-                capture_output=True,
-                text=True,
-                timeout=120  # مهلة زمنية 2 دقيقة
-            )
-            
-            end_time = time.time()
-            duration = end_time - start_time
-            
-            if result.returncode == 0:
-                print(f"✅ تم بنجاح في {duration:.1f} ثانية")
-                results.append({
-                    'name': analysis['name'],
-                    'status': 'success', 
-                    'duration': duration
-                })
-            else:
-                print(f"❌ فشل التشغيل")
-                print(f"خطأ: {result.stderr[:200]}...")
-                results.append({
-                    'name': analysis['name'],
-                    'status': 'failed',
-                    'error': result.stderr[:200]
-                })
-                
-        except subprocess.TimeoutExpired:
-            print(f"⏰ انتهت المهلة الزمنية (120 ثانية)")
-            results.append({
-                'name': analysis['name'],
-                'status': 'timeout',
-                'error': 'Timeout after 120 seconds'
-            })
-            
-        except Exception as e:
-            print(f"❌ خطأ غير متوقع: {e}")
-            results.append({
-                'name': analysis['name'],
-                'status': 'error',
-                'error': str(e)
-            })
+    def progress(name, record):
+        icon = {'success': '✅', 'timeout': '⏰'}.get(record['status'], '❌')
+        print(f"{icon} {name} ({record['kind']}): {record['status']} في {record['duration']:.1f} ثانية")
+        if record['status'] != 'success':
+            print(f"   خطأ: {str(record.get('error'))[-200:]}")
+        if verbose and record.get('output'):
+            print(record['output'])
+    
+    paths = [str(PROJECT_ROOT)] + [str(PROJECT_ROOT / f) for f in ANALYSIS_FOLDERS]
+    report = dag.run(max_workers=max_workers, initializer=_init_worker,
+                     initargs=(paths,), progress=progress)
     
     # تقرير النتائج النهائية
     print(f"\n" + "="*60)
     print(f"📊 تقرير النتائج النهائية:")
     print("=" * 60)
     
-    successful = [r for r in results if r['status'] == 'success']
-    failed = [r for r in results if r['status'] != 'success']
+    tasks = report['tasks']
+    successful = [n for n in tasks if tasks[n]['status'] == 'success']
+    failed = [n for n in tasks if tasks[n]['status'] != 'success']
     
-    print(f"✅ نجح: {len(successful)}/{len(results)} تحليل")
-    print(f"❌ فشل: {len(failed)}/{len(results)} تحليل")
-    
-    if successful:
-        print(f"\n🎉 التحليلات الناجحة:")
-        for result in successful:
-            duration = result.get('duration', 0)
-            print(f"   ✅ {result['name']} ({duration:.1f}s)")
+    print(f"✅ نجح: {len(successful)}/{len(tasks)} مهمة")
+    print(f"❌ فشل: {len(failed)}/{len(tasks)} مهمة")
     
     if failed:
-        print(f"\n⚠️ التحليلات الفاشلة:")
-        for result in failed:
-            print(f"   ❌ {result['name']}: {result.get('error', 'Unknown error')}")
+        print(f"\n⚠️ المهام الفاشلة:")
+        for name in failed:
+            print(f"   ❌ {name}: {tasks[name]['status']}")
+    
+    print_run_report(dag, report)
     
     # معلومات المخرجات
     print(f"\n📁 المخرجات المتوقعة:")
-    print(f"   📊 الرسوم البيانية: 04_VISUALIZATIONS/")
+    print(f"   📊 الرسوم البيانية: في مجلدات التحليل")
     print(f"   📋 التقارير: 05_REPORTS/")
-    print(f"   🔍 ملفات البيانات: في مجلدات التحليل")
     
-    total_time = sum(r.get('duration', 0) for r in successful)
-    print(f"\n⏱️ إجمالي وقت التشغيل: {total_time:.1f} ثانية")
-    
-    if len(successful) == len(results):
+    if not failed:
         print(f"\n🏆 تم تشغيل جميع التحليلات بنجاح!")
         print(f"🎯 مشروع باسل يحيى عبدالله للأعداد الأولية جاهز للاستخدام!")
     else:
         print(f"\n⚠️ بعض التحليلات لم تكتمل. راجع الأخطاء أعلاه.")
     
-    return results
+    return report
 
 def show_project_summary():
     """عرض ملخص المشروع"""
@@ -219,12 +348,44 @@ def show_project_summary():
     print(f"   ويفتح آفاق جديدة في الرياضيات والفيزياء والحوسبة الكمية")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Basil Prime Research analysis runner")
+    parser.add_argument('--headless', action='store_true',
+                        help='run the full analysis suite without the interactive menu')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='number of worker processes (default: CPU count)')
+    parser.add_argument('--timeout', type=float, default=120,
+                        help='per-analysis timeout in seconds')
+    parser.add_argument('--verbose', action='store_true',
+                        help='print each analysis output as it finishes')
+    parser.add_argument('--profile', nargs='?', const='-', default=None, metavar='PATH',
+                        help='collect per-stage timers and counters; print them, and '
+                             'save to PATH (.json, or .prom for Prometheus text) if given')
+    args = parser.parse_args()
+    
+    def dump_profile():
+        if args.profile is None:
+            return
+        metrics.print_report()
+        if args.profile != '-':
+            metrics.dump(args.profile)
+            print(f"⏱️ تم حفظ ملف الأداء: {args.profile}")
+    
+    if args.profile is not None:
+        metrics.enable()
+    
+    if args.headless:
+        report = run_analysis_suite(args.workers, args.timeout, args.verbose)
+        dump_profile()
+        failed = any(r['status'] != 'success' for r in report['tasks'].values())
+        sys.exit(1 if failed else 0)
+    
     print("🎯 مرحباً بك في مشروع باسل يحيى عبدالله للأعداد الأولية!")
     
     choice = input("\nاختر العملية:\n1. تشغيل جميع التحليلات\n2. عرض ملخص المشروع\n3. الخروج\n\nاختيارك (1-3): ")
     
     if choice == "1":
-        results = run_analysis_suite()
+        results = run_analysis_suite(args.workers, args.timeout, args.verbose)
+        dump_profile()
     elif choice == "2":
         show_project_summary()
     elif choice == "3":
@@ -15,6 +15,9 @@ from scipy.optimize import fsolve
 import warnings
 warnings.filterwarnings('ignore')
 
+from circuit_kernels import corrected_circuit_parameters
+from instrumentation import metrics
+
 class CorrectedAdvancedAlgorithms:
     """الخوارزميات المتقدمة المصححة بالفيزياء الأساسية الصحيحة"""
     
@@ -25,54 +28,7 @@ class CorrectedAdvancedAlgorithms:
         
     def corrected_circuit_parameters(self, prime: int, L: float = 1e-3, C: float = 1e-6, t: float = 1.0) -> Dict:
         """حساب معاملات الدائرة بالفيزياء الصحيحة"""
-        
-        # التردد والتردد الزاوي
-        frequency = prime / self.pi
-        omega = 2 * self.pi * frequency
-        
-        # المقاومة (جذر العدد الأولي)
-        R = np.sqrt(prime)
-        
-        # المعاوقات
-        X_L = omega * L
-        X_C = 1 / (omega * C)
-        Z_magnitude = np.sqrt(R**2 + (X_L - X_C)**2)
-        
-        # الشحنة كدالة متذبذبة (الفيزياء الصحيحة)
-        Q_amplitude = prime / (self.pi * Z_magnitude)
-        Q_t = Q_amplitude * np.cos(omega * t)
-        
-        # التيار التفاضلي الصحيح: i = dQ/dt
-        current_instantaneous = -omega * Q_amplitude * np.sin(omega * t)
-        current_rms = omega * Q_amplitude / np.sqrt(2)
-        
-        # الطاقة الصحيحة
-        energy_L = 0.5 * L * current_instantaneous**2
-        energy_C = 0.5 * Q_t**2 / C
-        total_energy = energy_L + energy_C
-        
-        # المتوسط الزمني للطاقة
-        energy_L_avg = 0.5 * L * (omega * Q_amplitude)**2 / 2
-        energy_C_avg = 0.5 * Q_amplitude**2 / (2 * C)
-        total_energy_avg = energy_L_avg + energy_C_avg
-        
-        return {
-            'prime': prime,
-            'frequency': frequency,
-            'omega': omega,
-            'resistance': R,
-            'impedance_magnitude': Z_magnitude,
-            'charge_amplitude': Q_amplitude,
-            'charge_instantaneous': Q_t,
-            'current_instantaneous': current_instantaneous,
-            'current_rms': current_rms,
-            'energy_instantaneous': total_energy,
-            'energy_average': total_energy_avg,
-            'L': L,
-            'C': C,
-            'X_L': X_L,
-            'X_C': X_C
-        }
+        return corrected_circuit_parameters(prime, L, C, t)
     
     def corrected_prime_predictor(self, known_primes: List[int], target_range: Tuple[int, int]) -> List[Dict]:
         """خوارزمية التنبؤ بالأعداد الأولية المصححة"""
@@ -204,21 +160,55 @@ class CorrectedAdvancedAlgorithms:
             'method': 'corrected_physics'
         }
     
-    def corrected_large_prime_search(self, start: int, search_range: int, target_count: int = 5) -> List[Dict]:
-        """البحث عن الأعداد الأولية الكبيرة بالمعادلات المصححة"""
+    @metrics.timed('corrected_large_prime_search.total')
+    def corrected_large_prime_search(self, start: int, search_range: int, target_count: int = 5,
+                                     checkpoint=None) -> List[Dict]:
+        """
+        البحث عن الأعداد الأولية الكبيرة بالمعادلات المصححة
+
+        Args:
+            checkpoint: ScanCheckpoint اختياري - يحفظ الموضع والعدادات دورياً
+                        ويستأنف من آخر نقطة حفظ
+        """
         
         large_primes = []
         candidates_tested = 0
-        
-        for candidate in range(start, start + search_range, 2):  # فقط الأعداد الفردية
+        quick_tests = 0
+        quick_passed = 0
+        full_checks = 0
+        stop = start + search_range
+        first = start
+        
+        if checkpoint is not None:
+            first = checkpoint.begin('corrected_large_prime_search',
+                                     {'start': start, 'search_range': search_range,
+                                      'target_count': target_count}, start)
+            large_primes = list(checkpoint.rows)
+            candidates_tested = checkpoint.counters.get('candidates_tested', 0)
+            quick_tests = checkpoint.counters.get('quick_tests', 0)
+            quick_passed = checkpoint.counters.get('quick_passed', 0)
+            full_checks = checkpoint.counters.get('full_checks', 0)
+        
+        next_candidate = first
+        for candidate in range(first, stop, 2):  # فقط الأعداد الفردية
+            next_candidate = candidate
+            if checkpoint is not None:
+                # كل ما قبل candidate تمت معالجته
+                checkpoint.counters.update(candidates_tested=candidates_tested,
+                                           quick_tests=quick_tests, quick_passed=quick_passed,
+                                           full_checks=full_checks)
+                checkpoint.step(candidate)
+            
             candidates_tested += 1
             
             if len(large_primes) >= target_count:
                 break
             
             # اختبار أولي سريع
+            quick_tests += 1
             if not self._quick_primality_test(candidate):
                 continue
+            quick_passed += 1
             
             # حساب معاملات الدائرة
             circuit_params = self.corrected_circuit_parameters(candidate)
@@ -228,6 +218,7 @@ class CorrectedAdvancedAlgorithms:
             
             # اختبار الأولية المتقدم إذا كان المؤشر عالي
             if primality_score > 0.7:
+                full_checks += 1
                 if self._is_prime(candidate):
                     large_primes.append({
                         'prime': candidate,
@@ -238,7 +229,23 @@ class CorrectedAdvancedAlgorithms:
                         'candidates_tested': candidates_tested,
                         'method': 'corrected_physics'
                     })
-        
+                    if checkpoint is not None:
+                        checkpoint.add_row(large_primes[-1])
+                        checkpoint.stats('primality_score').update(primality_score)
+        else:
+            next_candidate = stop
+        
+        if checkpoint is not None:
+            checkpoint.counters.update(candidates_tested=candidates_tested,
+                                       quick_tests=quick_tests, quick_passed=quick_passed,
+                                       full_checks=full_checks)
+            checkpoint.finish(next_candidate)
+        
+        # العدادات تُسجل مرة واحدة بعد الحلقة
+        metrics.count('corrected_large_prime_search.candidates_tested', quick_tests)
+        metrics.count('corrected_large_prime_search.quick_test_passed', quick_passed)
+        metrics.count('corrected_large_prime_search.primes_found', len(large_primes))
+        metrics.count('primality.calls', quick_tests + full_checks)
         return large_primes
     
     # الدوال المساعدة
@@ -8,7 +8,8 @@ Advanced Large Prime Number Predictor
 import numpy as np
 import matplotlib.pyplot as plt
 from corrected_prime_simulator import CorrectedPrimeCircuit
-from sympy import isprime, nextprime, prevprime, primerange
+from sympy import nextprime, prevprime, primerange
+from numeric_backend import integer_backend
 import pandas as pd
 from scipy.optimize import minimize_scalar
 import time
@@ -52,19 +53,37 @@ class AdvancedPrimePredictor(CorrectedPrimeCircuit):
             
         return predicted_next
     
-    def analyze_large_primes(self, start_prime=101, end_prime=200, step=5):
-        """تحليل الأعداد الأولية الكبيرة"""
+    def analyze_large_primes(self, start_prime=101, end_prime=200, step=5, checkpoint=None):
+        """
+        تحليل الأعداد الأولية الكبيرة
+
+        Args:
+            checkpoint: ScanCheckpoint اختياري للحفظ الدوري والاستئناف
+        """
         
         print(f"🔍 تحليل الأعداد الأولية من {start_prime} إلى {end_prime}")
         print("=" * 60)
         
         results = []
-        test_primes = list(primerange(start_prime, end_prime))
+        test_primes = list(primerange(start_prime, end_prime))[::step]  # كل خامس عدد أولي
+        first = 0
+        
+        if checkpoint is not None:
+            first = checkpoint.begin('analyze_large_primes',
+                                     {'start_prime': start_prime, 'end_prime': end_prime,
+                                      'step': step}, 0)
+            results = list(checkpoint.rows)
+            if checkpoint.resumed:
+                print(f"♻️ استئناف من العنصر {first}/{len(test_primes)} ({len(results)} نتيجة محفوظة)")
         
         print("Prime | Predicted | Actual Next | Error | Accuracy")
         print("-" * 55)
         
-        for prime in test_primes[::step]:  # كل خامس عدد أولي
+        for i in range(first, len(test_primes)):
+            prime = test_primes[i]
+            if checkpoint is not None:
+                checkpoint.step(i)
+            
             predicted = self.predict_next_prime(prime)
             actual_next = nextprime(prime)
             
@@ -81,6 +100,13 @@ class AdvancedPrimePredictor(CorrectedPrimeCircuit):
                     'error': error,
                     'accuracy': accuracy
                 })
+                if checkpoint is not None:
+                    checkpoint.add_row(results[-1])
+                    checkpoint.stats('error').update(error)
+                    checkpoint.stats('accuracy').update(accuracy)
+        
+        if checkpoint is not None:
+            checkpoint.finish(len(test_primes))
         
         return pd.DataFrame(results)
     
@@ -111,18 +137,19 @@ class AdvancedPrimePredictor(CorrectedPrimeCircuit):
         return sequence
     
     def find_closest_prime(self, number):
-        """البحث عن أقرب عدد أولي لرقم معطى"""
+        """البحث عن أقرب عدد أولي لرقم معطى (واجهة الأعداد الصحيحة حسب طوله)"""
         
         number = int(round(number))
+        integers = integer_backend(number.bit_length())
         
         # البحث في النطاق المحيط
         for offset in range(0, 20):
-            if isprime(number + offset):
+            if integers.is_prime(number + offset):
                 return number + offset
-            if offset > 0 and isprime(number - offset):
+            if offset > 0 and integers.is_prime(number - offset):
                 return number - offset
                 
-        return nextprime(number)
+        return integers.next_prime(number)
     
     def validate_predictions(self, test_range=(50, 150), sample_size=20):
         """التحقق من دقة التنبؤات"""
@@ -160,6 +187,29 @@ class AdvancedPrimePredictor(CorrectedPrimeCircuit):
             'sample_size': len(accuracies)
         }
 
+    def validate_predictions_sharded(self, lo, hi, shard_size=1_000_000, workers=None,
+                                     stride=1, hosts=None):
+        """
+        التحقق من دقة التنبؤ على كل الأعداد الأولية في [lo, hi) موزعاً على عمال
+
+        Args:
+            stride: اختبار كل stride عدداً أولياً
+            hosts: عناوين خوادم مقاطع بدلاً من العمليات المحلية
+
+        Returns:
+            {'accuracy': AccuracyCounts, 'predicted_vs_actual': CorrelationMoments, ...}
+        """
+        from range_sharding import PredictionAccuracyTask, run_sharded
+
+        print(f"✅ التحقق الموزع من دقة التنبؤات في [{lo:,}, {hi:,})")
+        result = run_sharded(PredictionAccuracyTask(self, stride=stride), lo, hi,
+                             shard_size, workers=workers, hosts=hosts)
+        accuracy = result['accuracy']
+        print(f"عدد التنبؤات: {accuracy.total:,}")
+        print(f"متوسط الدقة: {accuracy.accuracy:.2f}%")
+        print(f"ضمن {accuracy.tolerance:g}%: {accuracy.within:,}")
+        return result
+
 def plot_large_prime_analysis(results_df):
     """رسم تحليل الأعداد الأولية الكبيرة"""
     
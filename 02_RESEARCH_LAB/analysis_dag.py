@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+منفذ التحليلات كرسم بياني للاعتماديات
+Analysis Dependency-DAG Runner
+باسل يحيى عبدالله - Basil Yahya Abdullah
+
+كل عقدة تعلن مدخلاتها بالاسم:
+- عقد "artifact": بيانات مشتركة (جدول الأعداد الأولية، جدول الأصفار، دفعة الدوائر)
+  تُحسب مرة واحدة داخل العملية الرئيسية، والمصفوفات الكبيرة (shared=True)
+  تُنشر في الذاكرة المشتركة فيرتبط بها العمال دون نسخ
+- عقد "analysis": تحليلات مستقلة تعمل بالتوازي، كل منها في عملية خاصة (حتى
+  max_workers معاً) تُنهى فعلاً عند تجاوز مهلتها
+
+ويُسجل لكل مهمة زمن البدء والانتهاء، ثم يُحسب الزمن الكلي والمسار الحرج
+"""
+
+import io
+import os
+import time
+import traceback
+import multiprocessing
+from contextlib import redirect_stdout
+from multiprocessing.connection import wait
+from typing import Callable, Dict, Optional, Sequence
+
+from instrumentation import metrics
+from shared_arrays import SharedArrayRegistry, resolve_shared
+
+
+def _run_node(func: Callable, kwargs: Dict, cwd: Optional[str],
+              collect_metrics: bool = False) -> Dict:
+    """تنفيذ عقدة واحدة داخل العامل مع التقاط المخرجات والتوقيت"""
+
+    if cwd:
+        os.chdir(cwd)
+
+    if collect_metrics:
+        # قياسات العامل تبدأ من الصفر لكل عقدة وتُعاد مع النتيجة للدمج
+        metrics.enable()
+        metrics.reset()
+
+    buffer = io.StringIO()
+    start = time.time()
+    try:
+        kwargs = resolve_shared(kwargs)
+        with redirect_stdout(buffer):
+            value = func(**kwargs)
+        error = None
+    except Exception:
+        value = None
+        error = traceback.format_exc()
+    end = time.time()
+
+    return {
+        'value': value,
+        'error': error,
+        'output': buffer.getvalue(),
+        'start': start,
+        'end': end,
+        'pid': os.getpid(),
+        'metrics': metrics.snapshot() if collect_metrics else None
+    }
+
+
+def _node_process(conn, initializer: Optional[Callable], initargs: tuple, func: Callable,
+                  kwargs: Dict, cwd: Optional[str], collect_metrics: bool):
+    """عملية العقدة: التهيئة ثم _run_node وإرسال السجل عبر الأنبوب"""
+    try:
+        if initializer is not None:
+            initializer(*initargs)
+        record = _run_node(func, kwargs, cwd, collect_metrics)
+    except Exception:
+        now = time.time()
+        record = {'value': None, 'error': traceback.format_exc(), 'output': '',
+                  'start': now, 'end': now, 'pid': os.getpid(), 'metrics': None}
+    try:
+        conn.send(record)
+    except Exception as e:
+        # نتيجة غير قابلة للنقل
+        record.update(value=None, error=repr(e), metrics=None)
+        conn.send(record)
+    conn.close()
+
+
+def _stop_process(process):
+    """إنهاء عملية عقدة والتأكد من توقفها"""
+    process.terminate()
+    process.join(1.0)
+    if process.is_alive():
+        process.kill()
+        process.join()
+
+
+class AnalysisDAG:
+    """رسم بياني موجه غير دوري للتحليلات وبياناتها المشتركة"""
+
+    def __init__(self):
+        self.nodes = {}
+        self.order = []
+
+    def add_artifact(self, name: str, func: Callable, inputs: Sequence[str] = (),
+                     description: str = '', shared: bool = False):
+        """
+        إضافة بيانات مشتركة تُحسب مرة واحدة في العملية الرئيسية
+
+        Args:
+            shared: نشر مصفوفات النتيجة (مصفوفة أو قاموس مصفوفات) في الذاكرة
+                    المشتركة بدلاً من نقلها بـ pickle لكل مهمة
+        """
+        self._add_node(name, func, inputs, 'artifact', None, None, description)
+        self.nodes[name]['shared'] = shared
+
+    def add_analysis(self, name: str, func: Callable, inputs: Sequence[str] = (),
+                     cwd: str = None, timeout: float = None, description: str = ''):
+        """إضافة تحليل يعمل في عملية خاصة (تُنهى بعد timeout ثانية)"""
+        self._add_node(name, func, inputs, 'analysis', cwd, timeout, description)
+
+    def _add_node(self, name, func, inputs, kind, cwd, timeout, description):
+        if name in self.nodes:
+            raise ValueError(f"Duplicate node: {name}")
+
+        for dep in inputs:
+            if dep not in self.nodes:
+                raise ValueError(f"Node '{name}' depends on unknown node '{dep}'")
+
+        # الإضافة بترتيب الاعتماديات تضمن ترتيباً طوبولوجياً صالحاً
+        self.nodes[name] = {
+            'name': name,
+            'func': func,
+            'inputs': list(inputs),
+            'kind': kind,
+            'cwd': cwd,
+            'timeout': timeout,
+            'description': description
+        }
+        self.order.append(name)
+
+    def run(self, max_workers: int = None, initializer: Callable = None,
+            initargs: tuple = (), progress: Callable = None) -> Dict:
+        """
+        تشغيل الرسم البياني كاملاً
+
+        Args:
+            max_workers: أقصى عدد للتحليلات المتزامنة (افتراضياً عدد المعالجات)
+            initializer: دالة تهيئة عملية كل تحليل (مسارات الاستيراد، واجهة الرسم)
+            initargs: معاملات دالة التهيئة
+            progress: دالة تُستدعى (name, record) عند انتهاء كل عقدة
+
+        Returns:
+            تقرير يحتوي سجلات المهام والزمن الكلي والمسار الحرج
+        """
+        run_start = time.time()
+        values = {}
+        records = {}
+        # ما يُرسل للعمال: مراجع الذاكرة المشتركة بدل المصفوفات المنشورة
+        worker_values = {}
+        registry = SharedArrayRegistry()
+
+        def finish(name, record):
+            records[name] = record
+            worker_metrics = record.pop('metrics', None)
+            if worker_metrics:
+                metrics.merge(worker_metrics)
+            metrics.record_time(f"dag.{name}", record['duration'])
+            if record['status'] == 'success':
+                values[name] = record.pop('value')
+            else:
+                record.pop('value', None)
+            if progress:
+                progress(name, record)
+
+        def blocked(name):
+            return any(records.get(dep, {}).get('status', 'success') != 'success'
+                       for dep in self.nodes[name]['inputs'])
+
+        def ready(name):
+            return (name not in records and name not in running_names and
+                    all(dep in records for dep in self.nodes[name]['inputs']))
+
+        # العقد الجارية: الأنبوب → (الاسم، العملية، وقت البدء)
+        running = {}
+        running_names = set()
+        max_workers = max_workers or os.cpu_count() or 1
+        context = multiprocessing.get_context()
+
+        def finish_analysis(name, record):
+            record['status'] = 'success' if record['error'] is None else 'failed'
+            record['duration'] = record['end'] - record['start']
+            record['kind'] = 'analysis'
+            finish(name, record)
+
+        try:
+            while len(records) < len(self.nodes):
+                for name in self.order:
+                    if not ready(name):
+                        continue
+
+                    node = self.nodes[name]
+                    if blocked(name):
+                        now = time.time()
+                        finish(name, {'status': 'skipped', 'error': 'upstream failure',
+                                      'start': now, 'end': now, 'duration': 0.0,
+                                      'kind': node['kind']})
+                        continue
+
+                    if node['kind'] == 'artifact':
+                        kwargs = {dep: values[dep] for dep in node['inputs']}
+                        record = _run_node(node['func'], kwargs, None)
+                        record['status'] = 'success' if record['error'] is None else 'failed'
+                        record['duration'] = record['end'] - record['start']
+                        record['kind'] = 'artifact'
+                        finish(name, record)
+                        if record['status'] == 'success':
+                            worker_values[name] = (registry.share(name, values[name])
+                                                   if node['shared'] else values[name])
+                    elif len(running) < max_workers:
+                        kwargs = {dep: worker_values.get(dep, values.get(dep))
+                                  for dep in node['inputs']}
+                        receiver, sender = context.Pipe(duplex=False)
+                        process = context.Process(
+                            target=_node_process, name=f"dag-{name}", daemon=True,
+                            args=(sender, initializer, initargs, node['func'], kwargs,
+                                  node['cwd'], metrics.enabled))
+                        process.start()
+                        sender.close()
+                        running[receiver] = (name, process, time.time())
+                        running_names.add(name)
+
+                if not running:
+                    continue
+
+                ready_pipes = wait(list(running), timeout=0.5)
+
+                for receiver in ready_pipes:
+                    name, process, submitted = running.pop(receiver)
+                    running_names.discard(name)
+                    try:
+                        record = receiver.recv()
+                    except EOFError:
+                        # العملية انتهت دون نتيجة (انهيار أو إشارة)
+                        process.join()
+                        record = {'value': None, 'output': '', 'start': submitted, 'end': time.time(),
+                                  'error': f'Worker exited with code {process.exitcode}'}
+                    receiver.close()
+                    process.join()
+                    finish_analysis(name, record)
+
+                # المهلة الزمنية لكل مهمة: العملية تُنهى قبل تسجيل المهلة
+                now = time.time()
+                for receiver, (name, process, submitted) in list(running.items()):
+                    timeout = self.nodes[name]['timeout']
+                    if timeout is not None and now - submitted > timeout:
+                        _stop_process(process)
+                        receiver.close()
+                        running.pop(receiver)
+                        running_names.discard(name)
+                        end = time.time()
+                        finish(name, {'status': 'timeout',
+                                      'error': f'Timeout after {timeout} seconds',
+                                      'start': submitted, 'end': end,
+                                      'duration': end - submitted, 'kind': 'analysis'})
+
+        finally:
+            for receiver, (_, process, _) in running.items():
+                _stop_process(process)
+                receiver.close()
+            shared_bytes = registry.nbytes()
+            registry.close()
+
+        wall_clock = time.time() - run_start
+        critical_path, critical_time = self.critical_path(records)
+
+        return {
+            'tasks': records,
+            'values': values,
+            'wall_clock': wall_clock,
+            'sequential_time': sum(r['duration'] for r in records.values()),
+            'critical_path': critical_path,
+            'critical_path_time': critical_time,
+            'shared_bytes': shared_bytes
+        }
+
+    def critical_path(self, records: Dict) -> tuple:
+        """
+        أطول سلسلة اعتماديات بحسب الأزمنة الفعلية
+
+        Returns:
+            (قائمة أسماء العقد على المسار, مجموع أزمنتها)
+        """
+        path_time = {}
+        previous = {}
+
+        for name in self.order:
+            duration = records.get(name, {}).get('duration', 0.0)
+            best_dep, best_time = None, 0.0
+            for dep in self.nodes[name]['inputs']:
+                if path_time[dep] > best_time:
+                    best_dep, best_time = dep, path_time[dep]
+            path_time[name] = best_time + duration
+            previous[name] = best_dep
+
+        if not path_time:
+            return [], 0.0
+
+        end = max(path_time, key=path_time.get)
+        path = []
+        while end is not None:
+            path.append(end)
+            end = previous[end]
+
+        path.reverse()
+        return path, path_time[path[-1]]
+
+
+def print_run_report(dag: AnalysisDAG, report: Dict):
+    """طباعة تقرير التشغيل: التوقيت لكل مهمة والمسار الحرج"""
+
+    tasks = report['tasks']
+    start = min((r['start'] for r in tasks.values()), default=0.0)
+
+    print(f"\n⏱️ توقيت المهام:")
+    print(f"{'Task':28s} | {'Kind':8s} | {'Status':8s} | {'Start':>7s} | {'Duration':>8s}")
+    print("-" * 72)
+
+    for name in dag.order:
+        record = tasks[name]
+        print(f"{name:28s} | {record['kind']:8s} | {record['status']:8s} | "
+              f"{record['start'] - start:6.2f}s | {record['duration']:7.2f}s")
+
+    speedup = report['sequential_time'] / report['wall_clock'] if report['wall_clock'] > 0 else 0.0
+
+    print(f"\n⏱️ الزمن الكلي (wall-clock): {report['wall_clock']:.2f} ثانية")
+    print(f"⏱️ مجموع أزمنة المهام: {report['sequential_time']:.2f} ثانية (درجة التوازي {speedup:.1f}x)")
+    print(f"🧭 المسار الحرج ({report['critical_path_time']:.2f} ثانية): "
+          f"{' → '.join(report['critical_path'])}")
+    if report.get('shared_bytes'):
+        print(f"🧠 الذاكرة المشتركة: {report['shared_bytes'] / 1024:.1f} KB منشورة للعمال")
+
+
+if __name__ == "__main__":
+    print("🧭 منفذ التحليلات كرسم بياني للاعتماديات")
+    print("👉 للاستخدام: python RUN_ALL_ANALYSIS.py --headless")
@@ -9,12 +9,13 @@ Basil Prime Theory Library
 مكتبة شاملة مفتوحة المصدر
 """
 
+import copy
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.integrate import solve_ivp
 from typing import Dict, List, Tuple, Optional, Union
 import warnings
 
+from instrumentation import metrics
+
 __version__ = "1.0.0"
 __author__ = "Prof. Basil Yahya Abdullah"
 __email__ = "basil.prime.theory@example.com"
@@ -55,35 +56,20 @@ class BasilPrimeTheory:
     
     def _calculate_parameters(self):
         """حساب جميع المعاملات الفيزيائية والرياضية"""
-        
-        # المعاملات الأساسية
-        self.surface_area = 4 * self.PI * self.radius**2
-        self.frequency = self.prime / self.PI
-        self.angular_frequency = 2 * self.prime
-        self.period = 2 * self.PI / self.angular_frequency
-        
-        # المعاملات الكهربائية
-        self.resistance = np.sqrt(self.prime)
-        self.inductance = self.surface_area / (16 * self.PI**3 * self.charge)
-        self.capacitance = (4 * self.PI**3 * self.charge) / (self.surface_area * self.prime**2)
-        self.voltage = (self.surface_area * self.prime**2) / (4 * self.PI**3)
-        
-        # التحقق من شرط الرنين
-        self.LC_product = self.inductance * self.capacitance
-        self.resonance_condition = 1 / (4 * self.prime**2)
-        self.resonance_error = abs(self.LC_product - self.resonance_condition) / self.resonance_condition
-        
-        # المعاملات التفاضلية
-        self.natural_frequency = 1 / np.sqrt(self.inductance * self.capacitance)
-        self.damping_factor = self.resistance / (2 * self.inductance)
-        self.quality_factor = self.natural_frequency * self.inductance / self.resistance
-        self.time_constant = 2 * self.inductance / self.resistance
-        
-        # المعاملات الكمية
-        self.quantum_energy = 2 * self.HBAR * self.prime
-        self.zero_point_energy = self.HBAR * self.COSMIC_FREQUENCY / 2
-        self.quantum_ratio = self.quantum_energy / self.zero_point_energy
-        self.theoretical_quantum_ratio = 16 * self.PI * self.prime
+        for name, value in sphere_parameters(self.prime, self.radius, self.charge).items():
+            setattr(self, name, value)
+    
+    @classmethod
+    def _from_parameters(cls, prime: int, radius: float, charge: float,
+                         parameters: Dict) -> 'BasilPrimeTheory':
+        """بناء نموذج من معاملات محسوبة مسبقاً (صف من sphere_parameters المتجهة)"""
+        theory = cls.__new__(cls)
+        theory.prime = prime
+        theory.radius = radius
+        theory.charge = charge
+        for name, value in parameters.items():
+            setattr(theory, name, value)
+        return theory
     
     def differential_equation(self, t: float, y: np.ndarray) -> np.ndarray:
         """
@@ -114,6 +100,8 @@ class BasilPrimeTheory:
         if initial_charge is None:
             initial_charge = self.prime / (self.PI * np.sqrt(self.resistance**2))
         
+        from scipy.integrate import solve_ivp
+
         t_span = (0, duration)
         t_eval = np.linspace(0, duration, points)
         initial_conditions = [initial_charge, 0.0]
@@ -130,6 +118,8 @@ class BasilPrimeTheory:
         if not solution.success:
             raise RuntimeError(f"Failed to solve differential equation: {solution.message}")
         
+        metrics.count('ode.rhs_evaluations', solution.nfev)
+        
         # حساب المتغيرات المشتقة
         charge = solution.y[0]
         current = solution.y[1]
@@ -167,18 +157,27 @@ class BasilPrimeTheory:
         else:
             return self._predict_basic()
     
+    @metrics.timed('predict_enhanced.total')
     def _predict_enhanced(self) -> Dict:
         """خوارزمية التنبؤ المحسنة"""
         
         # محاكاة النظام
-        solution = self.solve_oscillation()
+        with metrics.timer('predict_enhanced.ode_solve'):
+            solution = self.solve_oscillation()
         
+        return self._predict_from_energy(solution['average_energy'], solution['energy_stability'])
+    
+    def _predict_from_energy(self, average_energy: float, energy_stability: float) -> Dict:
+        """
+        خطوة القرار في التنبؤ المحسن بعد حل المعادلة التفاضلية
+        (مشتركة بين النموذج المفرد و predict_next_primes)
+        """
         # حساب المعاملات للتنبؤ
         gap_base = 2
         quality_correction = int(self.quality_factor * 10) % 6
         damping_correction = int(self.damping_factor * 1000) % 4
-        energy_correction = int(solution['average_energy'] * 1e6) % 8
-        stability_correction = int(solution['energy_stability'] * 1e6) % 3
+        energy_correction = int(average_energy * 1e6) % 8
+        stability_correction = int(energy_stability * 1e6) % 3
         
         prime_mod = self.prime % 6
         if prime_mod == 1:
@@ -195,16 +194,21 @@ class BasilPrimeTheory:
             estimated_gap = 2
         
         # البحث عن العدد الأولي التالي
-        candidate = self.prime + estimated_gap
-        attempts = 0
-        max_attempts = 20
-        
-        while not self.is_prime(candidate) and attempts < max_attempts:
-            candidate += 1
-            attempts += 1
+        with metrics.timer('predict_enhanced.candidate_search'):
+            candidate = self.prime + estimated_gap
+            attempts = 0
+            max_attempts = 20
+            
+            while not self.is_prime(candidate) and attempts < max_attempts:
+                candidate += 1
+                attempts += 1
+            
+            if attempts >= max_attempts:
+                candidate = self._get_next_prime_traditional()
         
-        if attempts >= max_attempts:
-            candidate = self._get_next_prime_traditional()
+        metrics.count('predict_enhanced.candidates_tested', attempts + 1)
+        metrics.count('primality.calls', attempts + 1)
+        metrics.observe('predict_enhanced.search_attempts', attempts)
         
         # حساب مستوى الثقة
         confidence = self._calculate_confidence()
@@ -219,7 +223,7 @@ class BasilPrimeTheory:
             'physical_parameters': {
                 'quality_factor': self.quality_factor,
                 'damping_factor': self.damping_factor,
-                'average_energy': solution['average_energy']
+                'average_energy': average_energy
             }
         }
     
@@ -249,6 +253,7 @@ class BasilPrimeTheory:
         candidate = self.prime + 1
         while not self.is_prime(candidate):
             candidate += 1
+        metrics.count('primality.calls', candidate - self.prime)
         return candidate
     
     @staticmethod
@@ -293,8 +298,9 @@ class BasilPrimeTheory:
             'theoretical_quantum_ratio': self.theoretical_quantum_ratio
         }
     
-    def plot_oscillations(self, duration: float = None, save_path: str = None) -> plt.Figure:
+    def plot_oscillations(self, duration: float = None, save_path: str = None) -> 'plt.Figure':
         """رسم تذبذبات الكرة"""
+        import matplotlib.pyplot as plt
         
         solution = self.solve_oscillation(duration)
         
@@ -349,6 +355,166 @@ class BasilPrimeTheory:
         """تمثيل تقني للكائن"""
         return f"BasilPrimeTheory(prime={self.prime}, radius={self.radius}, charge={self.charge})"
 
+def sphere_parameters(prime, radius: float = 1.0, charge: float = 1.0) -> Dict:
+    """
+    المعاملات الفيزيائية لنموذج الكرة المتذبذبة
+
+    Args:
+        prime: عدد أولي أو مصفوفة أعداد أولية float64 (لا int64: prime**2 يفيض
+            فوق 3×10⁹)، كل المخرجات بنفس الشكل
+        radius, charge: نصف القطر والشحنة
+
+    Returns:
+        قاموس المعاملات كما تخزنها BasilPrimeTheory
+    """
+    PI = BasilPrimeTheory.PI
+    HBAR = BasilPrimeTheory.HBAR
+    COSMIC_FREQUENCY = BasilPrimeTheory.COSMIC_FREQUENCY
+
+    # المعاملات الأساسية
+    surface_area = 4 * PI * radius**2
+    frequency = prime / PI
+    angular_frequency = 2 * prime
+    period = 2 * PI / angular_frequency
+
+    # المعاملات الكهربائية
+    resistance = np.sqrt(prime)
+    inductance = surface_area / (16 * PI**3 * charge)
+    capacitance = (4 * PI**3 * charge) / (surface_area * prime**2)
+    voltage = (surface_area * prime**2) / (4 * PI**3)
+
+    # التحقق من شرط الرنين
+    LC_product = inductance * capacitance
+    resonance_condition = 1 / (4 * prime**2)
+    resonance_error = abs(LC_product - resonance_condition) / resonance_condition
+
+    # المعاملات التفاضلية
+    natural_frequency = 1 / np.sqrt(inductance * capacitance)
+    damping_factor = resistance / (2 * inductance)
+    quality_factor = natural_frequency * inductance / resistance
+    time_constant = 2 * inductance / resistance
+
+    # المعاملات الكمية
+    quantum_energy = 2 * HBAR * prime
+    zero_point_energy = HBAR * COSMIC_FREQUENCY / 2
+    quantum_ratio = quantum_energy / zero_point_energy
+    theoretical_quantum_ratio = 16 * PI * prime
+
+    return {
+        'surface_area': surface_area,
+        'frequency': frequency,
+        'angular_frequency': angular_frequency,
+        'period': period,
+        'resistance': resistance,
+        'inductance': inductance,
+        'capacitance': capacitance,
+        'voltage': voltage,
+        'LC_product': LC_product,
+        'resonance_condition': resonance_condition,
+        'resonance_error': resonance_error,
+        'natural_frequency': natural_frequency,
+        'damping_factor': damping_factor,
+        'quality_factor': quality_factor,
+        'time_constant': time_constant,
+        'quantum_energy': quantum_energy,
+        'zero_point_energy': zero_point_energy,
+        'quantum_ratio': quantum_ratio,
+        'theoretical_quantum_ratio': theoretical_quantum_ratio
+    }
+
+def predict_next_primes(primes: List[int], method: str = 'enhanced', radius: float = 1.0,
+                        charge: float = 1.0, chunk_size: int = 512) -> List[Dict]:
+    """
+    التنبؤ بالعدد الأولي التالي لدفعة أعداد أولية
+
+    نفس نتائج BasilPrimeTheory(p).predict_next_prime(method) لكل عدد، لكن الأعداد
+    المكررة تُحسب مرة واحدة، والمعاملات تُحسب بـ sphere_parameters المتجهة،
+    والمعادلات التفاضلية تُحل معاً بـ batch_ode (مطابقة بت ببت لـ solve_ivp)
+
+    Returns:
+        قائمة نتائج بنفس ترتيب primes
+    """
+    unique = sorted({int(p) for p in primes})
+    if method != 'enhanced':
+        predictions = {p: BasilPrimeTheory(p, radius, charge).predict_next_prime(method) for p in unique}
+        return _fan_out(primes, predictions)
+
+    for p in unique:
+        if not BasilPrimeTheory.is_prime(p):
+            warnings.warn(f"Warning: {p} is not a prime number!")
+
+    predictions = {}
+    for start in range(0, len(unique), chunk_size):
+        chunk = unique[start:start + chunk_size]
+        parameters = sphere_parameters(np.array(chunk, dtype=float), radius, charge)
+        with metrics.timer('predict_batch.ode_solve'):
+            solution = solve_oscillations_batch(np.array(chunk, dtype=np.int64), parameters)
+
+        rows = {name: (value.tolist() if np.ndim(value) else value) for name, value in parameters.items()}
+        for i, p in enumerate(chunk):
+            theory = BasilPrimeTheory._from_parameters(
+                p, radius, charge, {name: (value[i] if isinstance(value, list) else value)
+                                    for name, value in rows.items()})
+            if solution['success'][i]:
+                predictions[p] = theory._predict_from_energy(solution['average_energy'][i],
+                                                             solution['energy_stability'][i])
+            else:
+                predictions[p] = theory.predict_next_prime('enhanced')
+
+    metrics.count('predict_batch.unique_primes', len(unique))
+    return _fan_out(primes, predictions)
+
+
+def _fan_out(primes: List[int], predictions: Dict) -> List[Dict]:
+    """توزيع النتائج بترتيب الطلب؛ كل تكرار لنفس العدد يأخذ نسخة مستقلة"""
+    results, seen = [], set()
+    for p in primes:
+        p = int(p)
+        results.append(copy.deepcopy(predictions[p]) if p in seen else predictions[p])
+        seen.add(p)
+    return results
+
+
+def solve_oscillations_batch(primes: np.ndarray, parameters: Dict, points: int = 1000) -> Dict:
+    """
+    حل معادلات التذبذب لعدة أعداد أولية معاً (نفس إعدادات solve_oscillation)
+
+    Args:
+        primes: الأعداد الأولية (int64)
+        parameters: ناتج sphere_parameters(primes, ...)
+
+    Returns:
+        {'average_energy', 'energy_stability', 'success'} مصفوفات بطول primes
+    """
+    from batch_ode import solve_rk45_batch
+
+    inductance = parameters['inductance']
+    capacitance = parameters['capacitance']
+    resistance = parameters['resistance']
+    damping = resistance / inductance
+    stiffness = 1 / (inductance * capacitance)
+
+    def rhs(t, y, rows):
+        return np.stack([y[:, 1], -damping[rows] * y[:, 1] - stiffness[rows] * y[:, 0]], axis=1)
+
+    duration = 3 * parameters['period']
+    initial_charge = primes / (BasilPrimeTheory.PI * np.sqrt(resistance**2))
+    y0 = np.column_stack([initial_charge, np.zeros(len(primes))])
+    solution = solve_rk45_batch(rhs, y0, duration, np.linspace(0, duration, points, axis=1), rtol=1e-8)
+    metrics.count('ode.rhs_evaluations', int(solution['nfev'].sum()))
+
+    charge = solution['y'][:, 0]
+    current = solution['y'][:, 1]
+    energy_L = 0.5 * np.reshape(inductance, (-1, 1)) * current**2  # L لا تعتمد على العدد
+    energy_C = 0.5 * charge**2 / np.reshape(capacitance, (-1, 1))
+    total_energy = energy_L + energy_C
+
+    return {
+        'average_energy': np.mean(total_energy, axis=1),
+        'energy_stability': np.std(total_energy, axis=1),
+        'success': solution['success']
+    }
+
 # دوال مساعدة للمكتبة
 def generate_primes(start: int, count: int) -> List[int]:
     """توليد قائمة من الأعداد الأولية"""
@@ -364,6 +530,7 @@ def generate_primes(start: int, count: int) -> List[int]:
 
 def test_prediction_accuracy(primes_list: List[int], method: str = 'enhanced') -> Dict:
     """اختبار دقة التنبؤ على قائمة من الأعداد الأولية"""
+    import model_cache  # النماذج وحلول ODE المكررة تُحسب مرة واحدة
     
     results = {
         'predictions': [],
@@ -379,8 +546,7 @@ def test_prediction_accuracy(primes_list: List[int], method: str = 'enhanced') -
         current = primes_list[i]
         actual_next = primes_list[i + 1]
         
-        theory = BasilPrimeTheory(current)
-        prediction = theory.predict_next_prime(method)
+        prediction = model_cache.predict_next_prime(current, method)
         predicted_next = prediction['predicted_next']
         
         is_correct = predicted_next == actual_next
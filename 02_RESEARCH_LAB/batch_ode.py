@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+حل دفعة من المعادلات التفاضلية معاً
+Batched Dormand-Prince (RK45) Solver
+باسل يحيى عبدالله - Basil Yahya Abdullah
+
+نسخة متجهة من RK45 في scipy لعدد N من الأنظمة المستقلة بنفس عدد المتغيرات:
+لكل نظام زمنه وخطوته وقبول/رفض خطوته الخاصة (نفس منطق solve_ivp خطوة بخطوة)
+لكن كل محاولة خطوة تُحسب لجميع الأنظمة النشطة بعمليات numpy واحدة.
+
+النتائج مطابقة بت ببت لاستدعاء solve_ivp(method='RK45', t_eval=...) لكل نظام
+على حدة: عمليات الضرب المصفوفي تُرتب بنفس تخطيط الذاكرة الذي يستخدمه scipy
+فيمر كل منها بنفس نواة BLAS (matmul مكدسة)، وعامل تغيير الخطوة يُحسب بـ pow
+القياسية عنصراً عنصراً لأن np.power المتجهة قد تختلف في البت الأخير.
+"""
+
+from typing import Callable, Dict
+
+import numpy as np
+
+SAFETY = 0.9      # نفس ثوابت scipy.integrate._ivp.rk
+MIN_FACTOR = 0.2
+MAX_FACTOR = 10
+
+
+def _rms(x: np.ndarray) -> np.ndarray:
+    """norm من scipy لكل صف: sqrt(x·x) / sqrt(n)"""
+    return np.sqrt(np.matmul(x[:, None, :], x[:, :, None])[:, 0, 0]) / x.shape[1] ** 0.5
+
+
+def _power(values: np.ndarray, exponent: float) -> np.ndarray:
+    """
+    رفع لقوة عنصراً عنصراً بـ pow القياسية كما في حلقة scipy القياسية
+    (np.power المتجهة قد تختلف في البت الأخير)
+    """
+    return np.array([value ** exponent if value != 0 else np.inf for value in values.tolist()])
+
+
+def _combine(stages, weights: np.ndarray) -> np.ndarray:
+    """
+    Σ_s weights[s] · K[s] لكل نظام، كما يحسبها scipy: np.dot(K[:s].T, a[:s])
+
+    stages: قائمة مصفوفات (N, n). كل شريحة (s, n) متصلة ثم مبدلة كما في scipy
+    """
+    return np.matmul(np.stack(stages, axis=1).transpose(0, 2, 1), weights)
+
+
+def solve_rk45_batch(fun: Callable, y0: np.ndarray, t_bound: np.ndarray, t_eval: np.ndarray,
+                     rtol: float = 1e-3, atol: float = 1e-6) -> Dict:
+    """
+    حل N نظاماً من t = 0 حتى t_bound[i] وتقييم الحل عند t_eval[i]
+
+    Args:
+        fun: fun(t, y, rows) → dy/dt حيث y بشكل (k, n) و rows فهارس الأنظمة k
+        y0: الشروط الابتدائية (N, n)
+        t_bound: نهاية التكامل لكل نظام (N,)
+        t_eval: نقاط الإخراج لكل نظام (N, M) مرتبة ضمن [0, t_bound]
+        rtol, atol: كما في solve_ivp
+
+    Returns:
+        {'y': (N, n, M), 'nfev': (N,), 'success': (N,)}
+    """
+    from scipy.integrate import RK45
+
+    A, B, C, E, P = RK45.A, RK45.B, RK45.C, RK45.E, RK45.P
+    exponent = -1 / (RK45.error_estimator_order + 1)
+
+    y0 = np.asarray(y0, dtype=float)
+    t_bound = np.asarray(t_bound, dtype=float)
+    count, n = y0.shape
+    everyone = np.arange(count)
+
+    t = np.zeros(count)
+    y = y0.copy()
+    f = fun(t, y, everyone)
+    nfev = np.ones(count, dtype=np.int64)
+
+    # ===== الخطوة الابتدائية (select_initial_step) =====
+    scale = atol + np.abs(y) * rtol
+    d0 = _rms(y / scale)
+    d1 = _rms(f / scale)
+    small = (d0 < 1e-5) | (d1 < 1e-5)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        h0 = np.where(small, 1e-6, 0.01 * d0 / d1)
+    h0 = np.where(h0 < t_bound, h0, t_bound)
+    f1 = fun(t + h0, y + h0[:, None] * f, everyone)
+    nfev += 1
+    d2 = _rms((f1 - f) / scale) / h0
+    flat = (d1 <= 1e-15) & (d2 <= 1e-15)
+    with np.errstate(divide='ignore'):
+        h1 = np.where(flat, np.maximum(1e-6, h0 * 1e-3),
+                      _power(0.01 / np.maximum(d1, d2), 1 / (RK45.error_estimator_order + 1)))
+    h_abs = np.minimum(np.minimum(100 * h0, h1), t_bound)
+
+    # ===== الخطوات =====
+    active = t_bound > 0
+    success = np.ones(count, dtype=bool)
+    retrying = np.zeros(count, dtype=bool)
+    step_rows, step_t0, step_t1, step_y0, step_Q = [], [], [], [], []
+
+    while active.any():
+        rows = np.nonzero(active)[0]
+        t_i, y_i, f_i = t[rows], y[rows], f[rows]
+
+        # الحد الأدنى للخطوة عند t، وقص الخطوة في أول محاولة فقط
+        min_step = 10 * np.abs(np.nextafter(t_i, np.inf) - t_i)
+        h_i = h_abs[rows]
+        first = ~retrying[rows]
+        h_i = np.where(first & (h_i < min_step), min_step, h_i)
+
+        too_small = ~first & (h_i < min_step)
+        if too_small.any():
+            success[rows[too_small]] = False
+            active[rows[too_small]] = False
+            keep = ~too_small
+            rows, t_i, y_i, f_i, h_i = rows[keep], t_i[keep], y_i[keep], f_i[keep], h_i[keep]
+            if not len(rows):
+                continue
+
+        t_new = t_i + h_i
+        t_new = np.where(t_new - t_bound[rows] > 0, t_bound[rows], t_new)
+        h = t_new - t_i
+        h_i = np.abs(h)
+
+        # rk_step
+        stages = [f_i]
+        for s in range(1, len(C)):
+            dy = _combine(stages, A[s, :s]) * h[:, None]
+            stages.append(fun(t_i + C[s] * h, y_i + dy, rows))
+        y_new = y_i + h[:, None] * _combine(stages, B)
+        f_new = fun(t_i + h, y_new, rows)
+        stages.append(f_new)
+        nfev[rows] += len(C)
+
+        scale = atol + np.maximum(np.abs(y_i), np.abs(y_new)) * rtol
+        error_norm = _rms(_combine(stages, E) * h[:, None] / scale)
+
+        growth = SAFETY * _power(error_norm, exponent)
+        accepted = error_norm < 1
+
+        # قبول: min(MAX_FACTOR, ...) ثم min(1, factor) بعد الرفض
+        factor = np.where(error_norm == 0, MAX_FACTOR, np.where(growth < MAX_FACTOR, growth, MAX_FACTOR))
+        factor = np.where(retrying[rows] & ~(factor < 1), 1, factor)
+        # رفض: max(MIN_FACTOR, ...)
+        shrink = np.where(growth > MIN_FACTOR, growth, MIN_FACTOR)
+
+        rejected_rows = rows[~accepted]
+        h_abs[rejected_rows] = h_i[~accepted] * shrink[~accepted]
+        retrying[rejected_rows] = True
+
+        if accepted.any():
+            done = rows[accepted]
+            K = np.stack(stages, axis=1)[accepted]  # (k, 7, n)
+            step_rows.append(done)
+            step_t0.append(t_i[accepted])
+            step_t1.append(t_new[accepted])
+            step_y0.append(y_i[accepted])
+            step_Q.append(np.matmul(K.transpose(0, 2, 1), P))
+
+            t[done] = t_new[accepted]
+            y[done] = y_new[accepted]
+            f[done] = f_new[accepted]
+            h_abs[done] = h_i[accepted] * factor[accepted]
+            retrying[done] = False
+            active[done] = t_new[accepted] < t_bound[done]
+
+    return {'y': _dense_output(step_rows, step_t0, step_t1, step_y0, step_Q, t_eval, y0),
+            'nfev': nfev, 'success': success}
+
+
+def _dense_output(step_rows, step_t0, step_t1, step_y0, step_Q, t_eval, y0) -> np.ndarray:
+    """
+    تقييم الحل عند t_eval بكثيرات الحدود لكل خطوة (RkDenseOutput)
+
+    النقطة τ تُقيَّم بأول خطوة تنتهي عند t ≥ τ كما يفعل solve_ivp
+    """
+    t_eval = np.asarray(t_eval, dtype=float)
+    count, points = t_eval.shape
+    out = np.empty((count, y0.shape[1], points))
+    if not step_rows:
+        out[:] = y0[:, :, None]
+        return out
+
+    rows = np.concatenate(step_rows)
+    order = np.argsort(rows, kind='stable')  # خطوات كل نظام متتالية زمنياً
+    rows = rows[order]
+    t0 = np.concatenate(step_t0)[order]
+    t1 = np.concatenate(step_t1)[order]
+    y_old = np.concatenate(step_y0)[order]
+    Q = np.concatenate(step_Q)[order]
+
+    # فهرس الخطوة لكل نقطة
+    starts = np.searchsorted(rows, np.arange(count))
+    ends = np.searchsorted(rows, np.arange(count), side='right')
+    step_of = np.empty((count, points), dtype=np.int64)
+    for i in range(count):
+        step_of[i] = starts[i] + np.searchsorted(t1[starts[i]:ends[i]], t_eval[i], side='left')
+    step_of = np.minimum(step_of, np.maximum(ends - 1, 0)[:, None])
+
+    # تجميع الخطوات حسب عدد نقاطها: matmul مكدسة لكل مجموعة = np.dot لكل خطوة
+    flat_steps = step_of.ravel()
+    point_order = np.argsort(flat_steps, kind='stable')
+    sorted_steps = flat_steps[point_order]
+    unique_steps, first_point, per_step = np.unique(sorted_steps, return_index=True, return_counts=True)
+
+    for m in np.unique(per_step):
+        group = np.nonzero(per_step == m)[0]
+        steps = unique_steps[group]
+        flat_index = point_order[first_point[group][:, None] + np.arange(m)]  # (g, m)
+        tau = t_eval.ravel()[flat_index]
+
+        h = (t1[steps] - t0[steps])[:, None]
+        x = (tau - t0[steps][:, None]) / h
+        p = np.cumprod(np.repeat(x[:, None, :], Q.shape[2], axis=1), axis=1)  # (g, 4, m)
+        values = h[:, :, None] * np.matmul(Q[steps], p) + y_old[steps][:, :, None]
+
+        system, column = np.divmod(flat_index, points)
+        out[system[:, None, :], np.arange(y0.shape[1])[None, :, None], column[:, None, :]] = values
+    return out
+
+
+if __name__ == "__main__":
+    import time
+    from scipy.integrate import solve_ivp
+
+    print("🧮 حل دفعة من المعادلات التفاضلية (RK45)")
+    print("=" * 40)
+
+    # مذبذبات مخمدة: Q'' + a Q' + b Q = 0
+    rng = np.random.default_rng(0)
+    a = rng.uniform(0.1, 5, 200)
+    b = rng.uniform(10, 400, 200)
+    y0 = np.column_stack([np.ones(200), np.zeros(200)])
+    t_bound = rng.uniform(1, 5, 200)
+    t_eval = np.linspace(0, t_bound, 500, axis=1)
+
+    def fun(t, y, rows):
+        return np.stack([y[:, 1], -a[rows] * y[:, 1] - b[rows] * y[:, 0]], axis=1)
+
+    start = time.perf_counter()
+    batch = solve_rk45_batch(fun, y0, t_bound, t_eval, rtol=1e-8)
+    batch_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    identical = 0
+    for i in range(200):
+        single = solve_ivp(lambda t, z: np.array([z[1], -a[i] * z[1] - b[i] * z[0]]),
+                           (0, t_bound[i]), y0[i], t_eval=t_eval[i], rtol=1e-8)
+        identical += np.array_equal(single.y, batch['y'][i])
+    loop_time = time.perf_counter() - start
+
+    print(f"📊 مطابق بت ببت: {identical}/200")
+    print(f"⏱️ دفعة: {batch_time:.3f}s | حلقة solve_ivp: {loop_time:.3f}s")
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+نوى الدائرة المتجهة
+Vectorized Circuit Kernels
+باسل يحيى عبدالله - Basil Yahya Abdullah
+
+معاملات الدائرة بالفيزياء الصحيحة (i = dQ/dt) والتنبؤ الفيزيائي بالعدد الأولي التالي
+كدوال تقبل عدداً واحداً أو مصفوفة numpy، دون أي اعتماد على واجهة Tk،
+لتستخدمها الحاسبة والخوارزميات المصححة وخدمة HTTP بنفس التنفيذ
+"""
+
+from typing import Dict
+
+import numpy as np
+
+PI = np.pi
+DEFAULT_L = 1e-3  # مللي هنري
+DEFAULT_C = 1e-6  # ميكرو فاراد
+
+
+def corrected_circuit_parameters(prime, L: float = DEFAULT_L, C: float = DEFAULT_C,
+                                 t: float = 1.0) -> Dict:
+    """
+    حساب معاملات الدائرة بالفيزياء الصحيحة
+
+    Args:
+        prime: عدد أولي أو مصفوفة أعداد (كل المخرجات بنفس الشكل)
+        L, C: المحاثة والسعة
+        t: الزمن للقيم اللحظية
+    """
+    # التردد والتردد الزاوي
+    frequency = prime / PI
+    omega = 2 * PI * frequency
+
+    # المقاومة (جذر العدد الأولي)
+    R = np.sqrt(prime)
+
+    # المعاوقات
+    X_L = omega * L
+    X_C = 1 / (omega * C)
+    Z_magnitude = np.sqrt(R**2 + (X_L - X_C)**2)
+
+    # الشحنة كدالة متذبذبة (الفيزياء الصحيحة)
+    Q_amplitude = prime / (PI * Z_magnitude)
+    Q_t = Q_amplitude * np.cos(omega * t)
+
+    # التيار التفاضلي الصحيح: i = dQ/dt
+    current_instantaneous = -omega * Q_amplitude * np.sin(omega * t)
+    current_rms = omega * Q_amplitude / np.sqrt(2)
+
+    # الطاقة الصحيحة
+    energy_L = 0.5 * L * current_instantaneous**2
+    energy_C = 0.5 * Q_t**2 / C
+    total_energy = energy_L + energy_C
+
+    # المتوسط الزمني للطاقة
+    energy_L_avg = 0.5 * L * (omega * Q_amplitude)**2 / 2
+    energy_C_avg = 0.5 * Q_amplitude**2 / (2 * C)
+    total_energy_avg = energy_L_avg + energy_C_avg
+
+    return {
+        'prime': prime,
+        'frequency': frequency,
+        'omega': omega,
+        'resistance': R,
+        'impedance_magnitude': Z_magnitude,
+        'charge_amplitude': Q_amplitude,
+        'charge_instantaneous': Q_t,
+        'current_instantaneous': current_instantaneous,
+        'current_rms': current_rms,
+        'energy_instantaneous': total_energy,
+        'energy_average': total_energy_avg,
+        'L': L,
+        'C': C,
+        'X_L': X_L,
+        'X_C': X_C
+    }
+
+
+def predict_next_primes_physics(current_primes: np.ndarray, prime_table: np.ndarray,
+                                L: float = DEFAULT_L, C: float = DEFAULT_C) -> np.ndarray:
+    """
+    التنبؤ الفيزيائي بالعدد الأولي التالي لدفعة أعداد أولية
+
+    prime_table: جدول أعداد أولية مرتب يغطي حتى max(current_primes) + 20
+    """
+    current_primes = np.asarray(current_primes, dtype=np.int64)
+    params = corrected_circuit_parameters(current_primes.astype(float), L, C)
+    energy_frequency_ratio = params['energy_average'] / params['frequency']
+    estimated_gap = 2 + (energy_frequency_ratio * 2).astype(np.int64) % 6
+
+    # أول عدد أولي ≥ p + الفجوة المقدرة، بشرط أن يكون < p + 20
+    candidates = current_primes + estimated_gap
+    idx = np.searchsorted(prime_table, candidates)
+    found = prime_table[np.minimum(idx, len(prime_table) - 1)]
+    valid = (idx < len(prime_table)) & (found < current_primes + 20)
+
+    return np.where(valid, found, current_primes + 2)
+
+
+if __name__ == "__main__":
+    from prime_sieve import sieve_primes
+
+    print("⚡ نوى الدائرة المتجهة")
+    print("=" * 40)
+
+    primes = sieve_primes(100)
+    params = corrected_circuit_parameters(primes.astype(float))
+    print(f"📊 |Z| لأول 5 أعداد: {np.round(params['impedance_magnitude'][:5], 3).tolist()}")
+    print(f"📊 التنبؤ الفيزيائي: {predict_next_primes_physics(primes[:5], primes).tolist()}")
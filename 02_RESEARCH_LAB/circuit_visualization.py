@@ -10,6 +10,7 @@ import matplotlib.pyplot as plt
 import pandas as pd
 import seaborn as sns
 from prime_circuit_simulator import PrimeResonanceCircuit
+import fast_plot
 from sympy import isprime, primerange
 
 # إعداد الخطوط العربية
@@ -30,9 +31,9 @@ class CircuitVisualizer:
                      fontsize=16, fontweight='bold')
         
         # الرسم الأول: مقارنة الأعداد الأولية الفعلية مع المحسوبة
-        axes[0,0].scatter(results_df['p_input'], results_df['p_calculated'], 
+        fast_plot.scatter(axes[0,0], results_df['p_input'], results_df['p_calculated'], 
                          alpha=0.6, c=results_df['V_applied'], cmap='viridis')
-        axes[0,0].plot([results_df['p_input'].min(), results_df['p_input'].max()], 
+        fast_plot.plot(axes[0,0], [results_df['p_input'].min(), results_df['p_input'].max()], 
                       [results_df['p_input'].min(), results_df['p_input'].max()], 
                       'r--', label='Perfect Match')
         axes[0,0].set_xlabel('Prime Input (p_input)')
@@ -54,7 +55,7 @@ class CircuitVisualizer:
         # الرسم الثالث: الخطأ مقابل الجهد المطبق
         for p in results_df['p_input'].unique():
             subset = results_df[results_df['p_input'] == p]
-            axes[1,0].plot(subset['V_applied'], subset['relative_error'], 
+            fast_plot.plot(axes[1,0], subset['V_applied'], subset['relative_error'], 
                           marker='o', label=f'p={p}', alpha=0.7)
         axes[1,0].set_xlabel('Applied Voltage (V)')
         axes[1,0].set_ylabel('Relative Error (%)')
@@ -63,7 +64,7 @@ class CircuitVisualizer:
         axes[1,0].grid(True, alpha=0.3)
         
         # الرسم الرابع: العلاقة بين المقاومة والدقة
-        axes[1,1].scatter(results_df['R'], results_df['relative_error'], 
+        fast_plot.scatter(axes[1,1], results_df['R'], results_df['relative_error'], 
                          alpha=0.6, c=results_df['p_input'], cmap='plasma')
         axes[1,1].set_xlabel('Resistance (R = √p)')
         axes[1,1].set_ylabel('Relative Error (%)')
@@ -85,9 +86,9 @@ class CircuitVisualizer:
                      fontsize=16, fontweight='bold')
         
         # الرسم الأول: المقاومة مقابل العدد الأولي المحسوب
-        axes[0,0].plot(resistance_results['R_modified'], resistance_results['p_from_resistance'], 
+        fast_plot.plot(axes[0,0], resistance_results['R_modified'], resistance_results['p_from_resistance'], 
                       'b-', label='p = R²', linewidth=2)
-        axes[0,0].plot(resistance_results['R_modified'], resistance_results['p_calculated'], 
+        fast_plot.plot(axes[0,0], resistance_results['R_modified'], resistance_results['p_calculated'], 
                       'r--', label='p calculated from circuit', linewidth=2)
         axes[0,0].set_xlabel('Modified Resistance (Ω)')
         axes[0,0].set_ylabel('Prime Number')
@@ -96,7 +97,7 @@ class CircuitVisualizer:
         axes[0,0].grid(True, alpha=0.3)
         
         # الرسم الثاني: مضاعف المقاومة مقابل التيار
-        axes[0,1].plot(resistance_results['resistance_multiplier'], resistance_results['I'], 
+        fast_plot.plot(axes[0,1], resistance_results['resistance_multiplier'], resistance_results['I'], 
                       'g-', marker='o', linewidth=2)
         axes[0,1].set_xlabel('Resistance Multiplier')
         axes[0,1].set_ylabel('Current (A)')
@@ -104,7 +105,7 @@ class CircuitVisualizer:
         axes[0,1].grid(True, alpha=0.3)
         
         # الرسم الثالث: المعاوقة الكلية
-        axes[1,0].plot(resistance_results['resistance_multiplier'], resistance_results['Z_magnitude'], 
+        fast_plot.plot(axes[1,0], resistance_results['resistance_multiplier'], resistance_results['Z_magnitude'], 
                       'purple', marker='s', linewidth=2)
         axes[1,0].set_xlabel('Resistance Multiplier')
         axes[1,0].set_ylabel('Impedance Magnitude (Ω)')
@@ -112,11 +113,11 @@ class CircuitVisualizer:
         axes[1,0].grid(True, alpha=0.3)
         
         # الرسم الرابع: توزيع الجهود
-        axes[1,1].plot(resistance_results['resistance_multiplier'], resistance_results['V_R'], 
+        fast_plot.plot(axes[1,1], resistance_results['resistance_multiplier'], resistance_results['V_R'], 
                       'r-', label='V_R', linewidth=2)
-        axes[1,1].plot(resistance_results['resistance_multiplier'], resistance_results['V_L'], 
+        fast_plot.plot(axes[1,1], resistance_results['resistance_multiplier'], resistance_results['V_L'], 
                       'b-', label='V_L', linewidth=2)
-        axes[1,1].plot(resistance_results['resistance_multiplier'], resistance_results['V_C'], 
+        fast_plot.plot(axes[1,1], resistance_results['resistance_multiplier'], resistance_results['V_C'], 
                       'g-', label='V_C', linewidth=2)
         axes[1,1].set_xlabel('Resistance Multiplier')
         axes[1,1].set_ylabel('Voltage (V)')
@@ -138,15 +139,15 @@ class CircuitVisualizer:
         
         # الرسم الأول: التردد مقابل العدد الأولي
         unique_primes = results_df.groupby('p_input').first()
-        axes[0,0].plot(unique_primes.index, unique_primes['f'], 'bo-', linewidth=2)
+        fast_plot.plot(axes[0,0], unique_primes.index, unique_primes['f'], 'bo-', linewidth=2)
         axes[0,0].set_xlabel('Prime Number')
         axes[0,0].set_ylabel('Natural Frequency (Hz)')
         axes[0,0].set_title('Prime vs Natural Frequency (f = p/π)')
         axes[0,0].grid(True, alpha=0.3)
         
         # الرسم الثاني: المعاوقات التفاعلية
-        axes[0,1].plot(unique_primes.index, unique_primes['X_L'], 'r-', label='X_L', linewidth=2)
-        axes[0,1].plot(unique_primes.index, unique_primes['X_C'], 'b-', label='X_C', linewidth=2)
+        fast_plot.plot(axes[0,1], unique_primes.index, unique_primes['X_L'], 'r-', label='X_L', linewidth=2)
+        fast_plot.plot(axes[0,1], unique_primes.index, unique_primes['X_C'], 'b-', label='X_C', linewidth=2)
         axes[0,1].set_xlabel('Prime Number')
         axes[0,1].set_ylabel('Reactance (Ω)')
         axes[0,1].set_title('Inductive vs Capacitive Reactance')
@@ -163,9 +164,9 @@ class CircuitVisualizer:
         axes[0,2].grid(True, alpha=0.3)
         
         # الرسم الرابع: الطاقات
-        axes[1,0].plot(unique_primes.index, unique_primes['E_R'], 'r-', label='E_R', linewidth=2)
-        axes[1,0].plot(unique_primes.index, unique_primes['E_L'], 'b-', label='E_L', linewidth=2)
-        axes[1,0].plot(unique_primes.index, unique_primes['E_C'], 'g-', label='E_C', linewidth=2)
+        fast_plot.plot(axes[1,0], unique_primes.index, unique_primes['E_R'], 'r-', label='E_R', linewidth=2)
+        fast_plot.plot(axes[1,0], unique_primes.index, unique_primes['E_L'], 'b-', label='E_L', linewidth=2)
+        fast_plot.plot(axes[1,0], unique_primes.index, unique_primes['E_C'], 'g-', label='E_C', linewidth=2)
         axes[1,0].set_xlabel('Prime Number')
         axes[1,0].set_ylabel('Energy (J)')
         axes[1,0].set_title('Energy Distribution')
@@ -173,8 +174,8 @@ class CircuitVisualizer:
         axes[1,0].grid(True, alpha=0.3)
         
         # الرسم الخامس: الشحنات
-        axes[1,1].plot(unique_primes.index, unique_primes['Q_C'], 'c-', label='Q_C', linewidth=2)
-        axes[1,1].plot(unique_primes.index, unique_primes['Q_L'], 'orange', label='Q_L', linewidth=2)
+        fast_plot.plot(axes[1,1], unique_primes.index, unique_primes['Q_C'], 'c-', label='Q_C', linewidth=2)
+        fast_plot.plot(axes[1,1], unique_primes.index, unique_primes['Q_L'], 'orange', label='Q_L', linewidth=2)
         axes[1,1].set_xlabel('Prime Number')
         axes[1,1].set_ylabel('Charge (C)')
         axes[1,1].set_title('Charge Distribution')
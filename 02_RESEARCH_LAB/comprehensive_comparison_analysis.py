@@ -13,6 +13,7 @@ from typing import List, Dict, Tuple
 import pandas as pd
 import time
 from datetime import datetime
+from result_cache import cached_result
 
 class ComprehensiveComparisonAnalyzer:
     """محلل المقارنة الشاملة للنتائج قبل وبعد التصحيح"""
@@ -168,6 +169,7 @@ class ComprehensiveComparisonAnalyzer:
         
         return candidate if candidate < current_prime + 20 else current_prime + 2
     
+    @cached_result()
     def comprehensive_comparison(self, test_primes: List[int]) -> Dict:
         """إجراء المقارنة الشاملة بين الطريقتين"""
         
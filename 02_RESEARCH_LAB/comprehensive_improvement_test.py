@@ -20,6 +20,7 @@ try:
     from improved_gap_predictor import ImprovedGapPredictor
     from large_prime_predictor import LargePrimePredictor
     from corrected_prime_simulator import CorrectedPrimeCircuit
+    from results_store import default_store
 except ImportError as e:
     print(f"⚠️ خطأ في استيراد الوحدات: {e}")
     print("تأكد من وجود جميع الملفات في نفس المجلد")
@@ -341,6 +342,23 @@ class ComprehensiveImprovementTest:
             
         except Exception as e:
             print(f"❌ خطأ في حفظ التقرير: {e}")
+        
+        self.save_results_to_store()
+    
+    def save_results_to_store(self):
+        """حفظ بيانات كل اختبار كجداول في مخزن النتائج والملخص في بيانات التشغيل"""
+        
+        frames = {component: result['data'] for component, result in self.results.items()
+                  if 'data' in result}
+        summary = {component: {key: value for key, value in result.items() if key != 'data'}
+                   for component, result in self.results.items()}
+        
+        try:
+            run_id = default_store.save_run('comprehensive_improvement_test', frames,
+                                            summary=summary, timestamp=self.test_timestamp)
+            print(f"🗄️ تم حفظ البيانات في مخزن النتائج (run_id={run_id})")
+        except Exception as e:
+            print(f"❌ خطأ في حفظ البيانات في مخزن النتائج: {e}")
 
 def main():
     """الدالة الرئيسية للاختبار الشامل"""
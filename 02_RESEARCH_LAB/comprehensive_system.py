@@ -18,6 +18,7 @@ from advanced_prime_predictor import AdvancedPrimePredictor
 from zeta_zeros_calculator import ZetaZerosCalculator
 from prime_gaps_analyzer import PrimeGapsAnalyzer
 from cryptography_application import PrimeCircuitCrypto
+from results_store import default_store, to_frame
 
 class ComprehensivePrimeSystem:
     """النظام الشامل لجميع تطبيقات نظرية الدائرة"""
@@ -280,6 +281,19 @@ class ComprehensivePrimeSystem:
                 f.write(f"وقت التنفيذ: {results['timestamp']}\n\n")
         
         print(f"✅ تم حفظ التقرير في: {report_filename}")
+        
+        # الجداول نفسها في مخزن النتائج (DataFrame وقوائم القواميس وجداول الأعمدة)
+        frames = {}
+        for module_name, results in self.session_results.items():
+            for key, value in results.items():
+                frame = to_frame(value)
+                if frame is not None:
+                    frames[f"{module_name}_{key}"] = frame
+        
+        summary = {module_name: results.get('summary', {})
+                   for module_name, results in self.session_results.items()}
+        run_id = default_store.save_run('comprehensive_system', frames, summary=summary)
+        print(f"🗄️ تم حفظ الجداول في مخزن النتائج (run_id={run_id})")
     
     def main_loop(self):
         """الحلقة الرئيسية للنظام"""
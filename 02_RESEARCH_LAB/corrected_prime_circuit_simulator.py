@@ -8,9 +8,7 @@
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
 from typing import Tuple, Dict, List
-import pandas as pd
 
 class CorrectedPrimeCircuitSimulator:
     """محاكي مصحح للدوائر الكهربائية والأعداد الأولية"""
@@ -200,7 +198,7 @@ class CorrectedPrimeCircuitSimulator:
             'energy_total': energy_total
         }
     
-    def compare_methods(self, primes: List[int], t: float = 1.0) -> pd.DataFrame:
+    def compare_methods(self, primes: List[int], t: float = 1.0) -> 'pd.DataFrame':
         """
         مقارنة الطريقتين على مجموعة من الأعداد الأولية
         
@@ -211,6 +209,8 @@ class CorrectedPrimeCircuitSimulator:
         Returns:
             DataFrame: جدول المقارنة
         """
+        import pandas as pd
+        
         results = []
         
         for prime in primes:
@@ -249,6 +249,8 @@ class CorrectedPrimeCircuitSimulator:
             primes: قائمة الأعداد الأولية
             t: الزمن (ثانية)
         """
+        import matplotlib.pyplot as plt
+        
         df = self.compare_methods(primes, t)
         
         fig, axes = plt.subplots(2, 2, figsize=(15, 12))
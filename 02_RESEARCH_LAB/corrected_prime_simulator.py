@@ -6,9 +6,7 @@ Corrected Prime Number Circuit Simulator
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
 from prime_circuit_simulator import PrimeResonanceCircuit
-from sympy import isprime
 
 class CorrectedPrimeCircuit(PrimeResonanceCircuit):
     """محاكي دائرة الأعداد الأولية مع التصحيح"""
@@ -39,53 +37,34 @@ class CorrectedPrimeCircuit(PrimeResonanceCircuit):
             return 0
     
     def test_corrected_accuracy(self, prime_list, voltage_range):
-        """اختبار دقة المعادلة المصححة"""
+        """
+        اختبار دقة المعادلة المصححة
         
-        results = []
+        Returns:
+            CircuitArrays (أعمدة numpy)؛ التكرار عليها يعطي صفاً كقاموس لكل (عدد، جهد)
+        """
+        from sympy import isprime
         
-        for p in prime_list:
-            if not isprime(p):
-                continue
-                
-            for V in voltage_range:
-                sim_result = self.simulate_circuit(p, V)
-                if sim_result is None:
-                    continue
-                
-                # حساب الجهد والشحنة الكليين
-                V_total = sim_result['V_R'] + sim_result['V_L'] + sim_result['V_C']
-                Q_total = sim_result['Q_C'] + sim_result['Q_L']
-                
-                # حساب العدد الأولي بالطريقة الأصلية
-                p_original = self.calculate_prime_from_circuit(
-                    sim_result['V_R'], sim_result['V_L'], sim_result['V_C'],
-                    sim_result['Q_C'], sim_result['Q_L'], V_total, Q_total
-                )
-                
-                # حساب العدد الأولي بالطريقة المصححة
-                p_corrected = self.calculate_prime_from_circuit_corrected(
-                    sim_result['V_R'], sim_result['V_L'], sim_result['V_C'],
-                    sim_result['Q_C'], sim_result['Q_L'], V_total, Q_total
-                )
-                
-                # حساب الأخطاء
-                error_original = abs(p - p_original) / p * 100 if p > 0 else 0
-                error_corrected = abs(p - p_corrected) / p * 100 if p > 0 else 0
-                
-                result = sim_result.copy()
-                result.update({
-                    'V_total': V_total,
-                    'Q_total': Q_total,
-                    'p_original': p_original,
-                    'p_corrected': p_corrected,
-                    'error_original': error_original,
-                    'error_corrected': error_corrected,
-                    'improvement': error_original - error_corrected
-                })
-                
-                results.append(result)
+        primes = [p for p in prime_list if isprime(p)]
+        table = self.simulate_circuits(primes, voltage_range)
+        
+        # العدد الأولي بالطريقة الأصلية والمصححة (0 حيث K ≤ 0)
+        p_original, V_total, Q_total = self.calculate_primes_from_circuits(table)
+        p_corrected = self.correction_factor * p_original
         
-        return results
+        # حساب الأخطاء
+        error_original = np.abs(table['p_input'] - p_original) / table['p_input'] * 100
+        error_corrected = np.abs(table['p_input'] - p_corrected) / table['p_input'] * 100
+        
+        return table.with_columns(
+            V_total=V_total,
+            Q_total=Q_total,
+            p_original=p_original,
+            p_corrected=p_corrected,
+            error_original=error_original,
+            error_corrected=error_corrected,
+            improvement=error_original - error_corrected
+        )
 
 def test_correction_effectiveness():
     """اختبار فعالية التصحيح"""
@@ -126,6 +105,7 @@ def test_correction_effectiveness():
 
 def plot_correction_comparison(results):
     """رسم مقارنة بين النتائج الأصلية والمصححة"""
+    import matplotlib.pyplot as plt
     
     primes = [r['p_input'] for r in results]
     original_errors = [r['error_original'] for r in results]
@@ -18,6 +18,8 @@ import pandas as pd
 from scipy.optimize import curve_fit
 from scipy.stats import pearsonr
 import seaborn as sns
+from result_cache import cached_result
+from results_store import default_store
 
 class CorrectionFactorAnalyzer(CorrectedPrimeCircuit):
     """محلل العامل التصحيحي كدالة"""
@@ -57,6 +59,8 @@ class CorrectionFactorAnalyzer(CorrectedPrimeCircuit):
             'circuit_data': sim
         }
     
+    @cached_result(state=('correction_data',),
+                   restore=lambda self, df: setattr(self, 'correction_data', df))
     def analyze_correction_patterns(self, prime_range=(7, 200), voltage_range=[5, 10, 15, 20]):
         """تحليل أنماط العامل التصحيحي"""
         
@@ -67,39 +71,60 @@ class CorrectionFactorAnalyzer(CorrectedPrimeCircuit):
         
         primes = [p for p in range(prime_range[0], prime_range[1]) if isprime(p)]
         
+        prime_array = np.array(primes, dtype=np.int64)
+        
         print("Prime | Voltage | Raw Calc | Optimal Factor | Circuit Properties")
         print("-" * 80)
         
-        for prime in primes:
-            for voltage in voltage_range:
-                result = self.calculate_optimal_correction_factor(prime, voltage)
-                
-                if result:
-                    circuit = result['circuit_data']
-                    
-                    print(f"{prime:5d} | {voltage:7.1f} | {result['p_raw']:8.2f} | "
-                          f"{result['optimal_factor']:14.6f} | "
-                          f"E={circuit['E_total']:.3f}, f={circuit['f']:.2f}")
-                    
-                    # حفظ البيانات للتحليل
-                    data_point = {
-                        'prime': prime,
-                        'voltage': voltage,
-                        'p_raw': result['p_raw'],
-                        'optimal_factor': result['optimal_factor'],
-                        'prime_index': primes.index(prime),
-                        'prime_log': np.log(prime),
-                        'prime_sqrt': np.sqrt(prime),
-                        'energy_total': circuit['E_total'],
-                        'frequency': circuit['f'],
-                        'resistance': circuit['R'],
-                        'impedance_magnitude': abs(circuit['Z']),
-                        'current': circuit['I']
-                    }
-                    
-                    self.correction_data.append(data_point)
+        # أعمدة النتيجة محجوزة مسبقاً وتُملأ بكتل من الأعداد الأولية: جدول المحاكاة
+        # الكامل (20 عموداً) لا يوجد إلا لكتلة واحدة في كل مرة
+        columns = ('prime', 'voltage', 'p_raw', 'optimal_factor', 'prime_index', 'prime_log',
+                   'prime_sqrt', 'energy_total', 'frequency', 'resistance',
+                   'impedance_magnitude', 'current')
+        size = len(primes) * len(voltage_range)
+        dtypes = {'prime': np.int64, 'prime_index': np.int64, 'voltage': np.asarray(voltage_range).dtype}
+        data = {name: np.empty(size, dtype=dtypes.get(name, float)) for name in columns}
+        filled = 0
+        
+        for start in range(0, len(primes), 256):
+            table = self.simulate_circuits(prime_array[start:start + 256], voltage_range)
+            p_raw, _, _ = self.calculate_primes_from_circuits(table)
+            
+            # الصفوف التي p_raw ≤ 0 تُستبعد كما في الحلقة القياسية
+            valid = p_raw > 0
+            if not valid.all():
+                table, p_raw = table[valid], p_raw[valid]
+            prime = table['p_input']
+            block = {
+                'prime': prime,
+                'voltage': table['V_applied'],
+                'p_raw': p_raw,
+                'optimal_factor': prime / p_raw,
+                'prime_index': np.searchsorted(prime_array, prime),
+                'prime_log': np.log(prime),
+                'prime_sqrt': np.sqrt(prime),
+                'energy_total': table['E_total'],
+                'frequency': table['f'],
+                'resistance': table['R'],
+                'impedance_magnitude': np.abs(table['Z']),
+                'current': table['I']
+            }
+            
+            for row in zip(*(block[name].tolist() for name in
+                             ('prime', 'voltage', 'p_raw', 'optimal_factor', 'energy_total', 'frequency'))):
+                print("{:5d} | {:7.1f} | {:8.2f} | {:14.6f} | E={:.3f}, f={:.2f}".format(*row))
+            
+            for name in columns:
+                data[name][filled:filled + len(prime)] = block[name]
+            filled += len(prime)
+        
+        # حفظ البيانات للتحليل (DataFrame واحد بدل قاموس لكل صف)
+        frame = pd.DataFrame({name: data[name][:filled] for name in columns}, copy=False)
+        if len(self.correction_data):  # كما سابقاً: تتراكم نتائج الاستدعاءات المتتالية
+            frame = pd.concat([pd.DataFrame(self.correction_data), frame], ignore_index=True)
+        self.correction_data = frame
         
-        return pd.DataFrame(self.correction_data)
+        return self.correction_data
     
     def find_correction_function_patterns(self, df):
         """البحث عن أنماط في دالة التصحيح"""
@@ -333,6 +358,9 @@ def main():
     # تحليل الأنماط
     print(f"\n🚀 بدء تحليل الأنماط...")
     df = analyzer.analyze_correction_patterns((7, 100), [8, 10, 12, 15])
+    run_id = default_store.save_run('correction_factor_analysis', {'errors': df},
+                                    params={'prime_range': (7, 100), 'voltages': [8, 10, 12, 15]})
+    print(f"🗄️ تم حفظ بيانات العامل التصحيحي (run_id={run_id})")
     
     # البحث عن أنماط الارتباط
     correlations = analyzer.find_correction_function_patterns(df)
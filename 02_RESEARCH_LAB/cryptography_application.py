@@ -8,11 +8,15 @@ Cryptography Application using Prime Circuit Theory
 import numpy as np
 import hashlib
 from advanced_prime_predictor import AdvancedPrimePredictor
-from sympy import isprime, nextprime, randprime
+from numeric_backend import integer_backend
 import base64
 import time
 import secrets
 
+# معاملات الدائرة بأعداد عشرية (L = 1/(4 p^1.5)) تفيض بعد ~680 بت؛
+# فوق هذا الحد يُحتفظ بالعدد الأولي المرشح دون تصحيح الدائرة
+CIRCUIT_MAX_BITS = 640
+
 class PrimeCircuitCrypto(AdvancedPrimePredictor):
     """نظام التشفير باستخدام نظرية الدائرة الكهربائية للأعداد الأولية"""
     
@@ -33,8 +37,8 @@ class PrimeCircuitCrypto(AdvancedPrimePredictor):
         min_prime = 2**(min_bits - 1)
         max_prime = 2**min_bits
         
-        # توليد عدد أولي عشوائي في النطاق
-        candidate_prime = randprime(min_prime, max_prime)
+        # توليد عدد أولي عشوائي في النطاق (gmpy2 للأعداد الكبيرة إن وُجدت)
+        candidate_prime = integer_backend(min_bits).random_prime(min_prime, max_prime)
         
         # تحسين العدد الأولي باستخدام الدائرة
         optimized_prime = self.optimize_prime_with_circuit(candidate_prime, voltage)
@@ -44,6 +48,9 @@ class PrimeCircuitCrypto(AdvancedPrimePredictor):
     def optimize_prime_with_circuit(self, initial_prime, voltage):
         """تحسين العدد الأولي باستخدام خصائص الدائرة"""
         
+        if int(initial_prime).bit_length() > CIRCUIT_MAX_BITS:
+            return initial_prime
+        
         # محاكاة الدائرة للعدد الأولي الأولي
         sim = self.simulate_circuit(initial_prime, voltage)
         if sim is None:
@@ -144,13 +151,14 @@ class PrimeCircuitCrypto(AdvancedPrimePredictor):
         blocks = [message_bytes[i:i+block_size] for i in range(0, len(message_bytes), block_size)]
         
         encrypted_blocks = []
+        powmod = integer_backend(n.bit_length()).powmod
         
         for block in blocks:
             # تحويل الكتلة إلى رقم
             block_int = int.from_bytes(block, byteorder='big')
             
             # التشفير: c = m^e mod n
-            encrypted_block = pow(block_int, e, n)
+            encrypted_block = powmod(block_int, e, n)
             encrypted_blocks.append(encrypted_block)
         
         return encrypted_blocks
@@ -161,10 +169,11 @@ class PrimeCircuitCrypto(AdvancedPrimePredictor):
         n, d = private_key
         
         decrypted_blocks = []
+        powmod = integer_backend(n.bit_length()).powmod
         
         for encrypted_block in encrypted_blocks:
             # فك التشفير: m = c^d mod n
-            decrypted_block_int = pow(encrypted_block, d, n)
+            decrypted_block_int = powmod(encrypted_block, d, n)
             
             # تحويل الرقم إلى bytes
             byte_length = (decrypted_block_int.bit_length() + 7) // 8
@@ -8,11 +8,11 @@
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy.integrate import solve_ivp
 from typing import Dict, List, Tuple, Callable
 import math
 
+from instrumentation import metrics
+
 class DifferentialOscillatingSphere:
     """النموذج التفاضلي للكرة المتذبذبة"""
     
@@ -126,6 +126,7 @@ class DifferentialOscillatingSphere:
             t_eval = np.linspace(t_span[0], t_span[1], 1000)
         
         # حل المعادلة التفاضلية
+        from scipy.integrate import solve_ivp
         solution = solve_ivp(
             self.differential_equation,
             t_span,
@@ -138,6 +139,8 @@ class DifferentialOscillatingSphere:
         if not solution.success:
             raise RuntimeError(f"فشل في حل المعادلة التفاضلية: {solution.message}")
         
+        metrics.count('ode.rhs_evaluations', solution.nfev)
+        
         # استخراج النتائج
         t_values = solution.t
         Q_values = solution.y[0]
@@ -290,6 +293,7 @@ class DifferentialOscillatingSphere:
     def plot_differential_solution(self, simulation_time: float = None, 
                                  compare_analytical: bool = True):
         """رسم حل المعادلة التفاضلية"""
+        import matplotlib.pyplot as plt
         
         if simulation_time is None:
             simulation_time = 3 * self.period
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+دالة ديريكليه L(s, χ₄) على الخط الحرج
+Dirichlet L(s, χ₄) on the Critical Line
+باسل يحيى عبدالله - Basil Yahya Abdullah
+
+الحرف χ₄ (mod 4): χ(4k+1) = 1، χ(4k+3) = −1، χ(زوجي) = 0. أصفار L(s, χ₄) على
+الخط الحرج تحكم سباق الأعداد الأولية 4k+1 ضد 4k+3 (prime_race) كما تحكم أصفار
+زيتا توزيع الأعداد الأولية؛ أدنى صفر γ₁ ≈ 6.0209 هو سبب تقدم 4k+3 المعتاد.
+بنفس أدوات zeta_zeros (دالة حقيقية من نوع هاردي وطور θ وتغيرات إشارة تُصقل بـ brentq):
+
+- l_chi4(s): L(s, χ₄) = 4^(−s) (ζ(s, 1/4) − ζ(s, 3/4)) بأويلر–ماكلورين لهورفيتز
+  (zeta_function.hurwitz_zeta)، متجهة على المصفوفات
+- chi4_theta(t): طور Λ(s) = (4/π)^((s+1)/2) Γ((s+1)/2) L(s, χ₄) على الخط الحرج
+  (المعادلة الدالية Λ(s) = Λ(1 − s)، χ₄ فردي وحقيقي)
+- chi4_z(t): Z(t, χ₄) = e^(iθ(t)) L(½ + it, χ₄) حقيقية مثل دالة هاردي، فأصفارها
+  تغيرات إشارة
+- chi4_zeros(t_max): الأصفار 0 < γ ≤ t_max بشبكة بخطوة جزء من متوسط التباعد
+  2π / log(4t/2π) ثم brentq
+
+    chi4_zeros(30)   # [6.0209, 10.2437, 12.9880, 16.3426, ...]
+"""
+
+import math
+import time
+import argparse
+
+import numpy as np
+
+from zeta_function import DEFAULT_TOLERANCE, hurwitz_zeta
+
+CHI4_MODULUS = 4
+GRID_PER_GAP = 8            # نقاط الشبكة في متوسط المسافة بين صفرين
+
+
+def l_chi4(s, tol: float = DEFAULT_TOLERANCE):
+    """
+    L(s, χ₄) = Σ χ₄(n) n^(−s) لعدد مركب أو مصفوفة (Re(s) ≥ 1/2 بدقة tol؛ قرب
+    s = 1 يفقد الفرق بين قطبي هورفيتز ~log10(1/|s − 1|) رقماً)
+
+    Returns:
+        complex أو مصفوفة complex بشكل s
+    """
+    values = np.asarray(s, dtype=complex)
+    with np.errstate(invalid='ignore'):
+        result = np.exp(-values * math.log(CHI4_MODULUS)) * (hurwitz_zeta(values, 0.25, tol)
+                                                             - hurwitz_zeta(values, 0.75, tol))
+    # قطبا ζ(s, 1/4) و ζ(s, 3/4) يتلاشيان في الفرق: L(1, χ₄) = π/4 (لايبنتز)
+    result = np.where(values == 1, math.pi / 4, result)
+    return complex(result) if values.ndim == 0 else result
+
+
+def chi4_theta(t) -> np.ndarray:
+    """θ(t) = (t/2)·log(4/π) + Im log Γ(3/4 + it/2)"""
+    from scipy.special import loggamma
+    t = np.asarray(t, dtype=float)
+    return t / 2 * math.log(CHI4_MODULUS / math.pi) + loggamma(0.75 + 0.5j * t).imag
+
+
+def chi4_z(t, tol: float = DEFAULT_TOLERANCE) -> np.ndarray:
+    """Z(t, χ₄) = e^(iθ(t)) L(½ + it, χ₄) (حقيقية، |Z| = |L|)"""
+    t = np.asarray(t, dtype=float)
+    return (np.exp(1j * chi4_theta(t)) * l_chi4(0.5 + 1j * t, tol)).real
+
+
+def chi4_zero_count(T) -> np.ndarray:
+    """العدد التقريبي للأصفار 0 < γ ≤ T: (T/2π)·log(4T/2πe)"""
+    T = np.asarray(T, dtype=float)
+    return T / (2 * math.pi) * np.log(CHI4_MODULUS * T / (2 * math.pi * math.e))
+
+
+def chi4_zeros(t_max: float, t_min: float = 0.0, per_gap: int = GRID_PER_GAP,
+               xtol: float = 1e-12) -> np.ndarray:
+    """
+    أصفار L(½ + it, χ₄) في (t_min, t_max]
+
+    Args:
+        per_gap: نقاط الشبكة في متوسط المسافة عند t_max (زوج أصفار أقرب من
+            خطوة الشبكة قد يفوت)
+        xtol: دقة brentq المطلقة
+
+    Returns:
+        مصفوفة الارتفاعات γ مرتبة تصاعدياً
+    """
+    from scipy.optimize import brentq
+
+    gap = 2 * math.pi / max(1.0, math.log(CHI4_MODULUS * t_max / (2 * math.pi)))
+    grid = np.linspace(t_min, t_max, int(math.ceil((t_max - t_min) * per_gap / gap)) + 1)
+    values = chi4_z(grid)
+    changes = np.nonzero(np.signbit(values[:-1]) != np.signbit(values[1:]))[0]
+    scalar = lambda t: float(chi4_z(t))
+    return np.array([brentq(scalar, grid[i], grid[i + 1], xtol=xtol) for i in changes])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Zeros of the Dirichlet L-function L(s, chi_4)")
+    parser.add_argument('--t-max', type=float, default=100.0)
+    parser.add_argument('--check', type=int, default=5, help="أصفار يُتحقق منها بـ mpmath.dirichlet")
+    args = parser.parse_args()
+
+    print("📈 أصفار L(s, χ₄) على الخط الحرج")
+    print("=" * 50)
+
+    start = time.perf_counter()
+    zeros = chi4_zeros(args.t_max)
+    seconds = time.perf_counter() - start
+    print(f"⏱️ {len(zeros)} صفراً حتى {args.t_max:g} في {seconds:.2f}s "
+          f"(التقريب الأملس {float(chi4_zero_count(args.t_max)):.1f})")
+    print(f"   أول الأصفار: {', '.join(f'{gamma:.6f}' for gamma in zeros[:6])}")
+
+    if args.check:
+        import mpmath
+        worst = max(abs(complex(mpmath.dirichlet(0.5 + 1j * gamma, [0, 1, 0, -1])))
+                    for gamma in zeros[:args.check])
+        print(f"✅ أكبر |L(½ + iγ)| بـ mpmath ({args.check} أصفار): {worst:.2e}")
+
+
+if __name__ == "__main__":
+    main()
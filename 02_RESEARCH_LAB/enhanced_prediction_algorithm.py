@@ -8,8 +8,9 @@
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
 from differential_sphere_model import DifferentialOscillatingSphere
+from instrumentation import metrics
+import model_cache
 from typing import Dict, List, Tuple
 import math
 
@@ -37,8 +38,8 @@ class EnhancedPrimePrediction:
         }
         
         for i, prime in enumerate(primes_list):
-            # إنشاء نموذج الكرة
-            sphere = DifferentialOscillatingSphere(prime)
+            # معاملات نموذج الكرة (سجل مخزن)
+            sphere = model_cache.parameters(DifferentialOscillatingSphere, prime)
             
             # حساب المعاملات الفيزيائية
             omega_0 = 1 / np.sqrt(sphere.L * sphere.C)
@@ -46,8 +47,7 @@ class EnhancedPrimePrediction:
             Q_factor = omega_0 * sphere.L / sphere.R
             
             # محاكاة الطاقة
-            solution = sphere.solve_differential_equation((0, 2*sphere.period))
-            avg_energy = np.mean(solution['total_energy'])
+            avg_energy = model_cache.differential_energy(prime, 2).average
             energy_ratio = avg_energy / sphere.hbar / sphere.f0
             
             # حفظ البيانات
@@ -70,11 +70,12 @@ class EnhancedPrimePrediction:
         
         return patterns
     
+    @metrics.timed('predict_next_prime_enhanced.total')
     def predict_next_prime_enhanced(self, current_prime: int) -> Dict:
         """التنبؤ المحسن بالعدد الأولي التالي"""
         
-        # إنشاء نموذج الكرة للعدد الحالي
-        sphere = DifferentialOscillatingSphere(current_prime)
+        # معاملات نموذج الكرة للعدد الحالي (سجل مخزن)
+        sphere = model_cache.parameters(DifferentialOscillatingSphere, current_prime)
         
         # حساب المعاملات الفيزيائية
         omega_0 = 1 / np.sqrt(sphere.L * sphere.C)
@@ -83,9 +84,10 @@ class EnhancedPrimePrediction:
         tau = 2 * sphere.L / sphere.R
         
         # محاكاة الطاقة التفاضلية
-        solution = sphere.solve_differential_equation((0, 3*sphere.period))
-        avg_energy = np.mean(solution['total_energy'])
-        energy_std = np.std(solution['total_energy'])
+        with metrics.timer('predict_next_prime_enhanced.ode_solve'):
+            energy = model_cache.differential_energy(current_prime, 3)
+        avg_energy = energy.average
+        energy_std = energy.stability
         
         # حساب نسبة الطاقة إلى الطاقة الكونية
         cosmic_energy = sphere.hbar * sphere.f0 / 2
@@ -123,17 +125,22 @@ class EnhancedPrimePrediction:
             estimated_gap = 2
         
         # البحث عن العدد الأولي التالي
-        candidate = current_prime + estimated_gap
-        attempts = 0
-        max_attempts = 20
-        
-        while not self.is_prime(candidate) and attempts < max_attempts:
-            candidate += 1
-            attempts += 1
+        with metrics.timer('predict_next_prime_enhanced.candidate_search'):
+            candidate = current_prime + estimated_gap
+            attempts = 0
+            max_attempts = 20
+            
+            while not self.is_prime(candidate) and attempts < max_attempts:
+                candidate += 1
+                attempts += 1
+            
+            # إذا لم نجد عدد أولي، نستخدم الطريقة التقليدية
+            if attempts >= max_attempts:
+                candidate = self.get_next_prime_traditional(current_prime)
         
-        # إذا لم نجد عدد أولي، نستخدم الطريقة التقليدية
-        if attempts >= max_attempts:
-            candidate = self.get_next_prime_traditional(current_prime)
+        metrics.count('predict_next_prime_enhanced.candidates_tested', attempts + 1)
+        metrics.count('primality.calls', attempts + 1)
+        metrics.observe('predict_next_prime_enhanced.search_attempts', attempts)
         
         # حساب الثقة في التنبؤ
         confidence = self._calculate_confidence(current_prime, Q_factor, gamma, energy_ratio)
@@ -234,10 +241,12 @@ class EnhancedPrimePrediction:
         candidate = n + 1
         while not self.is_prime(candidate):
             candidate += 1
+        metrics.count('primality.calls', candidate - n)
         return candidate
     
     def plot_prediction_analysis(self, test_results: Dict):
         """رسم تحليل نتائج التنبؤ"""
+        import matplotlib.pyplot as plt
         
         predictions = test_results['predictions']
         
@@ -288,8 +297,8 @@ class EnhancedPrimePrediction:
         plt.tight_layout()
         return fig
 
-def test_enhanced_prediction():
-    """اختبار خوارزمية التنبؤ المحسنة"""
+def test_enhanced_prediction(plot: bool = True):
+    """اختبار خوارزمية التنبؤ المحسنة (plot=False يتخطى الرسوم)"""
     
     print("🚀 اختبار خوارزمية التنبؤ المحسنة")
     print("=" * 60)
@@ -320,10 +329,11 @@ def test_enhanced_prediction():
               f"فعلي: {pred['actual_next']}, ثقة: {pred['confidence']:.2f}")
     
     # رسم التحليل
-    print("\n🎨 إنشاء الرسوم البيانية...")
-    fig = predictor.plot_prediction_analysis(results)
-    plt.savefig('enhanced_prediction_analysis.png', dpi=300, bbox_inches='tight')
-    print("✅ تم حفظ الرسم: enhanced_prediction_analysis.png")
+    if plot:
+        print("\n🎨 إنشاء الرسوم البيانية...")
+        fig = predictor.plot_prediction_analysis(results)
+        fig.savefig('enhanced_prediction_analysis.png', dpi=300, bbox_inches='tight')
+        print("✅ تم حفظ الرسم: enhanced_prediction_analysis.png")
     
     # تحليل الأنماط
     print("\n🔍 تحليل أنماط الأعداد الأولية...")
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+رسم سريع للسلاسل الكبيرة
+Fast Plotting for Large Series
+باسل يحيى عبدالله - Basil Yahya Abdullah
+
+- تقليل النقاط بأخذ القيمة الصغرى والعظمى لكل بكسل (min/max) أو بطريقة LTTB
+  فلا يرسم matplotlib أكثر من نقطتين لكل بكسل مهما طالت السلسلة
+- خطوط قابلة لإعادة الاستخدام: set_data بدلاً من ax.clear() ثم ax.plot()
+- مدرج تكراري بفنان واحد (stairs) بدلاً من مستطيل لكل عمود
+- نقاط scatter مخففة: نقطة واحدة لكل خلية بكسل
+- BlitManager: إعادة رسم الفنانين المتحركين فقط فوق خلفية محفوظة
+"""
+
+import numpy as np
+
+MIN_PIXELS = 100
+
+
+def pixel_budget(ax) -> int:
+    """عرض المحور بالبكسل (عدد الأعمدة المتاحة للرسم)"""
+    return max(MIN_PIXELS, int(ax.bbox.width))
+
+
+def minmax_decimate(x, y, n_bins: int):
+    """
+    تقليل بالقيمة الصغرى والعظمى لكل عمود
+
+    الأعمدة بعدد متساوٍ من النقاط (تطابق البكسلات عندما تكون x شبه منتظمة
+    كالزمن أو الأعداد الأولية). الناتج يحافظ على القمم والقيعان
+    (لا تختفي القفزات كما يحدث مع أخذ عينة كل k نقطة)
+
+    Returns:
+        (x, y) بحد أقصى 2 × n_bins + 2 نقطة بترتيبها الأصلي
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n <= 2 * n_bins:
+        return x, y
+
+    chunk = -(-n // n_bins)
+    full = (n // chunk) * chunk
+    blocks = y[:full].reshape(-1, chunk)
+    if np.isnan(blocks).any():
+        lo_idx = np.argmin(np.where(np.isnan(blocks), np.inf, blocks), axis=1)
+        hi_idx = np.argmax(np.where(np.isnan(blocks), -np.inf, blocks), axis=1)
+    else:
+        lo_idx = np.argmin(blocks, axis=1)
+        hi_idx = np.argmax(blocks, axis=1)
+
+    offsets = np.arange(0, full, chunk)
+    keep = [offsets + lo_idx, offsets + hi_idx, [0, n - 1]]
+    if full < n:
+        tail = y[full:]
+        if not np.isnan(tail).all():
+            keep.append([full + np.nanargmin(tail), full + np.nanargmax(tail)])
+
+    keep = np.unique(np.concatenate(keep))
+    return x[keep], y[keep]
+
+
+def lttb(x, y, n_out: int):
+    """
+    Largest-Triangle-Three-Buckets: يختار من كل دلو النقطة التي تصنع
+    أكبر مثلث مع النقطة المختارة سابقاً ومتوسط الدلو التالي
+
+    Returns:
+        (x, y) بعدد n_out نقطة (الأولى والأخيرة محفوظتان)
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return x, y
+
+    bounds = np.linspace(1, n - 1, n_out - 1).astype(int)
+    keep = np.empty(n_out, dtype=int)
+    keep[0], keep[-1] = 0, n - 1
+
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = bounds[i], bounds[i + 1]
+        nxt_lo, nxt_hi = bounds[i + 1], (bounds[i + 2] if i + 2 < len(bounds) else n)
+        avg_x = x[nxt_lo:nxt_hi].mean()
+        avg_y = y[nxt_lo:nxt_hi].mean()
+
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) -
+                      (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(np.argmax(area))
+        keep[i + 1] = a
+
+    return x[keep], y[keep]
+
+
+def decimate(x, y, n_bins: int, method: str = 'minmax'):
+    """تقليل النقاط إلى ما يكفي n_bins بكسل ('minmax' أو 'lttb')"""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+
+    # LTTB لا يشترط ترتيب x، و minmax يحتاجه
+    if method == 'lttb' or (len(x) > 1 and np.any(np.diff(x) < 0)):
+        return lttb(x, y, 2 * n_bins)
+    return minmax_decimate(x, y, n_bins)
+
+
+class DecimatedLine:
+    """
+    خط matplotlib يحتفظ بالبيانات الكاملة ويرسم نسخة مقللة
+
+    عند التكبير (تغير xlim) يُعاد التقليل على الجزء الظاهر فقط بالدقة الكاملة
+    """
+
+    def __init__(self, ax, x=(), y=(), *args, method: str = 'minmax', **kwargs):
+        self.ax = ax
+        self.method = method
+        self.line, = ax.plot([], [], *args, **kwargs)
+        self.x = np.zeros(0)
+        self.y = np.zeros(0)
+        self._sorted = True
+        ax.callbacks.connect('xlim_changed', self._on_xlim_changed)
+        self.set_data(x, y)
+
+    def set_data(self, x, y):
+        """تحديث البيانات مع إعادة استخدام نفس Line2D"""
+        self.x = np.asarray(x, dtype=float)
+        self.y = np.asarray(y, dtype=float)
+        self._sorted = len(self.x) < 2 or not np.any(np.diff(self.x) < 0)
+        self._refresh(None)
+
+    def _refresh(self, xlim):
+        x, y = self.x, self.y
+        if xlim is not None and self._sorted and len(x):
+            lo = max(0, np.searchsorted(x, xlim[0]) - 1)
+            hi = min(len(x), np.searchsorted(x, xlim[1]) + 1)
+            x, y = x[lo:hi], y[lo:hi]
+        self.line.set_data(*decimate(x, y, pixel_budget(self.ax), self.method))
+
+    def _on_xlim_changed(self, ax):
+        self._refresh(ax.get_xlim())
+
+    def data_limits(self):
+        """حدود البيانات الكاملة (للتحجيم التلقائي دون الاعتماد على النسخة المقللة)"""
+        finite = np.isfinite(self.y)
+        if not np.any(finite):
+            return None
+        return (self.x[finite].min(), self.x[finite].max(),
+                self.y[finite].min(), self.y[finite].max())
+
+
+def plot(ax, x, y, *args, method: str = 'minmax', **kwargs) -> DecimatedLine:
+    """بديل ax.plot للسلاسل الطويلة - يعيد DecimatedLine (الخط في .line)"""
+    dline = DecimatedLine(ax, x, y, *args, method=method, **kwargs)
+
+    # مثل ax.plot: توسيع حدود البيانات (النسخة المقللة تحتفظ بالقيم القصوى)
+    xy = np.column_stack(dline.line.get_data())
+    if len(xy):
+        ax.update_datalim(xy[np.isfinite(xy).all(axis=1)])
+        ax.autoscale_view()
+    return dline
+
+
+def thin_points(ax, x, y) -> np.ndarray:
+    """
+    فهارس نقطة واحدة لكل خلية بكسل - النقاط المتطابقة بصرياً تُرسم مرة واحدة
+
+    Returns:
+        فهارس النقاط المحتفظ بها (لتطبيقها على الألوان والأحجام أيضاً)
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    width = pixel_budget(ax)
+    height = max(MIN_PIXELS, int(ax.bbox.height))
+    if len(x) <= width * height // 4:
+        return np.arange(len(x))
+
+    def to_pixel(values, size, log):
+        v = np.log10(np.where(values > 0, values, np.nan)) if log else values
+        lo, hi = np.nanmin(v), np.nanmax(v)
+        span = hi - lo if hi > lo else 1.0
+        return np.nan_to_num((v - lo) / span * (size - 1), nan=-1).astype(np.int64)
+
+    px = to_pixel(x, width, ax.get_xscale() == 'log')
+    py = to_pixel(y, height, ax.get_yscale() == 'log')
+    _, keep = np.unique(px * (height + 1) + py, return_index=True)
+    return np.sort(keep)
+
+
+def scatter(ax, x, y, c=None, s=None, **kwargs):
+    """بديل ax.scatter يخفف النقاط إلى نقطة لكل خلية بكسل"""
+    n = len(x)
+    keep = thin_points(ax, x, y)
+    x = np.asarray(x)[keep]
+    y = np.asarray(y)[keep]
+
+    # الألوان والأحجام لكل نقطة تُخفف بنفس الفهارس (الألوان الثابتة كما هي)
+    if c is not None and not isinstance(c, str) and np.ndim(c) == 1 and len(c) == n:
+        c = np.asarray(c)[keep]
+    if s is not None and np.ndim(s) == 1 and len(s) == n:
+        s = np.asarray(s)[keep]
+    return ax.scatter(x, y, c=c, s=s, **kwargs)
+
+
+def histogram(ax, data, bins=50, artist=None, **kwargs):
+    """
+    مدرج تكراري بفنان StepPatch واحد
+
+    Args:
+        artist: فنان سابق يُعاد استخدامه عبر set_data (بدلاً من ax.hist جديد)
+
+    Returns:
+        الفنان (StepPatch)
+    """
+    counts, edges = np.histogram(np.asarray(data), bins=bins)
+    if artist is not None:
+        artist.set_data(counts, edges)
+        return artist
+    kwargs.setdefault('fill', True)
+    return ax.stairs(counts, edges, **kwargs)
+
+
+def integer_bins(data):
+    """حدود أعمدة عند كل قيمة صحيحة (للفجوات بين الأعداد الأولية)"""
+    data = np.asarray(data)
+    if len(data) == 0:
+        return 1
+    return np.arange(data.min() - 0.5, data.max() + 1.5)
+
+
+class BlitManager:
+    """
+    رسم متزامن (blitting): الخلفية الثابتة تُحفظ عند كل رسم كامل،
+    والتحديثات ترسم الفنانين المتحركين فقط ثم تنسخ المنطقة إلى الشاشة
+    """
+
+    def __init__(self, canvas, artists=()):
+        self.canvas = canvas
+        self.background = None
+        self.artists = []
+        for artist in artists:
+            self.add_artist(artist)
+        self._cid = canvas.mpl_connect('draw_event', self._on_draw)
+
+    def add_artist(self, artist):
+        artist.set_animated(True)
+        self.artists.append(artist)
+
+    def _on_draw(self, event):
+        self.background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self._draw_artists()
+
+    def _draw_artists(self):
+        figure = self.canvas.figure
+        for artist in self.artists:
+            figure.draw_artist(artist)
+
+    def update(self):
+        """تحديث سريع: الخلفية المحفوظة + الفنانون المتحركون"""
+        if self.background is None:
+            self.canvas.draw()
+            return
+        self.canvas.restore_region(self.background)
+        self._draw_artists()
+        self.canvas.blit(self.canvas.figure.bbox)
+        self.canvas.flush_events()
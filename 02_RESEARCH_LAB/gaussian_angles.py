@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+توزيع زوايا الأعداد الأولية الغاوسية
+Streaming Angle Distribution of Gaussian Primes
+باسل يحيى عبدالله - Basil Yahya Abdullah
+
+كل عدد أولي p ≡ 1 (mod 4) يساوي x² + y² (x ≤ y)، فزاويته في المستوى المركب
+atan2(y, x) بين 45° و 90°، بينما تمثيل الأعداد 4k+3 (a = b = √(p/2) كما في
+analyze_45_degree_phenomenon) يعطي 45° دائماً. بدل سجل لكل عدد:
+
+- AngleHistogram: مدرج ثابت الخانات على [0°, 90°] مع عزوم الزوايا
+  (StreamingStats)، قابل للدمج والحفظ
+- angle_histograms: مدرج لكل صنف (4k+1 / 4k+3) وعزوم |z| = √p لمصفوفة أعداد
+  أولية دفعة دفعة (two_squares_batch)
+- GaussianAngleTask: نفس الشيء لمقطع [lo, hi) من الغربال المقطعي، فتوزعه
+  run_sharded على عمليات أو خوادم وتدمج النتائج؛ الذاكرة بطول المقطع فقط
+
+    result = angle_distribution(10**9, workers=4)
+    result['classes']['4k+1'].density()
+"""
+
+import time
+import argparse
+from typing import Dict
+
+import numpy as np
+
+from scan_checkpoint import StreamingStats
+from two_squares import two_squares_batch
+from range_sharding import DEFAULT_SHARD_SIZE, ShardTask, merge_partials, run_sharded
+
+ANGLE_BINS = 90
+ANGLE_RANGE = (0.0, 90.0)
+CHUNK_SIZE = 1 << 20
+
+PRIME_CLASSES = ('4k+1', '4k+3')
+
+
+class AngleHistogram:
+    """مدرج زوايا بخانات ثابتة (بالدرجات) مع عزوم الزوايا"""
+
+    def __init__(self, bins: int = ANGLE_BINS, low: float = ANGLE_RANGE[0], high: float = ANGLE_RANGE[1]):
+        if bins <= 0 or high <= low:
+            raise ValueError("AngleHistogram needs bins > 0 and high > low")
+        self.bins = bins
+        self.low = low
+        self.high = high
+        self.counts = np.zeros(bins, dtype=np.int64)
+        self.outside = 0
+        self.moments = StreamingStats()
+
+    def add(self, angles):
+        angles = np.asarray(angles, dtype=float).ravel()
+        index = np.floor((angles - self.low) * (self.bins / (self.high - self.low))).astype(np.int64)
+        index[angles == self.high] = self.bins - 1      # الحد الأعلى ضمن آخر خانة
+        inside = (index >= 0) & (index < self.bins)
+        self.counts += np.bincount(index[inside], minlength=self.bins)
+        self.outside += int(angles.size - np.count_nonzero(inside))
+        self.moments.extend(angles)
+
+    def merge(self, other: 'AngleHistogram'):
+        if (other.bins, other.low, other.high) != (self.bins, self.low, self.high):
+            raise ValueError("cannot merge angle histograms with different bins")
+        self.counts += other.counts
+        self.outside += other.outside
+        self.moments.merge(other.moments)
+
+    @property
+    def total(self) -> int:
+        return self.moments.count
+
+    @property
+    def edges(self) -> np.ndarray:
+        return np.linspace(self.low, self.high, self.bins + 1)
+
+    def density(self) -> np.ndarray:
+        """كثافة الاحتمال لكل خانة (تكاملها 1 على الزوايا داخل المدى)"""
+        inside = self.counts.sum()
+        width = (self.high - self.low) / self.bins
+        return self.counts / (inside * width) if inside else np.zeros(self.bins)
+
+    def most_common(self, n: int = 5):
+        """أكثر الخانات امتلاءً: [((بداية، نهاية)، العدد)]"""
+        edges = self.edges
+        order = np.argsort(-self.counts, kind='stable')[:n]
+        return [((float(edges[i]), float(edges[i + 1])), int(self.counts[i])) for i in order if self.counts[i]]
+
+    def to_dict(self) -> Dict:
+        return {'bins': self.bins, 'low': self.low, 'high': self.high,
+                'counts': self.counts.tolist(), 'outside': self.outside,
+                'moments': self.moments.to_dict()}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'AngleHistogram':
+        histogram = cls(data['bins'], data['low'], data['high'])
+        histogram.counts = np.array(data['counts'], dtype=np.int64)
+        histogram.outside = data['outside']
+        histogram.moments = StreamingStats.from_dict(data['moments'])
+        return histogram
+
+    def __repr__(self):
+        return (f"AngleHistogram(total={self.total}, mean={self.moments.mean:.4f}°, "
+                f"std={self.moments.std:.4f}°)")
+
+
+def prime_angles(primes) -> np.ndarray:
+    """
+    زاوية كل عدد أولي بالدرجات: atan2(y, x) لـ x² + y² = p (4k+1 و 2)،
+    و a = b = √(p/2) للأعداد 4k+3
+    """
+    p = np.asarray(primes, dtype=np.int64)
+    # a = b بالضبط (لا cos(π/4) و sin(π/4) المختلفتين في آخر بت) فالزاوية 45° تماماً
+    x = np.sqrt(p / 2)
+    y = x.copy()
+    exact = (p % 4 == 1) | (p == 2)
+    if exact.any():
+        x[exact], y[exact] = two_squares_batch(p[exact])
+    return np.degrees(np.arctan2(y, x))
+
+
+def empty_angle_result(bins: int = ANGLE_BINS) -> Dict:
+    """نتيجة جزئية فارغة بنفس بنية angle_histograms"""
+    return {
+        'prime_count': 0,
+        'classes': {name: AngleHistogram(bins) for name in PRIME_CLASSES},
+        'radius': StreamingStats()
+    }
+
+
+def angle_histograms(primes, bins: int = ANGLE_BINS, chunk_size: int = CHUNK_SIZE) -> Dict:
+    """
+    مدرجات الزوايا لكل صنف لمصفوفة أعداد أولية (أو memmap) دفعة دفعة
+
+    Returns:
+        {'prime_count', 'classes': {'4k+1': AngleHistogram, '4k+3': AngleHistogram},
+         'radius': StreamingStats لـ |z| = √p}
+        العدد 2 يُحسب مع 4k+3 كما في golden_resonance_model
+    """
+    result = empty_angle_result(bins)
+    for start in range(0, len(primes), chunk_size):
+        chunk = np.asarray(primes[start:start + chunk_size], dtype=np.int64)
+        angles = prime_angles(chunk)
+        is_4k1 = chunk % 4 == 1
+        result['classes']['4k+1'].add(angles[is_4k1])
+        result['classes']['4k+3'].add(angles[~is_4k1])
+        result['radius'].extend(np.sqrt(chunk.astype(float)))
+        result['prime_count'] += int(len(chunk))
+    return result
+
+
+class GaussianAngleTask(ShardTask):
+    """مدرجات زوايا الأعداد الأولية في مقطع [lo, hi)"""
+
+    name = 'gaussian_angles'
+
+    def __init__(self, bins: int = ANGLE_BINS):
+        self.bins = bins
+
+    def map(self, lo, hi):
+        from prime_sieve import primes_between
+        return angle_histograms(primes_between(lo, hi), self.bins)
+
+
+def angle_distribution(limit: int, bins: int = ANGLE_BINS, lo: int = 2,
+                       shard_size: int = DEFAULT_SHARD_SIZE, workers: int = None, **kwargs) -> Dict:
+    """
+    مدرجات الزوايا لكل الأعداد الأولية في [lo, limit) موزعة على مقاطع
+
+    Args:
+        limit: حد الأعداد الأولية (غير مشمول)
+        workers: عدد العمليات (0 = في نفس العملية)
+        kwargs: تُمرر إلى run_sharded (retries, hosts, progress)
+    """
+    if limit <= lo:
+        return empty_angle_result(bins)
+    return merge_partials(empty_angle_result(bins),
+                          run_sharded(GaussianAngleTask(bins), lo, limit, shard_size, workers=workers, **kwargs))
+
+
+def print_angle_distribution(result: Dict):
+    """طباعة ملخص مدرجات الزوايا"""
+    print(f"\n📐 زوايا {result['prime_count']:,} عدد أولي:")
+    for name in PRIME_CLASSES:
+        histogram = result['classes'][name]
+        if not histogram.total:
+            continue
+        moments = histogram.moments
+        print(f"   {name}: {histogram.total:,} عدد | المتوسط {moments.mean:.4f}° | "
+              f"الانحراف {moments.std:.4f}° | المدى [{moments.min:.2f}°, {moments.max:.2f}°]")
+        for (start, end), count in histogram.most_common(3):
+            print(f"      [{start:.1f}°, {end:.1f}°): {count:,} ({count / histogram.total:.2%})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streaming angle histograms of Gaussian primes")
+    parser.add_argument('--limit', type=float, default=1e8)
+    parser.add_argument('--bins', type=int, default=ANGLE_BINS)
+    parser.add_argument('--shard-size', type=float, default=10 * DEFAULT_SHARD_SIZE)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    print("🌀 توزيع زوايا الأعداد الأولية الغاوسية")
+    print("=" * 50)
+
+    def progress(done, total):
+        print(f"\r   المقاطع: {done}/{total}", end='', flush=True)
+
+    start = time.perf_counter()
+    result = angle_distribution(int(args.limit), args.bins, shard_size=int(args.shard_size),
+                                workers=args.workers, progress=progress)
+    seconds = time.perf_counter() - start
+    print(f"\n⏱️ {seconds:.1f}s ({result['prime_count'] / seconds:,.0f} عدد/ثانية)")
+    print_angle_distribution(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,7 @@ import matplotlib.pyplot as plt
 from corrected_prime_simulator import CorrectedPrimeCircuit
 from sympy import primerange, nextprime
 import pandas as pd
+from result_cache import cached_result
 
 class ImprovedGapPredictor(CorrectedPrimeCircuit):
     """متنبئ الفجوات المحسن مع قدرة على التنبؤ بفجوات متنوعة"""
@@ -114,6 +115,7 @@ class ImprovedGapPredictor(CorrectedPrimeCircuit):
         
         return predicted_gap, actual_gap, accuracy
     
+    @cached_result(state=('gap_sensitivity', 'energy_threshold', 'voltage_factor'))
     def comprehensive_gap_analysis(self, prime_range=(7, 100), voltage=10):
         """تحليل شامل للفجوات في نطاق معين"""
         
@@ -88,25 +88,11 @@ class ImprovedZetaCalculator(CorrectedPrimeCircuit):
             
         return complex(0.5, final_imaginary)
     
-    def evaluate_zeta_improved(self, s, max_terms=1000):
-        """تقييم محسن لدالة زيتا"""
+    def evaluate_zeta_improved(self, s, tol=1e-12):
+        """تقييم محسن لدالة زيتا (أويلر–ماكلورين مع الانعكاس عند Re(s) < 1/2)"""
         
-        if s.real <= 0:
-            return float('inf')
-            
-        zeta_sum = 0
-        for n in range(1, max_terms + 1):
-            try:
-                term = 1 / (n ** s)
-                zeta_sum += term
-                
-                # توقف مبكر إذا كان التقارب سريع
-                if abs(term) < 1e-10:
-                    break
-            except:
-                continue
-                
-        return zeta_sum
+        from zeta_function import zeta
+        return zeta(s, tol)
     
     def find_improved_zeta_zeros(self, prime_range=(7, 50), max_zeros=10):
         """البحث المحسن عن أصفار زيتا"""
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+أدوات القياس لخط التنبؤ
+Prediction Pipeline Instrumentation
+باسل يحيى عبدالله - Basil Yahya Abdullah
+
+مؤقتات (context manager)، عدادات، ومدرجات تكرارية لكل مرحلة:
+حل المعادلة التفاضلية، البحث عن المرشحين، اختبارات الأولية...
+
+القياس معطل افتراضياً وتكلفته عندها فحص واحد لـ metrics.enabled.
+التفعيل:
+    metrics.enable()                       من الكود
+    BASIL_PROFILE=1 python script.py       طباعة التقرير عند الخروج
+    BASIL_PROFILE=profile.json python ...  حفظ التقرير (json أو .prom) عند الخروج
+"""
+
+import os
+import json
+import time
+import atexit
+import bisect
+import functools
+from contextlib import nullcontext
+from typing import Callable, Dict, Sequence
+
+# حدود المدرج بالعقود: تصلح للأزمنة بالثواني وللأعداد الصحيحة الصغيرة
+DEFAULT_BUCKETS = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 0.1, 1.0, 10.0, 100.0, 1000.0)
+
+_NULL_TIMER = nullcontext()
+
+
+class Histogram:
+    """مدرج تكراري بحدود ثابتة (متوافق مع Prometheus)"""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # الأخير: +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.min = float('inf')
+        self.max = float('-inf')
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def merge(self, data: Dict):
+        """دمج مدرج مُصدَّر (من عامل آخر) بنفس الحدود"""
+        for i, c in enumerate(data['bucket_counts']):
+            self.counts[i] += c
+        self.count += data['count']
+        self.sum += data['sum']
+        if data['count']:
+            self.min = min(self.min, data['min'])
+            self.max = max(self.max, data['max'])
+
+    def to_dict(self) -> Dict:
+        return {
+            'count': self.count,
+            'sum': self.sum,
+            'mean': self.sum / self.count if self.count else 0.0,
+            'min': self.min if self.count else 0.0,
+            'max': self.max if self.count else 0.0,
+            'buckets': list(self.buckets),
+            'bucket_counts': list(self.counts)
+        }
+
+
+class _Timer:
+    """مؤقت مرحلة: يسجل المدة بالثواني في مدرج باسم المرحلة"""
+
+    __slots__ = ('registry', 'name', 'start')
+
+    def __init__(self, registry, name):
+        self.registry = registry
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.registry._timer_histogram(self.name).observe(time.perf_counter() - self.start)
+        return False
+
+
+class Instrumentation:
+    """سجل القياسات: مؤقتات وعدادات ومدرجات"""
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.reset()
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        """مسح جميع القياسات"""
+        self.counters = {}
+        self.timers = {}
+        self.histograms = {}
+
+    # ===== التسجيل =====
+
+    def timer(self, name: str):
+        """
+        مؤقت مرحلة كـ context manager
+
+        مثال:
+            with metrics.timer('predict_enhanced.ode_solve'):
+                solution = self.solve_oscillation()
+        """
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name)
+
+    def timed(self, name: str) -> Callable:
+        """مزخرف يقيس زمن الدالة كاملة"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                with _Timer(self, name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def count(self, name: str, value: float = 1):
+        """زيادة عداد"""
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def observe(self, name: str, value: float, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        """إضافة قيمة إلى مدرج تكراري"""
+        if self.enabled:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram(buckets)
+            histogram.observe(value)
+
+    def record_time(self, name: str, seconds: float):
+        """تسجيل مدة مقاسة مسبقاً في مؤقت"""
+        if self.enabled:
+            self._timer_histogram(name).observe(seconds)
+
+    def _timer_histogram(self, name: str) -> Histogram:
+        histogram = self.timers.get(name)
+        if histogram is None:
+            histogram = self.timers[name] = Histogram()
+        return histogram
+
+    # ===== التصدير =====
+
+    def snapshot(self) -> Dict:
+        """جميع القياسات كقاموس قابل للتحويل إلى JSON"""
+        return {
+            'counters': dict(self.counters),
+            'timers': {name: h.to_dict() for name, h in self.timers.items()},
+            'histograms': {name: h.to_dict() for name, h in self.histograms.items()}
+        }
+
+    def merge(self, snapshot: Dict):
+        """دمج لقطة من عملية أخرى (مثلاً عامل في مجمع العمليات)"""
+        for name, value in snapshot.get('counters', {}).items():
+            self.counters[name] = self.counters.get(name, 0) + value
+        for kind, store in (('timers', self.timers), ('histograms', self.histograms)):
+            for name, data in snapshot.get(kind, {}).items():
+                if name not in store:
+                    store[name] = Histogram(data['buckets'])
+                store[name].merge(data)
+
+    def to_json(self, indent: int = 2) -> str:
+        return json.dumps(self.snapshot(), indent=indent, ensure_ascii=False)
+
+    def to_prometheus(self, prefix: str = 'basil') -> str:
+        """صيغة Prometheus النصية"""
+
+        def metric_name(name, suffix=''):
+            clean = ''.join(ch if ch.isalnum() else '_' for ch in name)
+            return f"{prefix}_{clean}{suffix}"
+
+        lines = []
+        for name, value in sorted(self.counters.items()):
+            metric = metric_name(name, '_total')
+            lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric} {value}")
+
+        for store, suffix in ((self.timers, '_seconds'), (self.histograms, '')):
+            for name, histogram in sorted(store.items()):
+                metric = metric_name(name, suffix)
+                lines.append(f"# TYPE {metric} histogram")
+                cumulative = 0
+                for bound, c in zip(histogram.buckets, histogram.counts):
+                    cumulative += c
+                    lines.append(f'{metric}_bucket{{le="{bound:g}"}} {cumulative}')
+                lines.append(f'{metric}_bucket{{le="+Inf"}} {histogram.count}')
+                lines.append(f"{metric}_sum {histogram.sum}")
+                lines.append(f"{metric}_count {histogram.count}")
+
+        return '\n'.join(lines) + '\n'
+
+    def dump(self, path: str):
+        """حفظ التقرير: .prom أو .txt بصيغة Prometheus، وغير ذلك JSON"""
+        text = self.to_prometheus() if str(path).endswith(('.prom', '.txt')) else self.to_json()
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+    def print_report(self):
+        """طباعة ملخص القياسات"""
+        print(f"\n⏱️ ملف الأداء (Profile):")
+        print(f"{'Stage':48s} | {'Calls':>7s} | {'Total':>9s} | {'Mean':>9s} | {'Max':>9s}")
+        print("-" * 93)
+        for name, h in sorted(self.timers.items(), key=lambda item: -item[1].sum):
+            print(f"{name:48s} | {h.count:7d} | {h.sum * 1000:7.1f}ms | "
+                  f"{h.sum / h.count * 1000:7.3f}ms | {h.max * 1000:7.3f}ms")
+
+        if self.counters:
+            print(f"\n🔢 العدادات:")
+            for name, value in sorted(self.counters.items()):
+                print(f"   {name:48s} {value}")
+
+        if self.histograms:
+            print(f"\n📊 المدرجات:")
+            for name, h in sorted(self.histograms.items()):
+                data = h.to_dict()
+                print(f"   {name:48s} n={data['count']} mean={data['mean']:.3f} "
+                      f"min={data['min']:g} max={data['max']:g}")
+
+
+metrics = Instrumentation()
+
+
+def _profile_at_exit(target: str):
+    if target == '1':
+        metrics.print_report()
+    else:
+        metrics.dump(target)
+        print(f"⏱️ تم حفظ ملف الأداء: {target}")
+
+
+_PROFILE_TARGET = os.environ.get('BASIL_PROFILE', '')
+if _PROFILE_TARGET and _PROFILE_TARGET != '0':
+    metrics.enable()
+    # العمليات الفرعية ترسل قياساتها للعملية الرئيسية بدلاً من الكتابة فوق الملف
+    import multiprocessing
+    if multiprocessing.parent_process() is None:
+        atexit.register(_profile_at_exit, _PROFILE_TARGET)
+
+
+if __name__ == "__main__":
+    print("⏱️ أدوات القياس لخط التنبؤ")
+    print("=" * 40)
+
+    metrics.enable()
+    for p in [11, 101, 1009]:
+        with metrics.timer('demo.trial_division'):
+            divisors = [d for d in range(2, p) if p % d == 0]
+        metrics.count('demo.primality_calls')
+        metrics.observe('demo.trial_divisions', p - 2)
+
+    metrics.print_report()
+    print(f"\n{metrics.to_prometheus()}")
@@ -137,6 +137,13 @@ class InteractivePrimeStory:
             print(f'   "نحن نرقص بزاوية {angle:.2f}°"')
             print(f'   "نحكي قصص مختلفة"')
         
+        from prime_race import prime_race
+        race = prime_race(p + 1, workers=0)
+        leader = {1: "4k+1", -1: "4k+3"}.get(race.leader, "لا أحد")
+        print(f"🏁 السباق بين المجموعتين حتى {p}:")
+        print(f'   "4k+1: {race.count_1} عدداً، 4k+3: {race.count_3} عدداً (الفرق {race.lead:+d})"')
+        print(f'   "{leader} في المقدمة، وتبادلنا الصدارة {len(race.crossings)} مرة"')
+        
         print(f"🗣️ جميع الأعداد الأولية:")
         print(f'   "نتبع قانون π الكوني"')
         print(f'   "نرسل ترددات f = p/π إلى الكون"')
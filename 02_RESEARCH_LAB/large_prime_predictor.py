@@ -10,6 +10,7 @@ import matplotlib.pyplot as plt
 from corrected_prime_simulator import CorrectedPrimeCircuit
 from sympy import primerange, nextprime, isprime
 import pandas as pd
+from instrumentation import metrics
 
 class LargePrimePredictor(CorrectedPrimeCircuit):
     """متنبئ محسن للأعداد الأولية الكبيرة مع تصحيح تدهور الدقة"""
@@ -96,11 +97,13 @@ class LargePrimePredictor(CorrectedPrimeCircuit):
             'adaptive_k': adaptive_k
         }
     
+    @metrics.timed('predict_large_prime_enhanced.total')
     def predict_large_prime_enhanced(self, current_prime, voltage=10):
         """التنبؤ المحسن بالعدد الأولي التالي للأعداد الكبيرة"""
         
         # المحاكاة المحسنة
-        sim = self.enhanced_circuit_simulation(current_prime, voltage)
+        with metrics.timer('predict_large_prime_enhanced.circuit_simulation'):
+            sim = self.enhanced_circuit_simulation(current_prime, voltage)
         
         if sim is None:
             return None, 0
@@ -127,35 +130,60 @@ class LargePrimePredictor(CorrectedPrimeCircuit):
         predicted_prime_int = int(round(predicted_prime))
         
         # التأكد من أن العدد أولي
-        while not isprime(predicted_prime_int) and predicted_prime_int < current_prime + 50:
-            predicted_prime_int += 1
+        with metrics.timer('predict_large_prime_enhanced.candidate_search'):
+            first_candidate = predicted_prime_int
+            while not isprime(predicted_prime_int) and predicted_prime_int < current_prime + 50:
+                predicted_prime_int += 1
+        
+        candidates_tested = predicted_prime_int - first_candidate + 1
+        metrics.count('predict_large_prime_enhanced.candidates_tested', candidates_tested)
+        metrics.count('primality.calls', candidates_tested)
+        metrics.observe('predict_large_prime_enhanced.search_attempts', candidates_tested - 1)
         
         # حساب الدقة
-        actual_next_prime = nextprime(current_prime)
+        with metrics.timer('predict_large_prime_enhanced.reference_nextprime'):
+            actual_next_prime = nextprime(current_prime)
         accuracy = max(0, 100 - abs(predicted_prime_int - actual_next_prime) / actual_next_prime * 100)
         
         return predicted_prime_int, accuracy
     
-    def comprehensive_large_prime_test(self, start_prime=100, num_tests=20, voltage=10):
-        """اختبار شامل للأعداد الأولية الكبيرة"""
+    def comprehensive_large_prime_test(self, start_prime=100, num_tests=20, voltage=10,
+                                       checkpoint=None, start_index=None):
+        """
+        اختبار شامل للأعداد الأولية الكبيرة
+
+        Args:
+            checkpoint: ScanCheckpoint اختياري - المؤشر هو العدد الأولي التالي
+                        وعدد الاختبارات المنجزة، فلا تُعاد الغربلة من البداية
+            start_index: ترتيب أول عدد أولي بدل start_prime (nth_prime، حتى 10^12)
+        """
+        if start_index is not None:
+            from prime_sieve import nth_prime
+            start_prime = nth_prime(start_index)
         
         print(f"🔍 اختبار شامل للأعداد الأولية الكبيرة من {start_prime}")
         print("=" * 80)
         
-        # الحصول على أعداد أولية للاختبار
-        test_primes = []
-        current = start_prime
-        while len(test_primes) < num_tests:
-            if isprime(current):
-                test_primes.append(current)
-            current += 1
-        
         results = []
+        # المؤشر: [العدد الأولي التالي للاختبار، عدد الاختبارات المنجزة]
+        cursor = [nextprime(start_prime - 1), 0]
+        
+        if checkpoint is not None:
+            cursor = checkpoint.begin('comprehensive_large_prime_test',
+                                      {'start_prime': start_prime, 'num_tests': num_tests,
+                                       'voltage': voltage}, cursor)
+            results = list(checkpoint.rows)
+            if checkpoint.resumed:
+                print(f"♻️ استئناف من {cursor[0]} ({cursor[1]}/{num_tests} اختبار منجز)")
         
         print("Current | Predicted | Actual | Error | Accuracy | Adaptive K | Circuit Energy")
         print("-" * 90)
         
-        for prime in test_primes:
+        prime, done = cursor
+        while done < num_tests:
+            if checkpoint is not None:
+                checkpoint.step([prime, done])
+            
             predicted, accuracy = self.predict_large_prime_enhanced(prime, voltage)
             actual = nextprime(prime)
             
@@ -181,22 +209,42 @@ class LargePrimePredictor(CorrectedPrimeCircuit):
                     'adaptive_k': adaptive_k,
                     'circuit_energy': circuit_energy
                 })
+                if checkpoint is not None:
+                    checkpoint.add_row(results[-1])
+                    checkpoint.stats('accuracy').update(accuracy)
+                    checkpoint.stats('error_percent').update(error_percent)
+            
+            prime, done = actual, done + 1
+        
+        if checkpoint is not None:
+            checkpoint.finish([prime, done])
         
         return pd.DataFrame(results)
     
-    def analyze_accuracy_decay(self, results_df):
-        """تحليل تدهور الدقة مع زيادة حجم العدد"""
+    def analyze_accuracy_decay(self, results_df, size_ranges=None):
+        """
+        تحليل تدهور الدقة مع زيادة حجم العدد
+        
+        Args:
+            size_ranges: [(من، إلى، الاسم)]؛ افتراضياً 100-500، أو أربعة نطاقات
+                لوغاريتمية تغطي النتائج إذا تجاوزت 500 (مثلاً اختبار من nth_prime(10^9))
+        """
         
         print(f"\n📉 تحليل تدهور الدقة:")
         print("=" * 40)
         
         # تجميع النتائج حسب نطاقات الحجم
-        size_ranges = [
-            (100, 150, "100-150"),
-            (150, 200, "150-200"),
-            (200, 300, "200-300"),
-            (300, 500, "300-500")
-        ]
+        if size_ranges is None:
+            size_ranges = [
+                (100, 150, "100-150"),
+                (150, 200, "150-200"),
+                (200, 300, "200-300"),
+                (300, 500, "300-500")
+            ]
+            if len(results_df) and results_df['current_prime'].max() >= 500:
+                low, high = results_df['current_prime'].min(), results_df['current_prime'].max()
+                edges = np.unique(np.geomspace(low, high + 1, 5).astype(np.int64))
+                size_ranges = [(int(a), int(b), f"{a:,}-{b:,}") for a, b in zip(edges[:-1], edges[1:])]
         
         for min_size, max_size, range_name in size_ranges:
             range_data = results_df[
@@ -38,8 +38,14 @@ def generate_large_primes(start: int, count: int) -> list:
     
     return primes
 
-def test_large_primes_performance():
-    """اختبار الأداء على الأعداد الأولية الكبيرة"""
+def test_large_primes_performance(test_ranges=None, checkpoint=None):
+    """
+    اختبار الأداء على الأعداد الأولية الكبيرة
+
+    Args:
+        test_ranges: قائمة (بداية، عدد) - افتراضياً أربعة نطاقات حتى 1000
+        checkpoint: ScanCheckpoint اختياري - يُحفظ بعد كل نطاق ويُستأنف من النطاق التالي
+    """
     
     print("🔬 اختبار الأعداد الأولية الكبيرة")
     print("=" * 60)
@@ -48,17 +54,28 @@ def test_large_primes_performance():
     print("📊 توليد الأعداد الأولية الكبيرة...")
     
     # مجموعات مختلفة من الأعداد الأولية
-    test_ranges = [
-        (100, 10),   # 10 أعداد أولية بدءاً من 100
-        (200, 8),    # 8 أعداد أولية بدءاً من 200
-        (500, 6),    # 6 أعداد أولية بدءاً من 500
-        (1000, 5)    # 5 أعداد أولية بدءاً من 1000
-    ]
+    if test_ranges is None:
+        test_ranges = [
+            (100, 10),   # 10 أعداد أولية بدءاً من 100
+            (200, 8),    # 8 أعداد أولية بدءاً من 200
+            (500, 6),    # 6 أعداد أولية بدءاً من 500
+            (1000, 5)    # 5 أعداد أولية بدءاً من 1000
+        ]
     
     predictor = EnhancedPrimePrediction()
     all_results = {}
-    
-    for start_range, count in test_ranges:
+    first = 0
+    
+    if checkpoint is not None:
+        first = checkpoint.begin('test_large_primes_performance',
+                                 {'test_ranges': [list(r) for r in test_ranges]}, 0)
+        for row in checkpoint.rows:
+            all_results[row.pop('range_start')] = row
+        if checkpoint.resumed:
+            print(f"♻️ استئناف من النطاق {first + 1}/{len(test_ranges)}")
+    
+    for index in range(first, len(test_ranges)):
+        start_range, count = test_ranges[index]
         print(f"\n🎯 اختبار النطاق: {start_range}+ ({count} أعداد)")
         print("-" * 40)
         
@@ -92,6 +109,13 @@ def test_large_primes_performance():
             'results': results
         }
         
+        if checkpoint is not None:
+            checkpoint.add_row({'range_start': start_range, **all_results[start_range]})
+            checkpoint.stats('accuracy').update(results['accuracy'])
+            checkpoint.stats('prediction_time').update(prediction_time)
+            # النطاقات طويلة: نقطة حفظ بعد كل نطاق
+            checkpoint.step(index + 1, force=True)
+        
         # عرض بعض التنبؤات
         print("\n📋 عينة من التنبؤات:")
         for i, pred in enumerate(results['predictions'][:3]):
@@ -99,6 +123,9 @@ def test_large_primes_performance():
             print(f"  {status} {pred['current']} → {pred['predicted_next']} "
                   f"(فعلي: {pred['actual_next']}, ثقة: {pred['confidence']:.2f})")
     
+    if checkpoint is not None:
+        checkpoint.finish(len(test_ranges))
+    
     return all_results
 
 def analyze_large_primes_patterns(results):
@@ -202,6 +229,25 @@ def test_quantum_energy_ratios(primes_list):
     
     return quantum_ratios
 
+def test_batch_prediction_matches_scalar():
+    """predict_next_primes المتجهة تطابق BasilPrimeTheory فوق 3×10⁹ (حيث p² يفيض في int64)"""
+    import warnings
+    from basil_prime_theory import BasilPrimeTheory, predict_next_primes
+
+    primes = [1000003, 3037000493, 10000000019, 50000000021, 999999999989]
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        batch = predict_next_primes(primes)
+        scalar = [BasilPrimeTheory(p).predict_next_prime('enhanced') for p in primes]
+
+    for p, got, expected in zip(primes, batch, scalar):
+        assert got.keys() == expected.keys(), p
+        for name, value in expected.items():
+            if isinstance(value, float):
+                assert np.isclose(got[name], value, rtol=1e-12, atol=0), (p, name, got[name], value)
+            else:
+                assert got[name] == value, (p, name, got[name], value)
+
 def main():
     """الدالة الرئيسية"""
     
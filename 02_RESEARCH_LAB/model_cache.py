@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+ذاكرة مؤقتة لنماذج الأعداد الأولية
+Per-Prime Model Cache
+باسل يحيى عبدالله - Basil Yahya Abdullah
+
+BasilPrimeTheory(p) و DifferentialOscillatingSphere(p) و OscillatingSphere(p)
+تُبنى مراراً لنفس الأعداد في التحليلات والمقارنات. هذه الوحدة تحفظ ناتجها
+في ذاكرة LRU محدودة مفتاحها (الفئة، العدد، نصف القطر، الشحنة):
+
+- parameters(cls, p): سجل معاملات غير قابل للتعديل (NamedTuple) بدل الكائن
+- derived(cls, p, name, compute): قيمة مشتقة مكلفة (حل ODE، تنبؤ) تُحسب مرة واحدة
+- cache.stats(): عدد الإصابات والإخفاقات والإخراجات
+
+القيم المخزنة يجب أن تكون غير قابلة للتعديل (أعداد، NamedTuple) لأنها مشتركة
+بين كل من يطلبها.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, NamedTuple
+
+import numpy as np
+
+MAX_SIZE = 4096
+
+
+class TheoryParameters(NamedTuple):
+    """معاملات BasilPrimeTheory (نفس أسماء خصائص الكائن)"""
+    prime: int
+    radius: float
+    charge: float
+    surface_area: float
+    frequency: float
+    angular_frequency: int
+    period: float
+    resistance: float
+    inductance: float
+    capacitance: float
+    voltage: float
+    LC_product: float
+    resonance_condition: float
+    resonance_error: float
+    natural_frequency: float
+    damping_factor: float
+    quality_factor: float
+    time_constant: float
+    quantum_energy: float
+    zero_point_energy: float
+    quantum_ratio: float
+    theoretical_quantum_ratio: float
+
+
+class DifferentialParameters(NamedTuple):
+    """معاملات DifferentialOscillatingSphere"""
+    p: int
+    r0: float
+    Q0: float
+    pi: float
+    alpha: float
+    f0: float
+    hbar: float
+    f: float
+    omega: int
+    period: float
+    A0: float
+    R: float
+    L: float
+    C: float
+    LC_product: float
+    resonance_condition: float
+    Q_amplitude: float
+    V_amplitude: float
+
+
+class SphereParameters(NamedTuple):
+    """معاملات OscillatingSphere"""
+    p: int
+    r: float
+    Q: float
+    pi: float
+    alpha: float
+    f0: float
+    hbar: float
+    A: float
+    f: float
+    omega: int
+    V: float
+    L: float
+    C: float
+    LC_product: float
+    resonance_condition: float
+    R: float
+    Z_magnitude: float
+    E0: float
+    Ep: float
+
+
+class EnergySummary(NamedTuple):
+    """متوسط الطاقة الكلية وانحرافها المعياري لمحاكاة واحدة"""
+    average: float
+    stability: float
+
+    @classmethod
+    def of(cls, total_energy: np.ndarray) -> 'EnergySummary':
+        return cls(np.mean(total_energy), np.std(total_energy))
+
+
+RECORD_TYPES = {
+    'BasilPrimeTheory': TheoryParameters,
+    'DifferentialOscillatingSphere': DifferentialParameters,
+    'OscillatingSphere': SphereParameters,
+}
+
+
+class ModelCache:
+    """
+    ذاكرة LRU محدودة الحجم وآمنة للخيوط
+
+    الحساب عند الإخفاق يتم خارج القفل؛ إذا حسب خيطان نفس المفتاح معاً
+    تُحفظ النتيجة الأولى
+    """
+
+    def __init__(self, maxsize: int = MAX_SIZE):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, compute: Callable):
+        """القيمة المخزنة للمفتاح، أو compute() مع تخزينها"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        value = compute()
+
+        with self._lock:
+            value = self._entries.setdefault(key, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def stats(self) -> Dict:
+        """إحصاءات الإصابة"""
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._entries),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+    def clear(self):
+        """تفريغ الذاكرة وتصفير الإحصاءات"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# الذاكرة المشتركة للعملية
+cache = ModelCache()
+
+
+def parameters(cls, prime: int, radius: float = 1.0, charge: float = 1.0) -> NamedTuple:
+    """
+    سجل معاملات النموذج cls(prime, radius, charge)
+
+    Returns:
+        TheoryParameters أو DifferentialParameters أو SphereParameters
+    """
+    record_type = RECORD_TYPES[cls.__name__]
+
+    def build():
+        model = cls(prime, radius, charge)
+        return record_type(**{name: getattr(model, name) for name in record_type._fields})
+
+    return cache.get((cls.__name__, prime, radius, charge, 'parameters'), build)
+
+
+def derived(cls, prime: int, name: str, compute: Callable, radius: float = 1.0,
+            charge: float = 1.0):
+    """
+    قيمة مشتقة من النموذج، تُحسب بـ compute(cls(prime, radius, charge)) عند أول طلب
+
+    Args:
+        name: اسم القيمة (جزء من المفتاح، مثل 'energy_3T')
+        compute: دالة تستقبل كائن النموذج وتعيد قيمة غير قابلة للتعديل
+    """
+    return cache.get((cls.__name__, prime, radius, charge, name),
+                     lambda: compute(cls(prime, radius, charge)))
+
+
+def oscillation_energy(prime: int, radius: float = 1.0, charge: float = 1.0) -> EnergySummary:
+    """ملخص طاقة BasilPrimeTheory.solve_oscillation() (3 أدوار) المستخدم في التنبؤ المحسن"""
+    from basil_prime_theory import BasilPrimeTheory
+
+    return derived(BasilPrimeTheory, prime, 'energy_3T',
+                   lambda theory: EnergySummary.of(theory.solve_oscillation()['total_energy']),
+                   radius, charge)
+
+
+def differential_energy(prime: int, periods: int, radius: float = 1.0,
+                        charge: float = 1.0) -> EnergySummary:
+    """ملخص طاقة DifferentialOscillatingSphere.solve_differential_equation((0, periods·T))"""
+    from differential_sphere_model import DifferentialOscillatingSphere
+
+    def solve(sphere):
+        solution = sphere.solve_differential_equation((0, periods * sphere.period))
+        return EnergySummary.of(solution['total_energy'])
+
+    return derived(DifferentialOscillatingSphere, prime, f'energy_{periods}T', solve, radius, charge)
+
+
+def predict_next_prime(prime: int, method: str = 'enhanced', radius: float = 1.0,
+                       charge: float = 1.0) -> Dict:
+    """
+    نفس BasilPrimeTheory(prime).predict_next_prime(method) من السجلات المخزنة
+
+    يعيد قاموساً جديداً في كل استدعاء (الأجزاء المخزنة فقط هي المشتركة)
+    """
+    from basil_prime_theory import BasilPrimeTheory
+
+    record = parameters(BasilPrimeTheory, prime, radius, charge)
+    theory = BasilPrimeTheory._from_parameters(prime, radius, charge, record._asdict())
+    if method != 'enhanced':
+        return theory.predict_next_prime(method)
+    energy = oscillation_energy(prime, radius, charge)
+    return theory._predict_from_energy(energy.average, energy.stability)
+
+
+if __name__ == "__main__":
+    import time
+    import model_cache  # نفس الوحدة التي تستوردها basil_prime_theory (لا __main__)
+    from basil_prime_theory import test_prediction_accuracy, generate_primes
+
+    print("🗃️ ذاكرة نماذج الأعداد الأولية")
+    print("=" * 40)
+
+    primes = generate_primes(1000, 200)
+    for attempt in ('أول تشغيل', 'تشغيل مكرر'):
+        start = time.perf_counter()
+        results = test_prediction_accuracy(primes)
+        print(f"⏱️ {attempt}: {time.perf_counter() - start:.3f}s (دقة {results['accuracy']:.1%})")
+    print(f"📊 {model_cache.cache.stats()}")
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+واجهات الحساب العددي القابلة للتبديل
+Pluggable Numeric Backends (float64 / mpmath / gmpy2)
+باسل يحيى عبدالله - Basil Yahya Abdullah
+
+float64 يكفي لزيتا عند الارتفاعات الصغيرة، لكن الطور t·ln n يفقد log10(t) رقماً:
+خطأ Z(t) بحدود 10⁻¹⁰ عند t = 10⁶ و 5×10⁻⁵ عند t = 10¹⁰. وأعداد RSA قرب 2^4096
+تحتاج اختبار أولية وأسّاً معيارياً أسرع من sympy و pow. هنا واجهتان:
+
+- real_backend(t): Float64Backend (NumPy، متجهة، الافتراضية) حتى FLOAT64_MAX_HEIGHT،
+  وفوقه MpmathBackend بدقة zeta_digits(t) = 15 + ⌈log10 t⌉ رقماً عشرياً
+- integer_backend(bits): PythonIntegerBackend (sympy و pow) أو Gmpy2IntegerBackend
+  (gmpy2.is_prime و gmpy2.powmod) للأعداد من GMPY2_MIN_BITS بت فأكثر إن وُجدت gmpy2
+
+الاختيار تلقائي ('auto') ويمكن فرض واجهة بمتغيري البيئة BASIL_REAL_BACKEND و
+BASIL_INTEGER_BACKEND، أو تسجيل واجهة جديدة في REAL_BACKENDS / INTEGER_BACKENDS.
+المكتبات الاختيارية تُستورد عند الاستخدام فقط؛ إن غابت تبقى float64 وPython.
+
+    real_backend(1e9).siegel_z(1e9 + 0.3)
+    integer_backend(4096).is_prime(n)
+"""
+
+import os
+import math
+import secrets
+import warnings
+from importlib.util import find_spec
+
+import numpy as np
+
+# فحص وجود المكتبات دون استيرادها (تُستورد داخل الواجهة عند أول استخدام)
+MPMATH_AVAILABLE = find_spec('mpmath') is not None
+GMPY2_AVAILABLE = find_spec('gmpy2') is not None
+
+FLOAT64_DIGITS = 15
+FLOAT64_MAX_HEIGHT = 1e6    # فوقه خطأ float64 في Z(t) أكبر من 10⁻⁹
+GMPY2_MIN_BITS = 64         # تحته لا يستحق التحويل إلى mpz
+
+
+def zeta_digits(t) -> int:
+    """الأرقام العشرية اللازمة لحساب زيتا عند الارتفاع t بدقة float64 كاملة"""
+    return FLOAT64_DIGITS + max(0, math.ceil(math.log10(max(float(t), 1.0))))
+
+
+class Float64Backend:
+    """زيتا و Z(t) بـ NumPy (أويلر–ماكلورين وريمان-سيجل المتجهة)"""
+
+    name = 'float64'
+    dps = FLOAT64_DIGITS
+
+    def zeta(self, s):
+        from zeta_function import zeta
+        return zeta(s)
+
+    def siegel_z(self, t):
+        from zeta_zeros import riemann_siegel_z
+        return riemann_siegel_z(t)
+
+
+class MpmathBackend(Float64Backend):
+    """زيتا و Z(t) بـ mpmath بدقة dps رقماً، والنتائج float64/complex128"""
+
+    name = 'mpmath'
+
+    def __init__(self, dps: int = FLOAT64_DIGITS):
+        self.dps = dps
+
+    def zeta(self, s):
+        import mpmath
+        values = np.asarray(s, dtype=complex)
+        with mpmath.workdps(self.dps):
+            result = np.array([complex(mpmath.zeta(mpmath.mpc(z.real, z.imag))) for z in values.ravel()])
+        return complex(result[0]) if values.ndim == 0 else result.reshape(values.shape)
+
+    def siegel_z(self, t):
+        import mpmath
+        values = np.asarray(t, dtype=float)
+        with mpmath.workdps(self.dps):
+            result = np.array([float(mpmath.siegelz(x)) for x in values.ravel()])
+        return float(result[0]) if values.ndim == 0 else result.reshape(values.shape)
+
+
+class PythonIntegerBackend:
+    """أعداد Python الصحيحة: sympy لاختبار الأولية و pow للأس المعياري"""
+
+    name = 'python'
+
+    def is_prime(self, n: int) -> bool:
+        from sympy import isprime
+        return bool(isprime(n))
+
+    def next_prime(self, n: int) -> int:
+        from sympy import nextprime
+        return int(nextprime(n))
+
+    def random_prime(self, lo: int, hi: int) -> int:
+        """عدد أولي عشوائي في [lo, hi)"""
+        from sympy import randprime
+        return int(randprime(lo, hi))
+
+    def powmod(self, base: int, exponent: int, modulus: int) -> int:
+        return pow(base, exponent, modulus)
+
+
+class Gmpy2IntegerBackend(PythonIntegerBackend):
+    """gmpy2 (GMP): is_prime و next_prime و powmod، والنتائج int عادية"""
+
+    name = 'gmpy2'
+
+    def is_prime(self, n: int) -> bool:
+        import gmpy2
+        return bool(gmpy2.is_prime(n))
+
+    def next_prime(self, n: int) -> int:
+        import gmpy2
+        return int(gmpy2.next_prime(n))
+
+    def random_prime(self, lo: int, hi: int) -> int:
+        # مثل sympy.randprime: أول عدد أولي بعد نقطة عشوائية، مع الالتفاف إلى lo
+        if hi <= lo:
+            raise ValueError("random_prime needs hi > lo")
+        p = self.next_prime(lo + secrets.randbelow(hi - lo) - 1)
+        if p >= hi:
+            p = self.next_prime(lo - 1)
+        if p >= hi:
+            raise ValueError(f"no prime in [{lo}, {hi})")
+        return p
+
+    def powmod(self, base: int, exponent: int, modulus: int) -> int:
+        import gmpy2
+        return int(gmpy2.powmod(base, exponent, modulus))
+
+
+REAL_BACKENDS = {'float64': Float64Backend, 'mpmath': MpmathBackend}
+INTEGER_BACKENDS = {'python': PythonIntegerBackend, 'gmpy2': Gmpy2IntegerBackend}
+
+
+def _forced(variable: str, registry: dict):
+    """اسم الواجهة المفروضة من متغير البيئة (None = تلقائي)"""
+    name = os.environ.get(variable, 'auto')
+    if name == 'auto':
+        return None
+    if name not in registry:
+        raise ValueError(f"{variable}={name!r}: expected 'auto' or one of {sorted(registry)}")
+    return name
+
+
+def real_backend(t=0.0):
+    """
+    واجهة زيتا المناسبة لأكبر ارتفاع |t|
+
+    Args:
+        t: ارتفاع أو مصفوفة ارتفاعات
+
+    Returns:
+        Float64Backend حتى FLOAT64_MAX_HEIGHT، وإلا MpmathBackend(zeta_digits(t))
+    """
+    height = float(np.max(np.abs(t), initial=0.0))
+    name = _forced('BASIL_REAL_BACKEND', REAL_BACKENDS)
+    if name == 'mpmath' and not MPMATH_AVAILABLE:
+        warnings.warn("BASIL_REAL_BACKEND=mpmath but mpmath is not installed; using float64")
+        name = 'float64'
+    if name is None:
+        name = 'mpmath' if height > FLOAT64_MAX_HEIGHT and MPMATH_AVAILABLE else 'float64'
+    if name == 'mpmath':
+        return REAL_BACKENDS[name](zeta_digits(height))
+    return REAL_BACKENDS[name]()
+
+
+def integer_backend(bits: int = 0):
+    """
+    واجهة الأعداد الصحيحة المناسبة لعدد بطول bits بت
+
+    Returns:
+        Gmpy2IntegerBackend من GMPY2_MIN_BITS بت إن وُجدت gmpy2، وإلا PythonIntegerBackend
+    """
+    name = _forced('BASIL_INTEGER_BACKEND', INTEGER_BACKENDS)
+    if name == 'gmpy2' and not GMPY2_AVAILABLE:
+        warnings.warn("BASIL_INTEGER_BACKEND=gmpy2 but gmpy2 is not installed; using python integers")
+        name = 'python'
+    if name is None:
+        name = 'gmpy2' if bits >= GMPY2_MIN_BITS and GMPY2_AVAILABLE else 'python'
+    return INTEGER_BACKENDS[name]()
+
+
+if __name__ == "__main__":
+    import time
+
+    print("🧮 واجهات الحساب العددي")
+    print("=" * 40)
+    print(f"   mpmath: {'✅' if MPMATH_AVAILABLE else '❌'} | gmpy2: {'✅' if GMPY2_AVAILABLE else '❌'}")
+
+    for t in (1e4, 1e7, 1e10):
+        backend = real_backend(t)
+        start = time.perf_counter()
+        value = backend.siegel_z(t + 0.3)
+        print(f"   Z({t:.0e} + 0.3) = {value:+.12f} [{backend.name}, {backend.dps} رقماً] "
+              f"{(time.perf_counter() - start) * 1e3:.1f}ms")
+
+    for bits in (32, 1024, 2048):
+        backend = integer_backend(bits)
+        start = time.perf_counter()
+        p = backend.next_prime(1 << (bits - 1))
+        print(f"   أول عدد أولي بعد 2^{bits - 1}: {str(p)[:12]}… [{backend.name}] "
+              f"{time.perf_counter() - start:.2f}s")
@@ -8,7 +8,6 @@
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
 from typing import Dict, List, Tuple
 import math
 
@@ -188,6 +187,7 @@ class OscillatingSphere:
     
     def plot_oscillations(self, duration: float = 2.0, points: int = 1000):
         """رسم تذبذبات الكرة"""
+        import matplotlib.pyplot as plt
         
         # حساب الدور الزمني
         period = 2 * self.pi / self.omega
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+مجمّع طلبات التنبؤ
+Micro-Batching Prediction Dispatcher
+باسل يحيى عبدالله - Basil Yahya Abdullah
+
+واجهة أمام BasilPrimeTheory.predict_next_prime للاستدعاءات المتزامنة داخل العملية:
+كل طلب يُضاف إلى قائمة انتظار، وخيط واحد يجمع ما يصل خلال بضعة أجزاء من الثانية
+(أو حتى max_batch)، يزيل التكرار ويحسب الدفعة بـ predict_next_primes
+(معاملات متجهة + حل ODE مجمّع)، ثم يوزع النتائج على Futures أصحابها.
+
+    with PredictionBatcher() as batcher:
+        batcher.predict(7919)                       # من أي خيط
+        await batcher.predict_async(7919)           # من asyncio
+
+النتائج مطابقة لـ BasilPrimeTheory(p).predict_next_prime(method) طلباً بطلب.
+"""
+
+import time
+import asyncio
+import argparse
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List
+
+import numpy as np
+
+from instrumentation import metrics
+
+MAX_BATCH = 256
+MAX_DELAY = 0.003  # ثوانٍ
+
+
+class PredictionBatcher:
+    """
+    تجميع طلبات التنبؤ المتزامنة في دفعات
+
+    أول طلب في دفعة فارغة يبدأ نافذة max_delay، والدفعة الممتلئة تُرسل فوراً.
+    أثناء حساب دفعة تتراكم الطلبات الجديدة للدفعة التالية، فيكبر حجم الدفعة
+    تلقائياً مع الحمل
+    """
+
+    def __init__(self, method: str = 'enhanced', radius: float = 1.0, charge: float = 1.0,
+                 max_batch: int = MAX_BATCH, max_delay: float = MAX_DELAY):
+        self.method = method
+        self.radius = radius
+        self.charge = charge
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._pending = []
+        self._condition = threading.Condition()
+        self._closed = False
+        self.requests = 0
+        self.batches = 0
+        self.unique = 0
+        self._worker = threading.Thread(target=self._loop, name='prediction-batcher', daemon=True)
+        self._worker.start()
+
+    def submit(self, prime: int) -> Future:
+        """إضافة طلب وإرجاع Future لنتيجته"""
+        future = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("PredictionBatcher is closed")
+            self._pending.append((int(prime), future))
+            self.requests += 1
+            self._condition.notify()
+        return future
+
+    def predict(self, prime: int, timeout: float = None) -> Dict:
+        """التنبؤ بالعدد الأولي التالي (ينتظر دفعته)"""
+        return self.submit(prime).result(timeout)
+
+    async def predict_async(self, prime: int) -> Dict:
+        """نفس predict لكن دون حجز حلقة asyncio"""
+        return await asyncio.wrap_future(self.submit(prime))
+
+    def _take_batch(self) -> List:
+        with self._condition:
+            while not self._pending and not self._closed:
+                self._condition.wait()
+            if not self._pending:
+                return []
+            deadline = time.perf_counter() + self.max_delay
+            while len(self._pending) < self.max_batch and not self._closed:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            batch = self._pending[:self.max_batch]
+            del self._pending[:self.max_batch]
+            return batch
+
+    def _loop(self):
+        from basil_prime_theory import predict_next_primes
+
+        while True:
+            batch = self._take_batch()
+            if not batch:
+                return
+            primes = [prime for prime, _ in batch]
+            self.batches += 1
+            self.unique += len(set(primes))
+            metrics.observe('batcher.batch_size', len(batch),
+                            buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256, 512))
+            try:
+                with metrics.timer('batcher.batch'):
+                    results = predict_next_primes(primes, self.method, self.radius, self.charge)
+            except Exception as exc:
+                for _, future in batch:
+                    future.set_exception(exc)
+                continue
+            for (_, future), result in zip(batch, results):
+                future.set_result(result)
+
+    def stats(self) -> Dict:
+        """إحصاءات التجميع"""
+        return {
+            'requests': self.requests,
+            'batches': self.batches,
+            'unique_primes': self.unique,
+            'average_batch': self.requests / self.batches if self.batches else 0.0,
+            'pending': len(self._pending)
+        }
+
+    def close(self):
+        """إنهاء الخيط بعد حساب الطلبات المعلقة"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._worker.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _run_clients(call, primes: np.ndarray, threads: int, requests: int, seed: int = 42) -> Dict:
+    """عملاء متزامنون (خيوط) كل منهم يرسل طلبات متتالية ويقيس زمن كل طلب"""
+    per_client = max(1, requests // threads)
+
+    def client(index):
+        rng = np.random.default_rng(seed + index)
+        latencies = []
+        for prime in rng.choice(primes, per_client).tolist():
+            start = time.perf_counter()
+            call(prime)
+            latencies.append(time.perf_counter() - start)
+        return latencies
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        latencies = [value for chunk in pool.map(client, range(threads)) for value in chunk]
+    seconds = time.perf_counter() - start
+
+    ms = np.array(latencies) * 1000
+    return {
+        'requests': len(latencies),
+        'seconds': seconds,
+        'throughput': len(latencies) / seconds,
+        'p50_ms': float(np.percentile(ms, 50)),
+        'p99_ms': float(np.percentile(ms, 99))
+    }
+
+
+def main():
+    from prime_sieve import sieve_primes
+    from basil_prime_theory import BasilPrimeTheory
+
+    parser = argparse.ArgumentParser(description="Benchmark the prediction batcher")
+    parser.add_argument('--threads', type=int, default=32)
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--prime-limit', type=int, default=1_000_000)
+    parser.add_argument('--max-batch', type=int, default=MAX_BATCH)
+    parser.add_argument('--batch-delay-ms', type=float, default=MAX_DELAY * 1000)
+    args = parser.parse_args()
+
+    print("📦 مجمّع طلبات التنبؤ (enhanced)")
+    print("=" * 50)
+    primes = sieve_primes(args.prime_limit)[-2000:]  # أعداد متقاربة
+
+    direct = _run_clients(lambda p: BasilPrimeTheory(p).predict_next_prime('enhanced'),
+                          primes, args.threads, max(args.threads, args.requests // 10))
+    with PredictionBatcher(max_batch=args.max_batch, max_delay=args.batch_delay_ms / 1000) as batcher:
+        _run_clients(batcher.predict, primes, args.threads, args.threads * 4, seed=7)  # إحماء
+        batched = _run_clients(batcher.predict, primes, args.threads, args.requests)
+        stats = batcher.stats()
+
+    for name, report in (('مباشر', direct), ('مجمّع', batched)):
+        print(f"   {name}: {report['throughput']:,.0f} طلب/ثانية | "
+              f"p50 {report['p50_ms']:.1f}ms | p99 {report['p99_ms']:.1f}ms ({report['requests']} طلب)")
+    print(f"   التسريع: ×{batched['throughput'] / direct['throughput']:.1f} | "
+          f"متوسط حجم الدفعة: {stats['average_batch']:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,7 @@ import matplotlib.pyplot as plt
 from basil_prime_theory import BasilPrimeTheory, test_prediction_accuracy, generate_primes
 from enhanced_prediction_algorithm import EnhancedPrimePrediction
 from differential_sphere_model import DifferentialOscillatingSphere
+import model_cache
 import time
 from typing import Dict, List, Tuple
 import pandas as pd
@@ -27,9 +28,9 @@ class PredictionMethodsComparison:
     def method_1_basic_prediction(self, prime: int) -> Dict:
         """الطريقة الأولى: التنبؤ الأساسي من BasilPrimeTheory"""
         
-        theory = BasilPrimeTheory(prime)
+        theory = model_cache.parameters(BasilPrimeTheory, prime)
         start_time = time.time()
-        prediction = theory.predict_next_prime(method='basic')
+        prediction = model_cache.predict_next_prime(prime, method='basic')
         execution_time = time.time() - start_time
         
         return {
@@ -49,9 +50,8 @@ class PredictionMethodsComparison:
     def method_2_enhanced_prediction(self, prime: int) -> Dict:
         """الطريقة الثانية: التنبؤ المحسن من BasilPrimeTheory"""
         
-        theory = BasilPrimeTheory(prime)
         start_time = time.time()
-        prediction = theory.predict_next_prime(method='enhanced')
+        prediction = model_cache.predict_next_prime(prime, method='enhanced')
         execution_time = time.time() - start_time
         
         return {
@@ -67,9 +67,10 @@ class PredictionMethodsComparison:
     def method_3_differential_prediction(self, prime: int) -> Dict:
         """الطريقة الثالثة: التنبؤ التفاضلي من DifferentialOscillatingSphere"""
 
-        sphere = DifferentialOscillatingSphere(prime)
+        sphere = model_cache.parameters(DifferentialOscillatingSphere, prime)
         start_time = time.time()
-        predicted_next = sphere.predict_next_prime_differential()
+        predicted_next = model_cache.derived(DifferentialOscillatingSphere, prime, 'differential_prediction',
+                                             lambda model: model.predict_next_prime_differential())
         execution_time = time.time() - start_time
 
         # حساب مستوى الثقة بناءً على المعاملات الفيزيائية المتاحة
@@ -199,6 +200,9 @@ class PredictionMethodsComparison:
             
             print(f"📊 النتائج: دقة {accuracy:.1%}, وقت {avg_time:.4f}s, ثقة {avg_confidence:.2f}")
         
+        stats = model_cache.cache.stats()
+        print(f"\n🗃️ ذاكرة النماذج: {stats['hits']} إصابة / {stats['misses']} إخفاق")
+        
         return results
     
     def analyze_method_performance(self, comparison_results: Dict) -> Dict:
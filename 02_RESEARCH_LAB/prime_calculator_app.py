@@ -7,16 +7,160 @@
 الحاسبة التفاعلية للنظرية المكتشفة
 """
 
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from typing import Dict
+from typing import Callable, Dict
+
+import circuit_kernels
+import fast_plot
+from prime_sieve import sieve_primes
+from results_store import default_store
+
+
+class JobCancelled(Exception):
+    """إلغاء مهمة خلفية بطلب من المستخدم"""
+
+
+class BackgroundJob:
+    """
+    مهمة خلفية واحدة - دوالها تُستدعى من خيط العامل فقط
+    ولا تلمس عناصر Tk: كل شيء يمر عبر طابور الرسائل
+    """
+
+    def __init__(self, slot: str, outbox: queue.Queue):
+        self.slot = slot
+        self._outbox = outbox
+        self._cancel = threading.Event()
+        self._buffer = []
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def check(self):
+        """نقطة إلغاء: ترفع JobCancelled إذا ضغط المستخدم إلغاء"""
+        if self._cancel.is_set():
+            raise JobCancelled()
+
+    def write(self, text: str):
+        """إضافة نص للمخرجات (يُرسل دفعة واحدة عند التقدم التالي)"""
+        self._buffer.append(text)
+
+    def flush(self):
+        if self._buffer:
+            self._outbox.put((self, 'text', ''.join(self._buffer)))
+            self._buffer = []
+
+    def progress(self, done: int, total: int, message: str = ''):
+        """إرسال التقدم والنص المتراكم ثم التحقق من الإلغاء"""
+        self.flush()
+        self._outbox.put((self, 'progress', (done, total, message)))
+        self.check()
+
+
+class BackgroundJobRunner:
+    """
+    منفذ المهام الخلفية للواجهة
+
+    كل مهمة تعمل في خيط مستقل، وخيط Tk يقرأ رسائلها (نص، تقدم، نتيجة)
+    كل POLL_MS عبر root.after - مهمة واحدة لكل خانة (تبويب) في نفس الوقت
+    """
+
+    POLL_MS = 50
+
+    def __init__(self, root):
+        self.root = root
+        self.outbox = queue.Queue()
+        self.running = {}
+        self.root.after(self.POLL_MS, self._poll)
+
+    def is_running(self, slot: str) -> bool:
+        return slot in self.running
+
+    def submit(self, slot: str, func: Callable, *args, on_text: Callable = None,
+               on_progress: Callable = None, on_done: Callable = None,
+               on_error: Callable = None, on_finish: Callable = None) -> BackgroundJob:
+        """
+        تشغيل func(job, *args) في خيط خلفي
+
+        الدوال on_* تُستدعى في خيط Tk:
+            on_text(text), on_progress(done, total, message), on_done(result),
+            on_error(exception), on_finish(status) حيث status: done/cancelled/error
+        """
+        if slot in self.running:
+            return None
+
+        job = BackgroundJob(slot, self.outbox)
+        self.running[slot] = {
+            'job': job, 'on_text': on_text, 'on_progress': on_progress,
+            'on_done': on_done, 'on_error': on_error, 'on_finish': on_finish
+        }
+        threading.Thread(target=self._run, args=(job, func, args), daemon=True).start()
+        return job
+
+    def cancel(self, slot: str):
+        entry = self.running.get(slot)
+        if entry:
+            entry['job'].cancel()
+
+    def _run(self, job, func, args):
+        try:
+            result = func(job, *args)
+            job.flush()
+            self.outbox.put((job, 'done', result))
+        except JobCancelled:
+            job.flush()
+            self.outbox.put((job, 'cancelled', None))
+        except Exception as e:
+            job.flush()
+            self.outbox.put((job, 'error', e))
+
+    def _poll(self):
+        """توزيع رسائل العمال داخل خيط Tk"""
+        try:
+            while True:
+                job, kind, payload = self.outbox.get_nowait()
+                entry = self.running.get(job.slot)
+                if entry is None or entry['job'] is not job:
+                    continue
+
+                if kind == 'text':
+                    if entry['on_text']:
+                        entry['on_text'](payload)
+                elif kind == 'progress':
+                    if entry['on_progress']:
+                        entry['on_progress'](*payload)
+                else:
+                    del self.running[job.slot]
+                    if kind == 'done' and entry['on_done']:
+                        entry['on_done'](payload)
+                    elif kind == 'error':
+                        if entry['on_error']:
+                            entry['on_error'](payload)
+                        else:
+                            messagebox.showerror("خطأ", f"حدث خطأ: {str(payload)}")
+                    if entry['on_finish']:
+                        entry['on_finish'](kind)
+        except queue.Empty:
+            pass
+
+        self.root.after(self.POLL_MS, self._poll)
+
 
 class PrimeCalculatorApp:
     """حاسبة الأعداد الأولية وأصفار زيتا التفاعلية"""
 
+    MAX_LISTED = 200    # أقصى عدد أسطر تفصيلية في النص (الإحصائيات تشمل الكل)
+    JOB_CHUNK = 50000   # حجم الدفعة بين تحديثات التقدم ونقاط الإلغاء
+
     def __init__(self, root):
         self.root = root
         self.root.title("حاسبة نظرية الدوائر الكهربائية للأعداد الأولية - أستاذ باسل يحيى عبدالله")
@@ -28,6 +172,11 @@ class PrimeCalculatorApp:
         self.L = 1e-3  # مللي هنري
         self.C = 1e-6  # ميكرو فاراد
 
+        # المهام الخلفية: خانة لكل تبويب مع شريط تقدم وزر إلغاء
+        self.jobs = BackgroundJobRunner(self.root)
+        self.job_controls = {}
+        self.last_analysis = None
+
         # إعداد الواجهة
         self.setup_ui()
 
@@ -115,6 +264,8 @@ class PrimeCalculatorApp:
                  command=lambda: self.prime_results.delete(1.0, tk.END),
                  bg='#95a5a6', fg='white').pack(side='right', padx=5)
 
+        self.setup_job_controls(buttons_frame, 'prime')
+
     def setup_zeta_zeros_tab(self):
         """إعداد تبويب حساب أصفار زيتا"""
 
@@ -161,6 +312,8 @@ class PrimeCalculatorApp:
                  command=self.plot_zeta_zeros,
                  bg='#1abc9c', fg='white').pack(side='left', padx=5)
 
+        self.setup_job_controls(buttons_frame, 'zeta')
+
     def setup_circuit_analysis_tab(self):
         """إعداد تبويب تحليل الدائرة الكهربائية"""
 
@@ -214,6 +367,8 @@ class PrimeCalculatorApp:
                  command=self.compare_methods,
                  bg='#34495e', fg='white').pack(side='left', padx=5)
 
+        self.setup_job_controls(buttons_frame, 'circuit')
+
     def setup_analysis_tab(self):
         """إعداد تبويب المقارنة والتحليل"""
 
@@ -258,6 +413,7 @@ class PrimeCalculatorApp:
         self.fig, self.axes = plt.subplots(2, 2, figsize=(8, 6))
         self.canvas = FigureCanvasTkAgg(self.fig, plot_frame)
         self.canvas.get_tk_widget().pack(fill='both', expand=True)
+        self.setup_analysis_plots()
 
         # أزرار إضافية
         buttons_frame = tk.Frame(self.analysis_frame)
@@ -271,61 +427,79 @@ class PrimeCalculatorApp:
                  command=self.export_plots,
                  bg='#3498db', fg='white').pack(side='left', padx=5)
 
-    # ==================== الدوال الأساسية للحسابات ====================
+        self.setup_job_controls(buttons_frame, 'analysis')
 
-    def corrected_circuit_parameters(self, prime: int, L: float = None, C: float = None, t: float = 1.0) -> Dict:
-        """حساب معاملات الدائرة بالفيزياء الصحيحة"""
+    def setup_job_controls(self, parent, slot: str):
+        """شريط تقدم وزر إلغاء لمهام تبويب واحد"""
 
-        if L is None: L = self.L
-        if C is None: C = self.C
+        cancel_btn = tk.Button(parent, text="Cancel", state='disabled',
+                               command=lambda: self.jobs.cancel(slot),
+                               bg='#c0392b', fg='white')
+        cancel_btn.pack(side='right', padx=5)
+
+        progress_bar = ttk.Progressbar(parent, length=200, maximum=100, mode='determinate')
+        progress_bar.pack(side='right', padx=5)
 
-        # التردد والتردد الزاوي
-        frequency = prime / self.pi
-        omega = 2 * self.pi * frequency
+        status_label = tk.Label(parent, text="", font=('Arial', 9))
+        status_label.pack(side='right', padx=5)
 
-        # المقاومة (جذر العدد الأولي)
-        R = np.sqrt(prime)
+        self.job_controls[slot] = {
+            'cancel': cancel_btn,
+            'progress': progress_bar,
+            'status': status_label
+        }
 
-        # المعاوقات
-        X_L = omega * L
-        X_C = 1 / (omega * C)
-        Z_magnitude = np.sqrt(R**2 + (X_L - X_C)**2)
+    def start_job(self, slot: str, func: Callable, *args, output=None, on_done: Callable = None):
+        """
+        تشغيل حساب طويل في الخلفية مع تحديث النص تدريجياً
+
+        Args:
+            slot: خانة التبويب ('prime', 'zeta', 'circuit', 'analysis')
+            func: دالة العامل func(job, *args) - لا تلمس عناصر Tk
+            output: ScrolledText يستقبل نصوص job.write تدريجياً
+            on_done: تُستدعى بنتيجة func في خيط Tk (مثلاً للرسم)
+        """
+        if self.jobs.is_running(slot):
+            messagebox.showinfo("تنبيه", "يوجد حساب قيد التشغيل في هذا التبويب - انتظر أو اضغط Cancel")
+            return
+
+        controls = self.job_controls[slot]
+
+        def on_text(text):
+            if output is not None:
+                output.insert(tk.END, text)
+                output.see(tk.END)
+
+        def on_progress(done, total, message):
+            controls['progress']['value'] = 100.0 * done / total if total else 0
+            controls['status'].config(text=message or f"{done}/{total}")
+
+        def on_finish(status):
+            controls['cancel'].config(state='disabled')
+            if status == 'done':
+                controls['progress']['value'] = 100
+                controls['status'].config(text="✅")
+            elif status == 'cancelled':
+                controls['status'].config(text="⛔")
+                on_text("\n⛔ تم إلغاء الحساب\n\n")
+            else:
+                controls['status'].config(text="❌")
 
-        # الشحنة كدالة متذبذبة (الفيزياء الصحيحة)
-        Q_amplitude = prime / (self.pi * Z_magnitude)
-        Q_t = Q_amplitude * np.cos(omega * t)
+        controls['progress']['value'] = 0
+        controls['status'].config(text="...")
+        controls['cancel'].config(state='normal')
 
-        # التيار التفاضلي الصحيح: i = dQ/dt
-        current_instantaneous = -omega * Q_amplitude * np.sin(omega * t)
-        current_rms = omega * Q_amplitude / np.sqrt(2)
+        self.jobs.submit(slot, func, *args, on_text=on_text, on_progress=on_progress,
+                         on_done=on_done, on_finish=on_finish)
+    # ==================== الدوال الأساسية للحسابات ====================
 
-        # الطاقة الصحيحة
-        energy_L = 0.5 * L * current_instantaneous**2
-        energy_C = 0.5 * Q_t**2 / C
-        total_energy = energy_L + energy_C
+    def corrected_circuit_parameters(self, prime: int, L: float = None, C: float = None, t: float = 1.0) -> Dict:
+        """حساب معاملات الدائرة بالفيزياء الصحيحة (تقبل مصفوفات)"""
 
-        # المتوسط الزمني للطاقة
-        energy_L_avg = 0.5 * L * (omega * Q_amplitude)**2 / 2
-        energy_C_avg = 0.5 * Q_amplitude**2 / (2 * C)
-        total_energy_avg = energy_L_avg + energy_C_avg
+        if L is None: L = self.L
+        if C is None: C = self.C
 
-        return {
-            'prime': prime,
-            'frequency': frequency,
-            'omega': omega,
-            'resistance': R,
-            'impedance_magnitude': Z_magnitude,
-            'charge_amplitude': Q_amplitude,
-            'charge_instantaneous': Q_t,
-            'current_instantaneous': current_instantaneous,
-            'current_rms': current_rms,
-            'energy_instantaneous': total_energy,
-            'energy_average': total_energy_avg,
-            'L': L,
-            'C': C,
-            'X_L': X_L,
-            'X_C': X_C
-        }
+        return circuit_kernels.corrected_circuit_parameters(prime, L, C, t)
 
     def predict_next_prime_physics(self, current_prime: int) -> int:
         """التنبؤ بالعدد الأولي التالي بناءً على الفيزياء"""
@@ -346,6 +520,16 @@ class PrimeCalculatorApp:
 
         return candidate if candidate < current_prime + 20 else current_prime + 2
 
+    def predict_next_primes_physics(self, current_primes: np.ndarray,
+                                    prime_table: np.ndarray) -> np.ndarray:
+        """
+        نسخة متجهة من predict_next_prime_physics لدفعة أعداد أولية
+
+        prime_table: جدول أعداد أولية مرتب يغطي حتى max(current_primes) + 20
+        """
+        return circuit_kernels.predict_next_primes_physics(current_primes, prime_table,
+                                                           self.L, self.C)
+
     def is_prime(self, n: int) -> bool:
         """اختبار الأولية الدقيق"""
         if n < 2:
@@ -423,36 +607,38 @@ class PrimeCalculatorApp:
         """حساب سلسلة من الأعداد الأولية"""
         try:
             start_prime = int(self.prime_entry.get())
+        except ValueError:
+            messagebox.showerror("خطأ", "يرجى إدخال عدد صحيح صالح!")
+            return
 
-            if not self.is_prime(start_prime):
-                messagebox.showerror("خطأ", f"العدد {start_prime} ليس عدداً أولياً!")
-                return
+        if not self.is_prime(start_prime):
+            messagebox.showerror("خطأ", f"العدد {start_prime} ليس عدداً أولياً!")
+            return
 
-            result_text = f"""
+        self.start_job('prime', self._prime_sequence_job, start_prime, 10,
+                       output=self.prime_results)
+
+    def _prime_sequence_job(self, job: BackgroundJob, start_prime: int, count: int):
+        """حساب السلسلة في الخيط الخلفي"""
+
+        job.write(f"""
 🧮 سلسلة الأعداد الأولية المتنبأ بها
 {'='*60}
 
 البداية من العدد الأولي: {start_prime}
 
-"""
-
-            current = start_prime
-            for i in range(10):  # حساب 10 أعداد أولية
-                next_prime = self.predict_next_prime_physics(current)
-                gap = next_prime - current
+""")
 
-                result_text += f"{i+1:2d}. {current:3d} → {next_prime:3d} (فجوة: {gap})\n"
-                current = next_prime
+        current = start_prime
+        for i in range(count):
+            next_prime = self.predict_next_prime_physics(current)
+            gap = next_prime - current
 
-            result_text += f"\n✅ تم حساب 10 أعداد أولية بنجاح!\n\n"
+            job.write(f"{i+1:2d}. {current:3d} → {next_prime:3d} (فجوة: {gap})\n")
+            current = next_prime
+            job.progress(i + 1, count)
 
-            self.prime_results.insert(tk.END, result_text)
-            self.prime_results.see(tk.END)
-
-        except ValueError:
-            messagebox.showerror("خطأ", "يرجى إدخال عدد صحيح صالح!")
-        except Exception as e:
-            messagebox.showerror("خطأ", f"حدث خطأ: {str(e)}")
+        job.write(f"\n✅ تم حساب {count} أعداد أولية بنجاح!\n\n")
 
     def detailed_physics_analysis(self):
         """تحليل فيزيائي مفصل للعدد الأولي"""
@@ -528,54 +714,57 @@ class PrimeCalculatorApp:
             start = float(self.zeta_start.get())
             end = float(self.zeta_end.get())
             count = int(self.zeta_count.get())
+        except ValueError:
+            messagebox.showerror("خطأ", "يرجى إدخال قيم رقمية صالحة!")
+            return
 
-            result_text = f"""
+        self.start_job('zeta', self._zeta_zeros_job, start, end, count,
+                       output=self.zeta_results)
+
+    def _zeta_zeros_job(self, job: BackgroundJob, start: float, end: float, count: int):
+        """البحث عن الأصفار في الخيط الخلفي - كل صفر يظهر فور العثور عليه"""
+
+        job.write(f"""
 🎯 حساب أصفار دالة زيتا ريمان
 {'='*50}
 
 🔍 نطاق البحث: {start} إلى {end}
 📊 عدد الأصفار المطلوب: {count}
 
-"""
-
-            # البحث عن الأصفار
-            search_points = np.linspace(start, end, 1000)
-            zeros_found = []
+""")
 
-            for i, t in enumerate(search_points[:-1]):
-                if len(zeros_found) >= count:
-                    break
+        # البحث عن الأصفار
+        search_points = np.linspace(start, end, 1000)
+        steps = len(search_points) - 1
+        zeros_found = 0
 
-                # حساب قيمة دالة زيتا
-                zeta_current = self.zeta_approximation(0.5 + 1j * t)
-                zeta_next = self.zeta_approximation(0.5 + 1j * search_points[i + 1])
+        # كل نقطة تُقيّم مرة واحدة: قيمة النهاية في خطوة هي البداية في التالية
+        zeta_next = self.zeta_approximation(0.5 + 1j * search_points[0])
 
-                # البحث عن تغيير الإشارة
-                if np.real(zeta_current) * np.real(zeta_next) < 0:
-                    zero_location = (t + search_points[i + 1]) / 2  # تقريب بسيط
-                    equivalent_prime = zero_location * self.pi / 2
+        for i, t in enumerate(search_points[:-1]):
+            if zeros_found >= count:
+                break
 
-                    zeros_found.append({
-                        'location': zero_location,
-                        'equivalent_prime': equivalent_prime,
-                        'confidence': abs(np.real(zeta_current)) + abs(np.real(zeta_next))
-                    })
+            # حساب قيمة دالة زيتا
+            zeta_current = zeta_next
+            zeta_next = self.zeta_approximation(0.5 + 1j * search_points[i + 1])
 
-            result_text += f"✅ تم العثور على {len(zeros_found)} صفر:\n\n"
+            # البحث عن تغيير الإشارة
+            if np.real(zeta_current) * np.real(zeta_next) < 0:
+                zero_location = (t + search_points[i + 1]) / 2  # تقريب بسيط
+                equivalent_prime = zero_location * self.pi / 2
+                confidence = abs(np.real(zeta_current)) + abs(np.real(zeta_next))
+                zeros_found += 1
 
-            for i, zero in enumerate(zeros_found, 1):
-                result_text += f"{i:2d}. موقع الصفر: {zero['location']:.6f}\n"
-                result_text += f"    العدد الأولي المكافئ: {zero['equivalent_prime']:.2f}\n"
-                result_text += f"    أقرب عدد أولي: {self.find_nearest_prime(zero['equivalent_prime'])}\n"
-                result_text += f"    مؤشر الثقة: {1/zero['confidence']:.3f}\n\n"
+                job.write(f"{zeros_found:2d}. موقع الصفر: {zero_location:.6f}\n")
+                job.write(f"    العدد الأولي المكافئ: {equivalent_prime:.2f}\n")
+                job.write(f"    أقرب عدد أولي: {self.find_nearest_prime(equivalent_prime)}\n")
+                job.write(f"    مؤشر الثقة: {1/confidence:.3f}\n\n")
 
-            self.zeta_results.insert(tk.END, result_text)
-            self.zeta_results.see(tk.END)
+            if i % 20 == 0:
+                job.progress(i + 1, steps, f"t = {t:.2f}")
 
-        except ValueError:
-            messagebox.showerror("خطأ", "يرجى إدخال قيم رقمية صالحة!")
-        except Exception as e:
-            messagebox.showerror("خطأ", f"حدث خطأ: {str(e)}")
+        job.write(f"✅ تم العثور على {zeros_found} صفر\n\n")
 
     def find_nearest_prime(self, target: float) -> int:
         """العثور على أقرب عدد أولي للقيمة المستهدفة"""
@@ -763,51 +952,76 @@ class PrimeCalculatorApp:
             prime = int(self.circuit_prime.get())
             L = float(self.circuit_L.get())
             C = float(self.circuit_C.get())
+        except ValueError:
+            messagebox.showerror("خطأ", "يرجى إدخال قيم رقمية صالحة!")
+            return
 
-            if not self.is_prime(prime):
-                messagebox.showerror("خطأ", f"العدد {prime} ليس عدداً أولياً!")
-                return
+        if not self.is_prime(prime):
+            messagebox.showerror("خطأ", f"العدد {prime} ليس عدداً أولياً!")
+            return
+
+        self.start_job('circuit', self._waveforms_job, prime, L, C,
+                       on_done=lambda waves: self.show_waveforms(prime, waves))
+
+    def _waveforms_job(self, job: BackgroundJob, prime: int, L: float, C: float) -> Dict:
+        """حساب الموجات في الخيط الخلفي"""
+
+        omega = 2 * prime
+        period = 2 * self.pi / omega
+        t_values = np.linspace(0, 2 * period, 1000)
+
+        params = self.corrected_circuit_parameters(prime, L, C)
+        Q0 = params['charge_amplitude']
+        job.progress(1, 2)
+
+        charges = Q0 * np.cos(omega * t_values)
+        currents = -omega * Q0 * np.sin(omega * t_values)
+        energies_L = 0.5 * L * currents**2
+        energies_C = 0.5 * charges**2 / C
+        job.progress(2, 2)
+
+        return {
+            't': t_values,
+            'charges': charges,
+            'currents': currents,
+            'energies_L': energies_L,
+            'energies_C': energies_C,
+            'total_energies': energies_L + energies_C
+        }
+
+    def show_waveforms(self, prime: int, waves: Dict):
+        """عرض الموجات المحسوبة في نافذة جديدة (خيط Tk)"""
+        try:
+            t_values = waves['t']
+            charges = waves['charges']
+            currents = waves['currents']
 
             # إنشاء نافذة جديدة للرسم
             plot_window = tk.Toplevel(self.root)
             plot_window.title(f"الموجات الكهربائية للعدد الأولي {prime}")
             plot_window.geometry("1000x700")
 
-            # حساب الموجات
-            omega = 2 * prime
-            period = 2 * self.pi / omega
-            t_values = np.linspace(0, 2 * period, 1000)
-
-            params = self.corrected_circuit_parameters(prime, L, C)
-            Q0 = params['charge_amplitude']
-
-            charges = Q0 * np.cos(omega * t_values)
-            currents = -omega * Q0 * np.sin(omega * t_values)
-            energies_L = 0.5 * L * currents**2
-            energies_C = 0.5 * charges**2 / C
-            total_energies = energies_L + energies_C
-
             # إنشاء الرسوم
             fig, axes = plt.subplots(2, 2, figsize=(12, 8))
 
             # رسم الشحنة
-            axes[0, 0].plot(t_values * 1000, charges * 1e6, 'b-', linewidth=2)
+            fast_plot.plot(axes[0, 0], t_values * 1000, charges * 1e6, 'b-', linewidth=2)
             axes[0, 0].set_title(f'الشحنة Q(t) للعدد الأولي {prime}')
             axes[0, 0].set_xlabel('الزمن (ms)')
             axes[0, 0].set_ylabel('الشحنة (μC)')
             axes[0, 0].grid(True, alpha=0.3)
 
             # رسم التيار
-            axes[0, 1].plot(t_values * 1000, currents * 1000, 'r-', linewidth=2)
+            fast_plot.plot(axes[0, 1], t_values * 1000, currents * 1000, 'r-', linewidth=2)
             axes[0, 1].set_title(f'التيار i(t) = dQ/dt للعدد الأولي {prime}')
             axes[0, 1].set_xlabel('الزمن (ms)')
             axes[0, 1].set_ylabel('التيار (mA)')
             axes[0, 1].grid(True, alpha=0.3)
 
             # رسم الطاقة
-            axes[1, 0].plot(t_values * 1000, energies_L * 1e6, 'g-', label='طاقة المحث', linewidth=2)
-            axes[1, 0].plot(t_values * 1000, energies_C * 1e6, 'm-', label='طاقة المكثف', linewidth=2)
-            axes[1, 0].plot(t_values * 1000, total_energies * 1e6, 'k--', label='الطاقة الكلية', linewidth=2)
+            fast_plot.plot(axes[1, 0], t_values * 1000, waves['energies_L'] * 1e6, 'g-', label='طاقة المحث', linewidth=2)
+            fast_plot.plot(axes[1, 0], t_values * 1000, waves['energies_C'] * 1e6, 'm-', label='طاقة المكثف', linewidth=2)
+            fast_plot.plot(axes[1, 0], t_values * 1000, waves['total_energies'] * 1e6, 'k--', label='الطاقة الكلية', linewidth=2)
             axes[1, 0].set_title(f'الطاقة E(t) للعدد الأولي {prime}')
             axes[1, 0].set_xlabel('الزمن (ms)')
             axes[1, 0].set_ylabel('الطاقة (μJ)')
@@ -815,7 +1029,7 @@ class PrimeCalculatorApp:
             axes[1, 0].grid(True, alpha=0.3)
 
             # رسم المخطط الطوري
-            axes[1, 1].plot(charges * 1e6, currents * 1000, 'purple', linewidth=2)
+            fast_plot.plot(axes[1, 1], charges * 1e6, currents * 1000, 'purple', linewidth=2)
             axes[1, 1].set_title(f'المخطط الطوري للعدد الأولي {prime}')
             axes[1, 1].set_xlabel('الشحنة (μC)')
             axes[1, 1].set_ylabel('التيار (mA)')
@@ -825,11 +1039,9 @@ class PrimeCalculatorApp:
             canvas = FigureCanvasTkAgg(fig, plot_window)
             canvas.get_tk_widget().pack(fill='both', expand=True)
 
-            plt.tight_layout()
+            fig.tight_layout()
             canvas.draw()
 
-        except ValueError:
-            messagebox.showerror("خطأ", "يرجى إدخال قيم رقمية صالحة!")
         except Exception as e:
             messagebox.showerror("خطأ", f"حدث خطأ في الرسم: {str(e)}")
 
@@ -910,40 +1122,64 @@ class PrimeCalculatorApp:
         try:
             start = int(self.analysis_start.get())
             end = int(self.analysis_end.get())
+        except ValueError:
+            messagebox.showerror("خطأ", "يرجى إدخال قيم رقمية صالحة!")
+            return
 
-            # جمع الأعداد الأولية في النطاق
-            primes = [p for p in range(start, end + 1) if self.is_prime(p)]
+        self.start_job('analysis', self._comprehensive_analysis_job, start, end,
+                       output=self.analysis_results,
+                       on_done=self.on_comprehensive_analysis_done)
 
-            if len(primes) < 2:
-                messagebox.showerror("خطأ", "يجب أن يحتوي النطاق على عددين أوليين على الأقل!")
-                return
+    def on_comprehensive_analysis_done(self, data):
+        """الاحتفاظ بمصفوفات التحليل (لحفظها كجداول) ثم الرسم"""
+        self.last_analysis = data
+        self.plot_comprehensive_analysis(*data)
 
-            result_text = f"""
+    def _comprehensive_analysis_job(self, job: BackgroundJob, start: int, end: int):
+        """
+        التحليل الشامل في الخيط الخلفي
+
+        الأعداد الأولية من الغربال، والمعاملات تُحسب متجهياً على دفعات
+        (corrected_circuit_parameters تقبل مصفوفات) مع تقدم وإلغاء بين الدفعات.
+        القوائم الطويلة تُختصر في النص - الإحصائيات والدقة تشمل كل الأعداد
+        """
+
+        # +20: التنبؤ يبحث حتى p + 20 عن العدد التالي
+        prime_table = sieve_primes(end + 21)
+        primes = prime_table[(prime_table >= start) & (prime_table <= end)]
+
+        if len(primes) < 2:
+            raise ValueError("يجب أن يحتوي النطاق على عددين أوليين على الأقل!")
+
+        listed = primes[:self.MAX_LISTED].tolist()
+        more = f" ... (+{len(primes) - len(listed)})" if len(primes) > len(listed) else ""
+
+        job.write(f"""
 📊 التحليل الشامل للأعداد الأولية في النطاق {start}-{end}
 {'='*80}
 
 🔢 الأعداد الأولية المكتشفة: {len(primes)}
-📋 القائمة: {primes}
+📋 القائمة: {listed}{more}
 
-"""
+""")
 
-            # حساب المعاملات لكل عدد أولي
-            frequencies = []
-            energies = []
-            currents = []
-            gaps = []
+        # حساب المعاملات لكل عدد أولي (دفعات متجهة)
+        frequencies = np.empty(len(primes))
+        energies = np.empty(len(primes))
+        currents = np.empty(len(primes))
 
-            for i, prime in enumerate(primes):
-                params = self.corrected_circuit_parameters(prime)
-                frequencies.append(params['frequency'])
-                energies.append(params['energy_average'])
-                currents.append(params['current_rms'])
+        for lo in range(0, len(primes), self.JOB_CHUNK):
+            hi = min(lo + self.JOB_CHUNK, len(primes))
+            params = self.corrected_circuit_parameters(primes[lo:hi].astype(float))
+            frequencies[lo:hi] = params['frequency']
+            energies[lo:hi] = params['energy_average']
+            currents[lo:hi] = params['current_rms']
+            job.progress(hi, 2 * len(primes), "معاملات الدائرة")
 
-                if i > 0:
-                    gaps.append(prime - primes[i-1])
+        gaps = np.diff(primes)
 
-            # الإحصائيات
-            result_text += f"""
+        # الإحصائيات
+        job.write(f"""
 📊 الإحصائيات الأساسية:
    • متوسط التردد: {np.mean(frequencies):.6f} Hz
    • متوسط الطاقة: {np.mean(energies):.6e} J
@@ -956,91 +1192,120 @@ class PrimeCalculatorApp:
    • انحراف معياري للفجوات: {np.std(gaps):.2f}
 
 🔗 معاملات الارتباط:
-"""
+""")
 
-            # حساب معاملات الارتباط
-            if len(gaps) > 1:
-                freq_diffs = [frequencies[i+1] - frequencies[i] for i in range(len(frequencies)-1)]
-                energy_diffs = [energies[i+1] - energies[i] for i in range(len(energies)-1)]
+        # حساب معاملات الارتباط
+        if len(gaps) > 1:
+            freq_diffs = np.diff(frequencies)
+            energy_diffs = np.diff(energies)
 
-                if len(freq_diffs) > 1:
-                    corr_freq_gap = np.corrcoef(freq_diffs, gaps)[0, 1] if not np.isnan(np.corrcoef(freq_diffs, gaps)[0, 1]) else 0
-                    corr_energy_gap = np.corrcoef(energy_diffs, gaps)[0, 1] if not np.isnan(np.corrcoef(energy_diffs, gaps)[0, 1]) else 0
+            if len(freq_diffs) > 1:
+                corr_freq_gap = np.corrcoef(freq_diffs, gaps)[0, 1]
+                corr_energy_gap = np.corrcoef(energy_diffs, gaps)[0, 1]
+                corr_freq_gap = 0 if np.isnan(corr_freq_gap) else corr_freq_gap
+                corr_energy_gap = 0 if np.isnan(corr_energy_gap) else corr_energy_gap
 
-                    result_text += f"   • ارتباط التردد-الفجوة: {corr_freq_gap:.3f}\n"
-                    result_text += f"   • ارتباط الطاقة-الفجوة: {corr_energy_gap:.3f}\n"
+                job.write(f"   • ارتباط التردد-الفجوة: {corr_freq_gap:.3f}\n")
+                job.write(f"   • ارتباط الطاقة-الفجوة: {corr_energy_gap:.3f}\n")
 
-            # تحليل التنبؤات
-            result_text += f"""
+        # تحليل التنبؤات
+        job.write(f"""
 
 🔮 اختبار دقة التنبؤ:
-"""
-
-            correct_predictions = 0
-            total_predictions = len(primes) - 1
+""")
+
+        total_predictions = len(primes) - 1
+        correct_predictions = 0
+
+        for lo in range(0, total_predictions, self.JOB_CHUNK):
+            hi = min(lo + self.JOB_CHUNK, total_predictions)
+            predicted = self.predict_next_primes_physics(primes[lo:hi], prime_table)
+            actual = primes[lo + 1:hi + 1]
+            correct = predicted == actual
+            correct_predictions += int(np.count_nonzero(correct))
+
+            for i in range(lo, min(hi, self.MAX_LISTED)):
+                job.write(f"   {primes[i]:2d} → متنبأ: {predicted[i - lo]:2d}, فعلي: {actual[i - lo]:2d} "
+                          f"{'✅' if correct[i - lo] else '❌'}\n")
+            job.progress(len(primes) + hi, 2 * len(primes), "التنبؤات")
+
+        if total_predictions > self.MAX_LISTED:
+            job.write(f"   ... (+{total_predictions - self.MAX_LISTED} تنبؤ)\n")
+
+        accuracy = correct_predictions / total_predictions * 100 if total_predictions > 0 else 0
+        job.write(f"\n📊 دقة التنبؤ الإجمالية: {accuracy:.1f}% ({correct_predictions}/{total_predictions})\n")
+
+        return primes, frequencies, energies, currents, gaps
+
+    def setup_analysis_plots(self):
+        """إنشاء فنانين التحليل الشامل مرة واحدة - التحديثات تعيد استخدامهم"""
+
+        # الرسم الأول: التردد مقابل العدد الأولي
+        self.axes[0, 0].set_title('Frequency vs Prime Number')
+        self.axes[0, 0].set_xlabel('Prime Number')
+        self.axes[0, 0].set_ylabel('Frequency (Hz)')
+
+        # الرسم الثاني: الطاقة مقابل العدد الأولي
+        self.axes[0, 1].set_yscale('log')
+        self.axes[0, 1].set_title('Energy vs Prime Number')
+        self.axes[0, 1].set_xlabel('Prime Number')
+        self.axes[0, 1].set_ylabel('Energy (J)')
+
+        # الرسم الثالث: التيار مقابل العدد الأولي
+        self.axes[1, 0].set_yscale('log')
+        self.axes[1, 0].set_title('Current vs Prime Number')
+        self.axes[1, 0].set_xlabel('Prime Number')
+        self.axes[1, 0].set_ylabel('Current (A)')
+
+        # الرسم الرابع: توزيع الفجوات
+        self.axes[1, 1].set_title('Prime Gap Distribution')
+        self.axes[1, 1].set_xlabel('Gap Size')
+        self.axes[1, 1].set_ylabel('Frequency')
+
+        for ax in self.axes.flat:
+            ax.grid(True, alpha=0.3)
+
+        self.analysis_lines = [
+            fast_plot.plot(self.axes[0, 0], [], [], 'bo-', linewidth=2, markersize=6),
+            fast_plot.plot(self.axes[0, 1], [], [], 'ro-', linewidth=2, markersize=6),
+            fast_plot.plot(self.axes[1, 0], [], [], 'go-', linewidth=2, markersize=6)
+        ]
+        self.gap_histogram = fast_plot.histogram(self.axes[1, 1], [], bins=1, alpha=0.7,
+                                                 color='purple', edgecolor='black')
+
+        self.fig.tight_layout()
+        self.analysis_bounds = None
+        self.analysis_blit = fast_plot.BlitManager(
+            self.canvas, [dline.line for dline in self.analysis_lines] + [self.gap_histogram])
 
-            for i in range(total_predictions):
-                predicted = self.predict_next_prime_physics(primes[i])
-                actual = primes[i + 1]
-                is_correct = predicted == actual
-
-                if is_correct:
-                    correct_predictions += 1
-
-                result_text += f"   {primes[i]:2d} → متنبأ: {predicted:2d}, فعلي: {actual:2d} {'✅' if is_correct else '❌'}\n"
+    def plot_comprehensive_analysis(self, primes, frequencies, energies, currents, gaps):
+        """
+        رسم التحليل الشامل
 
-            accuracy = correct_predictions / total_predictions * 100 if total_predictions > 0 else 0
-            result_text += f"\n📊 دقة التنبؤ الإجمالية: {accuracy:.1f}% ({correct_predictions}/{total_predictions})\n"
+        الخطوط تُحدّث بـ set_data مع تقليل النقاط لكل بكسل، وإذا لم تتغير حدود
+        المحاور يكفي blit للفنانين بدلاً من إعادة رسم الشكل كاملاً
+        """
+        try:
+            for dline, values in zip(self.analysis_lines, (frequencies, energies, currents)):
+                dline.set_data(primes, values)
 
-            # رسم النتائج
-            self.plot_comprehensive_analysis(primes, frequencies, energies, currents, gaps)
+            gaps = np.asarray(gaps)
+            if len(gaps) > 0:
+                fast_plot.histogram(self.axes[1, 1], gaps, bins=fast_plot.integer_bins(gaps),
+                                    artist=self.gap_histogram)
 
-            self.analysis_results.insert(tk.END, result_text)
-            self.analysis_results.see(tk.END)
+            histogram = self.gap_histogram.get_data()
+            bounds = [dline.data_limits() for dline in self.analysis_lines]
+            bounds.append((histogram.edges[0], histogram.edges[-1], histogram.values.max()))
 
-        except ValueError:
-            messagebox.showerror("خطأ", "يرجى إدخال قيم رقمية صالحة!")
-        except Exception as e:
-            messagebox.showerror("خطأ", f"حدث خطأ: {str(e)}")
-
-    def plot_comprehensive_analysis(self, primes, frequencies, energies, currents, gaps):
-        """رسم التحليل الشامل"""
-        try:
-            # مسح الرسوم السابقة
-            for ax in self.axes.flat:
-                ax.clear()
-
-            # الرسم الأول: التردد مقابل العدد الأولي
-            self.axes[0, 0].plot(primes, frequencies, 'bo-', linewidth=2, markersize=6)
-            self.axes[0, 0].set_title('Frequency vs Prime Number')
-            self.axes[0, 0].set_xlabel('Prime Number')
-            self.axes[0, 0].set_ylabel('Frequency (Hz)')
-            self.axes[0, 0].grid(True, alpha=0.3)
-
-            # الرسم الثاني: الطاقة مقابل العدد الأولي
-            self.axes[0, 1].semilogy(primes, energies, 'ro-', linewidth=2, markersize=6)
-            self.axes[0, 1].set_title('Energy vs Prime Number')
-            self.axes[0, 1].set_xlabel('Prime Number')
-            self.axes[0, 1].set_ylabel('Energy (J)')
-            self.axes[0, 1].grid(True, alpha=0.3)
-
-            # الرسم الثالث: التيار مقابل العدد الأولي
-            self.axes[1, 0].semilogy(primes, currents, 'go-', linewidth=2, markersize=6)
-            self.axes[1, 0].set_title('Current vs Prime Number')
-            self.axes[1, 0].set_xlabel('Prime Number')
-            self.axes[1, 0].set_ylabel('Current (A)')
-            self.axes[1, 0].grid(True, alpha=0.3)
-
-            # الرسم الرابع: توزيع الفجوات
-            if gaps:
-                self.axes[1, 1].hist(gaps, bins=max(1, len(set(gaps))), alpha=0.7, color='purple', edgecolor='black')
-                self.axes[1, 1].set_title('Prime Gap Distribution')
-                self.axes[1, 1].set_xlabel('Gap Size')
-                self.axes[1, 1].set_ylabel('Frequency')
-                self.axes[1, 1].grid(True, alpha=0.3)
-
-            plt.tight_layout()
-            self.canvas.draw()
+            if bounds == self.analysis_bounds:
+                self.analysis_blit.update()
+            else:
+                self.analysis_bounds = bounds
+                for ax in self.axes.flat:
+                    ax.relim()
+                    ax.autoscale_view()
+                self.canvas.draw()
 
         except Exception as e:
             print(f"خطأ في الرسم: {str(e)}")
@@ -1085,11 +1350,40 @@ class PrimeCalculatorApp:
                     f.write("-"*40 + "\n")
                     f.write(self.analysis_results.get(1.0, tk.END))
 
-                messagebox.showinfo("نجح", f"تم حفظ النتائج في: {filename}")
+                message = f"تم حفظ النتائج في: {filename}"
+                run_id = self.save_results_to_store(report=filename)
+                if run_id:
+                    message += f"\nوالجداول في مخزن النتائج (run_id={run_id})"
+                messagebox.showinfo("نجح", message)
 
         except Exception as e:
             messagebox.showerror("خطأ", f"حدث خطأ في الحفظ: {str(e)}")
 
+    def save_results_to_store(self, report: str = None):
+        """
+        حفظ مصفوفات آخر تحليل شامل كجداول مُنمَّطة في مخزن النتائج
+
+        Returns:
+            run_id أو None إذا لم يُجرَ تحليل بعد
+        """
+        if self.last_analysis is None:
+            return None
+
+        import pandas as pd
+
+        primes, frequencies, energies, currents, gaps = self.last_analysis
+        circuit = pd.DataFrame({
+            'prime': primes,
+            'frequency': frequencies,
+            'energy_average': energies,
+            'current_rms': currents,
+            # الفجوة إلى العدد الأولي التالي (غير معروفة لآخر عدد)
+            'gap_next': np.append(gaps, -1)
+        })
+        return default_store.save_run('prime_calculator_app', {'circuit': circuit},
+                                      params={'start': int(primes[0]), 'end': int(primes[-1])},
+                                      report=report)
+
     def export_plots(self):
         """تصدير الرسوم البيانية"""
         try:
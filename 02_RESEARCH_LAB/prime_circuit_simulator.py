@@ -6,14 +6,80 @@ Prime Number Resonance Circuit Simulator
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
-import pandas as pd
-from sympy import isprime, primerange
-import seaborn as sns
-from scipy.optimize import fsolve
 import warnings
+from typing import Dict
 warnings.filterwarnings('ignore')
 
+# حقول نتيجة محاكاة واحدة بنفس ترتيب قاموس simulate_circuit
+CIRCUIT_FIELDS = ('p_input', 'R', 'L', 'C', 'f', 'Z', 'X_L', 'X_C', 'I',
+                  'V_R', 'V_L', 'V_C', 'Q_C', 'Q_L',
+                  'E_R', 'E_L', 'E_C', 'E_total', 'E_quantum', 'V_applied')
+
+
+class CircuitRecord:
+    """
+    نتيجة محاكاة واحدة بحقول ثابتة (__slots__) بدل قاموس من 20 مفتاحاً
+
+    تدعم القراءة بالمفتاح record['V_R'] كالقاموس
+    """
+    __slots__ = CIRCUIT_FIELDS
+
+    def __init__(self, *values):
+        for name, value in zip(self.__slots__, values):
+            setattr(self, name, value)
+
+    def __getitem__(self, name):
+        return getattr(self, name)
+
+    def as_dict(self) -> Dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class CircuitArrays:
+    """
+    نتائج محاكاة كثيرة كأعمدة numpy (struct-of-arrays)
+
+    table['V_R'] عمود كامل، table[i] صف كقاموس، table[a:b] جدول جزئي،
+    والتكرار يعطي صفوفاً كقواميس (توافق مع قوائم القواميس السابقة).
+    التحويل إلى pandas يتم مرة واحدة عند الحافة بـ to_frame()
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray]):
+        self.columns = columns
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return self.columns[key]
+        if isinstance(key, (int, np.integer)):
+            return {name: column[key].item() for name, column in self.columns.items()}
+        return CircuitArrays({name: column[key] for name, column in self.columns.items()})
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def keys(self):
+        return self.columns.keys()
+
+    def with_columns(self, **columns) -> 'CircuitArrays':
+        """جدول جديد بأعمدة إضافية (الأعمدة الحالية مشتركة دون نسخ)"""
+        return CircuitArrays({**self.columns, **columns})
+
+    @property
+    def nbytes(self) -> int:
+        return sum(column.nbytes for column in self.columns.values())
+
+    def to_frame(self):
+        """
+        DataFrame بنفس الأعمدة وأنواعها (int64، float64، complex128)
+        دون نسخ: الإطار يشارك ذاكرة الأعمدة
+        """
+        import pandas as pd
+        return pd.DataFrame(self.columns, copy=False)
+
 class PrimeResonanceCircuit:
     """محاكي دائرة الرنين للأعداد الأولية"""
     
@@ -45,6 +111,11 @@ class PrimeResonanceCircuit:
     
     def simulate_circuit(self, p, V_applied):
         """محاكاة الدائرة لعدد أولي معطى وجهد مطبق"""
+        record = self.simulate_circuit_record(p, V_applied)
+        return None if record is None else record.as_dict()
+    
+    def simulate_circuit_record(self, p, V_applied):
+        """نفس simulate_circuit لكن بسجل CircuitRecord مضغوط"""
         
         # حساب معاملات الدائرة
         R, L, C, f = self.calculate_circuit_parameters(p)
@@ -78,17 +149,54 @@ class PrimeResonanceCircuit:
         # حساب الطاقة الكمومية
         E_quantum = self.h * f
         
-        return {
-            'p_input': p,
-            'R': R, 'L': L, 'C': C, 'f': f,
-            'Z': Z, 'X_L': X_L, 'X_C': X_C,
-            'I': I_magnitude,
-            'V_R': abs(V_R), 'V_L': abs(V_L), 'V_C': abs(V_C),
-            'Q_C': Q_C, 'Q_L': Q_L,
-            'E_R': E_R, 'E_L': E_L, 'E_C': E_C, 'E_total': E_total,
-            'E_quantum': E_quantum,
-            'V_applied': V_applied
-        }
+        return CircuitRecord(p, R, L, C, f, Z, X_L, X_C, I_magnitude,
+                             abs(V_R), abs(V_L), abs(V_C), Q_C, Q_L,
+                             E_R, E_L, E_C, E_total, E_quantum, V_applied)
+    
+    def simulate_circuits(self, primes, voltages) -> CircuitArrays:
+        """
+        محاكاة متجهة لكل أزواج (عدد أولي، جهد) بترتيب الحلقتين المتداخلتين
+        
+        نفس معادلات simulate_circuit عموداً عموداً؛ القيم تطابق المسار القياسي
+        حتى بضع وحدات في المنزلة الأخيرة (القسمة المركبة في numpy)
+        
+        Returns:
+            CircuitArrays بأعمدة CIRCUIT_FIELDS
+        """
+        primes = np.asarray(primes, dtype=np.int64)
+        primes = primes[primes > 0]
+        voltages = np.asarray(voltages)                 # عمود V_applied بنوع المدخلات (int أو float)
+        p = np.repeat(primes, len(voltages))
+        V_applied = np.tile(voltages, len(primes))
+        
+        # معاملات الدائرة والمعاوقة
+        R = p ** 0.5
+        L = 1 / (4 * p ** 1.5)
+        C = 1 / p ** 0.5
+        f = p / self.PI
+        omega = 2 * self.PI * f
+        X_L = omega * L
+        X_C = 1 / (omega * C)
+        Z = np.empty(len(p), dtype=complex)
+        Z.real = R
+        Z.imag = X_L - X_C
+        
+        # التيار والجهود: |I·Z_element| = |I|·|Z_element|
+        I_magnitude = np.abs(V_applied / Z)
+        V_R = I_magnitude * R
+        V_L = I_magnitude * X_L
+        V_C = I_magnitude * X_C
+        
+        # الشحنات والطاقات
+        Q_C = C * V_C
+        Q_L = I_magnitude / (2 * self.PI * f)
+        E_R = 0.5 * R * I_magnitude**2
+        E_L = 0.5 * L * I_magnitude**2
+        E_C = 0.5 * C * V_C**2
+        
+        values = (p, R, L, C, f, Z, X_L, X_C, I_magnitude, V_R, V_L, V_C, Q_C, Q_L,
+                  E_R, E_L, E_C, E_R + E_L + E_C, self.h * f, V_applied)
+        return CircuitArrays(dict(zip(CIRCUIT_FIELDS, values)))
     
     def calculate_prime_from_circuit(self, V_R, V_L, V_C, Q_C, Q_L, V_total, Q_total):
         """حساب العدد الأولي من خصائص الدائرة باستخدام معادلتنا"""
@@ -110,49 +218,47 @@ class PrimeResonanceCircuit:
         except:
             return 0
     
-    def test_multiple_primes(self, prime_list, voltage_range):
-        """اختبار عدة أعداد أولية مع جهود مختلفة"""
+    def calculate_primes_from_circuits(self, table: CircuitArrays):
+        """
+        calculate_prime_from_circuit لكل صفوف الجدول
         
-        results = []
+        Returns:
+            (p_calculated, V_total, Q_total) أعمدة numpy؛ p_calculated = 0 حيث K ≤ 0
+        """
+        V_total = table['V_R'] + table['V_L'] + table['V_C']
+        Q_total = table['Q_C'] + table['Q_L']
+        K = (V_total * Q_total + 0.5 * table['Q_C'] * table['V_C']
+             - table['V_L'] * table['Q_L'] / (4 * self.PI))
         
-        for p in prime_list:
-            if not isprime(p):
-                continue
-                
-            for V in voltage_range:
-                sim_result = self.simulate_circuit(p, V)
-                if sim_result is None:
-                    continue
-                
-                # حساب الجهد والشحنة الكليين
-                V_total = sim_result['V_R'] + sim_result['V_L'] + sim_result['V_C']
-                Q_total = sim_result['Q_C'] + sim_result['Q_L']
-                
-                # حساب العدد الأولي من المعادلة
-                p_calculated = self.calculate_prime_from_circuit(
-                    sim_result['V_R'], sim_result['V_L'], sim_result['V_C'],
-                    sim_result['Q_C'], sim_result['Q_L'], V_total, Q_total
-                )
-                
-                # حساب الخطأ
-                error = abs(p - p_calculated)
-                relative_error = error / p * 100 if p > 0 else 0
-                
-                result = sim_result.copy()
-                result.update({
-                    'V_total': V_total,
-                    'Q_total': Q_total,
-                    'p_calculated': p_calculated,
-                    'error': error,
-                    'relative_error': relative_error
-                })
-                
-                results.append(result)
+        valid = K > 0
+        p_calculated = np.zeros(len(K))
+        p_calculated[valid] = (table['V_R'][valid]**2 * self.PI / K[valid])**(2/3)
+        return p_calculated, V_total, Q_total
+    
+    def test_multiple_primes(self, prime_list, voltage_range, as_frame=True):
+        """
+        اختبار عدة أعداد أولية مع جهود مختلفة
         
-        return pd.DataFrame(results)
+        Args:
+            as_frame: DataFrame (افتراضياً) أو CircuitArrays للاستخدام بالجملة
+        """
+        from sympy import isprime
+        
+        primes = [p for p in prime_list if isprime(p)]
+        table = self.simulate_circuits(primes, voltage_range)
+        
+        # حساب العدد الأولي من المعادلة والخطأ
+        p_calculated, V_total, Q_total = self.calculate_primes_from_circuits(table)
+        error = np.abs(table['p_input'] - p_calculated)
+        relative_error = error / table['p_input'] * 100
+        
+        table = table.with_columns(V_total=V_total, Q_total=Q_total, p_calculated=p_calculated,
+                                   error=error, relative_error=relative_error)
+        return table.to_frame() if as_frame else table
     
     def test_resistance_variation(self, base_prime, resistance_multipliers, V_applied=10):
         """اختبار تأثير تغيير المقاومة"""
+        import pandas as pd
         
         results = []
         
@@ -234,6 +340,16 @@ def main():
     
     print(f"\n📊 نتائج اختبار المقاومة:")
     print(f"   عدد النقاط المختبرة: {len(resistance_results)}")
+
+    # حفظ الجداول في مخزن النتائج
+    from results_store import default_store
+    run_id = default_store.save_run(
+        'prime_circuit_simulator',
+        {'circuit': results_df, 'resistance': resistance_results},
+        params={'primes': prime_list, 'voltages': voltage_range.tolist(),
+                'resistance_multipliers': resistance_multipliers.tolist()}
+    )
+    print(f"\n🗄️ تم حفظ النتائج في مخزن النتائج (run_id={run_id})")
     
     return simulator, results_df, resistance_results
 
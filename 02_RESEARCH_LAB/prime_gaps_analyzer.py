@@ -8,7 +8,8 @@ Advanced Prime Gaps Analyzer
 import numpy as np
 import matplotlib.pyplot as plt
 from advanced_prime_predictor import AdvancedPrimePredictor
-from sympy import primerange, nextprime, prevprime
+import fast_plot
+from sympy import primerange, prevprime
 import pandas as pd
 from scipy import stats
 from scipy.optimize import curve_fit
@@ -125,21 +126,57 @@ class PrimeGapsAnalyzer(AdvancedPrimePredictor):
             'gap_accuracy': gap_accuracy
         }
     
-    def predict_large_gaps(self, start_prime=100, count=20):
-        """التنبؤ بالفجوات الكبيرة"""
+    def analyze_gaps_sharded(self, lo, hi, shard_size=1_000_000, workers=None,
+                             stride=1, hosts=None):
+        """
+        توزيع الفجوات ودقة تنبؤ الدائرة بها على [lo, hi) موزعاً على عمال
+
+        النتائج تُجمع كنتائج جزئية قابلة للدمج (مدرج، عزوم، عدادات)
+        فلا تُحفظ صفوف لكل فجوة
+
+        Args:
+            stride: اختبار تنبؤ الدائرة على كل stride عدداً أولياً
+            hosts: عناوين خوادم مقاطع بدلاً من العمليات المحلية
+        """
+        from range_sharding import CircuitGapTask, GapScanTask, print_gap_scan, run_sharded
+
+        scan = run_sharded(GapScanTask(), lo, hi, shard_size, workers=workers, hosts=hosts)
+        print_gap_scan(scan, lo, hi)
+
+        circuit = run_sharded(CircuitGapTask(self, stride=stride), lo, hi, shard_size,
+                              workers=workers, hosts=hosts)
+        print(f"   دقة تنبؤ الدائرة بالفجوة: {circuit['accuracy'].accuracy:.2f}% "
+              f"(ارتباط المتوقع بالفعلي: {circuit['predicted_vs_actual'].correlation():.3f})")
+
+        return {'scan': scan, 'circuit': circuit}
+
+    def predict_large_gaps(self, start_prime=100, count=20, start_index=None):
+        """
+        التنبؤ بالفجوات الكبيرة
+        
+        Args:
+            start_prime: أول عدد (أو أول عدد أولي بعده)
+            count: عدد الفجوات
+            start_index: ترتيب أول عدد أولي بدل start_prime (nth_prime، حتى 10^12)
+        """
+        from prime_sieve import nth_prime, primes_from
+        
+        if start_index is not None:
+            start_prime = nth_prime(start_index)
         
         print(f"\n🔮 التنبؤ بالفجوات الكبيرة بدءاً من {start_prime}")
         print("=" * 50)
         
-        primes = list(primerange(start_prime, start_prime + count * 10))
+        # count + 1 عدداً أولياً متتالياً مهما كان الحجم (لا نافذة ثابتة بطول count × 10)
+        primes = primes_from(start_prime, count + 1).tolist()
         large_gaps = []
         
         print("Prime1 | Prime2 | Predicted Gap | Confidence")
         print("-" * 50)
         
-        for i in range(min(count, len(primes) - 1)):
+        for i in range(count):
             prime1 = primes[i]
-            prime2 = nextprime(prime1)
+            prime2 = primes[i + 1]
             
             predicted_gap = self.calculate_circuit_gap_prediction(prime1, prime2)
             
@@ -211,8 +248,8 @@ def plot_gaps_analysis(gaps_df, patterns_dict, large_gaps_df=None):
     fig.suptitle('Prime Gaps Analysis', fontsize=16)
     
     # الرسم الأول: الفجوات الفعلية مقابل المتنبأ بها
-    axes[0,0].scatter(gaps_df['actual_gap'], gaps_df['predicted_gap'], alpha=0.7, c='blue')
-    axes[0,0].plot([gaps_df['actual_gap'].min(), gaps_df['actual_gap'].max()], 
+    fast_plot.scatter(axes[0,0], gaps_df['actual_gap'], gaps_df['predicted_gap'], alpha=0.7, c='blue')
+    fast_plot.plot(axes[0,0], [gaps_df['actual_gap'].min(), gaps_df['actual_gap'].max()], 
                   [gaps_df['actual_gap'].min(), gaps_df['actual_gap'].max()], 
                   'r--', label='Perfect Prediction')
     axes[0,0].set_xlabel('Actual Gap')
@@ -230,15 +267,15 @@ def plot_gaps_analysis(gaps_df, patterns_dict, large_gaps_df=None):
     axes[0,1].grid(True, alpha=0.3)
     
     # الرسم الثالث: الدقة مقابل حجم العدد الأولي
-    axes[1,0].scatter(gaps_df['prime1'], gaps_df['accuracy'], alpha=0.7, c='orange')
+    fast_plot.scatter(axes[1,0], gaps_df['prime1'], gaps_df['accuracy'], alpha=0.7, c='orange')
     axes[1,0].set_xlabel('Prime Number')
     axes[1,0].set_ylabel('Prediction Accuracy (%)')
     axes[1,0].set_title('Accuracy vs Prime Size')
     axes[1,0].grid(True, alpha=0.3)
     
     # الرسم الرابع: الفجوات مقابل حجم العدد الأولي
-    axes[1,1].scatter(gaps_df['prime1'], gaps_df['actual_gap'], alpha=0.5, c='red', label='Actual')
-    axes[1,1].scatter(gaps_df['prime1'], gaps_df['predicted_gap'], alpha=0.5, c='blue', label='Predicted')
+    fast_plot.scatter(axes[1,1], gaps_df['prime1'], gaps_df['actual_gap'], alpha=0.5, c='red', label='Actual')
+    fast_plot.scatter(axes[1,1], gaps_df['prime1'], gaps_df['predicted_gap'], alpha=0.5, c='blue', label='Predicted')
     axes[1,1].set_xlabel('Prime Number')
     axes[1,1].set_ylabel('Gap Size')
     axes[1,1].set_title('Gap Size vs Prime Number')
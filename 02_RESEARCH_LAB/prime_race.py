@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+سباق الأعداد الأولية 4k+1 ضد 4k+3
+Streaming Prime Race Counters π(x;4,1) − π(x;4,3)
+باسل يحيى عبدالله - Basil Yahya Abdullah
+
+Δ(x) = π(x;4,1) − π(x;4,3) سالب في معظم الأوقات (انحياز تشيبيشيف: أدنى صفر
+لـ L(s, χ₄) في dirichlet_l)، ويصبح موجباً أول مرة عند x = 26861. هنا:
+
+- RaceCounter: عداد متدفق يُغذى بمقاطع الغربال المقطعي (primes_between):
+  العددان، Δ، عدد الأعداد الأولية التي تتقدم عندها 4k+1، القيم القصوى ومواقعها،
+  ومواقع تغير المتصدر (الإشارة غير الصفرية لـ Δ) كـ [(x, الإشارة الجديدة)]
+- prime_race(limit): نفس العداد لكل الأعداد الأولية < limit بمرورين موزعين
+  (run_sharded): الأول يعد كل مقطع ومدى مساره النسبي فقط؛ مجموع السوابق يعطي Δ
+  عند بداية كل مقطع، والمقاطع التي لا يمس فيها Δ الصفر تُلخص دون إعادة. الثاني
+  يعيد غربلة المقاطع القليلة القريبة من الصفر ويسجل تغيرات الإشارة فيها
+
+    race = prime_race(10**11, workers=8)     # كل تغيرات الإشارة حتى 10^11
+    race.crossings[:3]                        # [(26861, 1), (26879, -1), (616841, 1)]
+"""
+
+import time
+import argparse
+from typing import Dict, List
+
+import numpy as np
+
+from range_sharding import ShardTask, make_shards, run_sharded
+
+RACE_SHARD_SIZE = 1 << 24
+
+
+class RaceCounter:
+    """عداد سباق π(x;4,1) − π(x;4,3) لأعداد أولية متتالية تُضاف بالترتيب"""
+
+    def __init__(self, lead: int = 0, leader: int = 0, record: bool = True):
+        """
+        Args:
+            lead: Δ قبل أول عدد يُضاف
+            leader: آخر إشارة غير صفرية لـ Δ قبل ذلك (1: 4k+1، −1: 4k+3، 0: غير معروفة)
+            record: تسجيل مواقع تغير المتصدر
+        """
+        self.start_lead = lead
+        self.lead = lead
+        self.leader = leader
+        self.record = record
+        self.opening = None             # أول (x, إشارة) حين يبدأ العداد بمتصدر غير معروف
+        self.crossings = []
+        self.count_1 = 0
+        self.count_3 = 0
+        self.primes = 0
+        self.leading = 0                # أعداد أولية p عندها Δ(p) > 0
+        self.ties = 0                   # أعداد أولية p عندها Δ(p) = 0
+        self.max_lead, self.max_at = lead, None
+        self.min_lead, self.min_at = lead, None
+        self.last_prime = None
+
+    def add(self, primes) -> 'RaceCounter':
+        """إضافة مقطع أعداد أولية تالٍ (مرتب تصاعدياً)"""
+        p = np.asarray(primes, dtype=np.int64)
+        if not len(p):
+            return self
+        residue = p % 4
+        steps = (residue == 1).astype(np.int64) - (residue == 3)
+        path = self.lead + np.cumsum(steps)
+
+        self.count_1 += int(np.count_nonzero(residue == 1))
+        self.count_3 += int(np.count_nonzero(residue == 3))
+        self.primes += len(p)
+        self.leading += int(np.count_nonzero(path > 0))
+        self.ties += int(np.count_nonzero(path == 0))
+        i, j = int(np.argmax(path)), int(np.argmin(path))
+        if path[i] > self.max_lead:
+            self.max_lead, self.max_at = int(path[i]), int(p[i])
+        if path[j] < self.min_lead:
+            self.min_lead, self.min_at = int(path[j]), int(p[j])
+
+        nonzero = np.nonzero(path)[0]
+        if len(nonzero):
+            signs = np.sign(path[nonzero])
+            if self.record:
+                previous = np.concatenate(([self.leader], signs[:-1]))
+                changed = np.nonzero((signs != previous) & (previous != 0))[0]
+                self.crossings.extend(zip(p[nonzero[changed]].tolist(), signs[changed].tolist()))
+            if self.leader == 0:
+                self.opening = (int(p[nonzero[0]]), int(signs[0]))
+            self.leader = int(signs[-1])
+        self.lead = int(path[-1])
+        self.last_prime = int(p[-1])
+        return self
+
+    def merge(self, other: 'RaceCounter'):
+        """دمج عداد المقطع التالي (يجب أن يبدأ من Δ الحالي)"""
+        if other.start_lead != self.lead:
+            raise ValueError(f"race counters merged out of order: next starts at Δ = "
+                             f"{other.start_lead}, current Δ = {self.lead}")
+        if other.opening is not None:
+            if self.leader == 0:
+                self.opening = self.opening or other.opening
+            elif other.opening[1] != self.leader and self.record:
+                self.crossings.append(other.opening)
+        self.crossings.extend(other.crossings)
+        self.leader = other.leader or self.leader
+        self.count_1 += other.count_1
+        self.count_3 += other.count_3
+        self.primes += other.primes
+        self.leading += other.leading
+        self.ties += other.ties
+        if other.max_lead > self.max_lead:
+            self.max_lead, self.max_at = other.max_lead, other.max_at
+        if other.min_lead < self.min_lead:
+            self.min_lead, self.min_at = other.min_lead, other.min_at
+        self.lead = other.lead
+        self.last_prime = other.last_prime if other.last_prime is not None else self.last_prime
+
+    def shifted(self, lead: int) -> 'RaceCounter':
+        """
+        نفس المقطع لو بدأ من Δ = lead بدل start_lead
+
+        صالح فقط إذا لم يمس المسار المزاح الصفر (فلا تغير في المتصدر داخله)
+        """
+        offset = lead - self.start_lead
+        sign = 1 if self.min_lead + offset > 0 else -1
+        if self.max_lead + offset >= 0 and self.min_lead + offset <= 0:
+            raise ValueError("shifted race path touches zero; re-run the segment instead")
+        counter = RaceCounter(lead, sign, self.record)
+        counter.count_1, counter.count_3, counter.primes = self.count_1, self.count_3, self.primes
+        counter.leading = self.primes if sign > 0 else 0
+        counter.max_lead, counter.max_at = self.max_lead + offset, self.max_at
+        counter.min_lead, counter.min_at = self.min_lead + offset, self.min_at
+        counter.lead = self.lead + offset
+        counter.last_prime = self.last_prime
+        return counter
+
+    def to_dict(self) -> Dict:
+        return {'count_1': self.count_1, 'count_3': self.count_3, 'lead': self.lead,
+                'leading': self.leading, 'ties': self.ties, 'primes': self.primes,
+                'max_lead': self.max_lead, 'max_at': self.max_at,
+                'min_lead': self.min_lead, 'min_at': self.min_at,
+                'crossings': [list(crossing) for crossing in self.crossings]}
+
+    def __repr__(self):
+        return (f"RaceCounter(π(x;4,1)={self.count_1}, π(x;4,3)={self.count_3}, "
+                f"Δ={self.lead}, crossings={len(self.crossings)})")
+
+
+class RaceTask(ShardTask):
+    """عداد السباق لمقطع [lo, hi)"""
+
+    name = 'prime_race'
+
+    def __init__(self, leads: Dict[int, int] = None):
+        """
+        Args:
+            leads: None للمرور الأول (Δ نسبي من 0 بلا تسجيل)، أو {بداية المقطع: Δ عندها}
+        """
+        self.leads = leads
+
+    def map(self, lo, hi):
+        from prime_sieve import primes_between
+        if self.leads is None:
+            counter = RaceCounter(record=False)
+        else:
+            lead = self.leads[lo]
+            counter = RaceCounter(lead, int(np.sign(lead)))
+        return [counter.add(primes_between(lo, hi))]
+
+
+def _touching_runs(shards: List, touching: Dict[int, int]) -> List:
+    """المقاطع المتجاورة التي تحتاج مروراً ثانياً كنطاقات [lo, hi)"""
+    runs = []
+    for lo, hi in shards:
+        if lo not in touching:
+            continue
+        if runs and runs[-1][1] == lo:
+            runs[-1][1] = hi
+        else:
+            runs.append([lo, hi])
+    return runs
+
+
+def prime_race(limit: int, shard_size: int = RACE_SHARD_SIZE, workers: int = None,
+               **kwargs) -> RaceCounter:
+    """
+    سباق 4k+1 ضد 4k+3 لكل الأعداد الأولية < limit
+
+    Args:
+        limit: حد الأعداد الأولية (غير مشمول)
+        shard_size: طول المقطع
+        workers: عدد العمليات (0 = في نفس العملية)
+        kwargs: تُمرر إلى run_sharded (retries, hosts, progress)
+
+    Returns:
+        RaceCounter بكل تغيرات المتصدر
+    """
+    total = RaceCounter()
+    if limit <= 2:
+        return total
+    shards = make_shards(2, int(limit), int(shard_size))
+    summaries = run_sharded(RaceTask(), 2, limit, shard_size, workers=workers, **kwargs)
+
+    # Δ عند بداية كل مقطع؛ المقاطع التي يمس مسارها المزاح الصفر تُعاد بتسجيل
+    touching, lead = {}, 0
+    for (lo, _), summary in zip(shards, summaries):
+        if lead + summary.min_lead <= 0 <= lead + summary.max_lead:
+            touching[lo] = lead
+        lead += summary.lead
+
+    detailed = {}
+    for lo, hi in _touching_runs(shards, touching):
+        counters = run_sharded(RaceTask(touching), lo, hi, shard_size, workers=workers, **kwargs)
+        detailed.update(zip((start for start, _ in make_shards(lo, hi, int(shard_size))), counters))
+
+    for (lo, _), summary in zip(shards, summaries):
+        total.merge(detailed[lo] if lo in detailed else summary.shifted(total.lead))
+    return total
+
+
+def print_race(race: RaceCounter, limit: int, show: int = 12):
+    """طباعة ملخص السباق"""
+    print(f"\n🏁 السباق حتى {limit:,} ({race.primes:,} عدد أولي):")
+    print(f"   π(x;4,1) = {race.count_1:,} | π(x;4,3) = {race.count_3:,} | Δ = {race.lead:+,}")
+    print(f"   4k+1 في المقدمة عند {race.leading:,} عدد أولي ({race.leading / max(race.primes, 1):.6%})"
+          f" | تعادل عند {race.ties:,}")
+    print(f"   أكبر تقدم لـ 4k+1: {race.max_lead:+,} عند {race.max_at} | "
+          f"أكبر تقدم لـ 4k+3: {race.min_lead:+,} عند {race.min_at}")
+    print(f"   تغيرات المتصدر: {len(race.crossings):,}")
+    for x, sign in race.crossings[:show]:
+        print(f"      x = {x:,}: {'4k+1' if sign > 0 else '4k+3'} يتقدم")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streaming pi(x;4,1) - pi(x;4,3) prime race")
+    parser.add_argument('--limit', type=float, default=1e9, help="حتى 1e11 لكل تغيرات الإشارة المعروفة")
+    parser.add_argument('--shard-size', type=float, default=RACE_SHARD_SIZE)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--show', type=int, default=12)
+    args = parser.parse_args()
+
+    print("🏁 سباق الأعداد الأولية 4k+1 ضد 4k+3")
+    print("=" * 50)
+
+    def progress(done, total):
+        print(f"\r   المقاطع: {done}/{total}", end='', flush=True)
+
+    start = time.perf_counter()
+    race = prime_race(int(args.limit), int(args.shard_size), workers=args.workers, progress=progress)
+    seconds = time.perf_counter() - start
+    print(f"\n⏱️ {seconds:.1f}s ({race.primes / seconds:,.0f} عدد/ثانية)")
+    print_race(race, int(args.limit), args.show)
+
+
+if __name__ == "__main__":
+    main()
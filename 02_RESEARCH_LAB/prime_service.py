@@ -0,0 +1,460 @@
+#!/usr/bin/env python3
+"""
+خدمة HTTP/JSON للتنبؤ وزيتا والدائرة
+Asyncio Prediction / Zeta / Circuit Service
+باسل يحيى عبدالله - Basil Yahya Abdullah
+
+خادم asyncio (المكتبة القياسية فقط) يستقبل الطلبات ويجمع المتزامنة منها
+في دفعات صغيرة (micro-batching) لكل نقطة نهاية: الدفعة تنتظر بضعة
+أجزاء من الألف من الثانية أو حتى تمتلئ، تُزال الأعداد المكررة، ثم تُرسل
+دفعة واحدة إلى مجمع عمليات لتُحسب بالنوى المتجهة وتُوزع النتائج على أصحابها.
+
+نقاط النهاية (GET بمعاملات الاستعلام أو POST بجسم JSON):
+    /predict   prime, method=physics|enhanced    التنبؤ بالعدد الأولي التالي
+    /circuit   prime, L, C, t                    معاملات الدائرة المصححة
+    /zeta      re, im                            ζ(s)
+    /zeros     n, count                          أصفار زيتا غير التافهة (الجزء التخيلي)
+    /health    /metrics                          الحالة وقياسات Prometheus
+
+التشغيل:
+    python prime_service.py --port 8765 --workers 4
+    curl 'localhost:8765/predict?prime=1009'
+"""
+
+import os
+import json
+import math
+import time
+import asyncio
+import argparse
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional
+from urllib.parse import parse_qsl, urlsplit
+
+import numpy as np
+
+from instrumentation import metrics
+
+DEFAULT_PORT = 8765
+MAX_BATCH = 256
+MAX_DELAY = 0.002      # ثانية انتظار لتجميع الدفعة
+MAX_BODY = 1 << 20
+MAX_ZERO_INDEX = 100_000
+PREDICT_WINDOW = 20         # التنبؤ الفيزيائي يبحث في [p, p + 20) فقط
+BASE_PRIME_BLOCK = 512
+MAX_ZETA_HEIGHT = 10**6     # |s| الأقصى لـ /zeta (~3×10⁵ حد لكل نقطة)
+ZERO_COUNT_LIMIT = 100
+
+
+class RequestError(ValueError):
+    """خطأ في معاملات الطلب (يُعاد للعميل كـ 400)"""
+
+
+# ===== دوال الدفعات (تعمل داخل عمال المجمع - على مستوى الوحدة لتُنقل بـ pickle) =====
+
+@lru_cache(maxsize=8)
+def _prime_table(limit: int) -> np.ndarray:
+    from prime_sieve import sieve_primes
+    return sieve_primes(limit)
+
+
+def _table_limit(max_prime: int) -> int:
+    """حد الجدول مقرب لأعلى لقوة 2 ليُعاد استخدام الجدول بين الدفعات"""
+    return 1 << max(16, int(max_prime + 64).bit_length())
+
+
+def _window_primes(primes: np.ndarray, width: int = PREDICT_WINDOW) -> np.ndarray:
+    """
+    الأعداد الأولية في النوافذ [p, p + width) فقط (مرتبة)، بقسمة متجهة على
+    الأعداد الأولية حتى √(max + width) بدل غربلة كل شيء حتى max
+    """
+    candidates = np.unique((primes[:, None] + np.arange(width)).ravel())
+    candidates = candidates[(candidates % 2 == 1) | (candidates == 2)]
+    base = _prime_table(_table_limit(math.isqrt(int(candidates[-1])) + 1))
+    base = base[base * base <= candidates[-1]]
+    composite = np.zeros(len(candidates), dtype=bool)
+    for start in range(0, len(base), BASE_PRIME_BLOCK):
+        block = base[start:start + BASE_PRIME_BLOCK]
+        column = candidates[:, None]
+        composite |= ((column % block == 0) & (column != block)).any(axis=1)
+    return candidates[~composite & (candidates > 1)]
+
+
+def predict_batch(items: List[Dict]) -> List[Dict]:
+    """التنبؤ بالعدد الأولي التالي لدفعة (مع إزالة التكرار)"""
+    from circuit_kernels import predict_next_primes_physics
+
+    results = {}
+    physics = sorted({item['prime'] for item in items if item['method'] == 'physics'})
+    if physics:
+        primes = np.array(physics, dtype=np.int64)
+        predicted = predict_next_primes_physics(primes, _window_primes(primes))
+        for prime, value in zip(physics, predicted.tolist()):
+            results[(prime, 'physics')] = {'current_prime': prime, 'predicted_next': value,
+                                           'gap': value - prime, 'method': 'physics'}
+
+    enhanced = sorted({item['prime'] for item in items if item['method'] == 'enhanced'})
+    if enhanced:
+        from basil_prime_theory import predict_next_primes
+        for prime, prediction in zip(enhanced, predict_next_primes(enhanced, 'enhanced')):
+            results[(prime, 'enhanced')] = _jsonable(prediction)
+
+    return [results[(item['prime'], item['method'])] for item in items]
+
+
+def circuit_batch(items: List[Dict]) -> List[Dict]:
+    """معاملات الدائرة لدفعة: استدعاء متجه واحد لكل (L, C, t)"""
+    from circuit_kernels import corrected_circuit_parameters
+
+    groups = {}
+    for index, item in enumerate(items):
+        groups.setdefault((item['L'], item['C'], item['t']), []).append(index)
+
+    results = [None] * len(items)
+    for (L, C, t), indices in groups.items():
+        primes = np.array([items[i]['prime'] for i in indices], dtype=float)
+        params = corrected_circuit_parameters(primes, L, C, t)
+        for row, index in enumerate(indices):
+            results[index] = {key: (value[row] if isinstance(value, np.ndarray) else value)
+                              for key, value in params.items()}
+            results[index]['prime'] = items[index]['prime']
+            results[index] = _jsonable(results[index])
+    return results
+
+
+def zeta_batch(items: List[Dict]) -> List[Dict]:
+    from zeta_function import zeta
+    values = zeta(np.array([complex(item['re'], item['im']) for item in items]))
+    return [{'s': [item['re'], item['im']], 'zeta': [float(value.real), float(value.imag)],
+             'abs': float(abs(value))}
+            for item, value in zip(items, values)]
+
+
+def zeros_batch(items: List[Dict]) -> List[Dict]:
+    from zeta_zeros import locate_zeros
+    return [{'n': item['n'], 'zeros': _jsonable(locate_zeros(item['n'], item['count']))}
+            for item in items]
+
+
+def _jsonable(value):
+    """تحويل قيم numpy والأعداد المركبة إلى JSON"""
+    if isinstance(value, dict):
+        return {key: _jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    if isinstance(value, np.ndarray):
+        return _jsonable(value.tolist())
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, complex):
+        return [value.real, value.imag]
+    if isinstance(value, float) and not np.isfinite(value):
+        return None
+    return value
+
+
+# ===== التجميع =====
+
+class MicroBatcher:
+    """
+    تجميع الطلبات المتزامنة في دفعات لنقطة نهاية واحدة
+
+    أول طلب في دفعة فارغة يجدول الإرسال بعد max_delay، والدفعة الممتلئة
+    (max_batch) تُرسل فوراً. batch_fn تستقبل قائمة العناصر وتعيد قائمة
+    نتائج بنفس الترتيب، وتعمل في executor (مجمع عمليات)
+    """
+
+    def __init__(self, name: str, batch_fn: Callable[[List], List], executor: Optional[Executor],
+                 max_batch: int = MAX_BATCH, max_delay: float = MAX_DELAY):
+        self.name = name
+        self.batch_fn = batch_fn
+        self.executor = executor
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self._items = []
+        self._futures = []
+        self._timer = None
+        self._running = set()
+        self.batches = 0
+        self.requests = 0
+
+    async def submit(self, item):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._items.append(item)
+        self._futures.append(future)
+        self.requests += 1
+
+        if len(self._items) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_delay, self._flush)
+        return await future
+
+    def _flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._items:
+            return
+        items, futures = self._items, self._futures
+        self._items, self._futures = [], []
+        self.batches += 1
+        task = asyncio.get_running_loop().create_task(self._run(items, futures))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run(self, items, futures):
+        loop = asyncio.get_running_loop()
+        metrics.observe(f"service.{self.name}.batch_size", len(items),
+                        buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256, 512))
+        start = time.perf_counter()
+        try:
+            results = await loop.run_in_executor(self.executor, self.batch_fn, items)
+        except Exception as exc:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        metrics.record_time(f"service.{self.name}.batch", time.perf_counter() - start)
+        for future, result in zip(futures, results):
+            if not future.done():
+                future.set_result(result)
+
+
+# ===== تحليل المعاملات =====
+
+def _integer(value) -> int:
+    """int صارم: يرفض الكسور (3.7) والقيم المنطقية بدل اقتطاعها"""
+    if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+        raise ValueError(value)
+    return int(value)
+
+
+def _number(params: Dict, name: str, cast=float, default=None):
+    value = params.get(name, default)
+    if value is None:
+        raise RequestError(f"missing parameter: {name}")
+    try:
+        return cast(value)
+    except (TypeError, ValueError):
+        raise RequestError(f"invalid {name}: {value!r}")
+
+
+def parse_predict(params: Dict) -> Dict:
+    prime = _number(params, 'prime', _integer)
+    method = params.get('method', 'physics')
+    if prime < 2:
+        raise RequestError("prime must be >= 2")
+    if method not in ('physics', 'enhanced'):
+        raise RequestError("method must be 'physics' or 'enhanced'")
+    if method == 'enhanced' and prime > 10**12:
+        raise RequestError("enhanced method supports prime <= 10^12")
+    if method == 'physics' and prime > 10**9:
+        raise RequestError("physics method supports prime <= 10^9")
+    return {'prime': prime, 'method': method}
+
+
+def parse_circuit(params: Dict) -> Dict:
+    from circuit_kernels import DEFAULT_C, DEFAULT_L
+    prime = _number(params, 'prime', _integer)
+    if prime < 1:
+        raise RequestError("prime must be positive")
+    return {'prime': prime, 'L': _number(params, 'L', float, DEFAULT_L),
+            'C': _number(params, 'C', float, DEFAULT_C), 't': _number(params, 't', float, 1.0)}
+
+
+def parse_zeta(params: Dict) -> Dict:
+    re, im = _number(params, 're', float), _number(params, 'im', float, 0.0)
+    if not (math.isfinite(re) and math.isfinite(im)):
+        raise RequestError("re and im must be finite")
+    if math.hypot(re, im) > MAX_ZETA_HEIGHT:
+        raise RequestError(f"zeta supports |s| <= {MAX_ZETA_HEIGHT:g}")
+    if re == 1.0 and im == 0.0:
+        raise RequestError("zeta has a pole at s = 1")
+    return {'re': re, 'im': im}
+
+
+def parse_zeros(params: Dict) -> Dict:
+    n = _number(params, 'n', _integer, 1)
+    count = _number(params, 'count', _integer, 1)
+    if not 1 <= n <= MAX_ZERO_INDEX or not 1 <= count <= ZERO_COUNT_LIMIT:
+        raise RequestError(f"need 1 <= n <= {MAX_ZERO_INDEX} and 1 <= count <= {ZERO_COUNT_LIMIT}")
+    return {'n': n, 'count': count}
+
+
+ENDPOINTS = {
+    '/predict': (parse_predict, predict_batch),
+    '/circuit': (parse_circuit, circuit_batch),
+    '/zeta': (parse_zeta, zeta_batch),
+    '/zeros': (parse_zeros, zeros_batch),
+}
+
+
+# ===== خادم HTTP =====
+
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+           413: 'Payload Too Large', 500: 'Internal Server Error'}
+
+
+class PrimeService:
+    """خدمة HTTP/1.1 (keep-alive) فوق asyncio.start_server"""
+
+    def __init__(self, workers: Optional[int] = None, max_batch: int = MAX_BATCH,
+                 max_delay: float = MAX_DELAY, executor: Optional[Executor] = None):
+        self.executor = executor or ProcessPoolExecutor(max_workers=workers or os.cpu_count())
+        self.batchers = {path: MicroBatcher(path.strip('/'), batch_fn, self.executor,
+                                            max_batch, max_delay)
+                         for path, (_, batch_fn) in ENDPOINTS.items()}
+        self.started = time.time()
+        self.server = None
+        self._connections = {}
+
+    async def start(self, host: str = '127.0.0.1', port: int = DEFAULT_PORT):
+        self.server = await asyncio.start_server(self._handle_connection, host, port)
+        return self.server.sockets[0].getsockname()[:2]
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            for writer in list(self._connections.values()):
+                writer.close()
+            await asyncio.gather(*self._connections, return_exceptions=True)
+            await self.server.wait_closed()
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+    async def dispatch(self, method: str, target: str, body: bytes):
+        """توجيه طلب واحد → (الحالة، نوع المحتوى، الجسم)"""
+        url = urlsplit(target)
+        path = url.path.rstrip('/') or '/'
+
+        if path == '/health':
+            return 200, self._json({'status': 'ok', 'uptime': time.time() - self.started,
+                                    'batches': {name.strip('/'): {'requests': b.requests, 'batches': b.batches}
+                                                for name, b in self.batchers.items()}})
+        if path == '/metrics':
+            return 200, ('text/plain; version=0.0.4', metrics.to_prometheus().encode())
+
+        if path not in ENDPOINTS:
+            return 404, self._json({'error': f"unknown endpoint: {path}"})
+        if method not in ('GET', 'POST'):
+            return 405, self._json({'error': 'use GET or POST'})
+
+        params = dict(parse_qsl(url.query))
+        if body:
+            try:
+                payload = json.loads(body)
+            except ValueError:
+                return 400, self._json({'error': 'invalid JSON body'})
+            if not isinstance(payload, dict):
+                return 400, self._json({'error': 'JSON body must be an object'})
+            params.update(payload)
+
+        parse, _ = ENDPOINTS[path]
+        try:
+            item = parse(params)
+        except RequestError as exc:
+            return 400, self._json({'error': str(exc)})
+
+        metrics.count(f"service.requests{path.replace('/', '.')}")
+        with metrics.timer(f"service{path.replace('/', '.')}"):
+            result = await self.batchers[path].submit(item)
+        return 200, self._json(result)
+
+    @staticmethod
+    def _json(data):
+        return 'application/json', json.dumps(data, ensure_ascii=False).encode()
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        task = asyncio.current_task()
+        self._connections[task] = writer
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    await self._respond(writer, 413, *self._json({'error': 'headers too large'}), False)
+                    break
+
+                lines = head.decode('latin-1').split('\r\n')
+                try:
+                    method, target, version = lines[0].split(' ', 2)
+                except ValueError:
+                    await self._respond(writer, 400, *self._json({'error': 'bad request line'}), False)
+                    break
+                headers = {}
+                for line in lines[1:]:
+                    if ':' in line:
+                        name, value = line.split(':', 1)
+                        headers[name.strip().lower()] = value.strip()
+
+                length = headers.get('content-length') or '0'
+                if not (length.isascii() and length.isdigit()):
+                    await self._respond(writer, 400, *self._json({'error': 'invalid Content-Length'}), False)
+                    break
+                length = int(length)
+                if length > MAX_BODY:
+                    await self._respond(writer, 413, *self._json({'error': 'body too large'}), False)
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                keep_alive = (headers.get('connection', '').lower() != 'close'
+                              and version.upper() == 'HTTP/1.1')
+                try:
+                    status, (content_type, payload) = await self.dispatch(method, target, body)
+                except Exception as exc:
+                    status, (content_type, payload) = 500, self._json({'error': repr(exc)})
+                await self._respond(writer, status, content_type, payload, keep_alive)
+                if not keep_alive:
+                    break
+        finally:
+            self._connections.pop(task, None)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    @staticmethod
+    async def _respond(writer, status, content_type, payload, keep_alive):
+        head = (f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + payload)
+        await writer.drain()
+
+
+async def serve(host: str, port: int, workers: Optional[int], max_batch: int, max_delay: float):
+    service = PrimeService(workers, max_batch, max_delay)
+    address = await service.start(host, port)
+    print(f"🌐 الخدمة تعمل على http://{address[0]}:{address[1]} "
+          f"(عمال: {service.executor._max_workers}, دفعة ≤ {max_batch}, انتظار {max_delay * 1000:g}ms)")
+    try:
+        await service.server.serve_forever()
+    finally:
+        await service.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Prime prediction / zeta / circuit HTTP service")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--max-batch', type=int, default=MAX_BATCH)
+    parser.add_argument('--batch-delay-ms', type=float, default=MAX_DELAY * 1000)
+    args = parser.parse_args()
+
+    metrics.enable()
+    try:
+        asyncio.run(serve(args.host, args.port, args.workers, args.max_batch,
+                          args.batch_delay_ms / 1000))
+    except KeyboardInterrupt:
+        print("\n👋 تم إيقاف الخدمة")
+
+
+if __name__ == "__main__":
+    main()
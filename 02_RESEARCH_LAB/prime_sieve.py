@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+غربال الأعداد الأولية المشترك
+Shared Prime Sieve
+باسل يحيى عبدالله - Basil Yahya Abdullah
+
+جدول أعداد أولية واحد يُحسب مرة واحدة وتتشارك فيه التحليلات
+بدلاً من أن يولد كل سكريبت قائمته الخاصة بـ primerange
+
+وللوصول إلى عدد أولي بترتيبه أو حجمه دون توليد القائمة من البداية:
+- prime_pi(x): π(x) بالضبط (Lucy_Hedgehog، O(x^¾) متجهة، π(10^12) في ثانيتين)
+- nth_prime_approx(n): تقدير متجه بعكس li(x) − ½·li(√x) بنيوتن من بداية Cipolla
+- nth_prime(n): التقدير، ثم π عنده بالضبط، ثم مشي قصير بالغربال المقطعي
+- primes_from(start, count): أول count عدداً أولياً ابتداءً من start
+"""
+
+import math
+
+import numpy as np
+
+NEWTON_STEPS = 8
+
+
+def sieve_primes(limit: int) -> np.ndarray:
+    """
+    غربال إراتوستينس المتجه: جميع الأعداد الأولية الأصغر من limit
+
+    Args:
+        limit: الحد الأعلى (غير مشمول)
+
+    Returns:
+        مصفوفة int64 مرتبة تصاعدياً
+    """
+    if limit <= 2:
+        return np.zeros(0, dtype=np.int64)
+
+    # الأعداد الفردية فقط: الفهرس i يمثل العدد 2i + 1
+    is_prime = np.ones(limit // 2, dtype=bool)
+    is_prime[0] = False  # العدد 1
+
+    for i in range(1, (int(limit**0.5) - 1) // 2 + 1):
+        if is_prime[i]:
+            p = 2 * i + 1
+            is_prime[p * p // 2::p] = False
+
+    primes = 2 * np.nonzero(is_prime)[0] + 1
+    return np.concatenate(([2], primes)).astype(np.int64)
+
+
+def primes_between(lo: int, hi: int) -> np.ndarray:
+    """
+    غربال مقطعي: الأعداد الأولية في [lo, hi) بذاكرة بطول المقطع فقط
+
+    Args:
+        lo: بداية المقطع (مشمولة)
+        hi: نهاية المقطع (غير مشمولة)
+
+    Returns:
+        مصفوفة int64 مرتبة تصاعدياً
+    """
+    lo = max(lo, 2)
+    if hi <= lo:
+        return np.zeros(0, dtype=np.int64)
+
+    is_prime = np.ones(hi - lo, dtype=bool)
+    for p in sieve_primes(int(hi**0.5) + 1):
+        p = int(p)
+        first = max(p * p, -(-lo // p) * p)
+        is_prime[first - lo::p] = False
+
+    return np.nonzero(is_prime)[0].astype(np.int64) + lo
+
+
+def next_prime(n: int) -> int:
+    """أصغر عدد أولي ≥ n"""
+    width = 256
+    while True:
+        primes = primes_between(n, n + width)
+        if len(primes):
+            return int(primes[0])
+        n, width = n + width, width * 2
+
+
+def first_primes(count: int) -> np.ndarray:
+    """أول count عدداً أولياً"""
+    if count <= 0:
+        return np.zeros(0, dtype=np.int64)
+
+    # حد روسر العلوي: p_n < n(ln n + ln ln n) لكل n ≥ 6
+    n = max(count, 6)
+    limit = int(n * (np.log(n) + np.log(np.log(n)))) + 1
+    return sieve_primes(limit)[:count]
+
+
+def primes_from(start: int, count: int) -> np.ndarray:
+    """أول count عدداً أولياً ≥ start (نوافذ متضاعفة من الغربال المقطعي)"""
+    found = [np.zeros(0, dtype=np.int64)]
+    total = 0
+    width = max(256, int(count * math.log(max(start, 3)) * 1.2))
+    while total < count:
+        primes = primes_between(start, start + width)
+        found.append(primes[:count - total])
+        total += len(found[-1])
+        start, width = start + width, width * 2
+    return np.concatenate(found)
+
+
+def prime_pi(x: int) -> int:
+    """
+    عدد الأعداد الأولية ≤ x بالضبط (خوارزمية Lucy_Hedgehog)
+
+    small[v] = π(v) لكل v ≤ √x و large[i] = π(x // i)، تبدأ بعدد كل الأعداد
+    ≥ 2 ثم يُحذف مضاعفات كل عدد أولي p ≤ √x: S(v) −= S(v // p) − π(p − 1)
+    لكل v ≥ p²؛ كل تحديث شريحة متجهة تقرأ القيم القديمة قبل الكتابة
+    """
+    x = int(x)
+    if x < 2:
+        return 0
+    r = math.isqrt(x)
+    small = np.arange(-1, r, dtype=np.int64)                 # π(v) مؤقتاً: v − 1
+    quotients = x // np.arange(1, r + 1, dtype=np.int64)     # x // i
+    large = np.concatenate(([0], quotients - 1))
+
+    for p in sieve_primes(r + 1).tolist():
+        below = small[p - 1]
+        top = min(r, x // (p * p))
+        # x // (i·p) = (x // i) // p: من large إن كان i·p ≤ r وإلا من small
+        direct = min(top, r // p)
+        large[1:direct + 1] -= large[p:direct * p + 1:p] - below
+        if top > direct:
+            large[direct + 1:top + 1] -= small[quotients[direct:top] // p] - below
+        if p * p <= r:
+            # v // p ثابت على كل p قيم متتالية ابتداءً من p²
+            rows = (r + 1 - p * p) // p
+            shift = small[p:p + rows + 1] - below
+            small[p * p:p * p + rows * p].reshape(rows, p)[:] -= shift[:rows, None]
+            small[p * p + rows * p:] -= shift[rows]
+    return int(large[1])
+
+
+def nth_prime_approx(n) -> np.ndarray:
+    """
+    تقدير متجه للعدد الأولي رقم n: حل li(x) − ½·li(√x) = n بنيوتن
+
+    البداية من متسلسلة Cipolla: n(ln n + ln ln n − 1 + (ln ln n − 2)/ln n)،
+    والحد ½·li(√x) (أول تصحيح في دالة ريمان R) يقسم الخطأ على ~10 مقارنة بـ li وحدها
+
+    Args:
+        n: ترتيب (عدد أو مصفوفة، n ≥ 1)
+
+    Returns:
+        مصفوفة float بنفس شكل n
+    """
+    from scipy.special import expi
+
+    n = np.asarray(n, dtype=float)
+    ln_n = np.log(np.maximum(n, 6))
+    ln_ln_n = np.log(ln_n)
+    x = n * (ln_n + ln_ln_n - 1 + (ln_ln_n - 2) / ln_n)
+    x = np.maximum(x, 3.0)
+    for _ in range(NEWTON_STEPS):
+        ln_x = np.log(x)
+        residual = expi(ln_x) - expi(ln_x / 2) / 2 - n
+        slope = (1 - 0.5 / np.sqrt(x)) / ln_x
+        x = np.maximum(x - residual / slope, 2.0)
+    return x
+
+
+def nth_prime(n: int) -> int:
+    """
+    العدد الأولي رقم n (nth_prime(1) = 2) حتى n ≈ 10^12
+
+    π عند التقدير بالضبط ثم مشي بالغربال المقطعي للأمام أو للخلف بعدد
+    الأعداد الأولية الناقصة أو الزائدة فقط
+    """
+    n = int(n)
+    if n < 1:
+        raise ValueError("n must be a positive integer")
+    if n <= 1000:
+        return int(first_primes(n)[-1])
+
+    x = int(nth_prime_approx(n))
+    count = prime_pi(x)                   # الأعداد الأولية ≤ x
+    log_x = math.log(x)
+    if count < n:
+        lo = x + 1
+        while True:
+            width = int((n - count) * log_x * 1.5) + 1024
+            primes = primes_between(lo, lo + width)
+            if count + len(primes) >= n:
+                return int(primes[n - count - 1])
+            count, lo = count + len(primes), lo + width
+
+    hi = x + 1
+    while True:
+        width = int((count - n + 1) * log_x * 1.5) + 1024
+        primes = primes_between(max(2, hi - width), hi)
+        if count - len(primes) < n:
+            return int(primes[n - (count - len(primes)) - 1])
+        count, hi = count - len(primes), hi - width
+
+
+if __name__ == "__main__":
+    print("🔢 غربال الأعداد الأولية المشترك")
+    print("=" * 40)
+
+    primes = sieve_primes(1000)
+    print(f"📊 عدد الأعداد الأولية < 1000: {len(primes)}")
+    print(f"📊 أول 10 أعداد: {primes[:10].tolist()}")
+    print(f"📊 أول 30 عدداً ينتهي بـ: {first_primes(30)[-1]}")
+
+    import time
+    for n in (10**6, 10**9, 10**11):
+        start = time.perf_counter()
+        p = nth_prime(n)
+        print(f"📊 العدد الأولي رقم {n:,}: {p:,} (التقدير {nth_prime_approx(n):,.0f}) "
+              f"في {time.perf_counter() - start:.2f}s")
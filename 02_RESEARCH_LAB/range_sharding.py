@@ -0,0 +1,722 @@
+#!/usr/bin/env python3
+"""
+توزيع مسح النطاقات على عمال متعددين
+Distributed Range Sharding with a Coordinator
+باسل يحيى عبدالله - Basil Yahya Abdullah
+
+المنسق يقسم [lo, hi) إلى مقاطع ويوزعها على:
+- عمليات محلية (ProcessPoolExecutor)
+- أو خوادم مقاطع عبر المقابس (multiprocessing.connection) كبديل لعدة أجهزة
+
+كل مقطع يعيد نتيجة جزئية قابلة للدمج (مدرج الفجوات، عزوم الارتباط،
+عدادات الدقة) فيدمجها المنسق بترتيب المقاطع. المقطع الفاشل يُعاد حتى
+retries مرة، وما يبقى فاشلاً يُرفع في ShardFailure مع النتيجة الجزئية.
+
+المقطع [a, b) مسؤول عن كل فجوة يقع عددها الأولي الأول في [a, b)
+(يحسب العدد الأولي التالي لـ b بنفسه) فلا تضيع فجوات الحدود.
+
+    result = run_sharded(GapScanTask(), 10**9, 10**9 + 10**8, shard_size=10**7, workers=4)
+
+خادم مقاطع على جهاز آخر (نفس الكود، شبكة موثوقة فقط - الرسائل pickle):
+    BASIL_SHARD_AUTHKEY=secret python range_sharding.py serve --host 0.0.0.0 --port 6001
+    python range_sharding.py gaps --lo 1e9 --hi 1.1e9 --hosts host1:6001,host2:6001
+"""
+
+import os
+import time
+import ipaddress
+import queue
+import argparse
+import threading
+import traceback
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from multiprocessing.connection import Client, Listener
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from prime_sieve import next_prime, primes_between
+from scan_checkpoint import StreamingStats
+from instrumentation import metrics
+
+DEFAULT_SHARD_SIZE = 1_000_000
+BUILTIN_AUTHKEY = b'basil-prime'  # للخوادم المحلية فقط (127.0.0.1)
+DEFAULT_AUTHKEY = os.environ.get('BASIL_SHARD_AUTHKEY', BUILTIN_AUTHKEY.decode()).encode()
+
+Shard = Tuple[int, int]
+
+
+# ===== النتائج الجزئية القابلة للدمج =====
+
+class GapHistogram:
+    """مدرج الفجوات: الفجوة → عدد مرات ظهورها"""
+
+    def __init__(self):
+        self.counts = {}
+
+    def add(self, gaps):
+        values, counts = np.unique(np.asarray(gaps), return_counts=True)
+        for gap, count in zip(values.tolist(), counts.tolist()):
+            self.counts[gap] = self.counts.get(gap, 0) + count
+
+    def merge(self, other: 'GapHistogram'):
+        for gap, count in other.counts.items():
+            self.counts[gap] = self.counts.get(gap, 0) + count
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    def most_common(self, n: int = 5) -> List[Tuple[int, int]]:
+        return sorted(self.counts.items(), key=lambda item: (-item[1], item[0]))[:n]
+
+    def to_dict(self) -> Dict:
+        return {'total': self.total, 'counts': dict(sorted(self.counts.items()))}
+
+    def __repr__(self):
+        return f"GapHistogram(total={self.total}, most_common={self.most_common(3)})"
+
+
+class CorrelationMoments:
+    """
+    عزوم الارتباط بين x و y (متوسطات وعزوم مركزية - صيغة Chan للدمج)
+    تكفي لمعامل بيرسون وخط الانحدار دون الاحتفاظ بالبيانات
+    """
+
+    __slots__ = ('count', 'mean_x', 'mean_y', 'm2_x', 'm2_y', 'c_xy')
+
+    def __init__(self):
+        self.count = 0
+        self.mean_x = self.mean_y = 0.0
+        self.m2_x = self.m2_y = self.c_xy = 0.0
+
+    def add(self, x, y):
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        if x.size == 0:
+            return
+        batch = CorrelationMoments()
+        batch.count = int(x.size)
+        batch.mean_x = float(x.mean())
+        batch.mean_y = float(y.mean())
+        dx = x - batch.mean_x
+        dy = y - batch.mean_y
+        batch.m2_x = float(dx @ dx)
+        batch.m2_y = float(dy @ dy)
+        batch.c_xy = float(dx @ dy)
+        self.merge(batch)
+
+    def merge(self, other: 'CorrelationMoments'):
+        if other.count == 0:
+            return
+        count = self.count + other.count
+        dx = other.mean_x - self.mean_x
+        dy = other.mean_y - self.mean_y
+        weight = self.count * other.count / count
+        self.m2_x += other.m2_x + dx * dx * weight
+        self.m2_y += other.m2_y + dy * dy * weight
+        self.c_xy += other.c_xy + dx * dy * weight
+        self.mean_x += dx * other.count / count
+        self.mean_y += dy * other.count / count
+        self.count = count
+
+    def correlation(self) -> float:
+        """معامل بيرسون"""
+        if self.m2_x <= 0 or self.m2_y <= 0:
+            return 0.0
+        return self.c_xy / np.sqrt(self.m2_x * self.m2_y)
+
+    def regression(self) -> Tuple[float, float]:
+        """خط الانحدار y = slope * x + intercept"""
+        slope = self.c_xy / self.m2_x if self.m2_x > 0 else 0.0
+        return slope, self.mean_y - slope * self.mean_x
+
+    def to_dict(self) -> Dict:
+        slope, intercept = self.regression()
+        return {'count': self.count, 'mean_x': self.mean_x, 'mean_y': self.mean_y,
+                'correlation': self.correlation(), 'slope': slope, 'intercept': intercept}
+
+    def __repr__(self):
+        return f"CorrelationMoments(n={self.count}, r={self.correlation():.4f})"
+
+
+class AccuracyCounts:
+    """عدادات دقة التنبؤ: التطابق التام، ضمن التسامح، وإحصاءات الخطأ النسبي %"""
+
+    def __init__(self, tolerance: float = 5.0):
+        self.tolerance = tolerance
+        self.total = 0
+        self.exact = 0
+        self.within = 0
+        self.errors = StreamingStats()
+
+    def add(self, predicted, actual):
+        predicted = np.asarray(predicted, dtype=float)
+        actual = np.asarray(actual, dtype=float)
+        valid = np.isfinite(predicted)
+        predicted, actual = predicted[valid], actual[valid]
+
+        error = np.abs(predicted - actual) / actual * 100
+        self.total += int(actual.size)
+        self.exact += int(np.count_nonzero(np.rint(predicted) == actual))
+        self.within += int(np.count_nonzero(error <= self.tolerance))
+        self.errors.extend(error)
+
+    def merge(self, other: 'AccuracyCounts'):
+        self.total += other.total
+        self.exact += other.exact
+        self.within += other.within
+        self.errors.merge(other.errors)
+
+    @property
+    def accuracy(self) -> float:
+        """متوسط الدقة % (100 - متوسط الخطأ النسبي)"""
+        return 100 - self.errors.mean if self.total else 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            'total': self.total,
+            'exact': self.exact,
+            'within_tolerance': self.within,
+            'tolerance': self.tolerance,
+            'accuracy': self.accuracy,
+            'error': self.errors.to_dict()
+        }
+
+    def __repr__(self):
+        return (f"AccuracyCounts(total={self.total}, exact={self.exact}, "
+                f"within={self.within}, accuracy={self.accuracy:.2f}%)")
+
+
+def merge_partials(into, other):
+    """دمج نتيجتين جزئيتين (كائنات بـ merge أو قواميس منها أو أعداد)"""
+    if into is None:
+        return other
+    if other is None:
+        return into
+    if isinstance(into, dict):
+        for key, value in other.items():
+            into[key] = merge_partials(into.get(key), value)
+        return into
+    if hasattr(into, 'merge'):
+        into.merge(other)
+        return into
+    return into + other
+
+
+# ===== المهام =====
+
+def shard_primes(lo: int, hi: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    الأعداد الأولية p في [lo, hi) والعدد الأولي التالي لكل منها
+
+    Returns:
+        (primes, successors)
+    """
+    primes = primes_between(lo, hi)
+    if len(primes) == 0:
+        return primes, primes
+    successors = np.empty_like(primes)
+    successors[:-1] = primes[1:]
+    successors[-1] = next_prime(hi)
+    return primes, successors
+
+
+class ShardTask:
+    """
+    مهمة مقطع: map(lo, hi) تعيد نتيجة جزئية قابلة للدمج
+
+    يجب أن تكون المهمة قابلة لـ pickle (صنف على مستوى الوحدة)
+    """
+
+    name = 'shard_task'
+
+    def map(self, lo: int, hi: int):
+        raise NotImplementedError
+
+
+class GapScanTask(ShardTask):
+    """توزيع الفجوات، إحصاءاتها، وارتباطها بحجم العدد الأولي"""
+
+    name = 'gap_scan'
+
+    def map(self, lo, hi):
+        primes, successors = shard_primes(lo, hi)
+        gaps = successors - primes
+
+        histogram = GapHistogram()
+        histogram.add(gaps)
+        gap_stats = StreamingStats()
+        gap_stats.extend(gaps)
+        gap_vs_prime = CorrelationMoments()
+        gap_vs_prime.add(primes, gaps)
+
+        # الفجوة المطبّعة g / ln p (متوسطها ← 1 حسب مبرهنة الأعداد الأولية)
+        normalized = StreamingStats()
+        normalized.extend(gaps / np.log(primes.astype(float)) if len(primes) else gaps)
+
+        return {
+            'prime_count': int(len(primes)),
+            'gaps': histogram,
+            'gap_stats': gap_stats,
+            'normalized_gap': normalized,
+            'gap_vs_prime': gap_vs_prime
+        }
+
+
+class PredictionAccuracyTask(ShardTask):
+    """
+    اختبار متنبئ موجود على كل عدد أولي في المقطع (أو كل stride-ي منها)
+
+    Args:
+        predictor: كائن قابل لـ pickle (مثل AdvancedPrimePredictor)
+        method: اسم دالة التنبؤ: method(p) → العدد الأولي التالي المتوقع
+        stride: أخذ عينة كل stride عدداً أولياً
+        tolerance: حد الخطأ النسبي % للعد ضمن التسامح
+    """
+
+    name = 'prediction_accuracy'
+
+    def __init__(self, predictor, method: str = 'predict_next_prime',
+                 stride: int = 1, tolerance: float = 5.0):
+        self.predictor = predictor
+        self.method = method
+        self.stride = max(1, int(stride))
+        self.tolerance = tolerance
+
+    def map(self, lo, hi):
+        primes, successors = shard_primes(lo, hi)
+        primes, successors = primes[::self.stride], successors[::self.stride]
+
+        predict = getattr(self.predictor, self.method)
+        predicted = np.array([
+            value if value is not None else np.nan
+            for value in (predict(int(p)) for p in primes)
+        ], dtype=float)
+
+        accuracy = AccuracyCounts(self.tolerance)
+        accuracy.add(predicted, successors)
+        valid = np.isfinite(predicted)
+        predicted_vs_actual = CorrelationMoments()
+        predicted_vs_actual.add(predicted[valid], successors[valid])
+
+        return {
+            'accuracy': accuracy,
+            'predicted_vs_actual': predicted_vs_actual,
+            'failed_predictions': int(np.count_nonzero(~valid))
+        }
+
+
+class CircuitGapTask(ShardTask):
+    """دقة تنبؤ الدائرة بالفجوات (PrimeGapsAnalyzer.calculate_circuit_gap_prediction)"""
+
+    name = 'circuit_gap'
+
+    def __init__(self, analyzer, stride: int = 1, tolerance: float = 50.0):
+        self.analyzer = analyzer
+        self.stride = max(1, int(stride))
+        self.tolerance = tolerance
+
+    def map(self, lo, hi):
+        primes, successors = shard_primes(lo, hi)
+        primes, successors = primes[::self.stride], successors[::self.stride]
+
+        predicted = np.array([
+            self.analyzer.calculate_circuit_gap_prediction(int(p), int(q)) or np.nan
+            for p, q in zip(primes, successors)
+        ], dtype=float)
+        actual = successors - primes
+
+        accuracy = AccuracyCounts(self.tolerance)
+        accuracy.add(predicted, actual)
+        valid = np.isfinite(predicted)
+        predicted_vs_actual = CorrelationMoments()
+        predicted_vs_actual.add(predicted[valid], actual[valid])
+
+        histogram = GapHistogram()
+        histogram.add(actual)
+
+        return {'accuracy': accuracy, 'predicted_vs_actual': predicted_vs_actual,
+                'gaps': histogram}
+
+
+# ===== تنفيذ مقطع واحد (في العامل) =====
+
+def _run_shard(task: ShardTask, lo: int, hi: int, collect_metrics: bool):
+    """تنفيذ مقطع وإعادة (النتيجة، المدة، لقطة القياسات)"""
+    if collect_metrics:
+        metrics.enable()
+        metrics.reset()
+    start = time.perf_counter()
+    partial = task.map(lo, hi)
+    duration = time.perf_counter() - start
+    return partial, duration, metrics.snapshot() if collect_metrics else None
+
+
+def make_shards(lo: int, hi: int, shard_size: int) -> List[Shard]:
+    """تقسيم [lo, hi) إلى مقاطع متجاورة بطول shard_size"""
+    if shard_size <= 0:
+        raise ValueError("shard_size must be positive")
+    return [(start, min(start + shard_size, hi)) for start in range(lo, hi, shard_size)]
+
+
+class ShardFailure(RuntimeError):
+    """مقاطع فشلت بعد استنفاد المحاولات"""
+
+    def __init__(self, failed: Dict[Shard, str], partial):
+        shards = ', '.join(f"[{lo}, {hi})" for lo, hi in sorted(failed))
+        super().__init__(f"{len(failed)} shard(s) failed: {shards}")
+        self.failed = failed
+        self.partial = partial
+
+
+# ===== النقل: عمليات محلية =====
+
+def _run_local(task, shards, workers, on_done, on_error):
+    """
+    مجمع عمليات محلي؛ المقاطع الفاشلة تُعاد في الجولة التالية
+
+    انهيار عامل يكسر المجمع فتفشل كل مقاطعه الجارية دون معرفة المسبب،
+    لذلك تُعاد هذه المقاطع كل منها في مجمع خاص ولا تُحسب محاولة إلا على المسبب
+    """
+    pending = list(shards)
+    while pending:
+        suspects = []
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(_run_shard, task, lo, hi, metrics.enabled): (lo, hi)
+                       for lo, hi in pending}
+            pending = []
+            for future in as_completed(futures):
+                shard = futures[future]
+                try:
+                    on_done(shard, future.result())
+                except BrokenProcessPool:
+                    suspects.append(shard)
+                except Exception as exc:
+                    if on_error(shard, f"{type(exc).__name__}: {exc}"):
+                        pending.append(shard)
+
+        for shard in suspects:
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                try:
+                    on_done(shard, pool.submit(_run_shard, task, *shard, metrics.enabled).result())
+                except Exception as exc:
+                    if on_error(shard, f"{type(exc).__name__}: {exc}"):
+                        pending.append(shard)
+
+
+def _run_inline(task, shards, on_done, on_error):
+    """تنفيذ تسلسلي في نفس العملية (workers=0) - للتصحيح ولجهاز بمعالج واحد"""
+    pending = list(shards)
+    while pending:
+        shard = pending.pop(0)
+        try:
+            on_done(shard, _run_shard(task, *shard, False))
+        except Exception:
+            if on_error(shard, traceback.format_exc(limit=3)):
+                pending.append(shard)
+
+
+# ===== النقل: خوادم المقاطع عبر المقابس =====
+
+def _is_loopback(host: str) -> bool:
+    """هل العنوان محلي (127.0.0.0/8، ::1، localhost)"""
+    if host == 'localhost':
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def serve_shards(address=('127.0.0.1', 0), authkey: bytes = DEFAULT_AUTHKEY, ready=None):
+    """
+    خادم مقاطع: يستقبل (task, lo, hi, collect_metrics) ويعيد النتيجة
+
+    الرسالة None توقف الخادم. ready (Queue اختيارية) تستقبل العنوان الفعلي.
+    الرسائل pickle، فالخادم على عنوان غير محلي يرفض البدء بالمفتاح المدمج
+    ويحتاج authkey صريحاً (أو BASIL_SHARD_AUTHKEY)
+    """
+    if authkey == BUILTIN_AUTHKEY and not _is_loopback(address[0]):
+        raise ValueError(f"refusing to serve shards on {address[0]!r} with the built-in authkey; "
+                         f"set BASIL_SHARD_AUTHKEY or pass authkey")
+    with Listener(tuple(address), authkey=authkey) as listener:
+        if ready is not None:
+            ready.put(listener.address)
+        while True:
+            with listener.accept() as conn:
+                while True:
+                    try:
+                        message = conn.recv()
+                    except EOFError:
+                        break
+                    if message is None:
+                        return
+                    task, lo, hi, collect_metrics = message
+                    try:
+                        conn.send(('ok', _run_shard(task, lo, hi, collect_metrics)))
+                    except Exception:
+                        conn.send(('error', traceback.format_exc(limit=3)))
+
+
+def _socket_worker(task, address, authkey, work, on_done, on_error, finished):
+    """خيط لكل خادم: يسحب المقاطع من الطابور حتى انتهاء العمل أو سقوط الخادم"""
+    try:
+        conn = Client(tuple(address), authkey=authkey)
+    except OSError:
+        return
+
+    with conn:
+        while not finished.is_set():
+            try:
+                shard = work.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            try:
+                conn.send((task, shard[0], shard[1], metrics.enabled))
+                status, payload = conn.recv()
+            except (OSError, EOFError) as exc:
+                if on_error(shard, f"host {address[0]}:{address[1]} lost: {exc}"):
+                    work.put(shard)
+                return  # الخادم سقط - تتولى الخيوط الأخرى بقية العمل
+            if status == 'ok':
+                on_done(shard, payload)
+            elif on_error(shard, payload):
+                work.put(shard)
+
+
+def _run_hosts(task, shards, hosts, authkey, on_done, on_error, is_finished):
+    work = queue.Queue()
+    for shard in shards:
+        work.put(shard)
+
+    finished = threading.Event()
+    threads = [threading.Thread(target=_socket_worker, daemon=True,
+                                args=(task, address, authkey, work, on_done, on_error, finished))
+               for address in hosts]
+    for thread in threads:
+        thread.start()
+
+    while not is_finished():
+        if not any(thread.is_alive() for thread in threads):
+            break  # لم يبق خادم حي
+        time.sleep(0.05)
+    finished.set()
+    for thread in threads:
+        thread.join()
+
+    # مقاطع لم يعالجها أي خادم
+    unserved = []
+    while not work.empty():
+        unserved.append(work.get())
+    return unserved
+
+
+def start_local_servers(count: int, authkey: bytes = DEFAULT_AUTHKEY):
+    """
+    تشغيل count خادم مقاطع محلي (بديل لعدة أجهزة)
+
+    Returns:
+        (العناوين، العمليات)
+    """
+    ready = multiprocessing.Queue()
+    processes = []
+    for _ in range(count):
+        process = multiprocessing.Process(target=serve_shards, daemon=True,
+                                          args=(('127.0.0.1', 0), authkey, ready))
+        process.start()
+        processes.append(process)
+    addresses = [ready.get(timeout=30) for _ in processes]
+    return addresses, processes
+
+
+def stop_servers(addresses: Sequence, authkey: bytes = DEFAULT_AUTHKEY):
+    """إيقاف خوادم المقاطع"""
+    for address in addresses:
+        try:
+            with Client(tuple(address), authkey=authkey) as conn:
+                conn.send(None)
+        except OSError:
+            pass
+
+
+@contextmanager
+def local_shard_servers(count: int, authkey: bytes = DEFAULT_AUTHKEY):
+    """خوادم مقاطع محلية طوال كتلة with"""
+    addresses, processes = start_local_servers(count, authkey)
+    try:
+        yield addresses
+    finally:
+        stop_servers(addresses, authkey)
+        for process in processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+
+
+# ===== المنسق =====
+
+def run_sharded(task: ShardTask, lo: int, hi: int, shard_size: int = DEFAULT_SHARD_SIZE,
+                workers: Optional[int] = None, retries: int = 2, hosts: Optional[Sequence] = None,
+                authkey: bytes = DEFAULT_AUTHKEY,
+                progress: Optional[Callable[[int, int], None]] = None):
+    """
+    تنفيذ مهمة على [lo, hi) مقسماً إلى مقاطع ودمج النتائج
+
+    Args:
+        task: ShardTask (مثل GapScanTask())
+        lo, hi: النطاق [lo, hi)
+        shard_size: طول المقطع
+        workers: عدد العمليات المحلية (None: عدد المعالجات، 0: في نفس العملية)
+        retries: عدد إعادة المحاولة لكل مقطع فاشل
+        hosts: عناوين خوادم مقاطع [(host, port), ...] بدلاً من العمليات المحلية
+        progress: دالة progress(المنجز، الإجمالي) بعد كل مقطع
+
+    Returns:
+        النتيجة المدمجة (بترتيب المقاطع)
+
+    Raises:
+        ShardFailure: مقاطع فشلت بعد استنفاد المحاولات (مع النتيجة الجزئية)
+    """
+    shards = make_shards(int(lo), int(hi), int(shard_size))
+    results = {}
+    failed = {}
+    attempts = {shard: 0 for shard in shards}
+    lock = threading.Lock()
+
+    def on_done(shard, outcome):
+        partial, duration, snapshot = outcome
+        with lock:
+            if shard in results:
+                return
+            results[shard] = partial
+            failed.pop(shard, None)
+            if snapshot:
+                metrics.merge(snapshot)
+            metrics.record_time(f"sharding.{task.name}", duration)
+            if progress is not None:
+                progress(len(results), len(shards))
+
+    def on_error(shard, error) -> bool:
+        """تسجيل الفشل؛ True إذا بقيت محاولات"""
+        with lock:
+            attempts[shard] += 1
+            failed[shard] = error
+            metrics.count('sharding.shard_errors')
+            if attempts[shard] > retries:
+                return False
+            metrics.count('sharding.retries')
+            return True
+
+    def is_finished():
+        with lock:
+            return len(results) + sum(1 for shard in failed if attempts[shard] > retries) >= len(shards)
+
+    with metrics.timer('sharding.run'):
+        if hosts:
+            for shard in _run_hosts(task, shards, hosts, authkey, on_done, on_error, is_finished):
+                failed.setdefault(shard, 'no live shard server')
+        elif workers == 0:
+            _run_inline(task, shards, on_done, on_error)
+        else:
+            _run_local(task, shards, workers or os.cpu_count(), on_done, on_error)
+
+    metrics.count('sharding.shards', len(results))
+    merged = None
+    for shard in shards:
+        if shard in results:
+            merged = merge_partials(merged, results[shard])
+
+    if failed:
+        metrics.count('sharding.failed_shards', len(failed))
+        raise ShardFailure(failed, merged)
+    return merged
+
+
+def print_gap_scan(result: Dict, lo: int, hi: int):
+    """طباعة ملخص GapScanTask"""
+    gap_stats = result['gap_stats']
+    correlation = result['gap_vs_prime']
+    print(f"\n📊 مسح الفجوات في [{lo:,}, {hi:,}):")
+    print(f"   عدد الأعداد الأولية: {result['prime_count']:,}")
+    print(f"   متوسط الفجوة: {gap_stats.mean:.4f} (الانحراف: {gap_stats.std:.4f}, الأقصى: {gap_stats.max:g})")
+    print(f"   متوسط الفجوة / ln p: {result['normalized_gap'].mean:.4f}")
+    print(f"   الارتباط بين حجم العدد الأولي والفجوة: {correlation.correlation():.4f}")
+    print(f"   أكثر الفجوات شيوعاً:")
+    for gap, count in result['gaps'].most_common(5):
+        print(f"      الفجوة {gap}: {count:,} مرة ({count / result['prime_count'] * 100:.1f}%)")
+
+
+def _parse_hosts(text: str):
+    hosts = []
+    for item in text.split(','):
+        host, port = item.rsplit(':', 1)
+        hosts.append((host, int(port)))
+    return hosts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Distributed range sharding")
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    serve = sub.add_parser('serve', help='run a shard server')
+    serve.add_argument('--host', default='127.0.0.1')
+    serve.add_argument('--port', type=int, default=6001)
+
+    for name, help_text in (('gaps', 'sharded gap scan'), ('backtest', 'sharded predictor backtest')):
+        command = sub.add_parser(name, help=help_text)
+        command.add_argument('--lo', type=float, default=1e6)
+        command.add_argument('--hi', type=float, default=2e6)
+        command.add_argument('--shard-size', type=float, default=DEFAULT_SHARD_SIZE)
+        command.add_argument('--workers', type=int, default=None)
+        command.add_argument('--retries', type=int, default=2)
+        command.add_argument('--hosts', type=_parse_hosts, default=None,
+                             help='comma separated host:port shard servers')
+        command.add_argument('--local-servers', type=int, default=0,
+                             help='start N local shard servers (socket stand-in for hosts)')
+        if name == 'backtest':
+            command.add_argument('--stride', type=int, default=1)
+
+    args = parser.parse_args()
+
+    if args.command == 'serve':
+        try:
+            print(f"🖧 خادم مقاطع على {args.host}:{args.port}")
+            serve_shards((args.host, args.port))
+        except ValueError as exc:
+            parser.error(str(exc))
+        return
+
+    lo, hi = int(args.lo), int(args.hi)
+    if args.command == 'gaps':
+        task = GapScanTask()
+    else:
+        from advanced_prime_predictor import AdvancedPrimePredictor
+        task = PredictionAccuracyTask(AdvancedPrimePredictor(), stride=args.stride)
+
+    def progress(done, total):
+        print(f"\r   المقاطع: {done}/{total}", end='', flush=True)
+
+    print(f"🧩 توزيع [{lo:,}, {hi:,}) على مقاطع بطول {int(args.shard_size):,}")
+    start = time.time()
+    if args.local_servers:
+        with local_shard_servers(args.local_servers) as hosts:
+            result = run_sharded(task, lo, hi, args.shard_size, retries=args.retries,
+                                 hosts=hosts, progress=progress)
+    else:
+        result = run_sharded(task, lo, hi, args.shard_size, workers=args.workers,
+                             retries=args.retries, hosts=args.hosts, progress=progress)
+    print(f"\n⏱️ الزمن: {time.time() - start:.2f}s")
+
+    if args.command == 'gaps':
+        print_gap_scan(result, lo, hi)
+    else:
+        print(f"\n🎯 {result['accuracy']}")
+        print(f"   ارتباط المتوقع بالفعلي: {result['predicted_vs_actual'].correlation():.4f}")
+
+
+if __name__ == "__main__":
+    main()
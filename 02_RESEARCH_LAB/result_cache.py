@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+ذاكرة مؤقتة للنتائج معنونة بالمحتوى
+Content-Addressed Result Cache
+باسل يحيى عبدالله - Basil Yahya Abdullah
+
+مفتاح كل نتيجة = اسم الدالة + بصمة المعاملات + بصمة إصدار الكود
+- DataFrame تُحفظ Parquet (إن توفر pyarrow) وإلا pickle
+- مصفوفات numpy تُحفظ .npy
+- بقية النتائج تُحفظ pickle
+مع حد أقصى للحجم وإخلاء الأقدم استخداماً (LRU)
+"""
+
+import os
+import time
+import pickle
+import hashlib
+import inspect
+import functools
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence
+
+import numpy as np
+
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+DEFAULT_CACHE_DIR = Path(__file__).parent / '.result_cache'
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024  # 512 MB
+
+
+def _update_fingerprint(h, obj):
+    """إضافة بصمة ثابتة لكائن إلى دالة التجزئة"""
+
+    if isinstance(obj, np.ndarray):
+        h.update(f"ndarray:{obj.dtype.str}:{obj.shape}".encode())
+        h.update(np.ascontiguousarray(obj).tobytes())
+    elif type(obj).__name__ in ('DataFrame', 'Series'):
+        import pandas as pd
+        h.update(f"{type(obj).__name__}:{list(getattr(obj, 'columns', [obj.name]))}".encode())
+        h.update(pd.util.hash_pandas_object(obj, index=True).values.tobytes())
+    elif isinstance(obj, dict):
+        h.update(b"dict{")
+        for key in sorted(obj, key=repr):
+            _update_fingerprint(h, key)
+            _update_fingerprint(h, obj[key])
+        h.update(b"}")
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        items = sorted(obj, key=repr) if isinstance(obj, (set, frozenset)) else obj
+        h.update(f"{type(obj).__name__}[".encode())
+        for item in items:
+            _update_fingerprint(h, item)
+        h.update(b"]")
+    elif isinstance(obj, np.generic):
+        h.update(repr(obj.item()).encode())
+    else:
+        h.update(repr(obj).encode())
+
+
+def fingerprint(*objs) -> str:
+    """بصمة sha256 لمجموعة كائنات"""
+    h = hashlib.sha256()
+    for obj in objs:
+        _update_fingerprint(h, obj)
+    return h.hexdigest()
+
+
+def code_version(func: Callable, owner: type = None) -> str:
+    """
+    بصمة إصدار الكود: محتوى ملفات المصدر للدالة وكل أصناف الوراثة
+    أي تعديل في الصنف أو أسلافه يبطل النتائج المحفوظة
+    """
+    sources = set()
+    for obj in ([func] + list(owner.__mro__ if owner else [])):
+        try:
+            path = inspect.getsourcefile(obj)
+        except TypeError:
+            continue  # الأصناف المدمجة مثل object
+        if path:
+            sources.add(path)
+
+    h = hashlib.sha256()
+    for path in sorted(sources):
+        with open(path, 'rb') as f:
+            h.update(f.read())
+    return h.hexdigest()
+
+
+class ResultCache:
+    """ذاكرة مؤقتة على القرص محدودة الحجم"""
+
+    def __init__(self, cache_dir: str = None, max_bytes: int = DEFAULT_MAX_BYTES,
+                 enabled: bool = None):
+        """
+        Args:
+            cache_dir: مجلد التخزين
+            max_bytes: الحجم الأقصى قبل الإخلاء
+            enabled: تفعيل الذاكرة (افتراضياً ما لم يُضبط BASIL_RESULT_CACHE=0)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        if enabled is None:
+            enabled = os.environ.get('BASIL_RESULT_CACHE', '1') != '0'
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(self, func_name: str, params: Any, version: str) -> str:
+        """المفتاح المعنون بالمحتوى"""
+        return fingerprint(func_name, params, version)
+
+    def _find(self, key: str) -> Optional[Path]:
+        for path in self.cache_dir.glob(f"{key}.*"):
+            if not path.name.endswith('.tmp'):
+                return path
+        return None
+
+    def get(self, key: str):
+        """
+        قراءة نتيجة محفوظة
+
+        Returns:
+            (found, value)
+        """
+        if not self.enabled:
+            return False, None
+
+        path = self._find(key)
+        if path is None:
+            self.misses += 1
+            return False, None
+
+        try:
+            value = self._load(path)
+        except Exception:
+            # ملف تالف: نتجاهله ونعيد الحساب
+            path.unlink(missing_ok=True)
+            self.misses += 1
+            return False, None
+
+        # تحديث زمن الاستخدام لسياسة LRU
+        now = time.time()
+        os.utime(path, (now, now))
+        self.hits += 1
+        return True, value
+
+    def put(self, key: str, value):
+        """حفظ نتيجة ثم إخلاء الأقدم إن تجاوزنا الحجم"""
+        if not self.enabled:
+            return
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        suffix = self._suffix(value)
+        final_path = self.cache_dir / f"{key}{suffix}"
+        tmp_path = self.cache_dir / f"{key}{suffix}.{os.getpid()}.tmp"
+
+        try:
+            self._dump(tmp_path, value, suffix)
+            os.replace(tmp_path, final_path)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        self.evict()
+
+    def _suffix(self, value) -> str:
+        if isinstance(value, np.ndarray) and value.dtype != object:
+            return '.npy'
+        if type(value).__name__ == 'DataFrame' and PARQUET_AVAILABLE:
+            return '.parquet'
+        return '.pkl'
+
+    def _dump(self, path: Path, value, suffix: str):
+        if suffix == '.npy':
+            with open(path, 'wb') as f:
+                np.save(f, value, allow_pickle=False)
+        elif suffix == '.parquet':
+            value.to_parquet(path)
+        else:
+            with open(path, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def _load(self, path: Path):
+        if path.suffix == '.npy':
+            return np.load(path, allow_pickle=False)
+        if path.suffix == '.parquet':
+            import pandas as pd
+            return pd.read_parquet(path)
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+
+    def entries(self):
+        """ملفات الذاكرة مرتبة من الأقدم استخداماً"""
+        if not self.cache_dir.exists():
+            return []
+        files = [p for p in self.cache_dir.iterdir()
+                 if p.is_file() and not p.name.endswith('.tmp')]
+        return sorted(files, key=lambda p: p.stat().st_mtime)
+
+    def size_bytes(self) -> int:
+        """الحجم الكلي للنتائج المحفوظة"""
+        return sum(p.stat().st_size for p in self.entries())
+
+    def evict(self):
+        """إخلاء الأقدم استخداماً حتى نعود تحت الحد الأقصى"""
+        entries = self.entries()
+        total = sum(p.stat().st_size for p in entries)
+        for path in entries:
+            if total <= self.max_bytes:
+                break
+            total -= path.stat().st_size
+            path.unlink(missing_ok=True)
+
+    def clear(self):
+        """حذف جميع النتائج المحفوظة"""
+        for path in self.entries():
+            path.unlink(missing_ok=True)
+
+    def stats(self) -> Dict:
+        """إحصائيات الإصابة والحجم"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self.entries()),
+            'size_bytes': self.size_bytes(),
+            'max_bytes': self.max_bytes
+        }
+
+
+default_cache = ResultCache()
+
+
+def cached_result(state: Sequence[str] = (), restore: Callable = None,
+                  cache: ResultCache = None):
+    """
+    مزخرف لدوال التحليل في الأصناف
+
+    Args:
+        state: أسماء خصائص الكائن التي تؤثر على النتيجة (تدخل في المفتاح)
+        restore: دالة (self, value) تعيد الآثار الجانبية عند الإصابة
+                 (مثل ملء self.error_data)
+        cache: ذاكرة مخصصة (افتراضياً default_cache)
+
+    مثال:
+        @cached_result(state=('gap_sensitivity',))
+        def comprehensive_gap_analysis(self, prime_range=(7, 100), voltage=10):
+            ...
+    """
+    def decorator(method):
+        signature = inspect.signature(method)
+        versions = {}
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            store = cache or default_cache
+            if not store.enabled:
+                return method(self, *args, **kwargs)
+
+            owner = type(self)
+            if owner not in versions:
+                versions[owner] = code_version(method, owner)
+
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            params = {name: value for name, value in bound.arguments.items() if name != 'self'}
+            instance_state = {name: getattr(self, name, None) for name in state}
+
+            func_name = f"{owner.__module__}.{owner.__qualname__}.{method.__name__}"
+            key = store.make_key(func_name, (params, instance_state), versions[owner])
+
+            found, value = store.get(key)
+            if found:
+                print(f"♻️ {method.__name__}: نتيجة محفوظة ({key[:12]})")
+                if restore:
+                    restore(self, value)
+                return value
+
+            value = method(self, *args, **kwargs)
+            store.put(key, value)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+if __name__ == "__main__":
+    print("♻️ ذاكرة النتائج المؤقتة")
+    print("=" * 40)
+    stats = default_cache.stats()
+    print(f"📁 المجلد: {default_cache.cache_dir}")
+    print(f"📊 عدد النتائج: {stats['entries']}")
+    print(f"📊 الحجم: {stats['size_bytes'] / 1024:.1f} KB من {stats['max_bytes'] / 1024**2:.0f} MB")
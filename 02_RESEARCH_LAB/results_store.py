@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""
+مخزن النتائج العمودي
+Columnar Results Store
+باسل يحيى عبدالله - Basil Yahya Abdullah
+
+بدلاً من التقارير النصية: كل تشغيل يضيف جداول مُنمَّطة (أعمدة بأنواعها)
+إلى مجموعات بيانات مقسمة حسب التشغيل:
+
+    .results_store/
+        _runs/<run_id>.json                    بيانات التشغيل (الوقت، المعاملات، الملخص)
+        circuit/run_id=<run_id>/part-00000.parquet
+        circuit/run_id=<run_id>/_part-00000.stats.json   الحد الأدنى/الأقصى لكل عمود
+
+- Parquet (إن توفر pyarrow) مع مجموعات صفوف: القراءة تدفع الشروط إلى
+  إحصائيات الملفات ومجموعات الصفوف فلا تُقرأ إلا الأجزاء المطلوبة
+- بدون pyarrow: ملفات npz عمودية (عمود لكل مصفوفة) مع تقليم الأجزاء
+  بإحصائيات الحد الأدنى/الأقصى وقراءة الأعمدة المطلوبة فقط
+
+مثال:
+    store = ResultsStore()
+    run_id = store.save_run('prime_circuit_simulator', {'circuit': results_df})
+    df = store.read('circuit', columns=['p_input', 'relative_error'],
+                    filters=[('p_input', '>=', 1000), ('relative_error', '<', 5)])
+"""
+
+import os
+import sys
+import json
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_AVAILABLE = True
+except ImportError:
+    PARQUET_AVAILABLE = False
+
+DEFAULT_STORE_DIR = Path(__file__).parent / '.results_store'
+
+# مجموعات البيانات القياسية (يمكن إضافة غيرها بأي اسم)
+DATASETS = {
+    'primes': 'الأعداد الأولية والفجوات',
+    'circuit': 'كميات الدائرة (test_multiple_primes)',
+    'predictions': 'التنبؤات مقابل القيم الفعلية',
+    'errors': 'الأخطاء والعامل التصحيحي (analyze_correction_patterns)'
+}
+
+# عدد الصفوف في كل مجموعة صفوف Parquet (وحدة التخطي عند القراءة بالشروط)
+ROW_GROUP_ROWS = 1_000_000
+
+_OPERATORS = ('==', '!=', '<', '<=', '>', '>=', 'in', 'not in')
+
+
+def to_frame(value) -> Optional[Any]:
+    """
+    تحويل نتيجة (DataFrame، قائمة قواميس، أو جدول أعمدة له to_frame() مثل
+    CircuitArrays) إلى DataFrame، وإلا None
+    """
+    import pandas as pd
+
+    if isinstance(value, pd.DataFrame):
+        return value
+    if not isinstance(value, pd.Series) and callable(getattr(value, 'to_frame', None)):
+        frame = value.to_frame()
+        return frame if isinstance(frame, pd.DataFrame) else None
+    if isinstance(value, list) and value and all(isinstance(item, dict) for item in value):
+        return pd.DataFrame(value)
+    return None
+
+
+def normalize_frame(df):
+    """
+    أنواع أعمدة ثابتة قابلة للتخزين العمودي:
+    - الأعداد المركبة تُقسم إلى <col>_real و <col>_imag
+    - الأعمدة النصية/المختلطة تُحوَّل إلى نص
+    - الفهرس يُهمل (الجداول تُخزن كصفوف)
+    """
+    import pandas as pd
+
+    columns = {}
+    for name in df.columns:
+        series = df[name]
+        values = series.to_numpy()
+
+        if values.dtype == object and len(values) and all(isinstance(v, complex) for v in values):
+            values = values.astype(complex)
+
+        if np.iscomplexobj(values):
+            columns[f"{name}_real"] = values.real.astype(float)
+            columns[f"{name}_imag"] = values.imag.astype(float)
+        elif values.dtype == object:
+            columns[str(name)] = series.astype(str).to_numpy()
+        elif values.dtype.kind == 'M':
+            columns[str(name)] = values.astype('datetime64[ns]')
+        else:
+            columns[str(name)] = values
+
+    return pd.DataFrame(columns)
+
+
+def _npz_column(series) -> np.ndarray:
+    """عمود npz بنوع ثابت (النصوص كمصفوفة Unicode لا كائنات)"""
+    values = series.to_numpy()
+    return values.astype(str) if values.dtype == object else values
+
+
+def _column_stats(columns: Dict[str, np.ndarray]) -> Dict:
+    """
+    الحد الأدنى والأقصى لكل عمود (لتقليم الأجزاء عند القراءة)، محسوبة من
+    القيم المكتوبة فعلاً؛ القيم المفقودة (None/NaN) لا تطابق أي شرط فتُهمل
+    """
+    import pandas as pd
+
+    stats = {}
+    for name, values in columns.items():
+        entry = {'dtype': values.dtype.str}
+        if len(values) and values.dtype.kind in 'biuf':
+            finite = values[np.isfinite(values)] if values.dtype.kind == 'f' else values
+            if len(finite):
+                entry['min'] = finite.min().item()
+                entry['max'] = finite.max().item()
+        elif len(values) and values.dtype.kind in 'OU':
+            present = [str(v) for v in values[~pd.isna(values)]]
+            if present:
+                entry['min'] = min(present)
+                entry['max'] = max(present)
+        stats[name] = entry
+    return stats
+
+
+def _may_match(stats: Dict, column: str, op: str, value) -> bool:
+    """هل يمكن أن يحتوي الجزء على صفوف تحقق الشرط؟ (False = تخطٍ آمن)"""
+    entry = stats.get(column)
+    if entry is None or 'min' not in entry:
+        return True
+
+    lo, hi = entry['min'], entry['max']
+    try:
+        if op == '==':
+            return lo <= value <= hi
+        if op == '<':
+            return lo < value
+        if op == '<=':
+            return lo <= value
+        if op == '>':
+            return hi > value
+        if op == '>=':
+            return hi >= value
+        if op == 'in':
+            return any(lo <= v <= hi for v in value)
+    except TypeError:
+        return True
+    return True
+
+
+def _apply_filter(values: np.ndarray, op: str, value) -> np.ndarray:
+    if op == '==':
+        return values == value
+    if op == '!=':
+        return values != value
+    if op == '<':
+        return values < value
+    if op == '<=':
+        return values <= value
+    if op == '>':
+        return values > value
+    if op == '>=':
+        return values >= value
+    if op == 'in':
+        return np.isin(values, list(value))
+    return ~np.isin(values, list(value))
+
+
+def _arrow_expression(filters):
+    """تحويل الشروط إلى تعبير pyarrow.dataset (يُدفع إلى قارئ Parquet)"""
+    import pyarrow.dataset as ds
+
+    expression = None
+    for column, op, value in filters:
+        field = ds.field(column)
+        if op == 'in':
+            term = field.isin(list(value))
+        elif op == 'not in':
+            term = ~field.isin(list(value))
+        else:
+            term = {'==': field == value, '!=': field != value,
+                    '<': field < value, '<=': field <= value,
+                    '>': field > value, '>=': field >= value}[op]
+        expression = term if expression is None else expression & term
+    return expression
+
+
+def _json_default(obj):
+    """قيم numpy كأعداد JSON، وغيرها كنص"""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    return str(obj)
+
+
+class ResultsStore:
+    """مخزن مجموعات بيانات عمودية مقسمة حسب التشغيل"""
+
+    def __init__(self, root: str = None, fmt: str = None, enabled: bool = None):
+        """
+        Args:
+            root: مجلد المخزن
+            fmt: 'parquet' أو 'npz' (افتراضياً parquet إن توفر pyarrow)
+            enabled: تفعيل الكتابة (افتراضياً ما لم يُضبط BASIL_RESULTS_STORE=0)
+        """
+        self.root = Path(root) if root else DEFAULT_STORE_DIR
+        self.format = fmt or ('parquet' if PARQUET_AVAILABLE else 'npz')
+        if self.format == 'parquet' and not PARQUET_AVAILABLE:
+            raise ImportError("Parquet format requires pyarrow")
+        if enabled is None:
+            enabled = os.environ.get('BASIL_RESULTS_STORE', '1') != '0'
+        self.enabled = enabled
+
+    # ===== التشغيلات =====
+
+    def _run_path(self, run_id: str) -> Path:
+        return self.root / '_runs' / f"{run_id}.json"
+
+    def _write_json(self, path: Path, data: Dict):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2, default=_json_default)
+        os.replace(tmp_path, path)
+
+    def start_run(self, label: str = '', params: Dict = None, **metadata) -> str:
+        """
+        تسجيل تشغيل جديد
+
+        Returns:
+            run_id (قيمة عمود التقسيم run_id)
+        """
+        run_id = f"{datetime.now().strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        if self.enabled:
+            self._write_json(self._run_path(run_id), {
+                'run_id': run_id,
+                'label': label,
+                'created': datetime.now().isoformat(timespec='seconds'),
+                'script': os.path.basename(sys.argv[0]) if sys.argv else '',
+                'format': self.format,
+                'params': params or {},
+                'datasets': {},
+                **metadata
+            })
+        return run_id
+
+    def update_run(self, run_id: str, **metadata):
+        """إضافة بيانات إلى سجل التشغيل (مثل الملخص)"""
+        if not self.enabled:
+            return
+        run = self.run_info(run_id)
+        run.update(metadata)
+        self._write_json(self._run_path(run_id), run)
+
+    def run_info(self, run_id: str) -> Dict:
+        with open(self._run_path(run_id), encoding='utf-8') as f:
+            return json.load(f)
+
+    def runs(self):
+        """جميع التشغيلات كـ DataFrame (الأحدث أخيراً)"""
+        import pandas as pd
+
+        runs_dir = self.root / '_runs'
+        records = []
+        if runs_dir.exists():
+            for path in sorted(runs_dir.glob('*.json')):
+                with open(path, encoding='utf-8') as f:
+                    records.append(json.load(f))
+        return pd.DataFrame(records)
+
+    # ===== الكتابة =====
+
+    def append(self, dataset: str, df, run_id: str) -> Optional[Path]:
+        """
+        إضافة جدول إلى مجموعة بيانات ضمن تشغيل
+
+        Returns:
+            مسار الجزء المكتوب (None إذا كان المخزن معطلاً أو الجدول فارغاً)
+        """
+        if not self.enabled:
+            return None
+        if not dataset.isidentifier():
+            raise ValueError(f"Invalid dataset name: {dataset!r}")
+
+        frame = normalize_frame(df)
+        if frame.empty:
+            return None
+
+        partition = self.root / dataset / f"run_id={run_id}"
+        partition.mkdir(parents=True, exist_ok=True)
+        part = len(list(partition.glob('part-*')))
+        suffix = '.parquet' if self.format == 'parquet' else '.npz'
+        final_path = partition / f"part-{part:05d}{suffix}"
+        # البادئة '.' تجعل القارئ يتجاهل الملف المؤقت
+        tmp_path = partition / f".{final_path.name}.{os.getpid()}.tmp"
+
+        # الإحصاءات تُحسب قبل نشر الجزء كي لا يظهر جزء بلا ملف إحصاءات
+        if self.format == 'parquet':
+            columns = {name: frame[name].to_numpy() for name in frame.columns}
+        else:
+            columns = {name: _npz_column(frame[name]) for name in frame.columns}
+        stats = {'rows': len(frame), 'columns': _column_stats(columns)}
+
+        try:
+            if self.format == 'parquet':
+                frame.to_parquet(tmp_path, index=False, row_group_size=ROW_GROUP_ROWS)
+            else:
+                with open(tmp_path, 'wb') as f:
+                    np.savez(f, **columns)
+            self._write_json(partition / f"_part-{part:05d}.stats.json", stats)
+            os.replace(tmp_path, final_path)
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        run_path = self._run_path(run_id)
+        if run_path.exists():
+            run = self.run_info(run_id)
+            run['datasets'][dataset] = run['datasets'].get(dataset, 0) + len(frame)
+            self._write_json(run_path, run)
+
+        return final_path
+
+    def save_run(self, label: str, frames: Dict[str, Any], params: Dict = None,
+                 **metadata) -> str:
+        """تشغيل كامل: تسجيل التشغيل ثم إضافة كل الجداول (كل ما يقبله to_frame)"""
+        run_id = self.start_run(label, params, **metadata)
+        for dataset, value in frames.items():
+            frame = to_frame(value)
+            if frame is not None:
+                self.append(dataset, frame, run_id)
+        return run_id
+
+    # ===== القراءة =====
+
+    def datasets(self) -> List[str]:
+        if not self.root.exists():
+            return []
+        return sorted(p.name for p in self.root.iterdir()
+                      if p.is_dir() and not p.name.startswith(('_', '.')))
+
+    def read(self, dataset: str, columns: Sequence[str] = None,
+             filters: Sequence[tuple] = None, runs: Sequence[str] = None):
+        """
+        قراءة مجموعة بيانات مع دفع الشروط
+
+        Args:
+            columns: الأعمدة المطلوبة (None = الكل، run_id متاح كعمود)
+            filters: شروط (column, op, value) مجتمعة بـ AND
+                     op: == != < <= > >= in, not in
+            runs: قصر القراءة على تشغيلات محددة
+
+        Returns:
+            DataFrame
+        """
+        import pandas as pd
+
+        filters = list(filters or [])
+        for _, op, _ in filters:
+            if op not in _OPERATORS:
+                raise ValueError(f"Unsupported filter operator: {op!r}")
+        if runs is not None:
+            filters.append(('run_id', 'in', list(runs)))
+
+        path = self.root / dataset
+        if not path.exists():
+            return pd.DataFrame(columns=list(columns or []))
+
+        if self.format == 'parquet':
+            return self._read_parquet(path, columns, filters)
+        return self._read_npz(path, columns, filters)
+
+    def _read_parquet(self, path: Path, columns, filters):
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+
+        dataset = ds.dataset(path, format='parquet',
+                             partitioning=ds.partitioning(pa.schema([('run_id', pa.string())]),
+                                                          flavor='hive'))
+        table = dataset.to_table(columns=list(columns) if columns else None,
+                                 filter=_arrow_expression(filters) if filters else None)
+        return table.to_pandas()
+
+    def _read_npz(self, path: Path, columns, filters):
+        import pandas as pd
+
+        run_filters = [f for f in filters if f[0] == 'run_id']
+        column_filters = [f for f in filters if f[0] != 'run_id']
+
+        frames = []
+        for partition in sorted(path.glob('run_id=*')):
+            run_id = partition.name.split('=', 1)[1]
+            if not all(_apply_filter(np.array([run_id]), op, value)[0]
+                       for _, op, value in run_filters):
+                continue
+
+            for part in sorted(partition.glob('part-*.npz')):
+                stats_path = partition / f"_{part.stem}.stats.json"
+                if stats_path.exists():
+                    with open(stats_path, encoding='utf-8') as f:
+                        stats = json.load(f)['columns']
+                    if not all(_may_match(stats, c, op, v) for c, op, v in column_filters):
+                        continue
+
+                with np.load(part, allow_pickle=False) as data:
+                    available = list(data.files)
+                    wanted = [c for c in (columns or available) if c != 'run_id']
+                    needed = set(wanted) | {c for c, _, _ in column_filters}
+                    if not needed:
+                        needed = {available[0]}  # لعدد الصفوف فقط
+                    missing = needed - set(available)
+                    if missing:
+                        raise KeyError(f"{part}: missing columns {sorted(missing)}")
+
+                    loaded = {name: data[name] for name in needed}
+
+                mask = None
+                for column, op, value in column_filters:
+                    term = _apply_filter(loaded[column], op, value)
+                    mask = term if mask is None else mask & term
+
+                rows = len(next(iter(loaded.values()))) if mask is None else int(mask.sum())
+                frame = pd.DataFrame({name: loaded[name] if mask is None else loaded[name][mask]
+                                      for name in wanted}, index=pd.RangeIndex(rows))
+                if columns is None or 'run_id' in columns:
+                    frame['run_id'] = run_id
+                frames.append(frame)
+
+        if not frames:
+            return pd.DataFrame(columns=list(columns or []))
+        result = pd.concat(frames, ignore_index=True)
+        return result[list(columns)] if columns else result
+
+
+default_store = ResultsStore()
+
+
+if __name__ == "__main__":
+    print("🗄️ مخزن النتائج العمودي")
+    print("=" * 40)
+    print(f"📁 المجلد: {default_store.root}")
+    print(f"📦 الصيغة: {default_store.format}")
+
+    runs = default_store.runs()
+    print(f"📊 عدد التشغيلات: {len(runs)}")
+    for name in default_store.datasets():
+        rows = sum(run.get(name, 0) for run in runs['datasets']) if len(runs) else 0
+        print(f"   • {name}: {rows} صف {DATASETS.get(name, '')}")
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""
+نقاط الحفظ والاستئناف لعمليات المسح الطويلة
+Checkpoint/Resume for Long-Running Range Scans
+باسل يحيى عبدالله - Basil Yahya Abdullah
+
+المسح (مثل البحث عن الأعداد الأولية الكبيرة) يحفظ دورياً:
+- موضع المؤشر (العنصر التالي المطلوب معالجته)
+- المجاميع الجزئية كمراكم متدفق (StreamingStats) وعدادات - حجمها ثابت
+- حالة مولدات الأرقام العشوائية (random و numpy)
+
+صفوف النتائج تُضاف إلى ملف jsonl جانبي (إضافة فقط) فلا يُعاد كتابتها
+عند كل نقطة حفظ، ونقطة الحفظ تسجل طوله لتُقص الزيادة عند الاستئناف.
+الكتابة ذرية: ملف مؤقت + fsync + os.replace
+
+الاستخدام من سطر الأوامر:
+    python scan_checkpoint.py large-test --start 100 --count 100000 --checkpoint scan.json
+    python scan_checkpoint.py large-test --start 100 --count 100000 --checkpoint scan.json --resume
+"""
+
+import os
+import json
+import math
+import time
+import random
+import argparse
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+
+DEFAULT_INTERVAL = 30.0  # ثانية بين نقاط الحفظ
+
+
+class StreamingStats:
+    """
+    مراكم متدفق (Welford): العدد، المتوسط، التباين، الحد الأدنى والأقصى
+    بذاكرة ثابتة مهما طال المسح، وقابل للدمج والحفظ
+    """
+
+    __slots__ = ('count', 'mean', 'm2', 'min', 'max', 'total')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.total = 0.0
+
+    def update(self, value: float):
+        value = float(value)
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self.total += value
+
+    def extend(self, values):
+        """إضافة دفعة كاملة دفعة واحدة (متجهياً ثم دمج)"""
+        values = np.asarray(values, dtype=float).ravel()
+        if values.size == 0:
+            return
+        batch = StreamingStats()
+        batch.count = int(values.size)
+        batch.mean = float(values.mean())
+        batch.m2 = float(((values - batch.mean) ** 2).sum())
+        batch.min = float(values.min())
+        batch.max = float(values.max())
+        batch.total = float(values.sum())
+        self.merge(batch)
+
+    def merge(self, other: 'StreamingStats'):
+        """دمج مراكم آخر (صيغة Chan للتباين)"""
+        if other.count == 0:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.mean += delta * other.count / count
+        self.count = count
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self.total += other.total
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / self.count if self.count else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+    def to_dict(self) -> Dict:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'StreamingStats':
+        stats = cls()
+        for name in cls.__slots__:
+            setattr(stats, name, data[name])
+        return stats
+
+    def __repr__(self):
+        return (f"StreamingStats(n={self.count}, mean={self.mean:.6g}, "
+                f"std={self.std:.6g}, min={self.min:.6g}, max={self.max:.6g})")
+
+
+def _json_default(obj):
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    return str(obj)
+
+
+def _atomic_write(path: Path, text: str):
+    """كتابة ذرية: لا يبقى على القرص إلا النسخة القديمة كاملة أو الجديدة كاملة"""
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class ScanCheckpoint:
+    """حالة مسح قابلة للحفظ والاستئناف"""
+
+    def __init__(self, path: str, interval: float = DEFAULT_INTERVAL, resume: bool = False):
+        """
+        Args:
+            path: ملف نقطة الحفظ (json)؛ الصفوف في <path>.rows.jsonl
+            interval: الحد الأدنى بالثواني بين نقطتي حفظ
+            resume: الاستئناف من نقطة الحفظ إن وُجدت
+        """
+        self.path = Path(path)
+        self.rows_path = self.path.with_name(self.path.name + '.rows.jsonl')
+        self.interval = interval
+        self.resume = resume
+
+        self.scan = None
+        self.params = {}
+        self.cursor = None
+        self.counters = {}
+        self.stats_by_name = {}
+        self.rows = []
+        self.done = False
+        self.resumed = False
+
+        self._pending_rows = []
+        self._rows_bytes = 0
+        self._last_save = time.time()
+
+    # ===== البدء والاستئناف =====
+
+    def begin(self, scan: str, params: Dict, cursor: Any) -> Any:
+        """
+        بدء مسح أو استئنافه
+
+        Args:
+            scan: اسم المسح
+            params: معاملات المسح (يجب أن تطابق نقطة الحفظ عند الاستئناف)
+            cursor: موضع البداية لمسح جديد
+
+        Returns:
+            الموضع الذي يبدأ منه المسح (المحفوظ عند الاستئناف)
+        """
+        params = json.loads(json.dumps(params, default=_json_default))
+
+        if self.resume and self.path.exists():
+            with open(self.path, encoding='utf-8') as f:
+                state = json.load(f)
+            if state['scan'] != scan or state['params'] != params:
+                raise ValueError(
+                    f"Checkpoint {self.path} belongs to {state['scan']}({state['params']}), "
+                    f"not {scan}({params})"
+                )
+            self._restore(state)
+            self.resumed = True
+            return self.cursor
+
+        self.scan = scan
+        self.params = params
+        self.cursor = cursor
+        self.rows_path.unlink(missing_ok=True)
+        self.save()
+        return cursor
+
+    def _restore(self, state: Dict):
+        self.scan = state['scan']
+        self.params = state['params']
+        self.cursor = state['cursor']
+        self.counters = state['counters']
+        self.stats_by_name = {name: StreamingStats.from_dict(data)
+                              for name, data in state['stats'].items()}
+        self.done = state['done']
+        self._rows_bytes = state['rows_bytes']
+
+        # الصفوف المكتوبة بعد آخر نقطة حفظ تُقص (تُعاد معالجتها)
+        self.rows = []
+        if self.rows_path.exists():
+            with open(self.rows_path, 'r+b') as f:
+                f.truncate(self._rows_bytes)
+            with open(self.rows_path, encoding='utf-8') as f:
+                self.rows = [json.loads(line) for line in f if line.strip()]
+
+        rng = state.get('rng')
+        if rng:
+            python_state = rng['python']
+            random.setstate((python_state[0], tuple(python_state[1]), python_state[2]))
+            kind, keys, pos, has_gauss, cached = rng['numpy']
+            np.random.set_state((kind, np.array(keys, dtype=np.uint32), pos, has_gauss, cached))
+
+    # ===== التحديث =====
+
+    def stats(self, name: str) -> StreamingStats:
+        """المراكم المتدفق بالاسم (يُنشأ عند أول استخدام)"""
+        if name not in self.stats_by_name:
+            self.stats_by_name[name] = StreamingStats()
+        return self.stats_by_name[name]
+
+    def count(self, name: str, value: int = 1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def add_row(self, row: Dict):
+        """صف نتيجة (يُكتب في الملف الجانبي عند نقطة الحفظ التالية)"""
+        self.rows.append(row)
+        self._pending_rows.append(row)
+
+    def step(self, cursor: Any, force: bool = False) -> bool:
+        """
+        تسجيل الموضع التالي بعد معالجة عنصر، والحفظ إذا حان وقته
+
+        Returns:
+            True إذا حُفظت نقطة حفظ
+        """
+        self.cursor = cursor
+        if force or time.time() - self._last_save >= self.interval:
+            self.save()
+            return True
+        return False
+
+    def finish(self, cursor: Any = None):
+        """نهاية المسح: حفظ أخير مع علامة الاكتمال"""
+        if cursor is not None:
+            self.cursor = cursor
+        self.done = True
+        self.save()
+
+    # ===== الحفظ =====
+
+    def save(self):
+        """الصفوف المعلقة أولاً ثم نقطة الحفظ ذرياً"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        if self._pending_rows:
+            with open(self.rows_path, 'a', encoding='utf-8') as f:
+                for row in self._pending_rows:
+                    f.write(json.dumps(row, ensure_ascii=False, default=_json_default) + '\n')
+                f.flush()
+                os.fsync(f.fileno())
+            self._pending_rows = []
+        self._rows_bytes = self.rows_path.stat().st_size if self.rows_path.exists() else 0
+
+        kind, keys, pos, has_gauss, cached = np.random.get_state()
+        state = {
+            'scan': self.scan,
+            'params': self.params,
+            'cursor': self.cursor,
+            'counters': self.counters,
+            'stats': {name: s.to_dict() for name, s in self.stats_by_name.items()},
+            'rows_bytes': self._rows_bytes,
+            'done': self.done,
+            'saved_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'rng': {
+                'python': random.getstate(),
+                'numpy': [kind, keys.tolist(), pos, has_gauss, cached]
+            }
+        }
+        _atomic_write(self.path, json.dumps(state, default=_json_default))
+        self._last_save = time.time()
+
+    def summary(self) -> str:
+        lines = [f"📍 {self.scan}: الموضع {self.cursor}, {len(self.rows)} صف"
+                 f"{' (مكتمل)' if self.done else ''}"]
+        for name, value in sorted(self.counters.items()):
+            lines.append(f"   {name}: {value}")
+        for name, stats in sorted(self.stats_by_name.items()):
+            lines.append(f"   {name}: {stats}")
+        return '\n'.join(lines)
+
+
+def add_checkpoint_arguments(parser: argparse.ArgumentParser):
+    """معاملات سطر الأوامر المشتركة: --checkpoint و --resume و --checkpoint-interval"""
+    parser.add_argument('--checkpoint', metavar='PATH', default=None,
+                        help='periodically save scan state to PATH')
+    parser.add_argument('--resume', action='store_true',
+                        help='continue from the checkpoint at PATH')
+    parser.add_argument('--checkpoint-interval', type=float, default=DEFAULT_INTERVAL,
+                        metavar='SECONDS', help='minimum seconds between checkpoints')
+
+
+def checkpoint_from_args(args) -> 'ScanCheckpoint':
+    if args.resume and not args.checkpoint:
+        raise SystemExit("--resume requires --checkpoint PATH")
+    if not args.checkpoint:
+        return None
+    return ScanCheckpoint(args.checkpoint, args.checkpoint_interval, args.resume)
+
+
+def main(argv: List[str] = None):
+    """تشغيل أحد المسوح الطويلة مع نقاط الحفظ"""
+    parser = argparse.ArgumentParser(description="Checkpointed long-running prime scans")
+    commands = parser.add_subparsers(dest='scan', required=True)
+
+    search = commands.add_parser('corrected-search',
+                                 help='CorrectedAdvancedAlgorithms.corrected_large_prime_search')
+    search.add_argument('--start', type=int, default=1001)
+    search.add_argument('--range', type=int, default=1000)
+    search.add_argument('--target', type=int, default=5)
+
+    analyze = commands.add_parser('analyze', help='AdvancedPrimePredictor.analyze_large_primes')
+    analyze.add_argument('--start', type=int, default=101)
+    analyze.add_argument('--end', type=int, default=200)
+    analyze.add_argument('--step', type=int, default=5)
+
+    large = commands.add_parser('large-test',
+                                help='LargePrimePredictor.comprehensive_large_prime_test')
+    large.add_argument('--start', type=int, default=100)
+    large.add_argument('--count', type=int, default=20)
+    large.add_argument('--voltage', type=float, default=10)
+
+    performance = commands.add_parser('performance',
+                                      help='large_primes_test.test_large_primes_performance')
+    performance.add_argument('--ranges', type=int, nargs='+', metavar='N',
+                             default=None, help='START COUNT pairs, e.g. --ranges 100 10 1000 5')
+
+    for sub in (search, analyze, large, performance):
+        add_checkpoint_arguments(sub)
+
+    args = parser.parse_args(argv)
+    checkpoint = checkpoint_from_args(args)
+
+    if args.scan == 'corrected-search':
+        from advanced_algorithms_corrected import CorrectedAdvancedAlgorithms
+        result = CorrectedAdvancedAlgorithms().corrected_large_prime_search(
+            args.start, args.range, args.target, checkpoint=checkpoint)
+        print(f"✅ {len(result)} عدد أولي: {[r['prime'] for r in result]}")
+    elif args.scan == 'analyze':
+        from advanced_prime_predictor import AdvancedPrimePredictor
+        result = AdvancedPrimePredictor().analyze_large_primes(
+            args.start, args.end, args.step, checkpoint=checkpoint)
+        print(f"✅ {len(result)} صف")
+    elif args.scan == 'large-test':
+        from large_prime_predictor import LargePrimePredictor
+        result = LargePrimePredictor().comprehensive_large_prime_test(
+            args.start, args.count, args.voltage, checkpoint=checkpoint)
+        print(f"✅ {len(result)} صف")
+    else:
+        from large_primes_test import test_large_primes_performance
+        ranges = None
+        if args.ranges:
+            ranges = list(zip(args.ranges[::2], args.ranges[1::2]))
+        result = test_large_primes_performance(ranges, checkpoint=checkpoint)
+        print(f"✅ {len(result)} نطاق")
+
+    if checkpoint:
+        print(checkpoint.summary())
+    return result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+اختبار الحمل لخدمة HTTP
+Prime Service Load Test
+باسل يحيى عبدالله - Basil Yahya Abdullah
+
+عملاء asyncio متزامنون باتصالات keep-alive يرسلون طلبات لنقطة نهاية
+ويقيسون زمن كل طلب، ثم يطبع p50/p90/p99 والإنتاجية (طلب/ثانية)
+
+    python service_load_test.py --endpoint predict --concurrency 64 --requests 5000
+    python service_load_test.py --url http://host:8765 --endpoint circuit --duration 10
+
+بدون --url تُشغَّل الخدمة محلياً داخل نفس العملية (مع مجمع عملياتها)
+"""
+
+import json
+import time
+import random
+import asyncio
+import argparse
+from typing import Dict, List, Optional
+from urllib.parse import urlencode, urlsplit
+
+import numpy as np
+
+
+def make_params(endpoint: str, rng: random.Random, primes: np.ndarray) -> Dict:
+    """معاملات طلب عشوائي (أعداد أولية متقاربة كما في الحمل الحقيقي)"""
+    prime = int(primes[rng.randrange(len(primes))])
+    if endpoint == 'predict':
+        return {'prime': prime}
+    if endpoint == 'enhanced':
+        return {'prime': prime, 'method': 'enhanced'}
+    if endpoint == 'circuit':
+        return {'prime': prime}
+    if endpoint == 'zeta':
+        return {'re': 0.5, 'im': round(rng.uniform(10, 50), 1)}
+    if endpoint == 'zeros':
+        return {'n': rng.randint(1, 50), 'count': 1}
+    raise ValueError(f"unknown endpoint: {endpoint}")
+
+
+async def _request(reader, writer, host: str, path: str):
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode())
+    await writer.drain()
+    head = await reader.readuntil(b'\r\n\r\n')
+    lines = head.decode('latin-1').split('\r\n')
+    status = int(lines[0].split(' ')[1])
+    length = 0
+    for line in lines[1:]:
+        if line.lower().startswith('content-length:'):
+            length = int(line.split(':', 1)[1])
+    body = await reader.readexactly(length)
+    return status, body
+
+
+async def _client(host, port, endpoint, rng, primes, latencies, errors, budget, deadline):
+    reader, writer = await asyncio.open_connection(host, port)
+    path_name = 'predict' if endpoint == 'enhanced' else endpoint
+    try:
+        while budget['left'] > 0 and time.perf_counter() < deadline:
+            budget['left'] -= 1
+            path = f"/{path_name}?{urlencode(make_params(endpoint, rng, primes))}"
+            start = time.perf_counter()
+            status, body = await _request(reader, writer, host, path)
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                errors.append((status, body[:200]))
+    finally:
+        writer.close()
+
+
+async def run_load(url: str, endpoint: str, concurrency: int, requests: int,
+                   duration: Optional[float], prime_limit: int, seed: int = 42) -> Dict:
+    """
+    تشغيل الحمل على خدمة قائمة
+
+    Returns:
+        {'requests', 'errors', 'seconds', 'throughput', 'p50_ms', 'p90_ms', 'p99_ms', 'max_ms'}
+    """
+    from prime_sieve import sieve_primes
+
+    target = urlsplit(url)
+    primes = sieve_primes(prime_limit)[-2000:]  # أعداد متقاربة
+    latencies: List[float] = []
+    errors: List = []
+    budget = {'left': requests}
+    deadline = time.perf_counter() + duration if duration else float('inf')
+
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _client(target.hostname, target.port, endpoint, random.Random(seed + i), primes,
+                latencies, errors, budget, deadline)
+        for i in range(concurrency)
+    ))
+    seconds = time.perf_counter() - start
+
+    ms = np.array(latencies) * 1000 if latencies else np.zeros(1)
+    return {
+        'endpoint': endpoint,
+        'concurrency': concurrency,
+        'requests': len(latencies),
+        'errors': len(errors),
+        'first_error': errors[0] if errors else None,
+        'seconds': seconds,
+        'throughput': len(latencies) / seconds if seconds else 0.0,
+        'p50_ms': float(np.percentile(ms, 50)),
+        'p90_ms': float(np.percentile(ms, 90)),
+        'p99_ms': float(np.percentile(ms, 99)),
+        'max_ms': float(ms.max())
+    }
+
+
+def print_report(report: Dict):
+    print(f"\n📈 نتائج اختبار الحمل ({report['endpoint']}, تزامن {report['concurrency']}):")
+    print(f"   الطلبات: {report['requests']:,} (أخطاء: {report['errors']}) في {report['seconds']:.2f}s")
+    print(f"   الإنتاجية: {report['throughput']:,.0f} طلب/ثانية")
+    print(f"   الزمن: p50 {report['p50_ms']:.2f}ms | p90 {report['p90_ms']:.2f}ms | "
+          f"p99 {report['p99_ms']:.2f}ms | max {report['max_ms']:.2f}ms")
+    if report['first_error']:
+        print(f"   أول خطأ: {report['first_error']}")
+
+
+async def _local_run(args) -> Dict:
+    from prime_service import PrimeService
+
+    service = PrimeService(args.workers, args.max_batch, args.batch_delay_ms / 1000)
+    host, port = await service.start('127.0.0.1', 0)
+    try:
+        # إحماء العمال (الاستيراد والجداول) خارج القياس
+        await run_load(f"http://{host}:{port}", args.endpoint, args.concurrency,
+                       args.concurrency * 4, None, args.prime_limit, seed=7)
+        report = await run_load(f"http://{host}:{port}", args.endpoint, args.concurrency,
+                                args.requests, args.duration, args.prime_limit)
+        report['batches'] = {name: (b.requests, b.batches) for name, b in service.batchers.items()}
+        return report
+    finally:
+        await service.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test for prime_service")
+    parser.add_argument('--url', default=None, help='running service (default: start one locally)')
+    parser.add_argument('--endpoint', default='predict',
+                        choices=['predict', 'enhanced', 'circuit', 'zeta', 'zeros'])
+    parser.add_argument('--concurrency', type=int, default=64)
+    parser.add_argument('--requests', type=int, default=5000)
+    parser.add_argument('--duration', type=float, default=None, help='stop after N seconds')
+    parser.add_argument('--prime-limit', type=int, default=1_000_000)
+    parser.add_argument('--workers', type=int, default=None, help='local service workers')
+    parser.add_argument('--max-batch', type=int, default=256)
+    parser.add_argument('--batch-delay-ms', type=float, default=2.0)
+    parser.add_argument('--json', default=None, help='save the report as JSON')
+    args = parser.parse_args()
+
+    print(f"🚀 اختبار الحمل: {args.endpoint} × {args.requests:,} طلب بتزامن {args.concurrency}")
+    if args.url:
+        report = asyncio.run(run_load(args.url, args.endpoint, args.concurrency, args.requests,
+                                      args.duration, args.prime_limit))
+    else:
+        report = asyncio.run(_local_run(args))
+        requests, batches = report['batches']['/predict' if args.endpoint == 'enhanced'
+                                              else f"/{args.endpoint}"]
+        print(f"   متوسط حجم الدفعة: {requests / max(batches, 1):.1f}")
+
+    print_report(report)
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False, default=str)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+سجل المصفوفات المشتركة بين العمليات
+Shared-Memory Array Registry
+باسل يحيى عبدالله - Basil Yahya Abdullah
+
+العملية الرئيسية تنشر جدول الأعداد الأولية ومصفوفة الفجوات وأعمدة الدائرة
+مرة واحدة في multiprocessing.shared_memory، والعمال يرتبطون بها بالاسم
+دون نسخ (مصفوفة numpy فوق نفس الذاكرة) بدلاً من إعادة الغربلة أو نقلها بـ pickle
+
+    registry = SharedArrayRegistry()
+    refs = registry.share('prime_table', primes)        # SharedArrayRef صغير قابل للنقل
+    with ProcessPoolExecutor(initializer=attach_shared,
+                             initargs=(registry.manifest(),)) as pool:
+        pool.submit(analysis, refs)                      # العامل: resolve_shared(refs)
+    registry.close()                                     # أو تلقائياً عند الخروج
+"""
+
+import atexit
+import os
+import uuid
+import weakref
+from multiprocessing import shared_memory
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+
+class SharedArrayRef:
+    """مرجع صغير قابل للنقل لمصفوفة منشورة (الاسم والشكل والنوع فقط)"""
+
+    __slots__ = ('segment', 'shape', 'dtype')
+
+    def __init__(self, segment: str, shape: Tuple[int, ...], dtype: str):
+        self.segment = segment
+        self.shape = tuple(shape)
+        self.dtype = dtype
+
+    def __getstate__(self):
+        return (self.segment, self.shape, self.dtype)
+
+    def __setstate__(self, state):
+        self.segment, self.shape, self.dtype = state
+
+    def __repr__(self):
+        return f"SharedArrayRef({self.segment!r}, shape={self.shape}, dtype={self.dtype!r})"
+
+    def resolve(self) -> np.ndarray:
+        """المصفوفة فوق الذاكرة المشتركة (للقراءة فقط)"""
+        return _attach(self)
+
+
+def _release(segments: Dict[str, shared_memory.SharedMemory]):
+    """إغلاق وحذف مقاطع المالك (تُستدعى من close أو عند الخروج)"""
+    for segment in segments.values():
+        try:
+            segment.close()
+        except BufferError:
+            pass  # ما زالت هناك مصفوفات حية فوق المقطع - الحذف يكفي
+        try:
+            segment.unlink()
+        except FileNotFoundError:
+            pass
+    segments.clear()
+
+
+class SharedArrayRegistry:
+    """
+    جانب المالك: نشر المصفوفات وحذفها
+
+    المقاطع تُحذف عند close() أو عند انتهاء العملية الرئيسية
+    """
+
+    def __init__(self, prefix: str = 'basil'):
+        self.prefix = f"{prefix}_{os.getpid()}_{uuid.uuid4().hex[:6]}"
+        self._segments = {}
+        self.refs = {}
+        self._finalizer = weakref.finalize(self, _release, self._segments)
+
+    def publish(self, name: str, array) -> SharedArrayRef:
+        """نسخ مصفوفة مرة واحدة إلى الذاكرة المشتركة"""
+        if name in self.refs:
+            raise ValueError(f"Array already published: {name}")
+
+        array = np.ascontiguousarray(array)
+        if array.dtype == object:
+            raise TypeError(f"Cannot share object array: {name}")
+
+        segment = shared_memory.SharedMemory(
+            name=f"{self.prefix}_{len(self._segments)}", create=True,
+            size=max(array.nbytes, 1)
+        )
+        self._segments[name] = segment
+        np.ndarray(array.shape, dtype=array.dtype, buffer=segment.buf)[...] = array
+
+        ref = SharedArrayRef(segment.name, array.shape, array.dtype.str)
+        self.refs[name] = ref
+        return ref
+
+    def share(self, name: str, value):
+        """
+        نشر قيمة: مصفوفة → مرجع، قاموس → قاموس مراجع لأعمدة المصفوفات
+        (القيم الأخرى تبقى كما هي وتُنقل بـ pickle كالمعتاد)
+        """
+        if isinstance(value, np.ndarray) and value.dtype != object:
+            return self.publish(name, value)
+        if isinstance(value, dict):
+            return {key: self.share(f"{name}.{key}", item) for key, item in value.items()}
+        return value
+
+    def get(self, name: str) -> np.ndarray:
+        """المصفوفة المنشورة في العملية المالكة"""
+        ref = self.refs[name]
+        return np.ndarray(ref.shape, dtype=ref.dtype, buffer=self._segments[name].buf)
+
+    def manifest(self) -> Dict[str, SharedArrayRef]:
+        """مراجع جميع المصفوفات (معاملات attach_shared في مُهيئ العامل)"""
+        return dict(self.refs)
+
+    def nbytes(self) -> int:
+        return sum(segment.size for segment in self._segments.values())
+
+    def close(self):
+        """حذف جميع المقاطع"""
+        self._finalizer()
+        self.refs.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+# ===== جانب العامل =====
+
+_attached: Dict[str, Tuple[shared_memory.SharedMemory, np.ndarray]] = {}
+_named: Dict[str, SharedArrayRef] = {}
+
+
+def _attach(ref: SharedArrayRef) -> np.ndarray:
+    """ارتباط (مرة واحدة لكل عملية) بمقطع منشور"""
+    entry = _attached.get(ref.segment)
+    if entry is None:
+        segment = shared_memory.SharedMemory(name=ref.segment)
+
+        # العمال أبناء المالك ويتشاركون متتبع موارده، أما عملية مستقلة
+        # فمتتبعها سيحذف المقطع عند خروجها - لذلك نلغي تسجيله هناك
+        import multiprocessing
+        if multiprocessing.parent_process() is None:
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(segment._name, 'shared_memory')
+
+        array = np.ndarray(ref.shape, dtype=ref.dtype, buffer=segment.buf)
+        array.flags.writeable = False
+        entry = _attached[ref.segment] = (segment, array)
+    return entry[1]
+
+
+def _detach_all():
+    _attached.clear()  # المصفوفات تُحرر قبل إغلاق المقاطع
+    # mmap يُغلق عند جمع كائنات SharedMemory - لا حذف من جانب العامل
+
+
+atexit.register(_detach_all)
+
+
+def attach_shared(manifest: Dict[str, SharedArrayRef], initializer=None, initargs=()):
+    """
+    مُهيئ عامل ProcessPoolExecutor: الارتباط بكل المصفوفات المنشورة
+
+    Args:
+        manifest: registry.manifest()
+        initializer, initargs: مُهيئ إضافي يُستدعى بعد الارتباط
+    """
+    for name, ref in manifest.items():
+        _attach(ref)
+        _named[name] = ref
+    if initializer is not None:
+        initializer(*initargs)
+
+
+def get_shared(name: str) -> np.ndarray:
+    """مصفوفة منشورة بالاسم داخل العامل (بعد attach_shared)"""
+    return _attach(_named[name])
+
+
+def resolve_shared(value: Any):
+    """استبدال كل SharedArrayRef (داخل القواميس والقوائم أيضاً) بمصفوفته"""
+    if isinstance(value, SharedArrayRef):
+        return value.resolve()
+    if isinstance(value, dict):
+        return {key: resolve_shared(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(resolve_shared(item) for item in value)
+    return value
+
+
+def _demo_mean_gap(name: str) -> float:
+    return float(get_shared(name).mean())
+
+
+if __name__ == "__main__":
+    from concurrent.futures import ProcessPoolExecutor
+    from prime_sieve import sieve_primes
+
+    print("🧠 سجل المصفوفات المشتركة")
+    print("=" * 40)
+
+    with SharedArrayRegistry() as registry:
+        primes = sieve_primes(10_000_000)
+        registry.share('primes', {'prime_table': primes, 'gaps': np.diff(primes)})
+        print(f"📊 منشور: {primes.size} عدد أولي ({registry.nbytes() / 1024**2:.1f} MB)")
+
+        with ProcessPoolExecutor(max_workers=2, initializer=attach_shared,
+                                 initargs=(registry.manifest(),)) as pool:
+            mean_gap = pool.submit(_demo_mean_gap, 'primes.gaps').result()
+            print(f"📊 متوسط الفجوة (محسوب في العامل دون نسخ): {mean_gap:.4f}")
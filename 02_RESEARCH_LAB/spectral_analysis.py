@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+التحليل الطيفي لسلاسل الفجوات والترددات
+Chunked Spectral Analysis of Prime Sequences
+باسل يحيى عبدالله - Basil Yahya Abdullah
+
+تحليل FFT لـ 100 فجوة لا يكفي لاختبار "التردد المهيمن". هذه الوحدة تحسب
+كثافة الطيف (PSD) لسلاسل بطول 10^8 وأكثر من ملف مربوط بالذاكرة (memmap):
+
+- write_prime_series: سلسلة الفجوات (uint16) أو الترددات p/π (float64) إلى ملف
+  خام مقطعاً مقطعاً من الغربال المقطعي
+- welch_psd: متوسط Welch لمقاطع متداخلة (نافذة Hann) بـ rFFT على دفعات من
+  المقاطع، فالذاكرة بحجم الدفعة مهما طالت السلسلة (نفس نتيجة scipy.signal.welch)
+- periodogram: rFFT واحدة للسلسلة كلها (للسلاسل التي تتسع لها الذاكرة)
+- dominant_periods: أقوى القمم نسبة إلى خلفية الطيف المحلية، مع ثقة
+  1 − احتمال الإنذار الكاذب: قيمة Welch عند تردد بلا إشارة تتبع χ²(dof)/dof
+  حول الخلفية، والاحتمال مصحح لعدد الترددات المفحوصة
+
+    series = write_prime_series('gaps.u16', 2_100_000_000)    # ≈ 10^8 فجوة
+    spectrum = welch_psd(series, segment_length=4096)
+    dominant_periods(spectrum)
+"""
+
+import os
+import time
+import argparse
+from typing import Dict, List
+
+import numpy as np
+
+from instrumentation import metrics
+
+SEGMENT_LENGTH = 4096
+BATCH_VALUES = 1 << 21      # قيم في الذاكرة لكل دفعة من المقاطع
+SIEVE_SEGMENT = 1 << 24
+
+SERIES_DTYPES = {'gaps': np.uint16, 'frequencies': np.float64}
+
+
+def write_prime_series(path: str, limit: int, kind: str = 'gaps',
+                       segment_size: int = SIEVE_SEGMENT) -> np.memmap:
+    """
+    كتابة سلسلة الأعداد الأولية الأصغر من limit إلى ملف خام وربطه بالذاكرة
+
+    Args:
+        path: مسار الملف
+        limit: حد الأعداد الأولية
+        kind: 'gaps' (الفجوات المتتالية) أو 'frequencies' (p/π لكل عدد)
+
+    Returns:
+        np.memmap للقراءة فقط بنوع SERIES_DTYPES[kind]
+    """
+    from prime_sieve import primes_between
+
+    dtype = SERIES_DTYPES[kind]
+    previous = None
+    with open(path, 'wb') as f:
+        for lo in range(2, limit, segment_size):
+            primes = primes_between(lo, min(lo + segment_size, limit))
+            if not len(primes):
+                continue
+            if kind == 'gaps':
+                values = np.diff(primes, prepend=primes[0] if previous is None else previous)
+                values = values[1:] if previous is None else values
+            else:
+                values = primes / np.pi
+            f.write(values.astype(dtype).tobytes())
+            previous = primes[-1]
+    return np.memmap(path, dtype=dtype, mode='r')
+
+
+def hann_window(length: int) -> np.ndarray:
+    """نافذة Hann الدورية (كما في scipy.signal.get_window('hann'))"""
+    return 0.5 - 0.5 * np.cos(2 * np.pi * np.arange(length) / length)
+
+
+def _detrend(frames: np.ndarray, detrend) -> np.ndarray:
+    """إزالة المتوسط ('constant') أو الخط المستقيم ('linear') من كل صف"""
+    if detrend is None:
+        return np.array(frames, dtype=float)
+    frames = frames - frames.mean(axis=1, keepdims=True)
+    if detrend == 'linear':
+        t = np.arange(frames.shape[1]) - (frames.shape[1] - 1) / 2
+        frames -= np.outer(frames @ t / (t @ t), t)
+    return frames
+
+
+def _one_sided(power: np.ndarray, length: int) -> np.ndarray:
+    """مضاعفة الترددات الموجبة عدا الصفر وتردد نايكويست"""
+    power = power.copy()
+    power[1:length // 2 + 1 if length % 2 else length // 2] *= 2
+    return power
+
+
+def welch_psd(series, segment_length: int = SEGMENT_LENGTH, overlap: float = 0.5,
+              detrend='constant', fs: float = 1.0, batch_values: int = BATCH_VALUES) -> Dict:
+    """
+    كثافة الطيف بطريقة Welch لسلسلة طويلة (مصفوفة أو memmap)
+
+    Args:
+        series: السلسلة أحادية البعد
+        segment_length: طول كل مقطع (nperseg)
+        overlap: نسبة التداخل بين المقاطع المتتالية
+        detrend: 'constant' أو 'linear' أو None لكل مقطع
+        fs: معدل العينات (1 = الترددات بوحدة 1/عينة)
+        batch_values: حد القيم المحمّلة في الذاكرة لكل دفعة
+
+    Returns:
+        {'frequencies', 'psd', 'segments', 'segment_length', 'dof', 'samples'}
+    """
+    from numpy.lib.stride_tricks import sliding_window_view
+
+    n = len(series)
+    if n < segment_length:
+        raise ValueError(f"series has {n} samples, fewer than segment_length={segment_length}")
+    step = segment_length - int(overlap * segment_length)
+    segments = 1 + (n - segment_length) // step
+    window = hann_window(segment_length)
+    per_batch = max(1, batch_values // segment_length)
+
+    total = np.zeros(segment_length // 2 + 1)
+    with metrics.timer('spectral.welch'):
+        for first in range(0, segments, per_batch):
+            count = min(per_batch, segments - first)
+            start = first * step
+            block = np.asarray(series[start:start + (count - 1) * step + segment_length], dtype=float)
+            frames = _detrend(sliding_window_view(block, segment_length)[::step], detrend)
+            spectrum = np.fft.rfft(frames * window, axis=1)
+            total += np.sum(spectrum.real ** 2 + spectrum.imag ** 2, axis=0)
+    metrics.count('spectral.samples', n)
+
+    psd = _one_sided(total / (segments * fs * np.sum(window ** 2)), segment_length)
+    return {
+        'frequencies': np.fft.rfftfreq(segment_length, 1 / fs),
+        'psd': psd,
+        'segments': segments,
+        'segment_length': segment_length,
+        'dof': _welch_dof(window, step, segments),
+        'samples': n
+    }
+
+
+def _welch_dof(window: np.ndarray, step: int, segments: int) -> float:
+    """
+    درجات الحرية المكافئة لمتوسط Welch (Welch 1967): 2K / (1 + 2 Σ_j (1 − j/K) ρ_j)
+    حيث ρ_j ارتباط النافذة مع نفسها بإزاحة j مقاطع
+    """
+    energy = np.sum(window ** 2)
+    correction = 0.0
+    j = 1
+    while j < segments and j * step < len(window):
+        rho = (np.sum(window[j * step:] * window[:len(window) - j * step]) / energy) ** 2
+        correction += (1 - j / segments) * rho
+        j += 1
+    return 2 * segments / (1 + 2 * correction)
+
+
+def periodogram(series, detrend='constant', fs: float = 1.0) -> Dict:
+    """
+    كثافة الطيف بـ rFFT واحدة للسلسلة كلها (نافذة مستطيلة)
+
+    Returns:
+        نفس مفاتيح welch_psd مع segments = 1 و dof = 2
+    """
+    values = _detrend(np.asarray(series, dtype=float)[None, :], detrend)[0]
+    spectrum = np.fft.rfft(values)
+    psd = _one_sided((spectrum.real ** 2 + spectrum.imag ** 2) / (fs * len(values)), len(values))
+    return {
+        'frequencies': np.fft.rfftfreq(len(values), 1 / fs),
+        'psd': psd,
+        'segments': 1,
+        'segment_length': len(values),
+        'dof': 2.0,
+        'samples': len(values)
+    }
+
+
+def dominant_periods(spectrum: Dict, count: int = 5, background_bins: int = 65) -> List[Dict]:
+    """
+    أقوى القمم الطيفية نسبة إلى الخلفية المحلية مع ثقتها
+
+    الخلفية = الوسيط المتحرك للطيف على background_bins تردداً مقسوماً على وسيط
+    χ²(dof)/dof، فيبقى طيف الخلفية غير المسطح (مثل الضجيج الأحمر) مرجعاً عادلاً
+
+    Args:
+        spectrum: ناتج welch_psd أو periodogram
+        count: عدد القمم المطلوبة
+
+    Returns:
+        قائمة مرتبة تنازلياً حسب النسبة:
+        {'frequency', 'period', 'power', 'ratio', 'false_alarm', 'confidence'}
+    """
+    from scipy.ndimage import median_filter
+    from scipy.stats import chi2
+
+    frequencies, psd, dof = spectrum['frequencies'][1:], spectrum['psd'][1:], spectrum['dof']
+    background = median_filter(psd, size=min(background_bins, len(psd)), mode='nearest')
+    background = background / (chi2.median(dof) / dof)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = np.where(background > 0, psd / background, 0.0)
+
+    # قمم محلية فقط، ثم الأعلى نسبة
+    peak = np.ones(len(psd), dtype=bool)
+    peak[1:] &= psd[1:] >= psd[:-1]
+    peak[:-1] &= psd[:-1] >= psd[1:]
+    candidates = np.nonzero(peak)[0]
+    candidates = candidates[np.argsort(ratio[candidates])[::-1][:count]]
+
+    results = []
+    for i in candidates:
+        single = chi2.sf(ratio[i] * dof, dof)
+        false_alarm = -np.expm1(len(psd) * np.log1p(-single)) if single < 1 else 1.0
+        results.append({
+            'frequency': float(frequencies[i]),
+            'period': float(1 / frequencies[i]),
+            'power': float(psd[i]),
+            'ratio': float(ratio[i]),
+            'false_alarm': float(false_alarm),
+            'confidence': float(1 - false_alarm)
+        })
+    return results
+
+
+def main():
+    import resource
+
+    parser = argparse.ArgumentParser(description="Welch spectrum of the prime gap or frequency series")
+    parser.add_argument('--limit', type=int, default=200_000_000,
+                        help="حد الأعداد الأولية (2.1e9 ≈ 10^8 فجوة)")
+    parser.add_argument('--kind', choices=sorted(SERIES_DTYPES), default='gaps')
+    parser.add_argument('--path', default=None, help="ملف السلسلة (يُعاد استخدامه إن وُجد)")
+    parser.add_argument('--segment-length', type=int, default=SEGMENT_LENGTH)
+    parser.add_argument('--top', type=int, default=8)
+    args = parser.parse_args()
+
+    print(f"📊 التحليل الطيفي لسلسلة {args.kind}")
+    print("=" * 50)
+
+    path = args.path or f"prime_{args.kind}_{args.limit}.bin"
+    start = time.perf_counter()
+    if os.path.exists(path):
+        series = np.memmap(path, dtype=SERIES_DTYPES[args.kind], mode='r')
+    else:
+        series = write_prime_series(path, args.limit, args.kind)
+    print(f"   السلسلة: {len(series):,} قيمة ({series.nbytes / 2**20:.0f} MB على القرص) "
+          f"في {time.perf_counter() - start:.1f}s")
+
+    start = time.perf_counter()
+    detrend = 'linear' if args.kind == 'frequencies' else 'constant'
+    spectrum = welch_psd(series, args.segment_length, detrend=detrend)
+    seconds = time.perf_counter() - start
+    print(f"   Welch: {spectrum['segments']:,} مقطع في {seconds:.1f}s "
+          f"({len(series) / seconds / 1e6:.1f}M قيمة/ثانية) | dof = {spectrum['dof']:,.0f}")
+
+    print(f"\n🎯 الأدوار المهيمنة:")
+    for peak in dominant_periods(spectrum, args.top):
+        print(f"   الدور {peak['period']:10.3f} | التردد {peak['frequency']:.6f} | "
+              f"نسبة للخلفية ×{peak['ratio']:.2f} | الثقة {peak['confidence']:.2%}")
+    print(f"\n💾 ذروة الذاكرة: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+اختبار زمن استيراد الوحدات الأساسية
+Import-Time Regression Test
+باسل يحيى عبدالله - Basil Yahya Abdullah
+
+الوحدات الأساسية يجب أن تُستورد بسرعة دون تحميل مكتبات الرسم والحساب الثقيلة
+(matplotlib, scipy, pandas, sympy, seaborn) - هذه تُستورد عند أول استخدام فقط
+"""
+
+import os
+import subprocess
+import sys
+
+LAB_DIR = os.path.dirname(os.path.abspath(__file__))
+
+CORE_MODULES = ['basil_prime_theory', 'corrected_prime_simulator']
+HEAVY_PACKAGES = ['matplotlib', 'scipy', 'pandas', 'sympy', 'seaborn']
+
+# ميزانية الوحدة نفسها بالميكروثانية (numpy يُستورد أولاً ولا يدخل في الميزانية)
+IMPORT_BUDGET_US = 50_000
+
+
+def measure_import(module: str) -> dict:
+    """
+    تشغيل python -X importtime في عملية مستقلة
+
+    Returns:
+        {'cumulative_us': زمن استيراد الوحدة, 'modules': أسماء كل الوحدات المستوردة}
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import numpy; import {module}'],
+        cwd=LAB_DIR, capture_output=True, text=True, check=True
+    )
+
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, self_us, cumulative_us, name = [part.strip() for part in
+                                            line.replace('import time:', '|', 1).split('|')]
+        cumulative[name] = int(cumulative_us)
+
+    return {'cumulative_us': cumulative[module], 'modules': set(cumulative)}
+
+
+def test_core_modules_skip_heavy_imports():
+    """الوحدات الأساسية لا تستورد مكتبات الرسم أو الحساب الثقيلة"""
+    for module in CORE_MODULES:
+        loaded = measure_import(module)['modules']
+        heavy = [name for name in HEAVY_PACKAGES if name in loaded]
+        assert not heavy, f"{module} imports {heavy} at import time"
+
+
+def test_core_modules_import_budget():
+    """زمن استيراد الوحدات الأساسية ضمن الميزانية"""
+    for module in CORE_MODULES:
+        elapsed = measure_import(module)['cumulative_us']
+        assert elapsed < IMPORT_BUDGET_US, \
+            f"{module} took {elapsed / 1000:.1f} ms to import (budget {IMPORT_BUDGET_US / 1000:.0f} ms)"
+
+
+if __name__ == "__main__":
+    print("⏱️ اختبار زمن استيراد الوحدات الأساسية")
+    print("=" * 50)
+    for module in CORE_MODULES:
+        info = measure_import(module)
+        print(f"📊 {module}: {info['cumulative_us'] / 1000:.1f} ms")
+    test_core_modules_skip_heavy_imports()
+    test_core_modules_import_budget()
+    print("✅ جميع الاختبارات نجحت")
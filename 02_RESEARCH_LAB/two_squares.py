@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+تمثيل الأعداد الأولية كمجموع مربعين
+Sum of Two Squares (Hermite–Serret / Cornacchia)
+باسل يحيى عبدالله - Basil Yahya Abdullah
+
+كل عدد أولي p ≡ 1 (mod 4) يساوي x² + y² بطريقة وحيدة (x < y). البحث عن x
+حتى √p يكلف O(√p) لكل عدد؛ هنا:
+
+1. جذر −1 بترديد p: r = c^((p−1)/4) mod p لأول c غير تربيعي (r² ≡ −1)
+2. نزول إقليدي (Hermite–Serret): a, b = p, r ثم a, b = b, a mod b حتى b < √p
+   فيكون x = b و y = √(p − b²)
+
+أي O(log p) عملية لكل عدد. two_squares_batch تنفذ الخطوتين متجهتين على مصفوفة
+أعداد أولية (أس وضرب بـ uint64 للأعداد الأصغر من 2^32، فلا يفيض حاصل ضرب عددين
+أصغر من p) مع رجوع للحساب الدقيق بأعداد Python لما هو أكبر.
+"""
+
+import math
+from typing import Tuple
+
+import numpy as np
+
+CHUNK_SIZE = 1 << 20
+UINT32_LIMIT = 1 << 32
+NON_RESIDUE_CANDIDATES = 256
+
+
+def sqrt_minus_one(p: int) -> int:
+    """
+    جذر −1 بترديد عدد أولي p ≡ 1 (mod 4)
+
+    البحث عن c غير تربيعي محدود بـ NON_RESIDUE_CANDIDATES، ومعيار أويلر يكشف
+    العدد المركب مبكراً: لعدد أولي c^((p−1)/2) ≡ ±1 دائماً
+    """
+    for c in range(2, min(p, NON_RESIDUE_CANDIDATES)):
+        euler = pow(c, (p - 1) // 2, p)
+        if euler == p - 1:
+            r = pow(c, (p - 1) // 4, p)
+            if r * r % p == p - 1:
+                return r
+            break
+        if euler != 1:
+            break
+    raise ValueError(f"{p} is not a prime congruent to 1 mod 4")
+
+
+def two_squares(p: int) -> Tuple[int, int]:
+    """
+    (x, y) بحيث x² + y² = p و x ≤ y
+
+    Args:
+        p: 2 أو عدد أولي p ≡ 1 (mod 4)
+    """
+    p = int(p)
+    if p == 2:
+        return (1, 1)
+    if p % 4 != 1:
+        raise ValueError(f"{p} is not a sum of two squares (p ≡ 3 mod 4)")
+    a, b = p, sqrt_minus_one(p)
+    while b * b > p:
+        a, b = b, a % b
+    y = math.isqrt(p - b * b)
+    if b * b + y * y != p:
+        raise ValueError(f"{p} is not prime")
+    return (min(b, y), max(b, y))
+
+
+def _powmod(base: np.ndarray, exponent: np.ndarray, modulus: np.ndarray) -> np.ndarray:
+    """base^exponent mod modulus عنصراً عنصراً (uint64، modulus < 2^32)"""
+    result = np.ones_like(modulus)
+    base = base % modulus
+    exponent = exponent.copy()
+    while exponent.any():
+        odd = (exponent & 1).astype(bool)
+        result = np.where(odd, result * base % modulus, result)
+        base = base * base % modulus
+        exponent >>= 1
+    return result
+
+
+def _sqrt_minus_one_batch(p: np.ndarray) -> np.ndarray:
+    """جذر −1 لكل p ≡ 1 (mod 4) أصغر من 2^32 (uint64)"""
+    roots = np.zeros_like(p)
+    pending = np.arange(len(p))
+    exponent = (p - 1) // 4
+    for c in range(2, NON_RESIDUE_CANDIDATES):
+        if not len(pending):
+            return roots
+        modulus = p[pending]
+        r = _powmod(np.full_like(modulus, c), exponent[pending], modulus)
+        found = r * r % modulus == modulus - 1
+        roots[pending[found]] = r[found]
+        pending = pending[~found]
+    if len(pending):
+        raise ValueError(f"no square root of -1 modulo {int(p[pending[0]])} (not a prime ≡ 1 mod 4?)")
+    return roots
+
+
+def _descend_batch(p: np.ndarray, r: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """النزول الإقليدي المتجه ثم y = √(p − x²)"""
+    a, b = p.copy(), r.copy()
+    active = np.nonzero(b * b > p)[0]
+    while len(active):
+        a[active], b[active] = b[active], a[active] % b[active]
+        active = active[b[active] * b[active] > p[active]]
+
+    x = b.astype(np.int64)
+    rest = p.astype(np.int64) - x * x
+    y = np.sqrt(rest).astype(np.int64)
+    y -= y * y > rest
+    y += (y + 1) * (y + 1) <= rest
+    if np.any(x * x + y * y != p.astype(np.int64)):
+        bad = int(p[np.nonzero(x * x + y * y != p.astype(np.int64))[0][0]])
+        raise ValueError(f"{bad} is not prime")
+    return np.minimum(x, y), np.maximum(x, y)
+
+
+def two_squares_batch(primes, chunk_size: int = CHUNK_SIZE) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    two_squares لمصفوفة أعداد أولية
+
+    Args:
+        primes: أعداد أولية كلها 2 أو ≡ 1 (mod 4)
+        chunk_size: حجم الدفعة (يحد المصفوفات المؤقتة)
+
+    Returns:
+        (x, y) مصفوفتا int64 بحيث x² + y² = p و x ≤ y
+    """
+    primes = np.asarray(primes, dtype=np.int64)
+    if np.any((primes % 4 != 1) & (primes != 2)):
+        raise ValueError("two_squares_batch needs primes equal to 2 or congruent to 1 mod 4")
+
+    x = np.ones(len(primes), dtype=np.int64)   # 2 = 1² + 1²
+    y = np.ones(len(primes), dtype=np.int64)
+    odd = np.nonzero(primes != 2)[0]
+    small = odd[primes[odd] < UINT32_LIMIT]
+    large = odd[primes[odd] >= UINT32_LIMIT]
+
+    for start in range(0, len(small), chunk_size):
+        rows = small[start:start + chunk_size]
+        p = primes[rows].astype(np.uint64)
+        x[rows], y[rows] = _descend_batch(p, _sqrt_minus_one_batch(p))
+    for row in large.tolist():
+        x[row], y[row] = two_squares(int(primes[row]))
+    return x, y
+
+
+if __name__ == "__main__":
+    import time
+    from prime_sieve import sieve_primes
+
+    print("🔷 تمثيل الأعداد الأولية كمجموع مربعين")
+    print("=" * 40)
+
+    primes = sieve_primes(200_000_000)
+    primes = primes[primes % 4 == 1]
+
+    start = time.perf_counter()
+    x, y = two_squares_batch(primes)
+    seconds = time.perf_counter() - start
+    print(f"⏱️ {len(primes):,} عدد: {seconds:.1f}s ({len(primes) / seconds:,.0f} عدد/ثانية)")
+    print(f"✅ صحيحة: {bool(np.all(x * x + y * y == primes))}")
+
+    sample = primes[::max(1, len(primes) // 200)][:200].tolist()
+    start = time.perf_counter()
+    for p in sample:
+        next(q for q in range(1, math.isqrt(p) + 1) if math.isqrt(p - q * q) ** 2 == p - q * q)
+    loop = (time.perf_counter() - start) / len(sample)
+    print(f"   البحث حتى √p: {loop * 1e6:.0f}µs لكل عدد | الدفعة: {seconds / len(primes) * 1e6:.2f}µs")
@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+"""
+عدّ أصفار زيتا وتحديد مواقعها بترتيبها
+Riemann–von Mangoldt Zero Counting and Indexed Zero Location
+باسل يحيى عبدالله - Basil Yahya Abdullah
+
+N(T) = θ(T)/π + 1 + S(T) عدد أصفار زيتا على الخط الحرج حتى الارتفاع T.
+الجزء الأملس θ(T)/π + 1 قابل للعكس مباشرة، فموقع الصفر رقم n يُقدَّر في O(1)
+دون أي قائمة سابقة:
+
+- zero_estimate(n): حل θ(t) = (n − 3/2)π بـ Lambert W
+  (t ≈ 2π(n − 11/8) / W((n − 11/8)/e)) ثم خطوات نيوتن على θ، متجهة على المصفوفات
+- riemann_siegel_z(t): دالة هاردي Z(t) بصيغة ريمان-سيجل مع حدود التصحيح
+  C0 … C4 (خطأ ~10⁻¹¹ عند t ≈ 1.5×10³ و ~10⁻¹² عند 5×10³؛ فوقه يحده طور float64)، متجهة
+- locate_zeros(first, count): نقاط غرام g_k (θ(g_k) = kπ) تحيط بالأصفار؛ كتلة
+  غرام بين نقطتين "جيدتين" (−1)^k·Z(g_k) > 0 تحوي عدد فتراتها من الأصفار
+  (قاعدة روسر)، فتُحدد إشارات Z فيها ثم يُصقل كل صفر بـ Brent (brentq)؛ الإشارات
+  بـ float64 والصقل بواجهة real_backend (mpmath فوق 10⁶ حيث يفقد float64 دقة الطور،
+  وخطوة نيوتن بزيتا أويلر–ماكلورين تحت RS_POLISH_T)
+- zero_count(T): N(T) بالضبط من الأصفار المحددة حول T فقط، و S(T) = N(T) − الأملس
+
+    locate_zeros(10**6, 10**4)   # الأصفار من #10^6 إلى #10^6 + 10^4 − 1 دون مسح من البداية
+
+قاعدة روسر صحيحة حتى t ≈ 6.8×10⁶ (أول استثناء عند g_13999525)؛ الكتلة التي
+لا تظهر فيها كل أصفارها تُعاد أصفارها NaN مع تحذير.
+"""
+
+import math
+import time
+import argparse
+import warnings
+from functools import lru_cache
+
+import numpy as np
+
+from numeric_backend import real_backend
+
+RS_MIN_T = 1000.0           # أقل من ذلك تُحسب Z(t) بـ mpmath.siegelz (تصحيحات RS غير كافية)
+RS_POLISH_T = 5000.0        # تحته خطأ C0…C4 فوق 10⁻¹²: خطوة نيوتن أخيرة بزيتا أويلر–ماكلورين
+GRAM_PADDING = 32           # نقاط غرام إضافية حول النطاق المطلوب لإغلاق الكتل
+GRID_REFINEMENTS = (4, 16, 64, 256)
+CHUNK_SIZE = 4096
+NEWTON_STEPS = 3
+
+
+# ===== الجزء الأملس =====
+
+def riemann_siegel_theta(t) -> np.ndarray:
+    """θ(t) = arg Γ(1/4 + it/2) − (t/2)·ln π بالمتسلسلة التقاربية (t > 9)"""
+    t = np.asarray(t, dtype=float)
+    return (t / 2 * np.log(t / (2 * math.pi)) - t / 2 - math.pi / 8
+            + 1 / (48 * t) + 7 / (5760 * t ** 3) + 31 / (80640 * t ** 5) + 127 / (430080 * t ** 7))
+
+
+def smooth_zero_count(t) -> np.ndarray:
+    """الجزء الأملس من N(T): θ(T)/π + 1"""
+    return riemann_siegel_theta(t) / math.pi + 1
+
+
+def _solve_theta(k) -> np.ndarray:
+    """t بحيث θ(t) = kπ: بداية Lambert W من الحدين الأولين ثم نيوتن (θ'(t) = ½·ln(t/2π))"""
+    from scipy.special import lambertw
+
+    k = np.asarray(k, dtype=float)
+    shifted = k + 1 / 8
+    with np.errstate(invalid='ignore'):
+        t = 2 * math.pi * shifted / lambertw(shifted / math.e).real
+    t = np.where(np.isfinite(t) & (t > 10), t, 10.0)
+    for _ in range(NEWTON_STEPS):
+        t = t - (riemann_siegel_theta(t) - k * math.pi) / (0.5 * np.log(t / (2 * math.pi)))
+    return t
+
+
+def gram_point(k) -> np.ndarray:
+    """نقطة غرام g_k: θ(g_k) = kπ (k ≥ −1، متجهة)"""
+    return _solve_theta(k)
+
+
+def zero_estimate(n) -> np.ndarray:
+    """
+    تقدير الصفر رقم n (n ≥ 1) في O(1): N الأملس = n − ½، أي θ(t) = (n − 3/2)π
+
+    يقع الصفر n عادة في فترة غرام (g_{n−2}, g_{n−1}) والتقدير منتصفها بالزاوية
+    """
+    return _solve_theta(np.asarray(n, dtype=float) - 1.5)
+
+
+# ===== دالة هاردي Z(t) =====
+
+# C_k = Σ معامل·Ψ⁽ᵈ⁾/π^q كثلاثيات (d، المعامل، q) - حدود Gabcke حتى C4
+RS_CORRECTIONS = (
+    ((0, 1, 0),),
+    ((3, -1 / 96, 2),),
+    ((2, 1 / 64, 2), (6, 1 / 18432, 4)),
+    ((1, -1 / 64, 2), (5, -1 / 3840, 4), (9, -1 / 5308416, 6)),
+    ((0, 1 / 128, 2), (4, 19 / 24576, 4), (8, 11 / 5898240, 6), (12, 1 / 2038431744, 8)),
+)
+
+
+@lru_cache(maxsize=1)
+def _correction_polynomials():
+    """
+    معاملات C0 … C4 (أعمدة) كمتسلسلات تايلور في (p − ½)، تُحسب مرة واحدة بـ mpmath:
+    Ψ(p) = cos(2π(p² − p − 1/16)) / cos(2πp) دالة تامة،
+    C1 = −Ψ'''/(96π²)، C2 = Ψ''/(64π²) + Ψ⁽⁶⁾/(18432π⁴)، … (RS_CORRECTIONS)
+    """
+    import mpmath
+    from numpy.polynomial import polynomial
+
+    with mpmath.workdps(30):
+        psi = lambda p: mpmath.cos(2 * mpmath.pi * (p * p - p - mpmath.mpf(1) / 16)) / mpmath.cos(2 * mpmath.pi * p)
+        c0 = np.array([float(c) for c in mpmath.taylor(psi, mpmath.mpf(1) / 2, 40)])
+    coefficients = np.zeros((len(c0), len(RS_CORRECTIONS)))
+    for k, terms in enumerate(RS_CORRECTIONS):
+        for order, factor, pi_power in terms:
+            coefficients[:len(c0) - order, k] += factor * polynomial.polyder(c0, order) / math.pi ** pi_power
+    return coefficients
+
+
+def riemann_siegel_z(t) -> np.ndarray:
+    """
+    دالة هاردي Z(t) = e^(iθ(t))·ζ(½ + it) (حقيقية، أصفارها أصفار زيتا)
+
+    Z(t) = 2 Σ_{n ≤ N} cos(θ(t) − t·ln n)/√n + (−1)^(N−1)·a^(−½)·Σ_{k≤4} C_k/a^k
+    حيث a = √(t/2π)، N = ⌊a⌋، p = a − N؛ متجهة دفعة دفعة (t > 2π)
+    """
+    t = np.asarray(t, dtype=float)
+    flat = np.atleast_1d(t).ravel()
+    a = np.sqrt(flat / (2 * math.pi))
+    terms = np.floor(a).astype(np.int64)
+    theta = riemann_siegel_theta(flat)
+    n = np.arange(1, max(1, int(terms.max(initial=1))) + 1)
+    log_n, weight = np.log(n), 1 / np.sqrt(n)
+
+    main = np.empty_like(flat)
+    rows = max(1, CHUNK_SIZE * 64 // len(n))
+    for start in range(0, len(flat), rows):
+        block = slice(start, start + rows)
+        phases = np.cos(theta[block, None] - flat[block, None] * log_n)
+        phases *= np.where(n <= terms[block, None], weight, 0.0)
+        main[block] = 2 * phases.sum(axis=1)
+
+    coefficients = _correction_polynomials()
+    corrections = (a - terms - 0.5)[:, None] ** np.arange(len(coefficients)) @ coefficients
+    remainder = (corrections / a[:, None] ** np.arange(corrections.shape[1])).sum(axis=1)
+    sign = np.where(terms % 2 == 1, 1.0, -1.0)
+    return (main + sign * remainder / np.sqrt(a)).reshape(t.shape)
+
+
+def _z_scalar(t: float) -> float:
+    """
+    Z(t) لنقطة واحدة: mpmath تحت RS_MIN_T حيث تصحيحات RS غير كافية، وفوقه
+    واجهة real_backend(t) (float64 حتى FLOAT64_MAX_HEIGHT ثم mpmath بدقة تناسب t)
+    """
+    if t < RS_MIN_T:
+        import mpmath
+        return float(mpmath.siegelz(t))
+    return float(real_backend(t).siegel_z(t))
+
+
+def _newton_polish(t: float, step: float = 1e-5) -> float:
+    """
+    خطوة نيوتن واحدة من صفر صقله brentq: Z(t) = Re(e^(iθ)·ζ(½ + it)) بزيتا
+    أويلر–ماكلورين (real_backend، خطأ ~10⁻¹²) والمشتقة من ريمان-سيجل
+    """
+    value = (np.exp(1j * riemann_siegel_theta(t)) * real_backend(t).zeta(0.5 + 1j * t)).real
+    slope = (riemann_siegel_z(t + step) - riemann_siegel_z(t - step)) / (2 * step)
+    return t - float(value) / float(slope)
+
+
+# ===== تحديد مواقع الأصفار =====
+
+def _block_sign_changes(lo: float, hi: float, zeros: int):
+    """فترات تغير إشارة Z داخل كتلة غرام بشبكة تُنعَّم حتى تظهر كل أصفارها"""
+    for per_interval in GRID_REFINEMENTS:
+        grid = np.linspace(lo, hi, zeros * per_interval + 1)
+        values = riemann_siegel_z(grid)
+        values[0], values[-1] = _z_scalar(lo), _z_scalar(hi)
+        changes = np.nonzero(np.signbit(values[:-1]) != np.signbit(values[1:]))[0]
+        if len(changes) == zeros:
+            return [(grid[i], grid[i + 1]) for i in changes]
+    return None
+
+
+def locate_zeros(first: int, count: int = 1, xtol: float = 1e-12) -> np.ndarray:
+    """
+    أصفار زيتا ذات الترتيب first .. first + count − 1 (الصفر 1 = 14.1347...)
+
+    Args:
+        first: ترتيب أول صفر (≥ 1)
+        count: عدد الأصفار
+        xtol: دقة brentq المطلقة
+
+    Returns:
+        مصفوفة الارتفاعات t_n (NaN لصفر في كتلة خالفت قاعدة روسر)
+    """
+    from scipy.optimize import brentq
+
+    if first < 1:
+        raise ValueError("zero indices start at 1")
+    # الصفر n في فترة غرام (g_{n−2}, g_{n−1})
+    k_first, k_last = first - 2, first + count - 2
+    padding = GRAM_PADDING
+    while True:
+        k = np.arange(max(-1, k_first - padding), k_last + padding + 1)
+        g = gram_point(k)
+        z = riemann_siegel_z(g)
+        small = g < RS_MIN_T
+        if small.any():
+            z[small] = [_z_scalar(value) for value in g[small]]
+        good = np.nonzero(np.where(k % 2 == 0, z, -z) > 0)[0]
+        # كتلة مغلقة تبدأ عند أو قبل k_first (g_{−1} تعد جيدة: لا أصفار قبلها) وأخرى تنتهي بعد k_last
+        starts_ok = k[0] == -1 or (len(good) and k[good[0]] <= k_first)
+        if starts_ok and len(good) and k[good[-1]] >= k_last:
+            break
+        padding *= 2
+    if k[0] == -1 and (not len(good) or good[0] != 0):
+        good = np.concatenate(([0], good))
+
+    zeros = np.full(count, np.nan)
+    unresolved = 0
+    for j, end in zip(good[:-1], good[1:]):
+        first_zero = int(k[j]) + 2                      # أصفار الكتلة: first_zero .. first_zero + m − 1
+        m = int(end - j)
+        if first_zero + m <= first or first_zero >= first + count:
+            continue
+        brackets = [(g[j], g[end])] if m == 1 else _block_sign_changes(g[j], g[end], m)
+        if brackets is None:
+            unresolved += m
+            continue
+        for offset, (lo, hi) in enumerate(brackets):
+            index = first_zero + offset - first
+            if 0 <= index < count:
+                root = brentq(_z_scalar, lo, hi, xtol=xtol)
+                zeros[index] = _newton_polish(root) if RS_MIN_T <= root < RS_POLISH_T else root
+    if unresolved:
+        warnings.warn(f"{unresolved} zero(s) in Gram blocks that break Rosser's rule were left as NaN")
+    return zeros
+
+
+def zero_count(T) -> np.ndarray:
+    """
+    N(T) بالضبط لكل ارتفاع: الأصفار المحددة في فترات غرام المجاورة لـ T فقط
+
+    S(T) = zero_count(T) − smooth_zero_count(T)
+    """
+    T = np.asarray(T, dtype=float)
+    counts = np.zeros(T.shape, dtype=np.int64)
+    for position, value in np.ndenumerate(T):
+        if value < 14:
+            continue
+        n = max(1, int(math.floor(riemann_siegel_theta(value) / math.pi)) - 2)
+        window = 8
+        while True:
+            zeros = locate_zeros(n, window)
+            if (n == 1 or zeros[0] <= value) and zeros[-1] > value:
+                break
+            n, window = max(1, n - window), window * 2
+        counts[position] = n - 1 + int(np.count_nonzero(zeros <= value))
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Locate Riemann zeta zeros by index")
+    parser.add_argument('--first', type=int, default=1_000_000)
+    parser.add_argument('--count', type=int, default=10_000)
+    parser.add_argument('--check', type=int, default=3, help="أصفار يُتحقق منها بـ mpmath.zetazero")
+    args = parser.parse_args()
+
+    print("🌊 أصفار زيتا بترتيبها")
+    print("=" * 50)
+
+    start = time.perf_counter()
+    estimates = zero_estimate(np.arange(args.first, args.first + args.count))
+    print(f"   التقدير الأملس: {args.count:,} صفر في {(time.perf_counter() - start) * 1000:.1f}ms")
+
+    start = time.perf_counter()
+    zeros = locate_zeros(args.first, args.count)
+    seconds = time.perf_counter() - start
+    print(f"   Brent على Z(t): {np.count_nonzero(np.isfinite(zeros)):,} صفر في {seconds:.1f}s "
+          f"({seconds / args.count * 1e6:.0f}µs لكل صفر)")
+    print(f"   الصفر #{args.first:,}: {zeros[0]:.9f} (التقدير {estimates[0]:.4f})")
+    print(f"   أكبر بعد عن التقدير: {np.nanmax(np.abs(zeros - estimates)):.4f} "
+          f"| متوسط الفجوة: {np.nanmean(np.diff(zeros)):.6f}")
+
+    if args.check:
+        import mpmath
+        indices = np.linspace(0, args.count - 1, args.check).astype(int)
+        worst = max(abs(float(mpmath.zetazero(args.first + int(i)).imag) - zeros[i]) for i in indices)
+        print(f"   أكبر فرق عن mpmath.zetazero ({args.check} أصفار): {worst:.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ Corrected Riemann Zeta Zeros Calculator
 import numpy as np
 import matplotlib.pyplot as plt
 from corrected_prime_simulator import CorrectedPrimeCircuit
+import fast_plot
 from sympy import primerange, zeta
 import pandas as pd
 from scipy.optimize import fsolve
@@ -96,18 +97,12 @@ class ZetaZerosCalculator(CorrectedPrimeCircuit):
         return pd.DataFrame(calculated_zeros)
     
     def evaluate_zeta_at_point(self, s):
-        """تقييم دالة زيتا عند نقطة معقدة"""
+        """تقييم دالة زيتا عند نقطة معقدة أو مصفوفة نقاط"""
         
-        # استخدام التقريب للدالة زيتا
-        # ζ(s) ≈ Σ(1/n^s) for n=1 to N
-        N = 1000  # عدد الحدود
-        zeta_sum = 0
-        
-        for n in range(1, N + 1):
-            term = 1 / (n ** s)
-            zeta_sum += term
-            
-        return zeta_sum
+        # أويلر–ماكلورين بدل المجموع الجزئي Σ(1/n^s) لألف حد الذي لا يتقارب عند Re(s) ≤ 1،
+        # و mpmath بدقة تناسب الارتفاع عندما لا يكفي float64
+        from numeric_backend import real_backend
+        return real_backend(np.imag(s)).zeta(s)
     
     def analyze_zeta_zeros_accuracy(self, calculated_zeros_df):
         """تحليل دقة أصفار زيتا المحسوبة"""
@@ -194,9 +189,9 @@ def plot_zeta_zeros_analysis(calculated_zeros_df, new_zeros_df=None):
     if len(known_data) > 0:
         known_data['known_zero_numeric'] = pd.to_numeric(known_data['known_zero'])
         
-        axes[0,0].scatter(known_data['known_zero_numeric'], known_data['imaginary_part'], 
+        fast_plot.scatter(axes[0,0], known_data['known_zero_numeric'], known_data['imaginary_part'], 
                          alpha=0.7, c='blue', s=60)
-        axes[0,0].plot([known_data['known_zero_numeric'].min(), known_data['known_zero_numeric'].max()], 
+        fast_plot.plot(axes[0,0], [known_data['known_zero_numeric'].min(), known_data['known_zero_numeric'].max()], 
                       [known_data['known_zero_numeric'].min(), known_data['known_zero_numeric'].max()], 
                       'r--', label='Perfect Match')
         axes[0,0].set_xlabel('Known Zeros')
@@ -206,7 +201,7 @@ def plot_zeta_zeros_analysis(calculated_zeros_df, new_zeros_df=None):
         axes[0,0].grid(True, alpha=0.3)
     
     # الرسم الثاني: قيم زيتا
-    axes[0,1].scatter(calculated_zeros_df['imaginary_part'], calculated_zeros_df['zeta_magnitude'], 
+    fast_plot.scatter(axes[0,1], calculated_zeros_df['imaginary_part'], calculated_zeros_df['zeta_magnitude'], 
                      alpha=0.7, c='green')
     axes[0,1].set_xlabel('Imaginary Part of Zero')
     axes[0,1].set_ylabel('|ζ(s)|')
@@ -224,7 +219,7 @@ def plot_zeta_zeros_analysis(calculated_zeros_df, new_zeros_df=None):
     
     # الرسم الرابع: التنبؤات الجديدة
     if new_zeros_df is not None and len(new_zeros_df) > 0:
-        scatter = axes[1,1].scatter(new_zeros_df['predicted_zero'], new_zeros_df['confidence'], 
+        scatter = fast_plot.scatter(axes[1,1], new_zeros_df['predicted_zero'], new_zeros_df['confidence'], 
                                    c=new_zeros_df['zeta_magnitude'], cmap='viridis', alpha=0.7)
         axes[1,1].set_xlabel('Predicted Zero (Imaginary Part)')
         axes[1,1].set_ylabel('Confidence (%)')